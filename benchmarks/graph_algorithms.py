@@ -0,0 +1,97 @@
+"""Benchmark graph algorithms on synthetic knowledge graphs.
+
+Builds random graphs with a power-law-ish degree distribution (similar to
+merged ontology/pathway graphs) and times the array-based algorithms in
+`biodbs.graph` on both storage backends.
+
+Usage:
+    python benchmarks/graph_algorithms.py                 # 100k and 1M edges
+    python benchmarks/graph_algorithms.py --edges 100000 --workers 8
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+import scipy.sparse.csgraph  # noqa: F401  (imported up front so timings exclude it)
+
+from biodbs._funcs.graph.utils import (
+    compute_betweenness_centrality,
+    find_shortest_path,
+    get_all_connected_components,
+    get_connected_component,
+)
+from biodbs.graph import CompactKnowledgeGraph, Edge, EdgeType, KnowledgeGraph, Node
+
+
+def synthetic_graph(num_edges: int, avg_degree: int = 5, seed: int = 0, compact: bool = True):
+    """Random directed graph; half the edges point at Zipf-popular hubs."""
+    rng = np.random.default_rng(seed)
+    n = max(2, num_edges // avg_degree)
+    sources = rng.integers(0, n, num_edges)
+    hubs = rng.permutation(n)[np.minimum(rng.zipf(1.5, num_edges) - 1, n - 1)]
+    targets = np.where(rng.random(num_edges) < 0.5, hubs, rng.integers(0, n, num_edges))
+    relations = list(EdgeType)
+    codes = rng.integers(0, 4, num_edges)
+
+    graph = (CompactKnowledgeGraph if compact else KnowledgeGraph)(name=f"synthetic-{num_edges}")
+    graph.add_nodes([Node(id=f"N{i}", label=f"node {i}") for i in range(n)])
+    graph.add_edges(
+        Edge(f"N{s}", f"N{t}", relations[r])
+        for s, t, r in zip(sources.tolist(), targets.tolist(), codes.tolist())
+    )
+    if compact:
+        graph.compact()
+    return graph
+
+
+def timed(label: str, func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    print(f"  {label:<42} {time.perf_counter() - start:8.3f} s")
+    return result
+
+
+def run(num_edges: int, workers: int, samples: int, queries: int):
+    rng = np.random.default_rng(1)
+    for compact in (True, False):
+        backend = "CompactKnowledgeGraph" if compact else "KnowledgeGraph"
+        print(f"\n{num_edges:,} edges, {backend}")
+        graph = timed("build", synthetic_graph, num_edges, compact=compact)
+        n = graph.node_count
+        pairs = [(f"N{a}", f"N{b}") for a, b in rng.integers(0, n, (queries, 2)).tolist()]
+
+        timed("weak components", get_all_connected_components, graph)
+        timed("strong components", get_all_connected_components, graph, directed=True)
+        timed("component of one node", get_connected_component, graph, "N0")
+        timed(
+            f"{queries} shortest paths (undirected)",
+            lambda graph=graph, pairs=pairs: [
+                find_shortest_path(graph, a, b, directed=False) for a, b in pairs
+            ],
+        )
+        timed(
+            f"betweenness, {samples} sources, 1 process",
+            compute_betweenness_centrality, graph, sample_size=samples, seed=0,
+        )
+        if workers > 1:
+            timed(
+                f"betweenness, {samples} sources, {workers} processes",
+                compute_betweenness_centrality, graph, sample_size=samples, seed=0, workers=workers,
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--edges", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--samples", type=int, default=200, help="betweenness source nodes")
+    parser.add_argument("--queries", type=int, default=100, help="shortest-path queries")
+    args = parser.parse_args()
+    for num_edges in args.edges:
+        run(num_edges, args.workers, args.samples, args.queries)
+
+
+if __name__ == "__main__":
+    main()
@@ -35,11 +35,6 @@ from biodbs.exceptions import (
     IDTranslationError,
 )
 
-# =============================================================================
-# Fetch functions (low-level API wrappers for biological databases)
-# =============================================================================
-from biodbs.fetch._func import *
-
 # =============================================================================
 # Submodule namespaces (for organized imports)
 # =============================================================================
@@ -49,63 +44,65 @@ from biodbs import analysis
 from biodbs import graph
 
 # =============================================================================
-# Translate functions (ID mapping between databases)
+# Lazily imported functions (PEP 562): the defining module is only loaded
+# when a name is first used, so `import biodbs` stays cheap.
 # =============================================================================
-from biodbs._funcs.translate import (
-    translate_gene_ids,
-    translate_gene_ids_kegg,
-    translate_chemical_ids,
-    translate_chemical_ids_kegg,
-    translate_chembl_to_pubchem,
-    translate_pubchem_to_chembl,
-)
+from biodbs._lazy import lazy_exports
 
-# =============================================================================
-# Analysis functions (enrichment analysis, statistics, etc.)
-# =============================================================================
-from biodbs._funcs.analysis import (
-    ora,
-    ora_kegg,
-    ora_go,
-    ora_enrichr,
-    ORAResult,
-    hypergeometric_test,
-    multiple_test_correction,
-)
-
-# =============================================================================
-# Graph functions (knowledge graph construction and analysis)
-# =============================================================================
-from biodbs._funcs.graph import (
-    # Core classes
-    KnowledgeGraph,
-    Node,
-    Edge,
-    # Enums
-    NodeType,
-    EdgeType,
-    DataSource,
-    # Builders
-    build_graph,
-    build_disease_graph,
-    build_go_graph,
-    build_reactome_graph,
-    build_kegg_graph,
-    merge_graphs,
-    # Exporters
-    to_networkx,
-    to_json_ld,
-    to_rdf,
-    to_neo4j_csv,
-    to_cypher,
-    # Utilities
-    find_shortest_path,
-    find_all_paths,
-    get_neighborhood,
-    get_connected_component,
-    find_hub_nodes,
-    get_graph_statistics,
-)
+_EXPORTS = {
+    # Fetch functions (low-level API wrappers for biological databases)
+    "biodbs.fetch": tuple(fetch.__all__),
+    # Translate functions (ID mapping between databases)
+    "biodbs._funcs.translate": (
+        "translate_gene_ids",
+        "translate_gene_ids_kegg",
+        "translate_chemical_ids",
+        "translate_chemical_ids_kegg",
+        "translate_chembl_to_pubchem",
+        "translate_pubchem_to_chembl",
+    ),
+    # Analysis functions (enrichment analysis, statistics, etc.)
+    "biodbs._funcs.analysis": (
+        "ora",
+        "ora_kegg",
+        "ora_go",
+        "ora_enrichr",
+        "ORAResult",
+        "hypergeometric_test",
+        "multiple_test_correction",
+    ),
+    # Graph functions (knowledge graph construction and analysis)
+    "biodbs._funcs.graph": (
+        # Core classes
+        "KnowledgeGraph",
+        "Node",
+        "Edge",
+        # Enums
+        "NodeType",
+        "EdgeType",
+        "DataSource",
+        # Builders
+        "build_graph",
+        "build_disease_graph",
+        "build_go_graph",
+        "build_reactome_graph",
+        "build_kegg_graph",
+        "merge_graphs",
+        # Exporters
+        "to_networkx",
+        "to_json_ld",
+        "to_rdf",
+        "to_neo4j_csv",
+        "to_cypher",
+        # Utilities
+        "find_shortest_path",
+        "find_all_paths",
+        "get_neighborhood",
+        "get_connected_component",
+        "find_hub_nodes",
+        "get_graph_statistics",
+    ),
+}
 
 
 __all__ = [
@@ -191,6 +188,7 @@ __all__ = [
     "quickgo_search_annotations",
     "quickgo_search_annotations_all",
     "quickgo_download_annotations",
+    "quickgo_iter_annotations",
     "quickgo_get_gene_product",
     # FDA
     "fda_search",
@@ -301,4 +299,6 @@ __all__ = [
     "get_connected_component",
     "find_hub_nodes",
     "get_graph_statistics",
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, exports=_EXPORTS)
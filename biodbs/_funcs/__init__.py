@@ -32,36 +32,40 @@ Usage:
     print(result.significant_terms().as_dataframe())
 """
 
-from biodbs._funcs.translate import (
-    # Gene translation
-    translate_gene_ids,
-    translate_gene_ids_kegg,
-    # Chemical translation
-    translate_chemical_ids,
-    translate_chemical_ids_kegg,
-    translate_chembl_to_pubchem,
-    translate_pubchem_to_chembl,
-    # Protein translation
-    translate_protein_ids,
-    translate_gene_to_uniprot,
-    translate_uniprot_to_gene,
-    translate_uniprot_to_pdb,
-    translate_uniprot_to_ensembl,
-    translate_uniprot_to_refseq,
-)
+from biodbs._lazy import lazy_exports
 
-from biodbs._funcs.analysis import (
-    # Core ORA functions
-    ora,
-    ora_kegg,
-    ora_go,
-    ora_enrichr,
-    # Result class
-    ORAResult,
-    # Utility functions
-    hypergeometric_test,
-    multiple_test_correction,
-)
+# Imported on first access (PEP 562) to keep package import cheap.
+_EXPORTS = {
+    "biodbs._funcs.translate": (
+        # Gene translation
+        "translate_gene_ids",
+        "translate_gene_ids_kegg",
+        # Chemical translation
+        "translate_chemical_ids",
+        "translate_chemical_ids_kegg",
+        "translate_chembl_to_pubchem",
+        "translate_pubchem_to_chembl",
+        # Protein translation
+        "translate_protein_ids",
+        "translate_gene_to_uniprot",
+        "translate_uniprot_to_gene",
+        "translate_uniprot_to_pdb",
+        "translate_uniprot_to_ensembl",
+        "translate_uniprot_to_refseq",
+    ),
+    "biodbs._funcs.analysis": (
+        # Core ORA functions
+        "ora",
+        "ora_kegg",
+        "ora_go",
+        "ora_enrichr",
+        # Result class
+        "ORAResult",
+        # Utility functions
+        "hypergeometric_test",
+        "multiple_test_correction",
+    ),
+}
 
 __all__ = [
     # Gene translation
@@ -88,3 +92,5 @@ __all__ = [
     "hypergeometric_test",
     "multiple_test_correction",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, exports=_EXPORTS)
@@ -7,6 +7,7 @@ including over-representation analysis (ORA) for gene set enrichment.
 from biodbs._funcs.analysis.ora import (
     # Core ORA functions
     ora,
+    ora_batch,
     ora_kegg,
     ora_go,
     ora_enrichr,
@@ -16,6 +17,10 @@ from biodbs._funcs.analysis.ora import (
     ORAResult,
     ORATermResult,
     Pathway,
+    # Gene set index
+    GeneSetIndex,
+    # GO annotation ingest
+    GOAnnotationAggregator,
     # Enums
     Species,
     GOAspect,
@@ -24,12 +29,16 @@ from biodbs._funcs.analysis.ora import (
     PathwayDatabase,
     # Utility functions
     hypergeometric_test,
+    hypergeometric_test_batch,
     multiple_test_correction,
+    multiple_test_correction_array,
 )
+from biodbs._funcs.analysis._go import load_go_ancestors
 
 __all__ = [
     # Core ORA functions
     "ora",
+    "ora_batch",
     "ora_kegg",
     "ora_go",
     "ora_enrichr",
@@ -39,6 +48,11 @@ __all__ = [
     "ORAResult",
     "ORATermResult",
     "Pathway",
+    # Gene set index
+    "GeneSetIndex",
+    # GO annotation ingest
+    "GOAnnotationAggregator",
+    "load_go_ancestors",
     # Enums
     "Species",
     "GOAspect",
@@ -47,5 +61,7 @@ __all__ = [
     "PathwayDatabase",
     # Utility functions
     "hypergeometric_test",
+    "hypergeometric_test_batch",
     "multiple_test_correction",
+    "multiple_test_correction_array",
 ]
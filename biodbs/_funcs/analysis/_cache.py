@@ -9,6 +9,13 @@ Supported storage backends:
     - PostgreSQL: PostgreSQL server storage
     - JSON: Document-based storage (portable, human-readable)
     - CSV: Tabular export (for analysis in other tools)
+    - Parquet / Arrow IPC: Columnar files written with polars, one row per
+      pathway with a list column of genes (fastest to load)
+
+Loaded libraries are additionally memoized in a process-wide LRU memory
+tier (`PathwayMemoryCache`), so repeated ORA calls in a long-running process
+skip the storage round-trip. Entries follow the backing store's expiry and
+are invalidated whenever `save_pathways` or `clear_cache` touches their key.
 
 Example:
     >>> from biodbs._funcs.analysis._cache import PathwayDBManager
@@ -73,19 +80,25 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import sys
+import threading
 import time
 import warnings
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from contextlib import contextmanager
 from dataclasses import asdict
+from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     FrozenSet,
     Generator,
+    Hashable,
     List,
     Optional,
     Set,
@@ -96,12 +109,15 @@ from typing import (
 from biodbs.data._base import BaseDBManager, _sanitize_identifier
 
 if TYPE_CHECKING:
+    from biodbs._funcs.analysis._index import GeneSetIndex
     from biodbs._funcs.analysis.ora import Pathway
 
 
 # Default cache settings
 DEFAULT_CACHE_DIR = Path.home() / ".biodbs" / "cache"
 DEFAULT_CACHE_EXPIRY = 7 * 24 * 60 * 60  # 7 days in seconds
+DEFAULT_MEMORY_CACHE_ENTRIES = 32
+DEFAULT_MEMORY_CACHE_BYTES = 512 * 1024 * 1024  # 512 MiB
 
 
 class StorageBackend(str, Enum):
@@ -112,6 +128,8 @@ class StorageBackend(str, Enum):
     POSTGRESQL = "postgresql"
     JSON = "json"
     CSV = "csv"
+    PARQUET = "parquet"
+    ARROW = "arrow"
 
 
 # Type alias for database configuration
@@ -327,6 +345,240 @@ class PostgreSQLDialect(SQLDialect):
         return conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
 
 
+# =============================================================================
+# In-Process Memory Tier
+# =============================================================================
+
+
+def _estimate_nbytes(value: Any) -> int:
+    """Approximate the memory held by a cached pathway library.
+
+    Objects exposing ``nbytes`` (e.g. `GeneSetIndex`) report their own size.
+    For pathway dicts, the containers are counted but gene ID strings are
+    not, since they are shared between terms.
+    """
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    if isinstance(value, dict):
+        total = sys.getsizeof(value)
+        for item in value.values():
+            genes = getattr(item, "genes", None)
+            if genes is None and isinstance(item, tuple) and len(item) == 2:
+                genes = item[1]
+            total += sys.getsizeof(item) + (sys.getsizeof(genes) if genes is not None else 0)
+        return total
+    return sys.getsizeof(value)
+
+
+class PathwayMemoryCache:
+    """Thread-safe LRU cache of ready-built pathway libraries.
+
+    Sits above `PathwayDBManager` so repeated ORA calls in one process skip
+    the storage round-trip and object construction. Entries are keyed by
+    ``(namespace, cache_key, kind, options)``, where ``namespace`` identifies
+    the backing store, ``kind`` names the cached form (raw tuples, Pathway
+    dicts, compiled indexes) and ``options`` holds loader parameters.
+
+    An entry is dropped when:
+        - the backing store's ``expires_at`` for its cache_key has passed,
+        - `PathwayDBManager.save_pathways` or ``clear_cache`` touches its
+          cache_key,
+        - it is the least recently used entry and the entry or byte limit
+          is exceeded.
+
+    Example:
+        >>> cache = PathwayMemoryCache(max_entries=8)
+        >>> cache.put(("store", "kegg_hsa", "pathways", ()), pathways, expires_at=time.time() + 60)
+        >>> cache.get(("store", "kegg_hsa", "pathways", ())) is pathways
+        True
+        >>> cache.stats()["hits"]
+        1
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = DEFAULT_MEMORY_CACHE_ENTRIES,
+        max_bytes: Optional[int] = DEFAULT_MEMORY_CACHE_BYTES,
+    ):
+        """Initialize the memory cache.
+
+        Args:
+            max_entries: Maximum number of entries (None = unlimited).
+            max_bytes: Approximate byte budget across entries (None = unlimited).
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # key -> (value, nbytes)
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Tuple[Any, int]]" = OrderedDict()
+        # (namespace, cache_key) -> expires_at of the backing store
+        self._expiry: Dict[Tuple[Hashable, str], float] = {}
+        self._nbytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Tuple[Hashable, ...]) -> bool:
+        with self._lock:
+            return key in self._entries and not self._expired(key)
+
+    def __repr__(self) -> str:
+        return (
+            f"<PathwayMemoryCache entries={len(self._entries)} "
+            f"bytes={self._nbytes} hits={self.hits} misses={self.misses}>"
+        )
+
+    def _expired(self, key: Tuple[Hashable, ...]) -> bool:
+        expires_at = self._expiry.get((key[0], key[1]))
+        return expires_at is not None and time.time() > expires_at
+
+    def _drop(self, key: Tuple[Hashable, ...]) -> None:
+        _, nbytes = self._entries.pop(key)
+        self._nbytes -= nbytes
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[Any]:
+        """Return the cached value for ``key``, or None on a miss.
+
+        Cached values are shared between callers and must be treated as
+        read-only.
+        """
+        with self._lock:
+            if key in self._entries and self._expired(key):
+                self.invalidate(key[1], namespace=key[0])
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(
+        self,
+        key: Tuple[Hashable, ...],
+        value: Any,
+        expires_at: Optional[float] = None,
+        nbytes: Optional[int] = None,
+    ) -> None:
+        """Store ``value`` under ``key``, evicting LRU entries as needed.
+
+        Args:
+            key: ``(namespace, cache_key, kind, options)`` tuple.
+            value: Ready-built object to cache.
+            expires_at: Backing store expiry for the key's cache_key. If None,
+                any expiry already recorded for that cache_key is kept.
+            nbytes: Size of the value; estimated when omitted.
+        """
+        if nbytes is None:
+            nbytes = _estimate_nbytes(value)
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return
+
+        with self._lock:
+            if expires_at is not None:
+                self._expiry[(key[0], key[1])] = expires_at
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (value, nbytes)
+            self._nbytes += nbytes
+            self._evict()
+
+    def _evict(self) -> None:
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._nbytes > self.max_bytes)
+        ):
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+
+    def invalidate(
+        self,
+        cache_key: Optional[str] = None,
+        namespace: Optional[Hashable] = None,
+        kind: Optional[str] = None,
+    ) -> int:
+        """Drop matching entries.
+
+        Args:
+            cache_key: Only drop entries for this cache_key (None = all keys).
+            namespace: Only drop entries for this backing store (None = all stores).
+            kind: Only drop entries of this kind (None = all kinds).
+
+        Returns:
+            int: Number of entries removed.
+        """
+        with self._lock:
+            matches = [
+                key for key in self._entries
+                if (cache_key is None or key[1] == cache_key)
+                and (namespace is None or key[0] == namespace)
+                and (kind is None or key[2] == kind)
+            ]
+            for key in matches:
+                self._drop(key)
+            if kind is None:
+                for store_key in list(self._expiry):
+                    if (cache_key is None or store_key[1] == cache_key) and (
+                        namespace is None or store_key[0] == namespace
+                    ):
+                        del self._expiry[store_key]
+            return len(matches)
+
+    def set_expiry(
+        self, namespace: Hashable, cache_key: str, expires_at: Optional[float]
+    ) -> None:
+        """Record the backing store expiry for ``cache_key`` in ``namespace``."""
+        with self._lock:
+            if expires_at is None:
+                self._expiry.pop((namespace, cache_key), None)
+            else:
+                self._expiry[(namespace, cache_key)] = expires_at
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._expiry.clear()
+            self._nbytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def configure(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        """Change the size limits, evicting immediately if now over budget."""
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            self._evict()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current usage."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "nbytes": self._nbytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+            }
+
+
+# Process-wide memory tier shared by all PathwayDBManager instances
+_memory_cache = PathwayMemoryCache()
+
+
 class PathwayDBManager(BaseDBManager):
     """Manager for storing and retrieving pathway-gene relationships.
 
@@ -466,6 +718,119 @@ class PathwayDBManager(BaseDBManager):
             StorageBackend.POSTGRESQL,
         )
 
+    def _is_columnar_backend(self) -> bool:
+        """Check if current backend stores polars-readable columnar files."""
+        return self.backend in (StorageBackend.PARQUET, StorageBackend.ARROW)
+
+    def _columnar_dir(self) -> Path:
+        """Directory holding one columnar file per cache_key."""
+        return self.storage_path / self.db_name
+
+    def _columnar_path(self, cache_key: str) -> Path:
+        ext = "parquet" if self.backend == StorageBackend.PARQUET else "arrow"
+        return self._columnar_dir() / f"{cache_key}.{ext}"
+
+    def _read_columnar(self, path: Path, columns: Optional[List[str]] = None):
+        """Read a columnar pathway file (polars memory-maps local files by default)."""
+        import polars as pl
+
+        if self.backend == StorageBackend.PARQUET:
+            return pl.read_parquet(path, columns=columns)
+        return pl.read_ipc(path, columns=columns)
+
+    def _scan_columnar(self):
+        """Lazily scan every columnar pathway file of this manager."""
+        import polars as pl
+
+        pattern = str(self._columnar_path("*"))
+        if self.backend == StorageBackend.PARQUET:
+            return pl.scan_parquet(pattern)
+        return pl.scan_ipc(pattern)
+
+    def _columnar_files(self) -> List[Path]:
+        return sorted(self._columnar_dir().glob(self._columnar_path("*").name))
+
+    def _read_entries_columnar(self) -> List[Dict[str, Any]]:
+        """List (cache_key, created_at, expires_at) for every columnar file."""
+        entries = []
+        for path in self._columnar_files():
+            try:
+                df = self._read_columnar(path, columns=["created_at", "expires_at"])
+            except Exception:
+                continue
+            if len(df):
+                entries.append({
+                    "cache_key": path.stem,
+                    "created_at": df["created_at"][0],
+                    "expires_at": df["expires_at"].min(),
+                })
+        return entries
+
+    def _memory_namespace(self) -> str:
+        """Identify the backing store for keys in the in-process memory tier."""
+        if self.backend in (StorageBackend.MYSQL, StorageBackend.POSTGRESQL):
+            host = self.db_config.get("host", "localhost")
+            return f"{self.backend.value}://{host}/{self.db_config.get('database')}"
+        return f"{self.backend.value}:{self.storage_path.resolve() / self.db_name}"
+
+    def _memory_invalidate(self, cache_key: Optional[str] = None) -> None:
+        """Drop in-process memory tier entries for this store."""
+        _memory_cache.invalidate(cache_key, namespace=self._memory_namespace())
+
+    def get_expiry(self, cache_key: str) -> Optional[float]:
+        """Return the time (epoch seconds) at which ``cache_key`` expires.
+
+        Args:
+            cache_key: Unique key for the pathway set.
+
+        Returns:
+            float or None: Expiry timestamp, or None if the key is not stored
+                or its expiry is unknown.
+        """
+        if self._is_columnar_backend():
+            path = self._columnar_path(cache_key)
+            if not path.exists():
+                return None
+            try:
+                expires = self._read_columnar(path, columns=["expires_at"])["expires_at"]
+            except Exception as e:
+                self.logger.error("Failed to read expiry for %s: %s", cache_key, e)
+                return None
+            return float(expires.min()) if len(expires) else None
+
+        if not self._is_sql_backend():
+            entry = self._metadata.get(cache_key) or {}
+            candidates = []
+            if entry.get("expires_at") is not None:
+                candidates.append(float(entry["expires_at"]))
+            if self.cache_expiry_days is not None and entry.get("timestamp"):
+                try:
+                    created = datetime.fromisoformat(entry["timestamp"]).timestamp()
+                    candidates.append(created + self.cache_expiry_days * 24 * 60 * 60)
+                except (TypeError, ValueError):
+                    pass
+            return min(candidates) if candidates else None
+
+        if self.backend == StorageBackend.SQLITE:
+            if not (self.storage_path / f"{self.db_name}.db").exists():
+                return None
+
+        dialect = self._get_dialect()
+        pathways_table = _sanitize_identifier(self.PATHWAYS_TABLE)
+        try:
+            with dialect.connection() as conn:
+                cur = conn.cursor()
+                cur.execute(
+                    f"SELECT MIN(expires_at) FROM {pathways_table} "
+                    f"WHERE cache_key = {dialect.placeholder}",
+                    (cache_key,),
+                )
+                row = cur.fetchone()
+        except Exception as e:
+            self.logger.error("Failed to read expiry for %s: %s", cache_key, e)
+            return None
+        return float(row[0]) if row and row[0] is not None else None
+
     def _init_sql_schema(self, conn, dialect: SQLDialect) -> None:
         """Initialize the SQL schema for pathway storage.
 
@@ -594,6 +959,8 @@ class PathwayDBManager(BaseDBManager):
                 - PostgreSQL: PosixPath('postgresql://localhost/biodbs')
                 - JSON: PosixPath('/home/user/.biodbs/cache/kegg_hsa.json')
                 - CSV: PosixPath('/home/user/.biodbs/cache/kegg_hsa.csv')
+                - Parquet: PosixPath('/home/user/.biodbs/cache/pathways/kegg_hsa.parquet')
+                - Arrow: PosixPath('/home/user/.biodbs/cache/pathways/kegg_hsa.arrow')
 
         Example:
             >>> mgr = PathwayDBManager(storage_path="/tmp/cache", backend="sqlite")
@@ -606,20 +973,31 @@ class PathwayDBManager(BaseDBManager):
             /tmp/cache/pathways.db
         """
         if self._is_sql_backend():
-            return self._save_pathways_sql(
+            path = self._save_pathways_sql(
                 pathways, cache_key, database, species, gene_type, expiry_seconds
             )
         elif self.backend == StorageBackend.JSON:
-            return self._save_pathways_json(
+            path = self._save_pathways_json(
                 pathways, cache_key, database, species, gene_type, expiry_seconds
             )
         elif self.backend == StorageBackend.CSV:
-            return self._save_pathways_csv(
+            path = self._save_pathways_csv(
                 pathways, cache_key, database, species, gene_type
             )
+        elif self._is_columnar_backend():
+            path = self._save_pathways_columnar(
+                pathways, cache_key, database, species, gene_type, expiry_seconds
+            )
         else:
             raise ValueError(f"Unknown backend: {self.backend}")
 
+        # Anything built from the previous contents of this key is now stale
+        self._memory_invalidate(cache_key)
+        _memory_cache.set_expiry(
+            self._memory_namespace(), cache_key, self.get_expiry(cache_key)
+        )
+        return path
+
     def _save_pathways_sql(
         self,
         pathways: Union[Dict[str, Tuple[str, Set[str]]], Dict[str, "Pathway"]],
@@ -756,7 +1134,10 @@ class PathwayDBManager(BaseDBManager):
                     "genes": list(genes),
                 }
 
-        return self.save_json(data, cache_key, key=cache_key, database=database)
+        return self.save_json(
+            data, cache_key, key=cache_key, database=database,
+            expires_at=data["expires_at"],
+        )
 
     def _save_pathways_csv(
         self,
@@ -787,6 +1168,89 @@ class PathwayDBManager(BaseDBManager):
 
         return self.save_csv(rows, cache_key, key=cache_key, database=database)
 
+    def _save_pathways_columnar(
+        self,
+        pathways: Union[Dict[str, Tuple[str, Set[str]]], Dict[str, "Pathway"]],
+        cache_key: str,
+        database: str,
+        species: Optional[str],
+        gene_type: str,
+        expiry_seconds: Optional[float],
+    ) -> Path:
+        """Save pathways as a Parquet/Arrow file with one row per pathway."""
+        import polars as pl
+
+        now = time.time()
+        expires_at = now + (expiry_seconds or DEFAULT_CACHE_EXPIRY)
+
+        ids, names, databases, species_col, urls, genes_col = [], [], [], [], [], []
+        for pathway_id, data in pathways.items():
+            if hasattr(data, "name") and hasattr(data, "genes"):
+                name, genes = data.name, data.genes
+                urls.append(getattr(data, "url", None))
+                species_col.append(getattr(data, "species", species))
+                databases.append(getattr(data, "database", database))
+            else:
+                name, genes = data
+                urls.append(None)
+                species_col.append(species)
+                databases.append(database)
+            ids.append(pathway_id)
+            names.append(name)
+            genes_col.append([str(g) for g in genes])
+
+        df = pl.DataFrame(
+            {
+                "id": ids,
+                "name": names,
+                "database": databases,
+                "species": species_col,
+                "url": urls,
+                "genes": genes_col,
+            },
+            schema={
+                "id": pl.String,
+                "name": pl.String,
+                "database": pl.String,
+                "species": pl.String,
+                "url": pl.String,
+                "genes": pl.List(pl.String),
+            },
+        ).with_columns(
+            gene_count=pl.col("genes").list.len(),
+            gene_type=pl.lit(gene_type),
+            cache_key=pl.lit(cache_key),
+            created_at=pl.lit(now),
+            expires_at=pl.lit(expires_at),
+        )
+
+        path = self._columnar_path(cache_key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a sibling file and rename so readers never see a partial file
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        if self.backend == StorageBackend.PARQUET:
+            df.write_parquet(tmp_path)
+        else:
+            df.write_ipc(tmp_path, compression="uncompressed")
+        tmp_path.replace(path)
+
+        gene_count = int(df["gene_count"].sum()) if len(df) else 0
+        self._update_metadata(
+            cache_key,
+            filepath=str(path),
+            format=self.backend.value,
+            database=database,
+            species=species,
+            pathway_count=len(df),
+            gene_count=gene_count,
+            expires_at=expires_at,
+        )
+        self.logger.info(
+            "Saved %d pathways (%d genes) to %s [cache_key=%s]",
+            len(df), gene_count, path, cache_key,
+        )
+        return path
+
     def load_pathways(
         self,
         cache_key: str,
@@ -832,6 +1296,8 @@ class PathwayDBManager(BaseDBManager):
             return self._load_pathways_json(cache_key, use_cache, as_pathway_objects)
         elif self.backend == StorageBackend.CSV:
             return self._load_pathways_csv(cache_key, use_cache, as_pathway_objects)
+        elif self._is_columnar_backend():
+            return self._load_pathways_columnar(cache_key, use_cache, as_pathway_objects)
         else:
             raise ValueError(f"Unknown backend: {self.backend}")
 
@@ -1001,6 +1467,157 @@ class PathwayDBManager(BaseDBManager):
 
         return result
 
+    def _load_pathways_columnar(
+        self,
+        cache_key: str,
+        use_cache: bool,
+        as_pathway_objects: bool,
+    ) -> Optional[Dict[str, Tuple[str, FrozenSet[str]]]]:
+        """Load pathways from a memory-mapped Parquet/Arrow file."""
+        path = self._columnar_path(cache_key)
+        if not path.exists():
+            return None
+
+        try:
+            df = self._read_columnar(path)
+        except Exception as e:
+            self.logger.error("Failed to load pathways: %s", e)
+            return None
+
+        if len(df) == 0:
+            return {}
+        if use_cache and time.time() > df["expires_at"].min():
+            return None
+
+        ids = df["id"].to_list()
+        names = df["name"].to_list()
+        gene_sets = list(map(frozenset, df["genes"].to_list()))
+
+        if not as_pathway_objects:
+            return dict(zip(ids, zip(names, gene_sets)))
+
+        from biodbs._funcs.analysis.ora import Pathway
+
+        return {
+            pathway_id: Pathway(
+                id=pathway_id,
+                name=name,
+                genes=genes,
+                database=database,
+                species=species,
+                url=url,
+            )
+            for pathway_id, name, genes, database, species, url in zip(
+                ids,
+                names,
+                gene_sets,
+                df["database"].to_list(),
+                df["species"].to_list(),
+                df["url"].to_list(),
+            )
+        }
+
+    def load_gene_set_index(
+        self,
+        cache_key: str,
+        use_cache: bool = True,
+        database: Optional[str] = None,
+        min_size: int = 0,
+        max_size: Optional[int] = None,
+    ) -> Optional["GeneSetIndex"]:
+        """Load a pathway set directly as a compiled `GeneSetIndex`.
+
+        With the Parquet/Arrow backends the index is built from the columnar
+        file without materializing per-pathway Python sets, which is the
+        fastest way to get a large library (e.g. GO BP) ready for ORA. Other
+        backends fall back to `load_pathways`.
+
+        Args:
+            cache_key: Unique key for the pathway set (e.g., "go_9606_biological_process").
+            use_cache: If True, return None when the stored data has expired.
+            database: Database name for the index. Defaults to the stored one.
+            min_size: Minimum genes per pathway.
+            max_size: Maximum genes per pathway (None = no limit).
+
+        Returns:
+            GeneSetIndex or None if not found/expired.
+
+        Example:
+            >>> mgr = PathwayDBManager(storage_path="/tmp/cache", backend="parquet")
+            >>> index = mgr.load_gene_set_index("kegg_hsa")
+            >>> index
+            <GeneSetIndex database='KEGG' terms=2 genes=5>
+        """
+        from biodbs._funcs.analysis._index import GeneSetIndex
+
+        if not self._is_columnar_backend():
+            pathways = self.load_pathways(cache_key, use_cache=use_cache)
+            if pathways is None:
+                return None
+            if database is None:
+                database = (self._metadata.get(cache_key) or {}).get("database", "custom")
+            pathways = {
+                k: (name, genes)
+                for k, (name, genes) in pathways.items()
+                if min_size <= len(genes) and (max_size is None or len(genes) <= max_size)
+            }
+            return GeneSetIndex.from_gene_sets(pathways, database=database)
+
+        path = self._columnar_path(cache_key)
+        if not path.exists():
+            return None
+        try:
+            df = self._read_columnar(path, columns=["id", "name", "database", "genes", "expires_at"])
+        except Exception as e:
+            self.logger.error("Failed to load pathways: %s", e)
+            return None
+        if len(df) and use_cache and time.time() > df["expires_at"].min():
+            return None
+        if database is None:
+            database = df["database"][0] if len(df) and df["database"][0] else "custom"
+        sizes = df["genes"].list.len()
+        keep = sizes >= min_size
+        if max_size is not None:
+            keep = keep & (sizes <= max_size)
+        return GeneSetIndex.from_frame(df.filter(keep), database=database)
+
+    def _query_pathways_columnar(
+        self,
+        gene_id: Optional[str],
+        database: Optional[str],
+        species: Optional[str],
+        min_size: Optional[int],
+        max_size: Optional[int],
+    ) -> List[Dict[str, Any]]:
+        """Filter pathways across all columnar files with a lazy polars scan."""
+        import polars as pl
+
+        if not self._columnar_files():
+            return []
+
+        lf = self._scan_columnar()
+        if gene_id:
+            lf = lf.filter(pl.col("genes").list.contains(gene_id))
+        if database:
+            lf = lf.filter(pl.col("database") == database)
+        if species:
+            lf = lf.filter(pl.col("species") == species)
+        if min_size is not None:
+            lf = lf.filter(pl.col("gene_count") >= min_size)
+        if max_size is not None:
+            lf = lf.filter(pl.col("gene_count") <= max_size)
+
+        try:
+            df = (
+                lf.select("id", "name", "database", "species", "url", "gene_count", "cache_key")
+                .sort("gene_count", descending=True, maintain_order=True)
+                .collect()
+            )
+        except Exception as e:
+            self.logger.error("Query failed: %s", e)
+            return []
+        return df.to_dicts()
+
     def query_pathways(
         self,
         gene_id: Optional[str] = None,
@@ -1011,7 +1628,8 @@ class PathwayDBManager(BaseDBManager):
     ) -> List[Dict[str, Any]]:
         """Query pathways from storage with optional filters.
 
-        Only supported for SQL backends (SQLite, MySQL, PostgreSQL).
+        Supported for SQL backends (SQLite, MySQL, PostgreSQL) and the
+        columnar backends (Parquet, Arrow).
 
         Args:
             gene_id: Filter by gene ID. Returns only pathways containing this gene.
@@ -1056,6 +1674,8 @@ class PathwayDBManager(BaseDBManager):
             >>> # Find medium-sized pathways
             >>> medium = mgr.query_pathways(min_size=50, max_size=200)
         """
+        if self._is_columnar_backend():
+            return self._query_pathways_columnar(gene_id, database, species, min_size, max_size)
         if not self._is_sql_backend():
             raise ValueError(f"query_pathways not supported with {self.backend.value} backend")
 
@@ -1108,7 +1728,8 @@ class PathwayDBManager(BaseDBManager):
     def get_genes_for_pathway(self, pathway_id: str) -> Set[str]:
         """Get all genes for a specific pathway.
 
-        Only supported for SQL backends (SQLite, MySQL, PostgreSQL).
+        Supported for SQL backends (SQLite, MySQL, PostgreSQL) and the
+        columnar backends (Parquet, Arrow).
 
         Args:
             pathway_id: Pathway identifier (e.g., "hsa04110", "R-HSA-69620").
@@ -1128,6 +1749,23 @@ class PathwayDBManager(BaseDBManager):
             >>> print(f"Cell cycle has {len(genes)} genes")
             Cell cycle has 124 genes
         """
+        if self._is_columnar_backend():
+            import polars as pl
+
+            if not self._columnar_files():
+                return set()
+            try:
+                df = (
+                    self._scan_columnar()
+                    .filter(pl.col("id") == pathway_id)
+                    .select(pl.col("genes").explode())
+                    .collect()
+                )
+            except Exception as e:
+                self.logger.error("Failed to get genes for %s: %s", pathway_id, e)
+                return set()
+            return set(df["genes"].drop_nulls().to_list())
+
         if not self._is_sql_backend():
             raise ValueError(f"get_genes_for_pathway not supported with {self.backend.value} backend")
 
@@ -1156,7 +1794,8 @@ class PathwayDBManager(BaseDBManager):
     def clear_expired(self) -> int:
         """Remove expired cache entries from the database.
 
-        Only supported for SQL backends (SQLite, MySQL, PostgreSQL).
+        Supported for SQL backends (SQLite, MySQL, PostgreSQL) and the
+        columnar backends (Parquet, Arrow), which delete expired files.
         JSON and CSV backends return 0 (no operation performed).
 
         Returns:
@@ -1170,6 +1809,23 @@ class PathwayDBManager(BaseDBManager):
             >>> print(f"Removed {removed} expired pathways")
             Removed 5 expired pathways
         """
+        if self._is_columnar_backend():
+            removed = 0
+            now = time.time()
+            for path in self._columnar_files():
+                try:
+                    expires = self._read_columnar(path, columns=["expires_at"])["expires_at"]
+                except Exception as e:
+                    self.logger.error("Failed to read %s: %s", path, e)
+                    continue
+                if len(expires) and expires.min() < now:
+                    removed += len(expires)
+                    path.unlink()
+                    self._memory_invalidate(path.stem)
+            if removed:
+                self.logger.info("Cleared %d expired pathways from %s", removed, self.backend.value)
+            return removed
+
         if not self._is_sql_backend():
             # JSON and CSV don't support this operation
             return 0
@@ -1229,6 +1885,15 @@ class PathwayDBManager(BaseDBManager):
         """
         # Call parent to clear metadata
         super().clear_cache(key)
+        self._memory_invalidate(key)
+
+        # Columnar backends keep one file per cache_key
+        if self._is_columnar_backend():
+            paths = [self._columnar_path(key)] if key else self._columnar_files()
+            for path in paths:
+                if path.exists():
+                    path.unlink()
+            return
 
         # Also clear from SQL database
         if not self._is_sql_backend():
@@ -1278,37 +1943,206 @@ class PathwayDBManager(BaseDBManager):
 
 # Global manager instance (lazy initialization)
 _default_manager: Optional[PathwayDBManager] = None
+_default_backend: StorageBackend = StorageBackend.SQLITE
 
 
 def _get_default_manager() -> PathwayDBManager:
     """Get or create the default PathwayDBManager."""
     global _default_manager
     if _default_manager is None:
-        _default_manager = PathwayDBManager()
+        _default_manager = PathwayDBManager(backend=_default_backend)
     return _default_manager
 
 
+def _get_manager(cache_dir: Optional[str] = None) -> PathwayDBManager:
+    """Return a manager for ``cache_dir``, or the default manager."""
+    if cache_dir:
+        return PathwayDBManager(storage_path=cache_dir, backend=_default_backend)
+    return _get_default_manager()
+
+
+def set_default_backend(backend: Union[str, StorageBackend]) -> None:
+    """Set the storage backend used by the module-level cache functions.
+
+    Affects `get_cached_pathways`, `cache_pathways`, `clear_cache` and
+    `get_cache_info`, and therefore the pathway caching done by the ORA
+    functions. Only file backends make sense here (sqlite, json, csv,
+    parquet, arrow).
+
+    Args:
+        backend: Storage backend name or enum member.
+
+    Example:
+        >>> set_default_backend("parquet")
+        >>> result = ora_go(genes)  # GO terms now cached as Parquet
+    """
+    global _default_backend, _default_manager
+    if isinstance(backend, str):
+        backend = StorageBackend(backend.lower())
+    if backend in (StorageBackend.MYSQL, StorageBackend.POSTGRESQL):
+        raise ValueError(
+            f"{backend.value} needs db_config; create a PathwayDBManager instead"
+        )
+    _default_backend = backend
+    _default_manager = None
+
+
 def get_cached_pathways(
     cache_key: str,
     cache_dir: Optional[str] = None,
     max_age: Optional[float] = None,
-) -> Optional[Dict[str, Tuple[str, FrozenSet[str]]]]:
+    build: Optional[Callable[[Dict[str, Tuple[str, FrozenSet[str]]]], Any]] = None,
+    kind: str = "tuples",
+    options: Tuple[Hashable, ...] = (),
+) -> Optional[Any]:
     """Get cached pathway data (backwards-compatible function).
 
+    Results are served from the in-process memory tier when possible; the
+    backing store is only read on a memory miss.
+
     Args:
         cache_key: Unique key for the cached data (e.g., "kegg_hsa").
         cache_dir: Directory for cache files.
         max_age: Maximum age in seconds (not used with new system).
+        build: Optional callable turning the stored tuples into a ready-built
+            object (e.g. a dict of Pathway objects). Its result is what gets
+            memoized and returned.
+        kind: Name of the cached form, used to keep different ``build``
+            results for the same cache_key apart.
+        options: Extra hashable parameters the ``build`` result depends on.
 
     Returns:
-        Cached pathway data or None if not found/expired.
+        Cached pathway data (or the ``build`` result) or None if not
+        found/expired. The returned object is shared and must not be mutated.
     """
-    if cache_dir:
-        mgr = PathwayDBManager(storage_path=cache_dir)
-    else:
-        mgr = _get_default_manager()
+    mgr = _get_manager(cache_dir)
+    key = (mgr._memory_namespace(), cache_key, kind, options)
+
+    value = _memory_cache.get(key)
+    if value is not None:
+        return value
+
+    data = mgr.load_pathways(cache_key, use_cache=True)
+    if data is None:
+        return None
+
+    value = build(data) if build is not None else data
+    _memory_cache.put(key, value, expires_at=mgr.get_expiry(cache_key))
+    return value
+
+
+def get_cached_gene_set_index(
+    cache_key: str,
+    cache_dir: Optional[str] = None,
+    database: Optional[str] = None,
+    min_size: int = 0,
+    max_size: Optional[int] = None,
+) -> Optional["GeneSetIndex"]:
+    """Build a `GeneSetIndex` straight from a columnar (Parquet/Arrow) store.
+
+    Other backends return None, so callers fall back to loading the
+    pathway dict through `get_cached_pathways`.
+
+    Args:
+        cache_key: Unique key for the cached data (e.g., "kegg_hsa").
+        cache_dir: Directory for cache files.
+        database: Database name for the index. Defaults to the stored one.
+        min_size: Minimum genes per pathway.
+        max_size: Maximum genes per pathway (None = no limit).
+
+    Returns:
+        GeneSetIndex, or None if the store is not columnar or the data is
+        missing/expired.
+    """
+    mgr = _get_manager(cache_dir)
+    if not mgr._is_columnar_backend():
+        return None
+    return mgr.load_gene_set_index(
+        cache_key, use_cache=True, database=database, min_size=min_size, max_size=max_size
+    )
+
+
+def get_memoized(
+    cache_key: str,
+    kind: str,
+    options: Tuple[Hashable, ...] = (),
+    cache_dir: Optional[str] = None,
+) -> Optional[Any]:
+    """Look up an object derived from ``cache_key`` in the memory tier only.
+
+    Args:
+        cache_key: Backing store key the object was built from.
+        kind: Name of the cached form (e.g. "index").
+        options: Extra hashable parameters the object depends on.
+        cache_dir: Directory for cache files.
+
+    Returns:
+        The cached object or None.
+    """
+    mgr = _get_manager(cache_dir)
+    return _memory_cache.get((mgr._memory_namespace(), cache_key, kind, options))
+
+
+def memoize(
+    cache_key: str,
+    kind: str,
+    value: Any,
+    options: Tuple[Hashable, ...] = (),
+    cache_dir: Optional[str] = None,
+) -> None:
+    """Store an object derived from ``cache_key`` in the memory tier.
+
+    The entry shares the backing store's expiry for ``cache_key`` and is
+    invalidated when that key is saved or cleared.
+
+    Args:
+        cache_key: Backing store key the object was built from.
+        kind: Name of the cached form (e.g. "index").
+        value: Object to cache.
+        options: Extra hashable parameters the object depends on.
+        cache_dir: Directory for cache files.
+    """
+    mgr = _get_manager(cache_dir)
+    _memory_cache.put((mgr._memory_namespace(), cache_key, kind, options), value)
+
+
+def get_memory_cache() -> PathwayMemoryCache:
+    """Return the process-wide pathway memory cache."""
+    return _memory_cache
+
+
+def configure_memory_cache(
+    max_entries: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+) -> None:
+    """Set the entry and byte limits of the pathway memory cache.
 
-    return mgr.load_pathways(cache_key, use_cache=True)
+    Args:
+        max_entries: Maximum number of cached libraries.
+        max_bytes: Approximate byte budget across cached libraries.
+    """
+    _memory_cache.configure(max_entries=max_entries, max_bytes=max_bytes)
+
+
+def get_memory_cache_info() -> Dict[str, Any]:
+    """Return hit/miss counters and usage of the pathway memory cache."""
+    return _memory_cache.stats()
+
+
+def clear_memory_cache(kind: Optional[str] = None) -> int:
+    """Drop in-process cached pathway libraries.
+
+    Args:
+        kind: Only drop entries of this kind (None = all).
+
+    Returns:
+        int: Number of entries removed.
+    """
+    if kind is None:
+        removed = len(_memory_cache)
+        _memory_cache.clear()
+        return removed
+    return _memory_cache.invalidate(kind=kind)
 
 
 def cache_pathways(
@@ -1329,10 +2163,7 @@ def cache_pathways(
         True if caching succeeded.
     """
     try:
-        if cache_dir:
-            mgr = PathwayDBManager(storage_path=cache_dir)
-        else:
-            mgr = _get_default_manager()
+        mgr = _get_manager(cache_dir)
 
         # Extract database name from cache_key (e.g., "kegg_hsa" -> "KEGG")
         database = cache_key.split("_")[0].upper() if "_" in cache_key else "custom"
@@ -1364,10 +2195,7 @@ def clear_cache(
         True if clearing succeeded.
     """
     try:
-        if cache_dir:
-            mgr = PathwayDBManager(storage_path=cache_dir)
-        else:
-            mgr = _get_default_manager()
+        mgr = _get_manager(cache_dir)
 
         mgr.clear_cache(cache_key)
         return True
@@ -1391,10 +2219,7 @@ def get_cache_info(
             - entries: List of cache entries with metadata
             - storage_path, db_name, total_size_bytes, etc.
     """
-    if cache_dir:
-        mgr = PathwayDBManager(storage_path=cache_dir)
-    else:
-        mgr = _get_default_manager()
+    mgr = _get_manager(cache_dir)
 
     info = mgr.get_storage_info()
 
@@ -1423,6 +2248,10 @@ def get_cache_info(
         except Exception:
             pass  # Return empty entries on error
 
+    if mgr._is_columnar_backend():
+        for row in mgr._read_entries_columnar():
+            entries.append(row)
+
     info["entries"] = entries
 
     return info
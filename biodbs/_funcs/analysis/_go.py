@@ -0,0 +1,292 @@
+"""Incremental GO gene-set construction from streamed annotation files.
+
+This module provides `GOAnnotationAggregator`, which turns GAF or GPAD
+annotations into GO term -> gene sets one chunk at a time. Each chunk is
+filtered (negated annotations, evidence codes, aspect) and grouped with
+polars, and only the resulting term -> gene membership is kept, so memory is
+bounded by the size of the gene-set library rather than by the number of
+annotation lines. Annotations can optionally be propagated to ancestor terms
+(the GO true-path rule) from a precomputed ancestor table.
+
+Example:
+    >>> from biodbs._funcs.analysis._go import GOAnnotationAggregator
+    >>> from biodbs.data.QuickGO import iter_annotation_file
+    >>>
+    >>> aggregator = GOAnnotationAggregator(aspect="biological_process")
+    >>> aggregator.update(iter_annotation_file("goa_human.gaf.gz"))
+    >>> gene_sets = aggregator.gene_sets(min_term_size=5, max_term_size=500)
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from biodbs.data._base import columnar_frame, read_tsv
+
+if TYPE_CHECKING:
+    import polars as pl
+
+    from biodbs.data.QuickGO.data import QuickGOFetchedData
+
+
+# GAF aspect column codes per GO namespace
+GAF_ASPECT_CODES = {
+    "biological_process": "P",
+    "molecular_function": "F",
+    "cellular_component": "C",
+}
+
+# Experimental and curated evidence (excludes IEA), as used by ora_go
+DEFAULT_GO_EVIDENCE = ["IDA", "IPI", "IMP", "IGI", "IEP", "TAS", "IC"]
+
+# Default ECO class for each GO evidence code (GO's gaf-eco-mapping), used
+# to match GO codes against the ECO IDs in GPAD evidence columns
+GO_EVIDENCE_TO_ECO = {
+    "EXP": "ECO:0000269",
+    "IDA": "ECO:0000314",
+    "IPI": "ECO:0000353",
+    "IMP": "ECO:0000315",
+    "IGI": "ECO:0000316",
+    "IEP": "ECO:0000270",
+    "HTP": "ECO:0006056",
+    "HDA": "ECO:0007005",
+    "HMP": "ECO:0007001",
+    "HGI": "ECO:0007003",
+    "HEP": "ECO:0007007",
+    "IBA": "ECO:0000318",
+    "IBD": "ECO:0000319",
+    "IKR": "ECO:0000320",
+    "IRD": "ECO:0000321",
+    "ISS": "ECO:0000250",
+    "ISO": "ECO:0000266",
+    "ISA": "ECO:0000247",
+    "ISM": "ECO:0000255",
+    "IGC": "ECO:0000317",
+    "RCA": "ECO:0000245",
+    "TAS": "ECO:0000304",
+    "NAS": "ECO:0000303",
+    "IC": "ECO:0000305",
+    "ND": "ECO:0000307",
+    "IEA": "ECO:0000501",
+}
+
+# downloadLimit for whole-species downloads; QuickGO stops at 10000
+# annotations when no limit is given
+QUICKGO_DOWNLOAD_LIMIT = 2_000_000
+
+
+class GOAnnotationAggregator:
+    """Accumulates GO term -> gene membership from annotation chunks.
+
+    Chunks may be GAF or GPAD (``QuickGOFetchedData`` from a download or
+    `iter_annotation_file`, or polars frames with the same columns). Negated
+    annotations (``NOT`` qualifier in GAF, ``negation`` in GPAD) are always
+    dropped. Gene IDs are stored without their database prefix
+    (``UniProtKB:P04637`` -> ``P04637``).
+
+    Attributes:
+        aspect: GO namespace to keep, or ``"all"``.
+        evidence_codes: Evidence codes to keep; None keeps every code.
+        annotation_count: Number of annotations kept so far.
+    """
+
+    def __init__(
+        self,
+        aspect: str = "all",
+        evidence_codes: Optional[Iterable[str]] = None,
+    ):
+        """Initialize an empty aggregator.
+
+        Args:
+            aspect: ``"biological_process"``, ``"molecular_function"``,
+                ``"cellular_component"`` or ``"all"``. Only GAF carries an
+                aspect column; GPAD chunks can only be aggregated with
+                ``"all"``.
+            evidence_codes: Evidence codes to keep. GAF is matched on GO
+                codes such as ``"IDA"``. For GPAD, GO codes are translated to
+                their default ECO class (`GO_EVIDENCE_TO_ECO`) and ECO IDs are
+                matched as given; annotations using a more specific ECO class
+                need that ID listed explicitly. None keeps every code.
+
+        Raises:
+            ValueError: If ``aspect`` is not a GO namespace or ``"all"``.
+        """
+        if aspect != "all" and aspect not in GAF_ASPECT_CODES:
+            raise ValueError(
+                f"Unknown GO aspect '{aspect}'. "
+                f"Valid: {sorted(GAF_ASPECT_CODES)} or 'all'"
+            )
+        self.aspect = aspect
+        self.evidence_codes = list(evidence_codes) if evidence_codes else None
+        self._eco_codes = (
+            [GO_EVIDENCE_TO_ECO.get(code, code) for code in self.evidence_codes]
+            if self.evidence_codes is not None else None
+        )
+        self.annotation_count = 0
+        self._terms: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def __repr__(self) -> str:
+        return (
+            f"<GOAnnotationAggregator aspect='{self.aspect}' "
+            f"terms={len(self._terms)} annotations={self.annotation_count}>"
+        )
+
+    def add(self, chunk: Union["QuickGOFetchedData", "pl.DataFrame"]) -> int:
+        """Filter one chunk of annotations and merge it into the gene sets.
+
+        Args:
+            chunk: GAF or GPAD annotations.
+
+        Returns:
+            Number of annotations from the chunk that passed the filters.
+
+        Raises:
+            ValueError: If the chunk is neither GAF nor GPAD, or is GPAD while
+                an aspect filter is set.
+        """
+        import polars as pl
+
+        frame = chunk if isinstance(chunk, pl.DataFrame) else _chunk_frame(chunk)
+        if frame.is_empty():
+            return 0
+
+        if "aspect" in frame.columns:
+            keep = ~pl.col("qualifier").fill_null("").str.contains("NOT", literal=True)
+            if self.aspect != "all":
+                keep &= pl.col("aspect") == GAF_ASPECT_CODES[self.aspect]
+            evidence_codes = self.evidence_codes
+        elif "negation" in frame.columns:
+            if self.aspect != "all":
+                raise ValueError(
+                    "GPAD annotations carry no aspect column; "
+                    "use GAF to filter by aspect"
+                )
+            keep = pl.col("negation").fill_null("") != "NOT"
+            evidence_codes = self._eco_codes
+        else:
+            raise ValueError(
+                f"Expected GAF or GPAD columns, got {frame.columns}"
+            )
+        if evidence_codes is not None:
+            keep &= pl.col("evidence_code").is_in(evidence_codes)
+
+        kept = frame.filter(
+            keep
+            & pl.col("go_id").is_not_null() & (pl.col("go_id") != "")
+            & pl.col("db_object_id").is_not_null() & (pl.col("db_object_id") != "")
+        )
+        grouped = kept.group_by("go_id").agg(
+            pl.col("db_object_id").str.split(":").list.last().unique()
+        )
+        terms = self._terms
+        for go_id, genes in grouped.iter_rows():
+            members = terms.get(go_id)
+            if members is None:
+                terms[go_id] = set(genes)
+            else:
+                members.update(genes)
+        self.annotation_count += kept.height
+        return kept.height
+
+    def update(
+        self, chunks: Iterable[Union["QuickGOFetchedData", "pl.DataFrame"]]
+    ) -> "GOAnnotationAggregator":
+        """Add every chunk of an annotation stream; returns ``self``."""
+        for chunk in chunks:
+            self.add(chunk)
+        return self
+
+    def gene_sets(
+        self,
+        ancestors: Optional[Mapping[str, Iterable[str]]] = None,
+        min_term_size: int = 0,
+        max_term_size: Optional[int] = None,
+    ) -> Dict[str, FrozenSet[str]]:
+        """Return the aggregated GO term -> gene sets.
+
+        Args:
+            ancestors: Optional table mapping each GO term to all of its
+                ancestors (see `load_go_ancestors`). Genes annotated to a
+                term are then also counted for every ancestor (true-path
+                rule).
+            min_term_size: Minimum genes per term.
+            max_term_size: Maximum genes per term; None means no limit.
+
+        Returns:
+            Dict mapping GO ID -> frozenset of gene IDs.
+        """
+        terms: Mapping[str, Set[str]] = self._terms
+        if ancestors:
+            propagated = {go_id: set(genes) for go_id, genes in terms.items()}
+            for go_id, genes in terms.items():
+                for ancestor in ancestors.get(go_id, ()):
+                    members = propagated.get(ancestor)
+                    if members is None:
+                        propagated[ancestor] = set(genes)
+                    else:
+                        members.update(genes)
+            terms = propagated
+        return {
+            go_id: frozenset(genes)
+            for go_id, genes in terms.items()
+            if min_term_size <= len(genes)
+            and (max_term_size is None or len(genes) <= max_term_size)
+        }
+
+
+def _chunk_frame(chunk: "QuickGOFetchedData") -> "pl.DataFrame":
+    frame = columnar_frame(chunk.results)
+    if frame is None:
+        frame = chunk.as_dataframe(engine="polars")
+    return frame
+
+
+def load_go_ancestors(
+    source: Union[str, Path, "pl.DataFrame"],
+) -> Dict[str, Tuple[str, ...]]:
+    """Load a precomputed GO ancestor table for true-path propagation.
+
+    Args:
+        source: Two-column TSV file (``term<TAB>ancestor``, one pair per
+            line, ``#`` comments allowed) or a polars frame whose first two
+            columns are the term and the ancestor.
+
+    Returns:
+        Dict mapping GO term -> tuple of its ancestor terms.
+
+    Example:
+        >>> ancestors = load_go_ancestors("go_ancestors.tsv")
+        >>> ancestors["GO:0006915"][:2]
+        ('GO:0012501', 'GO:0008219')
+    """
+    import polars as pl
+
+    if isinstance(source, pl.DataFrame):
+        frame = source.select(source.columns[:2])
+        frame.columns = ["term", "ancestor"]
+    else:
+        frame = read_tsv(
+            Path(source).read_bytes(), ["term", "ancestor"],
+            comment_prefix="#", drop_extra=True,
+        )
+    grouped = (
+        frame.drop_nulls()
+        .filter(pl.col("term") != pl.col("ancestor"))
+        .group_by("term", maintain_order=True)
+        .agg(pl.col("ancestor").unique(maintain_order=True))
+    )
+    return {term: tuple(found) for term, found in grouped.iter_rows()}
@@ -0,0 +1,305 @@
+"""Compiled gene-set index for repeated over-representation analysis.
+
+This module provides `GeneSetIndex`, a read-only view of a gene-set library
+in which gene IDs are interned to integer columns and term membership is
+stored as a ``scipy.sparse`` CSR matrix (terms x genes). Building the index
+once and reusing it lets every ORA query compute all overlap counts with a
+single sparse mat-vec instead of per-term set intersections.
+
+Example:
+    >>> from biodbs._funcs.analysis._index import GeneSetIndex
+    >>>
+    >>> index = GeneSetIndex.from_gene_sets({
+    ...     "hsa04110": ("Cell cycle", {"TP53", "BRCA1", "CDK1"}),
+    ...     "hsa04115": ("p53 signaling", {"TP53", "MDM2", "CDKN1A"}),
+    ... }, database="KEGG")
+    >>> index
+    <GeneSetIndex database='KEGG' terms=2 genes=5>
+    >>> index.overlap_counts(index.query_mask({"TP53", "MDM2"}))
+    array([1, 2])
+"""
+
+from __future__ import annotations
+
+import threading
+from itertools import chain
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+    import polars as pl
+    from scipy import sparse
+
+    from biodbs._funcs.analysis.ora import Pathway
+
+
+class GeneSetIndex:
+    """Sparse membership index over a gene-set library.
+
+    Attributes:
+        term_ids: Term identifiers in row order.
+        term_names: Term names in row order.
+        genes: NumPy object array mapping column -> gene ID.
+        membership: CSR matrix of shape (n_terms, n_genes) with 1 where the
+            gene belongs to the term.
+        database: Source database name for result annotation.
+    """
+
+    # Number of per-background term-size vectors kept per index
+    MAX_CACHED_BACKGROUNDS = 8
+
+    def __init__(
+        self,
+        term_ids: List[str],
+        term_names: List[str],
+        genes: "np.ndarray",
+        membership: "sparse.csr_matrix",
+        database: str = "custom",
+    ):
+        self.term_ids = term_ids
+        self.term_names = term_names
+        self.genes = genes
+        self.membership = membership
+        self.database = database
+        self._gene_to_col: Dict[str, int] = {g: i for i, g in enumerate(genes.tolist())}
+        self._term_sizes: Dict[FrozenSet[str], "np.ndarray"] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_gene_sets(
+        cls,
+        gene_sets: Union[Dict[str, Tuple[str, Set[str]]], Dict[str, "Pathway"]],
+        database: str = "custom",
+    ) -> "GeneSetIndex":
+        """Build an index from a gene-set library.
+
+        Args:
+            gene_sets: Dict mapping set_id -> (set_name, set of genes) or
+                Pathway objects.
+            database: Source database name.
+
+        Returns:
+            GeneSetIndex with one row per gene set, in input order.
+        """
+        import numpy as np
+        from scipy import sparse
+
+        term_ids: List[str] = []
+        term_names: List[str] = []
+        members: List[Iterable[str]] = []
+
+        for set_id, data in gene_sets.items():
+            if hasattr(data, "name") and hasattr(data, "genes"):
+                name, genes = data.name, data.genes
+            else:
+                name, genes = data
+            term_ids.append(set_id)
+            term_names.append(name)
+            members.append(genes if isinstance(genes, (set, frozenset)) else set(genes))
+
+        gene_list = list(dict.fromkeys(chain.from_iterable(members)))
+        gene_to_col = {g: i for i, g in enumerate(gene_list)}
+
+        sizes = np.fromiter((len(m) for m in members), dtype=np.int64, count=len(members))
+        indptr = np.zeros(len(members) + 1, dtype=np.int64)
+        np.cumsum(sizes, out=indptr[1:])
+        indices = np.fromiter(
+            map(gene_to_col.__getitem__, chain.from_iterable(members)),
+            dtype=np.int32,
+            count=int(indptr[-1]),
+        )
+        membership = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.int32), indices, indptr),
+            shape=(len(members), len(gene_list)),
+        )
+
+        genes = np.empty(len(gene_list), dtype=object)
+        genes[:] = gene_list
+
+        return cls(term_ids, term_names, genes, membership, database=database)
+
+    @classmethod
+    def from_frame(cls, frame: "pl.DataFrame", database: str = "custom") -> "GeneSetIndex":
+        """Build an index from a polars frame with one row per gene set.
+
+        Genes are encoded to columns with vectorized polars operations, so no
+        per-gene Python objects are created.
+
+        Args:
+            frame: DataFrame with ``id``, ``name`` and ``genes`` (list of str)
+                columns. Each gene list must be free of duplicates.
+            database: Source database name.
+
+        Returns:
+            GeneSetIndex with one row per frame row, in frame order.
+        """
+        import numpy as np
+        import polars as pl
+        from scipy import sparse
+
+        flat = frame["genes"].explode().drop_nulls()
+        gene_list = flat.unique(maintain_order=True)
+        indices = flat.cast(pl.Enum(gene_list)).to_physical().to_numpy().astype(np.int32)
+
+        sizes = frame["genes"].list.drop_nulls().list.len().to_numpy().astype(np.int64)
+        indptr = np.zeros(len(frame) + 1, dtype=np.int64)
+        np.cumsum(sizes, out=indptr[1:])
+        membership = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.int32), indices, indptr),
+            shape=(len(frame), len(gene_list)),
+        )
+
+        genes = np.empty(len(gene_list), dtype=object)
+        genes[:] = gene_list.to_list()
+
+        return cls(
+            frame["id"].to_list(), frame["name"].to_list(), genes, membership,
+            database=database,
+        )
+
+    def __getstate__(self) -> Dict[str, object]:
+        # Locks cannot be pickled; per-background caches are rebuilt lazily
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_term_sizes"] = {}
+        return state
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.term_ids)
+
+    def __contains__(self, gene: str) -> bool:
+        return gene in self._gene_to_col
+
+    def __repr__(self) -> str:
+        return (
+            f"<GeneSetIndex database='{self.database}' "
+            f"terms={len(self.term_ids)} genes={len(self.genes)}>"
+        )
+
+    @property
+    def n_genes(self) -> int:
+        """Number of distinct genes across all terms."""
+        return len(self.genes)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the membership matrix and gene table."""
+        import sys
+
+        m = self.membership
+        return (
+            m.data.nbytes + m.indices.nbytes + m.indptr.nbytes
+            + self.genes.nbytes + sum(map(sys.getsizeof, self._gene_to_col))
+        )
+
+    def gene_universe(self) -> Set[str]:
+        """Return the union of all genes in the library."""
+        return set(self._gene_to_col)
+
+    def query_mask(self, genes: Iterable[str]) -> "np.ndarray":
+        """Build a 0/1 indicator vector over the index columns.
+
+        Genes that are not in the library are ignored.
+        """
+        import numpy as np
+
+        cols = [self._gene_to_col[g] for g in genes if g in self._gene_to_col]
+        mask = np.zeros(len(self.genes), dtype=np.int32)
+        mask[cols] = 1
+        return mask
+
+    def term_sizes(self, background: Optional[Set[str]] = None) -> "np.ndarray":
+        """Return the number of genes per term that fall inside ``background``.
+
+        With ``background=None`` this is simply the size of each term.
+        Results for explicit backgrounds are cached on the index.
+
+        Args:
+            background: Gene universe to restrict terms to.
+
+        Returns:
+            Integer array of term sizes in row order.
+        """
+        import numpy as np
+
+        if background is None:
+            return np.diff(self.membership.indptr).astype(np.int64)
+
+        key = frozenset(background)
+        with self._lock:
+            cached = self._term_sizes.get(key)
+        if cached is not None:
+            return cached
+
+        sizes = self.overlap_counts(self.query_mask(key))
+
+        with self._lock:
+            if len(self._term_sizes) >= self.MAX_CACHED_BACKGROUNDS:
+                self._term_sizes.pop(next(iter(self._term_sizes)))
+            self._term_sizes[key] = sizes
+        return sizes
+
+    def overlap_counts(self, mask: "np.ndarray") -> "np.ndarray":
+        """Count query genes per term with a single sparse mat-vec.
+
+        Args:
+            mask: Indicator vector from `query_mask`.
+
+        Returns:
+            Integer array of overlap counts in row order.
+        """
+        import numpy as np
+
+        return np.asarray(self.membership @ mask, dtype=np.int64)
+
+    def query_matrix(self, gene_lists: List[Iterable[str]]) -> "sparse.csr_matrix":
+        """Build a (n_lists x n_genes) 0/1 indicator matrix for many queries.
+
+        Genes that are not in the library are ignored.
+        """
+        import numpy as np
+        from scipy import sparse
+
+        cols = [
+            sorted({self._gene_to_col[g] for g in genes if g in self._gene_to_col})
+            for genes in gene_lists
+        ]
+        indptr = np.zeros(len(cols) + 1, dtype=np.int64)
+        np.cumsum([len(c) for c in cols], out=indptr[1:])
+        indices = np.fromiter(chain.from_iterable(cols), dtype=np.int32, count=int(indptr[-1]))
+        return sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.int32), indices, indptr),
+            shape=(len(cols), len(self.genes)),
+        )
+
+    def overlap_genes(self, rows: Iterable[int], mask: "np.ndarray") -> List[List[str]]:
+        """Materialize overlap gene lists for the selected term rows only.
+
+        Args:
+            rows: Row positions of terms to materialize.
+            mask: Indicator vector from `query_mask`.
+
+        Returns:
+            One list of gene IDs per requested row.
+        """
+        indptr = self.membership.indptr
+        indices = self.membership.indices
+        overlaps = []
+        for row in rows:
+            cols = indices[indptr[row]:indptr[row + 1]]
+            overlaps.append(self.genes[cols[mask[cols] > 0]].tolist())
+        return overlaps
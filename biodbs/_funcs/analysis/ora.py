@@ -29,17 +29,24 @@ Example:
 
 from __future__ import annotations
 
+import hashlib
 import math
+import re
 import warnings
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     FrozenSet,
+    Iterable,
     List,
     Literal,
+    Mapping,
     Optional,
     Set,
     Tuple,
@@ -47,14 +54,31 @@ from typing import (
 )
 
 # Import fetchers and utilities at module level
-from biodbs._funcs.analysis._cache import cache_pathways, get_cached_pathways
+from biodbs._funcs.analysis._cache import (
+    _get_manager,
+    cache_pathways,
+    clear_memory_cache,
+    get_cached_gene_set_index,
+    get_cached_pathways,
+    get_memoized,
+    memoize,
+)
+from biodbs._funcs.analysis._go import (
+    DEFAULT_GO_EVIDENCE,
+    QUICKGO_DOWNLOAD_LIMIT,
+    GOAnnotationAggregator,
+)
+from biodbs._funcs.analysis._index import GeneSetIndex
 from biodbs._funcs.translate import translate_gene_ids
 from biodbs.fetch.EnrichR import EnrichR_Fetcher
 from biodbs.fetch.KEGG.funcs import kegg_link, kegg_list
-from biodbs.fetch.QuickGO.funcs import quickgo_search_annotations_all
+from biodbs.data.QuickGO.data import _annotation_file_format, iter_annotation_file
+from biodbs.fetch.QuickGO import QuickGO_Fetcher
+from biodbs.fetch.QuickGO.funcs import quickgo_get_terms, quickgo_iter_annotations
 from biodbs.fetch.Reactome import Reactome_Fetcher
 
 if TYPE_CHECKING:
+    import numpy as np
     import pandas as pd
 
 
@@ -424,70 +448,242 @@ def hypergeometric_test(
     return min(1.0, p_value)
 
 
+def _normalize_correction_method(
+    method: Union[str, CorrectionMethod],
+) -> CorrectionMethod:
+    """Resolve a correction method name or alias to a CorrectionMethod."""
+    if isinstance(method, CorrectionMethod):
+        return method
+    method = method.lower()
+    method_map = {
+        "bonferroni": CorrectionMethod.BONFERRONI,
+        "bh": CorrectionMethod.BH,
+        "benjamini_hochberg": CorrectionMethod.BH,
+        "fdr_bh": CorrectionMethod.BH,
+        "by": CorrectionMethod.BY,
+        "benjamini_yekutieli": CorrectionMethod.BY,
+        "fdr_by": CorrectionMethod.BY,
+        "holm": CorrectionMethod.HOLM,
+        "none": CorrectionMethod.NONE,
+    }
+    return method_map.get(method, CorrectionMethod.BH)
+
+
 def multiple_test_correction(
     p_values: List[float],
     method: Union[str, CorrectionMethod] = CorrectionMethod.BH,
 ) -> List[float]:
     """Apply multiple testing correction to p-values."""
-    if isinstance(method, str):
-        method = method.lower()
-        method_map = {
-            "bonferroni": CorrectionMethod.BONFERRONI,
-            "bh": CorrectionMethod.BH,
-            "benjamini_hochberg": CorrectionMethod.BH,
-            "fdr_bh": CorrectionMethod.BH,
-            "by": CorrectionMethod.BY,
-            "benjamini_yekutieli": CorrectionMethod.BY,
-            "fdr_by": CorrectionMethod.BY,
-            "holm": CorrectionMethod.HOLM,
-            "none": CorrectionMethod.NONE,
-        }
-        method = method_map.get(method, CorrectionMethod.BH)
-
-    n = len(p_values)
-    if n == 0:
+    if len(p_values) == 0:
         return []
+    return multiple_test_correction_array(p_values, method).tolist()
 
-    if method == CorrectionMethod.NONE:
-        return list(p_values)
+
+# =============================================================================
+# Batch Statistical Functions
+# =============================================================================
+
+
+def _log_factorial_table(max_n: int) -> "np.ndarray":
+    """Return log(i!) for i in 0..max_n."""
+    import numpy as np
+
+    table = np.zeros(max_n + 1, dtype=np.float64)
+    if max_n > 0:
+        np.cumsum(np.log(np.arange(1, max_n + 1, dtype=np.float64)), out=table[1:])
+    return table
+
+
+def _hypergeom_sf_numpy(
+    k: "np.ndarray",
+    K: "np.ndarray",
+    n: "np.ndarray",
+    N: "np.ndarray",
+) -> "np.ndarray":
+    """Log-space NumPy kernel for P(X >= k), used when SciPy is unavailable.
+
+    Sums the probability mass from ``k`` to ``min(n, K)`` for every term at
+    once, stepping the upper tail in lock-step across all terms.
+    """
+    import numpy as np
+
+    log_fact = _log_factorial_table(int(N.max()) if N.size else 0)
+
+    def log_comb(a, b):
+        return log_fact[a] - log_fact[b] - log_fact[a - b]
+
+    upper = np.minimum(n, K)
+    log_denom = log_comb(N, n)
+    log_sf = np.full(k.shape, -np.inf)
+
+    span = int((upper - k).max()) if k.size else -1
+    for step in range(span + 1):
+        i = k + step
+        valid = (i <= upper) & (n - i <= N - K)
+        if not valid.any():
+            continue
+        iv = np.where(valid, i, 0)
+        log_p = np.where(
+            valid,
+            log_comb(K, np.minimum(iv, K))
+            + log_comb(N - K, np.clip(n - iv, 0, N - K))
+            - log_denom,
+            -np.inf,
+        )
+        log_sf = np.logaddexp(log_sf, log_p)
+
+    return np.minimum(1.0, np.exp(log_sf))
+
+
+def hypergeometric_test_batch(
+    k: Any,
+    K: Any,
+    n: Any,
+    N: Any,
+) -> "np.ndarray":
+    """Vectorized hypergeometric test for many terms at once.
+
+    Array counterpart of `hypergeometric_test`. All arguments are broadcast
+    against each other, so ``n`` and ``N`` may be scalars shared by every term.
+    P-values are computed in a single ``scipy.stats.hypergeom.sf`` call, or by
+    a log-space NumPy kernel when SciPy is not installed.
+
+    Args:
+        k: Overlap counts (genes in both query and term).
+        K: Term sizes.
+        n: Query sizes.
+        N: Background sizes.
+
+    Returns:
+        NumPy array of P(X >= k) with the broadcast shape of the inputs.
+
+    Example:
+        ```python
+        p = hypergeometric_test_batch([5, 2], [50, 40], 100, 20000)
+        ```
+    """
+    import numpy as np
+
+    k, K, n, N = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.int64) for x in (k, K, n, N))
+    )
+
+    if (k < 0).any() or (K < 0).any() or (n < 0).any() or (N < 0).any():
+        raise ValueError("All parameters must be non-negative")
+    if (k > np.minimum(n, K)).any():
+        raise ValueError("k cannot exceed min(n, K)")
+    if (K > N).any() or (n > N).any():
+        raise ValueError("K and n cannot exceed N")
+
+    try:
+        from scipy import stats
+
+        return np.asarray(stats.hypergeom.sf(k - 1, N, K, n), dtype=np.float64)
+    except ImportError:
+        pass
+
+    return _hypergeom_sf_numpy(k, K, n, N)
+
+
+def multiple_test_correction_array(
+    p_values: Any,
+    method: Union[str, CorrectionMethod] = CorrectionMethod.BH,
+) -> "np.ndarray":
+    """Apply multiple testing correction to an array of p-values.
+
+    NumPy implementation backing `multiple_test_correction`; the sort and
+    cumulative min/max steps run as array operations. A 2-D array is
+    corrected row by row in one pass, with NaN marking untested entries,
+    which lets many query lists of different lengths be corrected at once.
+
+    Args:
+        p_values: 1-D or 2-D array of raw p-values. NaN entries are ignored
+            and stay NaN in the output.
+        method: Correction method or alias (e.g. "bh", "fdr_by", "holm").
+
+    Returns:
+        NumPy array of adjusted p-values with the input shape and order.
+    """
+    import numpy as np
+
+    method = _normalize_correction_method(method)
+    p = np.asarray(p_values, dtype=np.float64)
+
+    if p.size == 0 or method == CorrectionMethod.NONE:
+        return p.copy()
+
+    # Number of tests per row (NaN entries are not tests)
+    m = np.sum(~np.isnan(p), axis=-1, keepdims=True)
 
     if method == CorrectionMethod.BONFERRONI:
-        return [min(1.0, p * n) for p in p_values]
+        return np.minimum(1.0, p * m)
+
+    # NaN sorts last, so untested entries never affect the running min/max
+    order = np.argsort(p, axis=-1, kind="stable")
+    ranked = np.take_along_axis(p, order, axis=-1)
+    ranks = np.arange(1, p.shape[-1] + 1, dtype=np.float64)
 
     if method == CorrectionMethod.HOLM:
-        indexed = sorted(enumerate(p_values), key=lambda x: x[1])
-        adjusted = [0.0] * n
-        cummax = 0.0
-        for rank, (orig_idx, p) in enumerate(indexed):
-            adj_p = p * (n - rank)
-            cummax = max(cummax, adj_p)
-            adjusted[orig_idx] = min(1.0, cummax)
-        return adjusted
-
-    if method == CorrectionMethod.BH:
-        indexed = sorted(enumerate(p_values), key=lambda x: x[1])
-        adjusted = [0.0] * n
-        cummin = 1.0
-        for rank in range(n - 1, -1, -1):
-            orig_idx, p = indexed[rank]
-            adj_p = p * n / (rank + 1)
-            cummin = min(cummin, adj_p)
-            adjusted[orig_idx] = min(1.0, cummin)
-        return adjusted
-
-    if method == CorrectionMethod.BY:
-        c_n = sum(1.0 / i for i in range(1, n + 1))
-        indexed = sorted(enumerate(p_values), key=lambda x: x[1])
-        adjusted = [0.0] * n
-        cummin = 1.0
-        for rank in range(n - 1, -1, -1):
-            orig_idx, p = indexed[rank]
-            adj_p = p * n * c_n / (rank + 1)
-            cummin = min(cummin, adj_p)
-            adjusted[orig_idx] = min(1.0, cummin)
-        return adjusted
-
-    raise ValueError(f"Unknown correction method: {method}")
+        adj = np.fmax.accumulate(ranked * (m - ranks + 1), axis=-1)
+    elif method in (CorrectionMethod.BH, CorrectionMethod.BY):
+        scale = m.astype(np.float64)
+        if method == CorrectionMethod.BY:
+            harmonic = np.concatenate(([0.0], np.cumsum(1.0 / ranks)))
+            scale = scale * harmonic[m]
+        adj = ranked * scale / ranks
+        adj = np.flip(np.fmin.accumulate(np.flip(adj, axis=-1), axis=-1), axis=-1)
+    else:
+        raise ValueError(f"Unknown correction method: {method}")
+
+    adj = np.where(np.isnan(ranked), np.nan, np.minimum(1.0, adj))
+    adjusted = np.empty_like(adj)
+    np.put_along_axis(adjusted, order, adj, axis=-1)
+    return adjusted
+
+
+def _ora_statistics(
+    k: "np.ndarray",
+    K: "np.ndarray",
+    n: Any,
+    N: Any,
+    correction_method: Union[str, CorrectionMethod],
+) -> Dict[str, "np.ndarray"]:
+    """Score a batch of terms and return the result columns.
+
+    Returns:
+        Dict with ``p_value``, ``adjusted_p_value`` and ``fold_enrichment``
+        arrays aligned with ``k`` and ``K``.
+    """
+    p_values = hypergeometric_test_batch(k, K, n, N)
+    return {
+        "p_value": p_values,
+        "adjusted_p_value": multiple_test_correction_array(p_values, correction_method),
+        "fold_enrichment": _fold_enrichment(k, K, n, N),
+    }
+
+
+def _fold_enrichment(k: Any, K: Any, n: Any, N: Any) -> "np.ndarray":
+    """Vectorized k / expected overlap, inf where nothing is expected."""
+    import numpy as np
+
+    expected = (K / np.asarray(N, dtype=np.float64)) * n
+    safe = np.where(expected > 0, expected, 1.0)
+    return np.where(expected > 0, k / safe, np.inf)
+
+
+def _odds_ratio(k: Any, K: Any, n: Any, N: Any) -> "np.ndarray":
+    """Vectorized counterpart of `ORATermResult.odds_ratio`."""
+    import numpy as np
+
+    k, K, n, N = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (k, K, n, N))
+    )
+    a, b, c = n - k, K - k, N - K - n + k
+    degenerate = (a == 0) | (b == 0) | (c == 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = (k / np.where(degenerate, 1.0, a)) / np.where(degenerate, 1.0, b / np.where(c == 0, 1.0, c))
+    fallback = np.where(k > 0, np.inf, 0.0)
+    return np.where(degenerate, fallback, ratio)
 
 
 # =============================================================================
@@ -608,6 +804,103 @@ def _translate_ids_for_ora(
 # =============================================================================
 
 
+def _kegg_cache_key(species: Species) -> str:
+    return f"kegg_{species.kegg_code}"
+
+
+# Digests of recently used ancestor tables by identity. Each table is kept
+# referenced so its id cannot be reused by another object.
+_ANCESTOR_DIGESTS: "OrderedDict[int, Tuple[Mapping[str, Iterable[str]], str]]" = OrderedDict()
+_MAX_ANCESTOR_DIGESTS = 8
+
+
+def _ancestors_digest(ancestors: Mapping[str, Iterable[str]]) -> str:
+    """Short content digest of a GO ancestor table.
+
+    Tables are hashed once and remembered by identity, so they must not be
+    modified in place after their first use.
+    """
+    cached = _ANCESTOR_DIGESTS.get(id(ancestors))
+    if cached is not None and cached[0] is ancestors:
+        return cached[1]
+    digest = hashlib.sha256()
+    for term in sorted(ancestors):
+        digest.update("\t".join([term, *sorted(ancestors[term])]).encode())
+        digest.update(b"\n")
+    value = digest.hexdigest()[:12]
+    _ANCESTOR_DIGESTS[id(ancestors)] = (ancestors, value)
+    while len(_ANCESTOR_DIGESTS) > _MAX_ANCESTOR_DIGESTS:
+        _ANCESTOR_DIGESTS.popitem(last=False)
+    return value
+
+
+def _check_annotation_aspect(annotation_file: Optional[Union[str, Path]], aspect: str) -> None:
+    """Reject an aspect filter on a GPAD file, which has no aspect column."""
+    if (
+        annotation_file is not None
+        and aspect != "all"
+        and _annotation_file_format(annotation_file) == "gpad"
+    ):
+        raise ValueError(
+            f"GPAD annotations carry no GO aspect; use aspect='all' with "
+            f"'{Path(annotation_file).name}' or pass a GAF file"
+        )
+
+
+def _go_cache_key(
+    species: Species,
+    aspect: str,
+    source: Optional[Union[str, Path]] = None,
+    ancestors: Optional[Mapping[str, Iterable[str]]] = None,
+) -> str:
+    """Backing store key for a GO library.
+
+    Local annotation files are keyed by their full name and a digest of
+    their resolved path, size and modification time; propagated libraries
+    also by a digest of the ancestor table.
+    """
+    key = f"go_{species.taxon_id}_{aspect}"
+    if source is not None:
+        path = Path(source)
+        stat = path.stat()
+        stamp = f"{path.resolve()}\0{stat.st_size}\0{stat.st_mtime_ns}"
+        name = re.sub(r"\W", "_", path.name)
+        key += f"_{name}_{hashlib.sha256(stamp.encode()).hexdigest()[:12]}"
+    if ancestors:
+        key += f"_propagated_{_ancestors_digest(ancestors)}"
+    return key
+
+
+def _reactome_cache_key(species: Species, id_type: str) -> str:
+    species_key = species.scientific_name.lower().replace(" ", "_")
+    return f"reactome_{species_key}_{id_type}"
+
+
+def _pathways_from_cache(
+    cached: Dict[str, Tuple[str, FrozenSet[str]]],
+    database: str,
+    min_term_size: int = 0,
+    max_term_size: Optional[int] = None,
+) -> Dict[str, Pathway]:
+    """Build Pathway objects from cached (name, frozenset) tuples.
+
+    Stored gene sets are already frozensets and are reused as-is.
+    """
+    return {
+        k: Pathway(id=k, name=name, genes=genes, database=database)
+        for k, (name, genes) in cached.items()
+        if min_term_size <= len(genes)
+        and (max_term_size is None or len(genes) <= max_term_size)
+    }
+
+
+def _non_empty(column: str):
+    """Polars predicate: ``column`` is neither null nor an empty string."""
+    import polars as pl
+
+    return pl.col(column).is_not_null() & (pl.col(column) != "")
+
+
 def _get_kegg_pathways(
     species: Species,
     use_cache: bool = True,
@@ -624,45 +917,48 @@ def _get_kegg_pathways(
         Dict mapping pathway_id -> Pathway object
     """
     organism = species.kegg_code
-    cache_key = f"kegg_{organism}"
+    cache_key = _kegg_cache_key(species)
 
     if use_cache:
-        cached = get_cached_pathways(cache_key, cache_dir)
+        cached = get_cached_pathways(
+            cache_key,
+            cache_dir,
+            build=lambda data: _pathways_from_cache(data, "KEGG"),
+            kind="pathways",
+        )
         if cached is not None:
-            # Convert cached tuples to Pathway objects
-            return {
-                k: Pathway.from_tuple(k, (v[0], set(v[1])), "KEGG")
-                for k, v in cached.items()
-            }
+            return cached
+
+    import polars as pl
 
     # Get pathway list
     pathway_data = kegg_list("pathway", organism=organism)
-    df_pathways = pathway_data.as_dataframe()
-
-    pathway_names = {}
-    for _, row in df_pathways.iterrows():
-        pathway_id = row.get("entry_id", "")
-        name = row.get("description", "")
-        if pathway_id and name:
-            clean_id = pathway_id.replace(f"path:{organism}", f"{organism}")
-            pathway_names[clean_id] = name.split(" - ")[0] if " - " in name else name
+    df_pathways = (
+        pathway_data.as_dataframe(columns=["entry_id", "description"], engine="polars")
+        .filter(_non_empty("entry_id") & _non_empty("description"))
+        .select(
+            pl.col("entry_id").str.replace_all(f"path:{organism}", organism, literal=True),
+            pl.col("description").str.split(" - ").list.first(),
+        )
+    )
+    pathway_names = dict(
+        zip(df_pathways["entry_id"].to_list(), df_pathways["description"].to_list())
+    )
 
-    # Get gene-pathway links
+    # Get gene-pathway links, grouped into one gene list per pathway
     link_data = kegg_link("pathway", organism)
-    df_links = link_data.as_dataframe()
-
-    pathway_genes: Dict[str, Set[str]] = {}
-    for _, row in df_links.iterrows():
-        gene_id = row.get("source_id", "")
-        pathway_id = row.get("target_id", "")
-
-        if gene_id and pathway_id:
-            clean_pathway = pathway_id.replace("path:", "")
-            clean_gene = gene_id.replace(f"{organism}:", "")
-
-            if clean_pathway not in pathway_genes:
-                pathway_genes[clean_pathway] = set()
-            pathway_genes[clean_pathway].add(clean_gene)
+    df_links = (
+        link_data.as_dataframe(columns=["source_id", "target_id"], engine="polars")
+        .filter(_non_empty("source_id") & _non_empty("target_id"))
+        .group_by(
+            pl.col("target_id").str.replace_all("path:", "", literal=True),
+            maintain_order=True,
+        )
+        .agg(pl.col("source_id").str.replace_all(f"{organism}:", "", literal=True))
+    )
+    pathway_genes = dict(
+        zip(df_links["target_id"].to_list(), df_links["source_id"].to_list())
+    )
 
     # Build Pathway objects
     pathways = {}
@@ -693,8 +989,15 @@ def _get_go_terms(
     cache_dir: Optional[str] = None,
     min_term_size: int = 5,
     max_term_size: int = 500,
+    annotation_file: Optional[Union[str, Path]] = None,
+    ancestors: Optional[Mapping[str, Iterable[str]]] = None,
 ) -> Dict[str, Pathway]:
-    """Get GO term gene sets from QuickGO.
+    """Get GO term gene sets from streamed GAF annotations.
+
+    Annotations are streamed from a QuickGO GAF download (or read from a
+    local GAF/GPAD file) in chunks and aggregated incrementally, so memory
+    is bounded by the resulting gene sets rather than by the number of
+    annotations.
 
     Args:
         species: Species enum.
@@ -704,75 +1007,116 @@ def _get_go_terms(
         cache_dir: Directory for cache files.
         min_term_size: Minimum genes per term.
         max_term_size: Maximum genes per term.
+        annotation_file: Local GAF/GPAD file (optionally gzipped) for
+            ``species`` to read instead of downloading from QuickGO. GPAD
+            has no aspect column and needs ``aspect="all"``.
+        ancestors: GO term -> ancestor terms table. If given, annotations
+            are propagated to all ancestors (true-path rule).
 
     Returns:
         Dict mapping GO_id -> Pathway object
+
+    Raises:
+        ValueError: If ``annotation_file`` is GPAD and ``aspect`` is not "all".
     """
     if isinstance(aspect, GOAspect):
         aspect = aspect.value
 
-    taxon_id = species.taxon_id
-    cache_key = f"go_{taxon_id}_{aspect}"
+    _check_annotation_aspect(annotation_file, aspect)
+    cache_key = _go_cache_key(species, aspect, source=annotation_file, ancestors=ancestors)
 
     if use_cache:
-        cached = get_cached_pathways(cache_key, cache_dir)
+        cached = get_cached_pathways(
+            cache_key,
+            cache_dir,
+            build=lambda data: _pathways_from_cache(
+                data, f"GO:{aspect}", min_term_size, max_term_size
+            ),
+            kind="pathways",
+            options=(min_term_size, max_term_size),
+        )
         if cached is not None:
-            return {
-                k: Pathway.from_tuple(k, (v[0], set(v[1])), f"GO:{aspect}")
-                for k, v in cached.items()
-                if min_term_size <= len(v[1]) <= max_term_size
-            }
+            return cached
 
-    # Build query parameters
-    kwargs = {"taxonId": taxon_id}
+    evidence_codes = evidence_codes or DEFAULT_GO_EVIDENCE
+    aggregator = GOAnnotationAggregator(aspect, evidence_codes)
 
-    if aspect != "all":
-        kwargs["aspect"] = aspect
-
-    if evidence_codes:
-        kwargs["goEvidence"] = evidence_codes
+    if annotation_file is not None:
+        aggregator.update(iter_annotation_file(annotation_file))
     else:
-        kwargs["goEvidence"] = ["IDA", "IPI", "IMP", "IGI", "IEP", "TAS", "IC"]
-
-    try:
-        data = quickgo_search_annotations_all(max_records=100000, **kwargs)
-    except Exception as e:
-        warnings.warn(f"Failed to fetch GO annotations: {e}")
-        return {}
-
-    go_terms: Dict[str, Tuple[str, Set[str]]] = {}
+        # Filters are applied server-side too, to keep the download small
+        kwargs = {
+            "taxonId": species.taxon_id,
+            "goEvidence": evidence_codes,
+            "downloadLimit": QUICKGO_DOWNLOAD_LIMIT,
+        }
+        if aspect != "all":
+            kwargs["aspect"] = aspect
+        try:
+            aggregator.update(quickgo_iter_annotations(download_format="gaf", **kwargs))
+        except Exception as e:
+            warnings.warn(f"Failed to fetch GO annotations: {e}")
+            return {}
+
+    gene_sets = aggregator.gene_sets(ancestors, min_term_size, max_term_size)
+    names, names_complete = _go_term_names(list(gene_sets))
+
+    pathways = {
+        go_id: Pathway(
+            id=go_id,
+            name=names.get(go_id) or go_id,
+            genes=genes,
+            database=f"GO:{aspect}",
+            species=species.scientific_name,
+            url=f"https://www.ebi.ac.uk/QuickGO/term/{go_id}",
+        )
+        for go_id, genes in gene_sets.items()
+    }
 
-    for annot in data.results:
-        go_id = annot.get("goId", "")
-        go_name = annot.get("goName", go_id)
-        gene_id = annot.get("geneProductId", "")
+    # Names missing after a failed lookup must not outlive this call
+    if use_cache and pathways and names_complete:
+        cache_data = {k: (v.name, v.genes) for k, v in pathways.items()}
+        cache_pathways(cache_key, cache_data, cache_dir)
 
-        if go_id and gene_id:
-            if ":" in gene_id:
-                gene_id = gene_id.split(":")[-1]
+    return pathways
 
-            if go_id not in go_terms:
-                go_terms[go_id] = (go_name, set())
-            go_terms[go_id][1].add(gene_id)
 
-    # Filter by size and convert to Pathway objects
-    pathways = {}
-    for go_id, (name, genes) in go_terms.items():
-        if min_term_size <= len(genes) <= max_term_size:
-            pathways[go_id] = Pathway(
-                id=go_id,
-                name=name,
-                genes=frozenset(genes),
-                database=f"GO:{aspect}",
-                species=species.scientific_name,
-                url=f"https://www.ebi.ac.uk/QuickGO/term/{go_id}",
-            )
+def _go_term_names(
+    go_ids: List[str], batch_size: int = 100
+) -> Tuple[Dict[str, str], bool]:
+    """Look up GO term names from QuickGO (GAF lines carry only IDs).
 
-    if use_cache and pathways:
-        cache_data = {k: (v.name, v.genes) for k, v in pathways.items()}
-        cache_pathways(cache_key, cache_data, cache_dir)
+    Batches are requested concurrently, paced by the QuickGO host's rate
+    limit. Terms whose names cannot be fetched are left out; callers fall
+    back to the GO ID.
 
-    return pathways
+    Returns:
+        Tuple of (GO ID -> name, whether every batch was fetched).
+    """
+    batches = [go_ids[start:start + batch_size] for start in range(0, len(go_ids), batch_size)]
+    fetcher = QuickGO_Fetcher()
+    names: Dict[str, str] = {}
+    errors = []
+    for _, data in fetcher.iter_process(
+        quickgo_get_terms,
+        args_list=[(batch,) for batch in batches],
+        rate_limit_per_second=fetcher.RATE_LIMIT,
+        ordered=False,
+        return_exceptions=True,
+        host=fetcher.HOST,
+    ):
+        if isinstance(data, Exception):
+            errors.append(data)
+            continue
+        for term in data.results:
+            if term.get("id") and term.get("name"):
+                names[term["id"]] = term["name"]
+    if errors:
+        warnings.warn(
+            f"Failed to fetch GO term names for {len(errors)} of {len(batches)} "
+            f"batches: {errors[0]}"
+        )
+    return names, not errors
 
 
 def _get_reactome_pathways(
@@ -797,43 +1141,45 @@ def _get_reactome_pathways(
         Dict mapping pathway_id -> Pathway object
     """
     species_name = species.scientific_name
-    species_key = species_name.lower().replace(" ", "_")
-    cache_key = f"reactome_{species_key}_{id_type}"
+    cache_key = _reactome_cache_key(species, id_type)
 
     if use_cache:
-        cached = get_cached_pathways(cache_key, cache_dir)
+        cached = get_cached_pathways(
+            cache_key,
+            cache_dir,
+            build=lambda data: _pathways_from_cache(
+                data, "Reactome", min_term_size, max_term_size
+            ),
+            kind="pathways",
+            options=(min_term_size, max_term_size),
+        )
         if cached is not None:
-            return {
-                k: Pathway.from_tuple(k, (v[0], set(v[1])), "Reactome")
-                for k, v in cached.items()
-                if min_term_size <= len(v[1]) <= max_term_size
-            }
+            return cached
 
     fetcher = Reactome_Fetcher(species=species_name)
 
     try:
-        hierarchy = fetcher.get_events_hierarchy(species_name)
+        gene_sets = fetcher.build_pathway_gene_sets(
+            species_name,
+            id_type=id_type,
+            checkpoint=_get_manager(cache_dir) if use_cache else None,
+            checkpoint_key=f"{cache_key}_partial",
+        )
     except Exception as e:
-        warnings.warn(f"Failed to fetch Reactome hierarchy: {e}")
+        warnings.warn(f"Failed to fetch Reactome pathways: {e}")
         return {}
 
-    pathway_ids = fetcher._extract_pathway_ids_from_hierarchy(hierarchy)
     pathways = {}
-
-    for pathway_id, pathway_name in pathway_ids:
-        try:
-            genes = fetcher.get_pathway_genes(pathway_id, id_type=id_type)
-            if genes and min_term_size <= len(genes) <= max_term_size:
-                pathways[pathway_id] = Pathway(
-                    id=pathway_id,
-                    name=pathway_name,
-                    genes=frozenset(genes),
-                    database="Reactome",
-                    species=species_name,
-                    url=f"https://reactome.org/content/detail/{pathway_id}",
-                )
-        except Exception:
-            continue
+    for pathway_id, (pathway_name, genes) in gene_sets.items():
+        if min_term_size <= len(genes) <= max_term_size:
+            pathways[pathway_id] = Pathway(
+                id=pathway_id,
+                name=pathway_name,
+                genes=frozenset(genes),
+                database="Reactome",
+                species=species_name,
+                url=f"https://reactome.org/content/detail/{pathway_id}",
+            )
 
     if use_cache and pathways:
         cache_data = {k: (v.name, v.genes) for k, v in pathways.items()}
@@ -842,6 +1188,67 @@ def _get_reactome_pathways(
     return pathways
 
 
+# =============================================================================
+# Compiled Gene-Set Indexes
+# =============================================================================
+
+
+def _get_gene_set_index(
+    cache_key: str,
+    loader: Callable[[], Dict[str, Pathway]],
+    database_name: str,
+    options: Tuple[Any, ...] = (),
+    cache_dir: Optional[str] = None,
+    use_cache: bool = True,
+    min_term_size: int = 0,
+    max_term_size: Optional[int] = None,
+) -> GeneSetIndex:
+    """Return the compiled index for a pathway library, building it once.
+
+    Indexes live in the pathway memory tier next to the library they were
+    built from, so they expire and are invalidated together with it. With a
+    Parquet/Arrow store the index is built straight from the stored columns;
+    otherwise (or when nothing is stored yet) it is built from ``loader()``.
+
+    Args:
+        cache_key: Backing store key of the library (e.g. "kegg_hsa").
+        loader: Callable returning the library's Pathway dict.
+        database_name: Database name stored on the index.
+        options: Loader parameters the index depends on (e.g. size filters).
+        cache_dir: Directory for cache files.
+        use_cache: If False, rebuild the index and replace any stored copy.
+        min_term_size: Minimum genes per term, applied to stored libraries.
+        max_term_size: Maximum genes per term, applied to stored libraries.
+
+    Returns:
+        GeneSetIndex for the library.
+    """
+    if use_cache:
+        index = get_memoized(cache_key, "index", options, cache_dir=cache_dir)
+        if index is not None:
+            return index
+        index = get_cached_gene_set_index(
+            cache_key,
+            cache_dir,
+            database=database_name,
+            min_size=min_term_size,
+            max_size=max_term_size,
+        )
+    else:
+        index = None
+
+    if index is None:
+        index = GeneSetIndex.from_gene_sets(loader(), database=database_name)
+    if len(index) > 0:
+        memoize(cache_key, "index", index, options, cache_dir=cache_dir)
+    return index
+
+
+def clear_gene_set_indexes() -> None:
+    """Drop all in-process gene-set indexes used by ora_kegg/ora_go/ora_reactome_local."""
+    clear_memory_cache(kind="index")
+
+
 # =============================================================================
 # Main ORA Functions
 # =============================================================================
@@ -849,7 +1256,9 @@ def _get_reactome_pathways(
 
 def ora(
     genes: List[str],
-    gene_sets: Union[Dict[str, Tuple[str, Set[str]]], Dict[str, Pathway]],
+    gene_sets: Union[
+        Dict[str, Tuple[str, Set[str]]], Dict[str, Pathway], GeneSetIndex
+    ],
     background: Optional[Set[str]] = None,
     min_overlap: int = 3,
     correction_method: Union[str, CorrectionMethod] = CorrectionMethod.BH,
@@ -859,7 +1268,8 @@ def ora(
 
     Args:
         genes: List of query genes.
-        gene_sets: Dict mapping set_id -> (set_name, set of genes) or Pathway objects.
+        gene_sets: Dict mapping set_id -> (set_name, set of genes) or Pathway objects,
+            or a prebuilt `GeneSetIndex` to reuse across queries.
         background: Background gene set (universe). If None, uses union of all genes.
         min_overlap: Minimum overlap required to test a gene set.
         correction_method: Multiple testing correction method.
@@ -868,26 +1278,28 @@ def ora(
     Returns:
         ORAResult with enrichment results.
     """
+    import numpy as np
+
     query_set = set(genes)
 
-    # Normalize gene_sets to Dict[str, Tuple[str, Set[str]]]
-    normalized_gene_sets: Dict[str, Tuple[str, Set[str]]] = {}
-    for set_id, data in gene_sets.items():
-        if isinstance(data, Pathway):
-            normalized_gene_sets[set_id] = (data.name, set(data.genes))
-        else:
-            normalized_gene_sets[set_id] = data
+    if isinstance(gene_sets, GeneSetIndex):
+        index = gene_sets
+    else:
+        index = GeneSetIndex.from_gene_sets(gene_sets, database=database_name)
 
-    # Determine background
+    # The background always includes the query genes, so every query gene
+    # counts towards n and, when inside a term, towards that term's size.
     if background is None:
-        background = set()
-        for _, gene_set in normalized_gene_sets.values():
-            background.update(gene_set)
-
-    background = background | query_set
+        term_sizes = index.term_sizes()
+        N = index.n_genes + sum(1 for g in query_set if g not in index)
+    else:
+        term_sizes = index.term_sizes(background)
+        extra = query_set.difference(background)
+        N = len(background) + len(extra)
+        if extra:
+            term_sizes = term_sizes + index.overlap_counts(index.query_mask(extra))
 
-    N = len(background)
-    n = len(query_set & background)
+    n = len(query_set)
 
     if n == 0:
         return ORAResult(
@@ -899,52 +1311,48 @@ def ora(
             database=database_name,
         )
 
-    results = []
-    p_values = []
-
-    for set_id, (set_name, gene_set) in normalized_gene_sets.items():
-        K = len(gene_set & background)
-        if K == 0:
-            continue
-
-        overlap = query_set & gene_set & background
-        k = len(overlap)
-
-        if k < min_overlap:
-            continue
-
-        p_value = hypergeometric_test(k, K, n, N)
-        expected = (K / N) * n
-        fold_enrichment = k / expected if expected > 0 else float("inf")
-
-        result = ORATermResult(
-            term_id=set_id,
-            term_name=set_name,
-            p_value=p_value,
-            adjusted_p_value=p_value,
-            overlap_count=k,
-            term_size=K,
-            query_size=n,
-            background_size=N,
-            fold_enrichment=fold_enrichment,
-            overlap_genes=list(overlap),
-            database=database_name,
-        )
-        results.append(result)
-        p_values.append(p_value)
-
-    if results:
-        adjusted = multiple_test_correction(p_values, correction_method)
-        for i, result in enumerate(results):
-            result.adjusted_p_value = adjusted[i]
+    query_mask = index.query_mask(query_set)
+    overlap_counts = index.overlap_counts(query_mask)
+    rows = np.flatnonzero((term_sizes > 0) & (overlap_counts >= min_overlap))
 
-    results.sort(key=lambda x: x.adjusted_p_value)
+    results = []
+    if rows.size:
+        k_arr = overlap_counts[rows]
+        K_arr = term_sizes[rows]
+        stats = _ora_statistics(k_arr, K_arr, n, N, correction_method)
+
+        # Only terms that pass the filters get their overlap genes materialized
+        overlaps = index.overlap_genes(rows.tolist(), query_mask)
+        p_values = stats["p_value"].tolist()
+        adjusted = stats["adjusted_p_value"]
+        fold = stats["fold_enrichment"].tolist()
+        k_values = k_arr.tolist()
+        K_values = K_arr.tolist()
+        row_list = rows.tolist()
+
+        for i in np.argsort(adjusted, kind="stable").tolist():
+            row = row_list[i]
+            results.append(
+                ORATermResult(
+                    term_id=index.term_ids[row],
+                    term_name=index.term_names[row],
+                    p_value=p_values[i],
+                    adjusted_p_value=float(adjusted[i]),
+                    overlap_count=k_values[i],
+                    term_size=K_values[i],
+                    query_size=n,
+                    background_size=N,
+                    fold_enrichment=fold[i],
+                    overlap_genes=overlaps[i],
+                    database=database_name,
+                )
+            )
 
     return ORAResult(
         results=results,
         query_genes=genes,
-        mapped_genes=list(query_set & background),
-        unmapped_genes=list(query_set - background),
+        mapped_genes=list(query_set),
+        unmapped_genes=[],
         background_size=N,
         database=database_name,
         parameters={
@@ -954,6 +1362,190 @@ def ora(
     )
 
 
+def ora_batch(
+    gene_lists: Dict[str, List[str]],
+    gene_sets: Union[
+        Dict[str, Tuple[str, Set[str]]], Dict[str, Pathway], GeneSetIndex
+    ],
+    background: Optional[Set[str]] = None,
+    min_overlap: int = 3,
+    correction_method: Union[str, CorrectionMethod] = CorrectionMethod.BH,
+    database_name: str = "custom",
+    engine: Literal["pandas", "polars"] = "pandas",
+    n_jobs: Optional[int] = None,
+) -> "pd.DataFrame":
+    """Score many query gene lists against one gene-set library in a single pass.
+
+    Gives the same statistics as calling `ora` once per list, but builds the
+    query x gene indicator matrix once, computes every overlap count with one
+    sparse matrix product, scores all (list, term) pairs in one batch and
+    applies multiple testing correction per list in one vectorized step.
+
+    Args:
+        gene_lists: Dict mapping query name -> list of query genes.
+        gene_sets: Dict mapping set_id -> (set_name, set of genes) or Pathway objects,
+            or a prebuilt `GeneSetIndex`.
+        background: Background gene set shared by all queries. If None, uses
+            union of all genes.
+        min_overlap: Minimum overlap required to test a gene set.
+        correction_method: Multiple testing correction method, applied per query.
+        database_name: Name of the database for result annotation.
+        engine: DataFrame engine for the result ("pandas" or "polars").
+        n_jobs: If greater than 1, split the queries across this many worker
+            processes. Worth it only for very large libraries or query sets.
+
+    Returns:
+        Long-format DataFrame with one row per tested (query, term) pair: a
+        ``query`` column followed by the `ORATermResult.to_dict` columns,
+        sorted by query (in input order) and adjusted p-value.
+
+    Example:
+        ```python
+        clusters = {"c1": ["TP53", "MDM2", "CDKN1A"], "c2": ["CDK1", "CCNB1", "BUB1"]}
+        df = ora_batch(clusters, my_pathways, min_overlap=2)
+        print(df[df["adjusted_p_value"] < 0.05][["query", "term_id", "p_value"]])
+        ```
+    """
+    if engine not in ("pandas", "polars"):
+        raise ValueError(f"Unsupported engine: {engine}")
+
+    if isinstance(gene_sets, GeneSetIndex):
+        index = gene_sets
+    else:
+        index = GeneSetIndex.from_gene_sets(gene_sets, database=database_name)
+
+    names = list(gene_lists)
+    if n_jobs is not None and n_jobs > 1 and len(names) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunk_size = -(-len(names) // n_jobs)
+        chunks = [names[i:i + chunk_size] for i in range(0, len(names), chunk_size)]
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            futures = [
+                pool.submit(
+                    _ora_batch_columns,
+                    {name: gene_lists[name] for name in chunk},
+                    index,
+                    background,
+                    min_overlap,
+                    correction_method,
+                    database_name,
+                )
+                for chunk in chunks
+            ]
+            parts = [future.result() for future in futures]
+        columns = {
+            key: [value for part in parts for value in part[key]] for key in parts[0]
+        }
+    else:
+        columns = _ora_batch_columns(
+            gene_lists, index, background, min_overlap, correction_method, database_name
+        )
+
+    if engine == "pandas":
+        import pandas as pd
+
+        return pd.DataFrame(columns)
+
+    import polars as pl
+
+    return pl.DataFrame(columns)
+
+
+def _ora_batch_columns(
+    gene_lists: Dict[str, List[str]],
+    index: GeneSetIndex,
+    background: Optional[Set[str]],
+    min_overlap: int,
+    correction_method: Union[str, CorrectionMethod],
+    database_name: str,
+) -> Dict[str, List[Any]]:
+    """Compute the long-format `ora_batch` result as a dict of columns."""
+    import numpy as np
+
+    names = list(gene_lists)
+    query_sets = [set(gene_lists[name]) for name in names]
+    queries = index.query_matrix(query_sets)
+    membership_t = index.membership.T.tocsc()
+
+    # Per-query n and N; the background always includes the query genes
+    n = np.fromiter((len(q) for q in query_sets), dtype=np.int64, count=len(names))
+    extra_counts = None
+    if background is None:
+        term_sizes = index.term_sizes()
+        N = index.n_genes + n - np.diff(queries.indptr)
+    else:
+        term_sizes = index.term_sizes(background)
+        extras = [q.difference(background) for q in query_sets]
+        N = len(background) + np.fromiter(
+            (len(e) for e in extras), dtype=np.int64, count=len(names)
+        )
+        if any(extras):
+            extra_counts = (index.query_matrix(extras) @ membership_t).tocsr()
+
+    overlaps = (queries @ membership_t).tocsr()
+    if min_overlap > 0:
+        coo = overlaps.tocoo()
+        q_idx, t_idx = coo.row.astype(np.int64), coo.col.astype(np.int64)
+        k = coo.data.astype(np.int64)
+    else:
+        dense = overlaps.toarray()
+        q_idx, t_idx = (x.ravel() for x in np.indices(dense.shape))
+        k = dense.ravel().astype(np.int64)
+
+    K = term_sizes[t_idx]
+    if extra_counts is not None:
+        K = K + np.asarray(extra_counts[q_idx, t_idx], dtype=np.int64).ravel()
+
+    keep = (k >= min_overlap) & (K > 0) & (n[q_idx] > 0)
+    order = np.lexsort((t_idx[keep], q_idx[keep]))
+    q_idx, t_idx, k, K = (x[keep][order] for x in (q_idx, t_idx, k, K))
+    n_q, N_q = n[q_idx], N[q_idx]
+
+    p_values = hypergeometric_test_batch(k, K, n_q, N_q)
+
+    # Lay p-values out one query per row (NaN-padded) and correct all rows at once
+    adjusted = p_values.copy()
+    if p_values.size:
+        per_query = np.bincount(q_idx, minlength=len(names))
+        starts = np.concatenate(([0], np.cumsum(per_query)[:-1]))
+        pos = np.arange(len(q_idx)) - starts[q_idx]
+        padded = np.full((len(names), int(per_query.max())), np.nan)
+        padded[q_idx, pos] = p_values
+        adjusted = multiple_test_correction_array(padded, correction_method)[q_idx, pos]
+
+        final = np.lexsort((pos, adjusted, q_idx))
+        q_idx, t_idx, k, K, n_q, N_q, p_values, adjusted = (
+            x[final] for x in (q_idx, t_idx, k, K, n_q, N_q, p_values, adjusted)
+        )
+
+    # Materialize overlap genes one query at a time from the sparse product
+    overlap_genes: List[str] = [""] * len(q_idx)
+    boundaries = np.flatnonzero(np.diff(q_idx)) + 1
+    for block in np.split(np.arange(len(q_idx)), boundaries):
+        if not block.size:
+            continue
+        rows = index.membership[t_idx[block]].multiply(queries[q_idx[block[0]]]).tocsr()
+        for j, genes in zip(block.tolist(), np.split(index.genes[rows.indices], rows.indptr[1:-1])):
+            overlap_genes[j] = ",".join(genes.tolist())
+
+    return {
+        "query": [names[i] for i in q_idx.tolist()],
+        "term_id": [index.term_ids[t] for t in t_idx.tolist()],
+        "term_name": [index.term_names[t] for t in t_idx.tolist()],
+        "p_value": p_values.tolist(),
+        "adjusted_p_value": adjusted.tolist(),
+        "overlap_count": k.tolist(),
+        "term_size": K.tolist(),
+        "query_size": n_q.tolist(),
+        "background_size": N_q.tolist(),
+        "fold_enrichment": _fold_enrichment(k, K, n_q, N_q).tolist(),
+        "odds_ratio": _odds_ratio(k, K, n_q, N_q).tolist(),
+        "overlap_genes": overlap_genes,
+        "database": [database_name] * len(q_idx),
+    }
+
+
 def ora_kegg(
     genes: List[str],
     organism: str = "hsa",
@@ -1022,14 +1614,20 @@ def ora_kegg(
             database=translation_database,
         )
 
-    # Get KEGG pathways
-    pathways = _get_kegg_pathways(
-        species=species,
-        use_cache=use_cache,
+    # Get the compiled KEGG pathway index
+    pathways = _get_gene_set_index(
+        _kegg_cache_key(species),
+        lambda: _get_kegg_pathways(
+            species=species,
+            use_cache=use_cache,
+            cache_dir=cache_dir,
+        ),
+        database_name="KEGG",
         cache_dir=cache_dir,
+        use_cache=use_cache,
     )
 
-    if not pathways:
+    if len(pathways) == 0:
         warnings.warn(f"No KEGG pathways found for organism: {organism}")
         return ORAResult(
             results=[],
@@ -1072,6 +1670,8 @@ def ora_go(
     translation_database: Union[str, TranslationDatabase] = TranslationDatabase.BIOMART,
     use_cache: bool = True,
     cache_dir: Optional[str] = None,
+    annotation_file: Optional[Union[str, Path]] = None,
+    ancestors: Optional[Mapping[str, Iterable[str]]] = None,
 ) -> ORAResult:
     """Perform Gene Ontology over-representation analysis using QuickGO.
 
@@ -1090,12 +1690,21 @@ def ora_go(
         translation_database: Database for ID translation.
         use_cache: Whether to use cached GO data.
         cache_dir: Directory for cache files.
+        annotation_file: Local GAF/GPAD file (optionally gzipped) for the
+            species, read in chunks instead of downloading annotations
+            from QuickGO. GPAD files carry no aspect column, so they need
+            ``aspect="all"``; GO evidence codes are matched against their
+            ECO IDs.
+        ancestors: GO term -> ancestor terms table (see
+            `load_go_ancestors`). If given, annotations are propagated up
+            the GO DAG (true-path rule) before scoring.
 
     Returns:
         ORAResult with GO term enrichment results.
 
     Raises:
-        ValueError: If taxon_id is not supported.
+        ValueError: If taxon_id is not supported, or ``annotation_file`` is
+            GPAD and ``aspect`` is not "all".
 
     Example:
         ```python
@@ -1109,6 +1718,8 @@ def ora_go(
     """
     # Get species from taxon ID
     species = Species.from_taxon_id(taxon_id)
+    aspect_str = aspect if isinstance(aspect, str) else aspect.value
+    _check_annotation_aspect(annotation_file, aspect_str)
 
     # Normalize ID type
     from_type = _normalize_id_type(from_id_type)
@@ -1130,20 +1741,34 @@ def ora_go(
             database=translation_database,
         )
 
-    # Get GO terms
-    go_terms = _get_go_terms(
-        species=species,
-        aspect=aspect,
-        evidence_codes=evidence_codes,
-        use_cache=use_cache,
+    db_name = f"GO:{aspect_str}"
+
+    # Get the compiled GO term index
+    go_terms = _get_gene_set_index(
+        _go_cache_key(species, aspect_str, source=annotation_file, ancestors=ancestors),
+        lambda: _get_go_terms(
+            species=species,
+            aspect=aspect,
+            evidence_codes=evidence_codes,
+            use_cache=use_cache,
+            cache_dir=cache_dir,
+            min_term_size=min_term_size,
+            max_term_size=max_term_size,
+            annotation_file=annotation_file,
+            ancestors=ancestors,
+        ),
+        database_name=db_name,
+        options=(
+            tuple(evidence_codes) if evidence_codes else None,
+            min_term_size, max_term_size,
+        ),
         cache_dir=cache_dir,
+        use_cache=use_cache,
         min_term_size=min_term_size,
         max_term_size=max_term_size,
     )
 
-    aspect_str = aspect if isinstance(aspect, str) else aspect.value
-
-    if not go_terms:
+    if len(go_terms) == 0:
         warnings.warn(f"No GO terms found for taxon: {taxon_id}")
         return ORAResult(
             results=[],
@@ -1159,8 +1784,6 @@ def ora_go(
             },
         )
 
-    db_name = f"GO:{aspect_str}"
-
     result = ora(
         genes=mapped_genes,
         gene_sets=go_terms,
@@ -1479,16 +2102,25 @@ def ora_reactome_local(
             database=translation_database,
         )
 
-    pathways = _get_reactome_pathways(
-        species=species_enum,
-        id_type="gene_symbol",
-        use_cache=use_cache,
+    pathways = _get_gene_set_index(
+        _reactome_cache_key(species_enum, "gene_symbol"),
+        lambda: _get_reactome_pathways(
+            species=species_enum,
+            id_type="gene_symbol",
+            use_cache=use_cache,
+            cache_dir=cache_dir,
+            min_term_size=min_term_size,
+            max_term_size=max_term_size,
+        ),
+        database_name="Reactome",
+        options=(min_term_size, max_term_size),
         cache_dir=cache_dir,
+        use_cache=use_cache,
         min_term_size=min_term_size,
         max_term_size=max_term_size,
     )
 
-    if not pathways:
+    if len(pathways) == 0:
         warnings.warn(f"No Reactome pathways found for species: {species}")
         return ORAResult(
             results=[],
@@ -4,43 +4,49 @@ This module provides the internal implementations for the graph module.
 Use `biodbs.graph` for the public API.
 """
 
-from biodbs._funcs.graph.core import (
-    # Enums
-    NodeType,
-    EdgeType,
-    DataSource,
-    # Data classes
-    Node,
-    Edge,
-    # Container
-    KnowledgeGraph,
-)
+from biodbs._lazy import lazy_exports
 
-from biodbs._funcs.graph.builders import (
-    build_graph,
-    build_disease_graph,
-    build_go_graph,
-    build_reactome_graph,
-    build_kegg_graph,
-    merge_graphs,
-)
-
-from biodbs._funcs.graph.exporters import (
-    to_networkx,
-    to_json_ld,
-    to_rdf,
-    to_neo4j_csv,
-    to_cypher,
-)
-
-from biodbs._funcs.graph.utils import (
-    find_shortest_path,
-    find_all_paths,
-    get_neighborhood,
-    get_connected_component,
-    find_hub_nodes,
-    get_graph_statistics,
-)
+# Imported on first access (PEP 562) to keep package import cheap.
+_EXPORTS = {
+    "biodbs._funcs.graph.core": (
+        # Enums
+        "NodeType",
+        "EdgeType",
+        "DataSource",
+        # Data classes
+        "Node",
+        "Edge",
+        # Container
+        "KnowledgeGraph",
+    ),
+    "biodbs._funcs.graph.compact": ("CompactKnowledgeGraph",),
+    "biodbs._funcs.graph.builders": (
+        "build_graph",
+        "build_disease_graph",
+        "build_go_graph",
+        "build_reactome_graph",
+        "build_kegg_graph",
+        "merge_graphs",
+    ),
+    "biodbs._funcs.graph.exporters": (
+        "to_networkx",
+        "to_json_ld",
+        "to_rdf",
+        "to_neo4j_csv",
+        "to_cypher",
+        "write_json_ld",
+        "write_rdf",
+        "write_cypher",
+    ),
+    "biodbs._funcs.graph.utils": (
+        "find_shortest_path",
+        "find_all_paths",
+        "get_neighborhood",
+        "get_connected_component",
+        "find_hub_nodes",
+        "get_graph_statistics",
+    ),
+}
 
 __all__ = [
     # Enums
@@ -52,6 +58,7 @@ __all__ = [
     "Edge",
     # Container
     "KnowledgeGraph",
+    "CompactKnowledgeGraph",
     # Builders
     "build_graph",
     "build_disease_graph",
@@ -65,6 +72,9 @@ __all__ = [
     "to_rdf",
     "to_neo4j_csv",
     "to_cypher",
+    "write_json_ld",
+    "write_rdf",
+    "write_cypher",
     # Utilities
     "find_shortest_path",
     "find_all_paths",
@@ -73,3 +83,5 @@ __all__ = [
     "find_hub_nodes",
     "get_graph_statistics",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, exports=_EXPORTS)
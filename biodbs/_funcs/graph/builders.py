@@ -372,22 +372,16 @@ def build_go_graph(
         graph.add_node(node)
 
     # Create annotation edges
-    if create_annotation_edges:
-        for gene_id, go_id, relation_str, evidence in annotations:
-            try:
-                relation = EdgeType(relation_str)
-            except ValueError:
-                relation = EdgeType.ASSOCIATED_WITH
-
-            evidence_set = frozenset([evidence]) if evidence and include_evidence else frozenset()
-
-            edge = Edge(
-                source=gene_id,
-                target=go_id,
-                relation=relation,
-                evidence=evidence_set,
-            )
-            graph.add_edge(edge)
+    if create_annotation_edges and annotations:
+        gene_ids, go_ids, relations, evidence = zip(*annotations)
+        graph.add_edges_bulk(
+            {
+                "source": gene_ids,
+                "target": go_ids,
+                "relation": relations,
+                "evidence": [[code] if code and include_evidence else None for code in evidence],
+            }
+        )
 
     return graph
 
@@ -658,58 +652,33 @@ def build_kegg_link_graph(
         # KnowledgeGraph(name='KEGGLinkGraph', nodes=8500, edges=42000)
         ```
     """
-    graph = KnowledgeGraph(
+    import pandas as pd
+
+    pairs = ((r.get("source_id"), r.get("target_id")) for r in link_data.records)
+    links = pd.DataFrame(
+        [(s, t) for s, t in pairs if s and t], columns=["source", "target"], dtype=object
+    )
+
+    # Source IDs first, so an ID on both sides keeps the source type
+    ids = pd.concat([links["source"], links["target"]], ignore_index=True)
+    node_types = [source_type.value] * len(links) + [target_type.value] * len(links)
+    nodes = pd.DataFrame(
+        {
+            "id": ids,
+            "label": ids.str.split(":").str[-1],
+            "node_type": node_types,
+            "source": DataSource.KEGG.value,
+        }
+    )
+
+    return KnowledgeGraph.from_frames(
+        nodes,
+        links.assign(relation=relation.value),
         name=name,
         description="Knowledge graph from KEGG links",
         source=DataSource.KEGG,
     )
 
-    sources: Set[str] = set()
-    targets: Set[str] = set()
-
-    for record in link_data.records:
-        source_id = record.get("source_id", "")
-        target_id = record.get("target_id", "")
-
-        if source_id and target_id:
-            sources.add(source_id)
-            targets.add(target_id)
-
-    # Create source nodes
-    for source_id in sources:
-        node = Node(
-            id=source_id,
-            label=source_id.split(":")[-1] if ":" in source_id else source_id,
-            node_type=source_type,
-            source=DataSource.KEGG,
-        )
-        graph.add_node(node)
-
-    # Create target nodes
-    for target_id in targets:
-        node = Node(
-            id=target_id,
-            label=target_id.split(":")[-1] if ":" in target_id else target_id,
-            node_type=target_type,
-            source=DataSource.KEGG,
-        )
-        graph.add_node(node)
-
-    # Create edges
-    for record in link_data.records:
-        source_id = record.get("source_id", "")
-        target_id = record.get("target_id", "")
-
-        if source_id and target_id:
-            edge = Edge(
-                source=source_id,
-                target=target_id,
-                relation=relation,
-            )
-            graph.add_edge(edge)
-
-    return graph
-
 
 def _infer_kegg_node_type(entry_id: str) -> NodeType:
     """Infer KEGG node type from entry ID format."""
@@ -747,6 +716,10 @@ def merge_graphs(
     (same ID) are kept as-is (first occurrence wins). Duplicate edges
     (same source, target, relation) are deduplicated.
 
+    Graphs are folded in with the bulk-loading path (`KnowledgeGraph.update`),
+    so the cost is linear in the total size. The result has the class of the
+    first graph, so merging CompactKnowledgeGraphs stays array-based.
+
     Args:
         *graphs: Variable number of KnowledgeGraph instances to merge.
         name: Name for the merged graph.
@@ -771,25 +744,20 @@ def merge_graphs(
 
     if len(graphs) == 1:
         # Just copy the single graph
-        merged = KnowledgeGraph(
-            name=name,
-            description=description or graphs[0].description,
-            source=graphs[0].source,
-        )
-        merged.add_nodes(graphs[0].nodes)
-        merged.add_edges(graphs[0].edges)
-        return merged
+        default_description = graphs[0].description
+    else:
+        default_description = f"Merged from {len(graphs)} graphs"
 
-    # Start with first graph as base
-    merged = KnowledgeGraph(
+    merged = type(graphs[0])(
         name=name,
-        description=description or f"Merged from {len(graphs)} graphs",
+        description=description or default_description,
         source=graphs[0].source,
     )
 
-    # Add all nodes and edges from each graph
+    # Add all nodes before any edges, so edges between graphs are kept
+    for graph in graphs:
+        merged.add_nodes_bulk(graph)
     for graph in graphs:
-        merged.add_nodes(graph.nodes)
-        merged.add_edges(graph.edges)
+        merged.add_edges_bulk(graph)
 
     return merged
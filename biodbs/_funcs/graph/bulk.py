@@ -0,0 +1,247 @@
+"""Columnar bulk loading for knowledge graphs.
+
+This module provides:
+    - node_frame: Normalize a node table to the standard node columns
+    - edge_frame: Normalize an edge table to the standard edge columns
+    - nodes_from_frame: Build `Node` objects from a normalized node table
+    - edges_from_frame: Build `Edge` objects from a normalized edge table
+    - edge_table: Columns of an iterable of `Edge` objects
+    - edge_extras: Evidence/properties column for array-backed storage
+
+Tables can be pandas or polars DataFrames, pyarrow Tables/RecordBatches, or
+mappings of column name to array. Node tables need an ``id`` column and may
+have ``label``, ``node_type``, ``source``, ``properties`` and ``xrefs``. Edge
+tables need ``source`` and ``target`` and may have ``relation``, ``weight``,
+``evidence`` and ``properties``. These are the columns written by
+`KnowledgeGraph.nodes_as_dataframe` and `edges_as_dataframe`.
+
+Duplicate rows are dropped by hashing the key columns (first row wins), and
+edges whose endpoints are not nodes of the graph are dropped with a
+semi-join on the node IDs. `KnowledgeGraph.add_nodes_bulk`,
+`add_edges_bulk` and `from_frames` are built on these helpers.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Collection, Dict, FrozenSet, Iterable, List, Mapping, Tuple
+
+import numpy as np
+import pandas as pd
+
+from biodbs._funcs.graph.core import DataSource, Edge, EdgeType, Node, NodeType
+
+NODE_COLUMNS: Dict[str, Any] = {
+    "id": None,
+    "label": None,  # defaults to the ID
+    "node_type": NodeType.OTHER.value,
+    "source": DataSource.CUSTOM.value,
+    "properties": None,
+    "xrefs": None,
+}
+
+EDGE_COLUMNS: Dict[str, Any] = {
+    "source": None,
+    "target": None,
+    "relation": EdgeType.RELATED_TO.value,
+    "weight": 1.0,
+    "evidence": None,
+    "properties": None,
+}
+
+
+def _as_pandas(table: Any) -> pd.DataFrame:
+    """Convert a supported table type to a pandas DataFrame."""
+    if isinstance(table, pd.DataFrame):
+        return table
+    module = type(table).__module__
+    if module.startswith("polars"):
+        # Column by column, so pyarrow is not required
+        return pd.DataFrame(
+            {
+                name: series.to_numpy() if series.dtype.is_numeric() else series.to_list()
+                for name, series in table.to_dict().items()
+            }
+        )
+    if module.startswith("pyarrow"):
+        return table.to_pandas()
+    if isinstance(table, Mapping):
+        return pd.DataFrame(dict(table))
+    raise TypeError(
+        "Expected a pandas/polars DataFrame, pyarrow Table or mapping of columns, "
+        f"got {type(table).__name__}"
+    )
+
+
+def _normalize(
+    table: Any, columns: Dict[str, Any], required: List[str], kind: str
+) -> pd.DataFrame:
+    """Select ``columns`` (filling defaults) and drop rows missing a key."""
+    frame = _as_pandas(table)
+    missing = [name for name in required if name not in frame.columns]
+    if missing:
+        raise ValueError(f"{kind} table is missing required column(s): {missing}")
+
+    data = {}
+    for name, default in columns.items():
+        if name not in frame.columns:
+            data[name] = np.full(len(frame), default, dtype=object)
+        elif default is not None:
+            data[name] = frame[name].where(frame[name].notna(), default).to_numpy()
+        else:
+            data[name] = frame[name].to_numpy()
+    # Object columns: hashing (duplicated/isin) on them is much faster than
+    # on pandas' Arrow-backed string dtype
+    out = pd.DataFrame(data, dtype=object)
+    return out[out[required].notna().all(axis=1)]
+
+
+def _enum_values(column: pd.Series, enum: type) -> pd.Series:
+    """Map a column of enum members or values to enum members."""
+    codes, uniques = pd.factorize(column, use_na_sentinel=False)
+    members = np.array([enum(value) for value in uniques], dtype=object)
+    # dtype=object, or pandas infers a string column from str-based enums
+    return pd.Series(members[codes], index=column.index, dtype=object)
+
+
+def node_frame(table: Any, exclude: Collection[str] = ()) -> pd.DataFrame:
+    """Normalize a node table and drop duplicate or excluded IDs.
+
+    Args:
+        table: Node table with at least an ``id`` column.
+        exclude: IDs to drop, e.g. nodes already in the graph.
+
+    Returns:
+        DataFrame with the `NODE_COLUMNS`, one row per new node ID.
+    """
+    frame = _normalize(table, NODE_COLUMNS, ["id"], "node")
+    frame = frame[~frame["id"].duplicated()]
+    if len(exclude):
+        frame = frame[~frame["id"].isin(exclude)]
+    frame = frame.assign(
+        label=frame["label"].where(frame["label"].notna(), frame["id"]),
+        node_type=_enum_values(frame["node_type"], NodeType),
+        source=_enum_values(frame["source"], DataSource),
+    )
+    return frame
+
+
+def edge_frame(table: Any, node_ids: Collection[str]) -> pd.DataFrame:
+    """Normalize an edge table, dropping duplicate and dangling edges.
+
+    Args:
+        table: Edge table with at least ``source`` and ``target`` columns.
+        node_ids: IDs of the nodes edges may connect.
+
+    Returns:
+        DataFrame with the `EDGE_COLUMNS`; relations are `EdgeType`
+        members and weights are floats.
+    """
+    frame = _normalize(table, EDGE_COLUMNS, ["source", "target"], "edge")
+    frame = frame.assign(
+        relation=_enum_values(frame["relation"], EdgeType),
+        weight=pd.to_numeric(frame["weight"]).fillna(1.0).astype(float),
+    )
+    frame = frame[~frame.duplicated(["source", "target", "relation"])]
+    # Semi-join on the node IDs
+    return frame[frame["source"].isin(node_ids) & frame["target"].isin(node_ids)]
+
+
+_EMPTY: FrozenSet = frozenset()
+
+
+def _frozen(value: Any) -> FrozenSet:
+    """Convert a list-like cell to a frozenset (empty for missing values)."""
+    if isinstance(value, str):
+        return frozenset([value])
+    if value is None or (not hasattr(value, "__iter__") and pd.isna(value)):
+        return _EMPTY
+    return frozenset(value)
+
+
+def _frozen_items(value: Any) -> FrozenSet[Tuple[str, Any]]:
+    """Convert a dict cell (or frozenset of items) to frozen properties."""
+    if isinstance(value, (dict, Mapping)):
+        return frozenset(value.items())
+    return _frozen(value)
+
+
+def _frozen_column(column: pd.Series, convert: Callable[[Any], FrozenSet]) -> List[FrozenSet]:
+    """Apply ``convert`` to the non-null cells of a column."""
+    values = [_EMPTY] * len(column)
+    present = np.flatnonzero(column.notna().to_numpy())
+    for i, value in zip(present.tolist(), column.iloc[present].tolist()):
+        values[i] = convert(value)
+    return values
+
+
+def nodes_from_frame(frame: pd.DataFrame) -> List[Node]:
+    """Build nodes from a table returned by `node_frame`."""
+    return [
+        Node(
+            id=node_id,
+            label=label,
+            node_type=node_type,
+            source=source,
+            properties=properties,
+            xrefs=xrefs,
+        )
+        for node_id, label, node_type, source, properties, xrefs in zip(
+            frame["id"].tolist(),
+            frame["label"].tolist(),
+            frame["node_type"].tolist(),
+            frame["source"].tolist(),
+            _frozen_column(frame["properties"], _frozen_items),
+            _frozen_column(frame["xrefs"], _frozen),
+        )
+    ]
+
+
+def edges_from_frame(frame: pd.DataFrame) -> List[Edge]:
+    """Build edges from a table returned by `edge_frame`."""
+    return [
+        Edge(
+            source=source,
+            target=target,
+            relation=relation,
+            weight=weight,
+            evidence=evidence,
+            properties=properties,
+        )
+        for source, target, relation, weight, evidence, properties in zip(
+            frame["source"].tolist(),
+            frame["target"].tolist(),
+            frame["relation"].tolist(),
+            frame["weight"].tolist(),
+            _frozen_column(frame["evidence"], _frozen),
+            _frozen_column(frame["properties"], _frozen_items),
+        )
+    ]
+
+
+def edge_table(edges: Iterable[Edge]) -> Dict[str, list]:
+    """Columns of an edge iterable, in the layout `edge_frame` reads."""
+    table: Dict[str, list] = {name: [] for name in EDGE_COLUMNS}
+    for edge in edges:
+        table["source"].append(edge.source)
+        table["target"].append(edge.target)
+        table["relation"].append(edge.relation)
+        table["weight"].append(edge.weight)
+        table["evidence"].append(edge.evidence or None)
+        table["properties"].append(edge.properties or None)
+    return table
+
+
+def edge_extras(frame: pd.DataFrame) -> np.ndarray:
+    """Per-edge ``(evidence, properties)`` tuples, or None for plain edges."""
+    extras = np.empty(len(frame), dtype=object)
+    present = np.flatnonzero(
+        (frame["evidence"].notna() | frame["properties"].notna()).to_numpy()
+    )
+    for i, evidence, properties in zip(
+        present.tolist(),
+        _frozen_column(frame["evidence"].iloc[present], _frozen),
+        _frozen_column(frame["properties"].iloc[present], _frozen_items),
+    ):
+        if evidence or properties:
+            extras[i] = (evidence, properties)
+    return extras
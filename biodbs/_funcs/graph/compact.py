@@ -0,0 +1,739 @@
+"""Compact array-backed storage for large knowledge graphs.
+
+This module provides:
+    - CompactKnowledgeGraph: A `KnowledgeGraph` that interns node IDs to
+      integers and keeps edges in CSR/CSC arrays instead of `Edge` sets
+
+`KnowledgeGraph` keeps every edge as a frozen `Edge` object in a set and in
+two per-node sets, which costs a few hundred bytes per edge. The compact
+backend stores each edge as one row of numpy arrays (target, relation code,
+weight), sorted by source (CSR) with a second index sorted by target (CSC).
+That is about 20 bytes per edge, and neighbor lookups are array slices.
+
+New edges go into an append buffer and are merged into the arrays the next
+time an adjacency query needs them, or when `compact()` is called. Removed
+nodes and edges are tombstoned and dropped on the same compaction, which
+also renumbers node indices to stay dense.
+
+Example:
+    ```python
+    from biodbs.graph import CompactKnowledgeGraph, build_go_graph
+
+    graph = CompactKnowledgeGraph.from_graph(build_go_graph(terms))
+    graph.get_outgoing_edges("GO:0006915")   # same API as KnowledgeGraph
+    i = graph.node_index("GO:0006915")
+    graph.neighbor_indices(i)               # numpy view, no copy
+    matrix = graph.to_scipy_sparse()        # shares the CSR arrays
+    ```
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+import numpy as np
+import pandas as pd
+
+from biodbs._funcs.graph.core import (
+    Edge,
+    EdgeType,
+    KnowledgeGraph,
+    Node,
+)
+
+if TYPE_CHECKING:
+    import scipy.sparse
+
+# Relation codes stored in the uint8 relation column
+_RELATIONS: Tuple[EdgeType, ...] = tuple(EdgeType)
+_RELATION_CODES: Dict[EdgeType, int] = {rel: i for i, rel in enumerate(_RELATIONS)}
+
+# Edges materialized per block when iterating over the whole graph
+_ITER_BLOCK = 1 << 16
+
+
+def _index_dtype(n: int, m: int) -> type:
+    """Smallest index dtype scipy.sparse accepts without copying."""
+    return np.int32 if max(n, m) < np.iinfo(np.int32).max else np.int64
+
+
+class CompactKnowledgeGraph(KnowledgeGraph):
+    """Knowledge graph stored as integer-indexed CSR/CSC arrays.
+
+    Has the same public API as `KnowledgeGraph`. Nodes are still `Node`
+    objects, but edges are only turned into `Edge` objects when they are
+    returned. Use `node_index`, `neighbor_indices` and `to_scipy_sparse`
+    to work on the integer representation directly.
+
+    Edge weights are stored as float64. Evidence and properties are kept
+    only for edges that have them.
+
+    Example:
+        ```python
+        graph = CompactKnowledgeGraph(name="GO")
+        graph.add_nodes(nodes)
+        graph.add_edges(edges)      # buffered
+        graph.compact()             # optional; queries compact on demand
+        ```
+    """
+
+    def _init_edge_storage(self) -> None:
+        """Create empty CSR/CSC arrays and the append buffer."""
+        self._index: Dict[str, int] = {}  # node_id -> row
+        self._ids: List[Optional[str]] = []  # row -> node_id (None once removed)
+        self._removed_nodes = 0
+        self._edge_total = 0
+
+        # CSR: edges sorted by (source, target, relation)
+        self._indptr = np.zeros(1, dtype=np.int32)
+        self._targets = np.empty(0, dtype=np.int32)
+        self._relations = np.empty(0, dtype=np.uint8)
+        self._weights = np.empty(0, dtype=np.float64)
+        self._extras = np.empty(0, dtype=object)  # None or (evidence, properties)
+        self._dead: Optional[np.ndarray] = None  # tombstones, allocated on removal
+        self._dead_count = 0
+
+        # CSC: positions of the CSR edges sorted by (target, source, relation)
+        self._in_indptr = np.zeros(1, dtype=np.int32)
+        self._in_sources = np.empty(0, dtype=np.int32)
+        self._in_order = np.empty(0, dtype=np.int32)
+        self._in_weights: Optional[np.ndarray] = None
+
+        # Append buffer for edges added since the last compaction
+        self._buf_src = array("q")
+        self._buf_dst = array("q")
+        self._buf_rel = array("B")
+        self._buf_weight = array("d")
+        self._buf_extras: List[Optional[Tuple]] = []
+        self._buf_keys: Dict[Tuple[int, int, int], int] = {}  # key -> buffer slot
+        self._buf_dead = 0
+
+    @classmethod
+    def from_graph(cls, graph: KnowledgeGraph) -> "CompactKnowledgeGraph":
+        """Copy any `KnowledgeGraph` into the compact representation.
+
+        Args:
+            graph: The graph to copy.
+
+        Returns:
+            A compacted CompactKnowledgeGraph with the same nodes and edges.
+        """
+        compact = cls(name=graph.name, description=graph.description, source=graph.source)
+        compact.update(graph)
+        compact.compact()
+        return compact
+
+    # -------------------------------------------------------------------------
+    # Compaction
+    # -------------------------------------------------------------------------
+
+    @property
+    def _dirty(self) -> bool:
+        return bool(self._buf_keys) or self._dead_count > 0 or self._removed_nodes > 0
+
+    def _ensure_compact(self) -> None:
+        if self._dirty:
+            self.compact()
+
+    def compact(self) -> None:
+        """Merge buffered edges into the arrays and drop removed items.
+
+        Node indices are renumbered if nodes were removed. Queries call this
+        automatically when needed; call it directly after a batch of
+        updates to pay the cost up front.
+        """
+        if not self._dirty:
+            if len(self._indptr) - 1 < len(self._ids):
+                self._pad_rows()
+            return
+
+        src = self._sources()
+        dst = self._targets.astype(np.int64)
+        rel = self._relations
+        weight = self._weights
+        extras = self._extras
+        if self._dead is not None:
+            keep = ~self._dead
+            src, dst, rel, weight, extras = (
+                src[keep], dst[keep], rel[keep], weight[keep], extras[keep]
+            )
+
+        if self._buf_src:
+            buf_extras = np.empty(len(self._buf_extras), dtype=object)
+            buf_extras[:] = self._buf_extras
+            buf = (
+                np.frombuffer(self._buf_src, dtype=np.int64),
+                np.frombuffer(self._buf_dst, dtype=np.int64),
+                np.frombuffer(self._buf_rel, dtype=np.uint8),
+                np.frombuffer(self._buf_weight, dtype=np.float64),
+                buf_extras,
+            )
+            if self._buf_dead:
+                keep = np.zeros(len(self._buf_src), dtype=bool)
+                keep[list(self._buf_keys.values())] = True
+                buf = tuple(col[keep] for col in buf)
+            src, dst, rel, weight, extras = (
+                np.concatenate([a, b]) for a, b in zip((src, dst, rel, weight, extras), buf)
+            )
+
+        if self._removed_nodes:
+            alive = np.fromiter((i is not None for i in self._ids), dtype=bool, count=len(self._ids))
+            renumber = np.cumsum(alive) - 1
+            src, dst = renumber[src], renumber[dst]
+            self._ids = [i for i in self._ids if i is not None]
+            self._index = {node_id: i for i, node_id in enumerate(self._ids)}
+            self._removed_nodes = 0
+
+        self._build(src, dst, rel, weight, extras)
+
+    def _sources(self) -> np.ndarray:
+        """Source index of every CSR position."""
+        counts = np.diff(self._indptr)
+        return np.repeat(np.arange(len(counts), dtype=np.int64), counts)
+
+    def _build(
+        self,
+        src: np.ndarray,
+        dst: np.ndarray,
+        rel: np.ndarray,
+        weight: np.ndarray,
+        extras: np.ndarray,
+    ) -> None:
+        """Replace the arrays with the given live edges and empty the buffer."""
+        n, m = len(self._ids), len(src)
+        idx = _index_dtype(n, m)
+
+        order = np.lexsort((rel, dst, src))
+        src, dst = src[order], dst[order]
+        self._targets = dst.astype(idx)
+        self._relations = rel[order]
+        self._weights = weight[order]
+        self._extras = extras[order]
+        self._indptr = np.zeros(n + 1, dtype=idx)
+        self._indptr[1:] = np.cumsum(np.bincount(src, minlength=n))
+
+        in_order = np.lexsort((self._relations, src, dst))
+        self._in_order = in_order.astype(idx)
+        self._in_sources = src[in_order].astype(idx)
+        self._in_indptr = np.zeros(n + 1, dtype=idx)
+        self._in_indptr[1:] = np.cumsum(np.bincount(dst, minlength=n))
+        self._in_weights = None
+
+        self._dead = None
+        self._dead_count = 0
+        self._buf_src, self._buf_dst = array("q"), array("q")
+        self._buf_rel, self._buf_weight = array("B"), array("d")
+        self._buf_extras = []
+        self._buf_keys = {}
+        self._buf_dead = 0
+
+    def add_edges_bulk(self, edges: Any) -> int:
+        """Add edges from a columnar table or another graph in one pass.
+
+        Endpoints are mapped to node indices with a hash join, duplicates
+        (including edges already in the graph) are dropped by hashing the
+        packed (source, target, relation) key, and the arrays are rebuilt
+        once. Edges from another CompactKnowledgeGraph are taken straight
+        from its arrays.
+
+        Args:
+            edges: Edge table, or a KnowledgeGraph whose edges to add.
+
+        Returns:
+            Number of edges actually added.
+        """
+        from biodbs._funcs.graph.bulk import edge_extras, edge_frame, edge_table
+
+        self._ensure_compact()
+        index = pd.Index(self._ids)
+        if isinstance(edges, CompactKnowledgeGraph):
+            edges.compact()
+            lookup = index.get_indexer(edges._ids)
+            src = lookup[edges._sources()]
+            dst = lookup[edges._targets]
+            rel, weight, extras = edges._relations, edges._weights, edges._extras
+            keep = (src >= 0) & (dst >= 0)
+            src, dst, rel, weight, extras = (
+                src[keep], dst[keep], rel[keep], weight[keep], extras[keep]
+            )
+        else:
+            if isinstance(edges, KnowledgeGraph):
+                edges = edge_table(edges.iter_edges())
+            frame = edge_frame(edges, self._index.keys())
+            src = index.get_indexer(frame["source"])
+            dst = index.get_indexer(frame["target"])
+            rel = frame["relation"].map(_RELATION_CODES).to_numpy(dtype=np.uint8)
+            weight = frame["weight"].to_numpy(dtype=np.float64)
+            extras = edge_extras(frame)
+
+        old_src = self._sources()
+        old_keys = self._pack(old_src, self._targets, self._relations)
+        keys = np.concatenate([old_keys, self._pack(src, dst, rel)])
+        new = ~pd.Series(keys).duplicated().to_numpy()[len(old_keys):]
+        if not new.any():
+            return 0
+
+        self._build(
+            np.concatenate([old_src, src[new]]),
+            np.concatenate([self._targets.astype(np.int64), dst[new]]),
+            np.concatenate([self._relations, rel[new]]),
+            np.concatenate([self._weights, weight[new]]),
+            np.concatenate([self._extras, extras[new]]),
+        )
+        added = int(new.sum())
+        self._edge_total += added
+        return added
+
+    def _pack(self, src: np.ndarray, dst: np.ndarray, rel: np.ndarray) -> np.ndarray:
+        """One int64 key per (source, target, relation) triple."""
+        n = np.int64(max(1, len(self._ids)))
+        return (src.astype(np.int64) * n + dst) * len(_RELATIONS) + rel
+
+    def _pad_rows(self) -> None:
+        """Extend the row pointers to cover nodes added since compaction."""
+        n = len(self._ids)
+        pad = n + 1 - len(self._indptr)
+        idx = _index_dtype(n, len(self._targets))
+        self._indptr = np.concatenate(
+            [self._indptr, np.full(pad, self._indptr[-1])]
+        ).astype(idx, copy=False)
+        self._in_indptr = np.concatenate(
+            [self._in_indptr, np.full(pad, self._in_indptr[-1])]
+        ).astype(idx, copy=False)
+        if self._targets.dtype != idx:
+            self._targets = self._targets.astype(idx)
+            self._in_sources = self._in_sources.astype(idx)
+            self._in_order = self._in_order.astype(idx)
+
+    @staticmethod
+    def _span(indptr: np.ndarray, i: int) -> Tuple[int, int]:
+        """Bounds of row ``i``; rows added after compaction are empty."""
+        if i + 1 < len(indptr):
+            return int(indptr[i]), int(indptr[i + 1])
+        return 0, 0
+
+    def _find(self, s: int, t: int, r: Optional[int] = None) -> int:
+        """CSR position of a live compacted edge, or -1."""
+        lo, hi = self._span(self._indptr, s)
+        if lo == hi:
+            return -1
+        pos = lo + int(np.searchsorted(self._targets[lo:hi], t))
+        while pos < hi and self._targets[pos] == t:
+            if (r is None or self._relations[pos] == r) and (
+                self._dead is None or not self._dead[pos]
+            ):
+                return pos
+            pos += 1
+        return -1
+
+    def _kill(self, pos: int) -> bool:
+        """Tombstone a compacted edge; False if it was already dead."""
+        if self._dead is None:
+            self._dead = np.zeros(len(self._targets), dtype=bool)
+        if self._dead[pos]:
+            return False
+        self._dead[pos] = True
+        self._dead_count += 1
+        self._edge_total -= 1
+        return True
+
+    def _edge(self, source: str, target: str, pos: int) -> Edge:
+        """Materialize the compacted edge at CSR position ``pos``."""
+        extra = self._extras[pos]
+        relation = _RELATIONS[self._relations[pos]]
+        weight = float(self._weights[pos])
+        if extra is None:
+            return Edge(source, target, relation, weight)
+        return Edge(source, target, relation, weight, extra[0], extra[1])
+
+    # -------------------------------------------------------------------------
+    # Integer Views
+    # -------------------------------------------------------------------------
+
+    def node_index(self, node_id: str) -> int:
+        """Get the integer index of a node (valid until the next compaction).
+
+        Raises:
+            KeyError: If the node does not exist.
+        """
+        self._ensure_compact()
+        return self._index[node_id]
+
+    def node_id(self, index: int) -> str:
+        """Get the node ID at an integer index."""
+        self._ensure_compact()
+        return self._ids[index]
+
+    @property
+    def node_ids(self) -> List[str]:
+        """Node IDs in index order (the row order of `to_scipy_sparse`)."""
+        self.compact()
+        return list(self._ids)
+
+    def neighbor_indices(self, index: int, direction: str = "outgoing") -> np.ndarray:
+        """Get neighbor indices of a node as a read-only view of the arrays.
+
+        No memory is allocated for the neighbors themselves. The view is
+        invalidated by the next compaction.
+
+        Args:
+            index: Node index from `node_index`.
+            direction: "outgoing" (targets, sorted) or "incoming" (sources,
+                sorted).
+
+        Returns:
+            numpy array view; a neighbor repeats once per relation.
+        """
+        self._ensure_compact()
+        if direction == "outgoing":
+            lo, hi = self._span(self._indptr, index)
+            view = self._targets[lo:hi]
+        elif direction == "incoming":
+            lo, hi = self._span(self._in_indptr, index)
+            view = self._in_sources[lo:hi]
+        else:
+            raise ValueError(f"direction must be 'outgoing' or 'incoming', got {direction!r}")
+        view.flags.writeable = False
+        return view
+
+    def to_scipy_sparse(
+        self, format: str = "csr", weighted: bool = True
+    ) -> "scipy.sparse.spmatrix":
+        """Export the adjacency matrix without copying the edge arrays.
+
+        Rows and columns follow `node_ids`. Edges with different relations
+        between the same pair of nodes are separate (duplicate) entries,
+        which scipy sums when the matrix is used.
+
+        Args:
+            format: "csr" (rows are sources) or "csc" (columns are targets).
+            weighted: Use edge weights as values; otherwise every value is 1.
+
+        Returns:
+            A scipy.sparse matrix that shares memory with the graph. Treat it
+            as read-only.
+        """
+        import scipy.sparse as sp
+
+        self.compact()
+        n = len(self._ids)
+        if format == "csr":
+            data = self._weights if weighted else np.ones(len(self._targets))
+            return sp.csr_matrix((data, self._targets, self._indptr), shape=(n, n), copy=False)
+        if format == "csc":
+            if not weighted:
+                data = np.ones(len(self._in_sources))
+            else:
+                if self._in_weights is None:
+                    self._in_weights = self._weights[self._in_order]
+                data = self._in_weights
+            return sp.csc_matrix((data, self._in_sources, self._in_indptr), shape=(n, n), copy=False)
+        raise ValueError(f"format must be 'csr' or 'csc', got {format!r}")
+
+    # -------------------------------------------------------------------------
+    # Node Operations
+    # -------------------------------------------------------------------------
+
+    @property
+    def edge_count(self) -> int:
+        """Get the number of edges."""
+        return self._edge_total
+
+    def add_node(self, node: Node) -> bool:
+        """Add a node to the graph.
+
+        Args:
+            node: The node to add.
+
+        Returns:
+            True if the node was added, False if it already existed.
+        """
+        if node.id in self._nodes:
+            return False
+        self._nodes[node.id] = node
+        self._index[node.id] = len(self._ids)
+        self._ids.append(node.id)
+        return True
+
+    def remove_node(self, node_id: str) -> bool:
+        """Remove a node and all its connected edges.
+
+        Args:
+            node_id: The node identifier.
+
+        Returns:
+            True if the node was removed, False if it didn't exist.
+        """
+        i = self._index.pop(node_id, None)
+        if i is None:
+            return False
+
+        lo, hi = self._span(self._indptr, i)
+        for pos in range(lo, hi):
+            self._kill(pos)
+        lo, hi = self._span(self._in_indptr, i)
+        for pos in self._in_order[lo:hi].tolist():
+            self._kill(pos)
+        for key in [k for k in self._buf_keys if k[0] == i or k[1] == i]:
+            self._drop_buffered(key)
+
+        del self._nodes[node_id]
+        self._ids[i] = None
+        self._removed_nodes += 1
+        return True
+
+    # -------------------------------------------------------------------------
+    # Edge Operations
+    # -------------------------------------------------------------------------
+
+    def _key(self, edge: Edge) -> Optional[Tuple[int, int, int]]:
+        s = self._index.get(edge.source)
+        t = self._index.get(edge.target)
+        if s is None or t is None:
+            return None
+        return s, t, _RELATION_CODES[edge.relation]
+
+    def _drop_buffered(self, key: Tuple[int, int, int]) -> None:
+        del self._buf_keys[key]
+        self._buf_dead += 1
+        self._edge_total -= 1
+
+    def add_edge(self, edge: Edge) -> bool:
+        """Add an edge to the append buffer.
+
+        Args:
+            edge: The edge to add.
+
+        Returns:
+            True if the edge was added, False if it already existed
+            or if source/target nodes don't exist.
+        """
+        key = self._key(edge)
+        if key is None or key in self._buf_keys or self._find(*key) >= 0:
+            return False
+
+        self._buf_keys[key] = len(self._buf_src)
+        self._buf_src.append(key[0])
+        self._buf_dst.append(key[1])
+        self._buf_rel.append(key[2])
+        self._buf_weight.append(edge.weight)
+        self._buf_extras.append(
+            (edge.evidence, edge.properties) if edge.evidence or edge.properties else None
+        )
+        self._edge_total += 1
+        return True
+
+    def add_edges(self, edges: Iterable[Edge]) -> int:
+        """Add multiple edges to the graph.
+
+        Args:
+            edges: Edges to add.
+
+        Returns:
+            Number of edges actually added.
+        """
+        add = self.add_edge
+        return sum(1 for edge in edges if add(edge))
+
+    def get_edge(
+        self, source: str, target: str, relation: Optional[EdgeType] = None
+    ) -> Optional[Edge]:
+        """Get an edge between two nodes.
+
+        Args:
+            source: Source node ID.
+            target: Target node ID.
+            relation: Optional relation type to match.
+
+        Returns:
+            The Edge if found, None otherwise.
+        """
+        if source not in self._index or target not in self._index:
+            return None
+        self._ensure_compact()
+        code = None if relation is None else _RELATION_CODES[EdgeType(relation)]
+        pos = self._find(self._index[source], self._index[target], code)
+        return None if pos < 0 else self._edge(source, target, pos)
+
+    def remove_edge(self, edge: Edge) -> bool:
+        """Remove an edge from the graph.
+
+        Args:
+            edge: The edge to remove.
+
+        Returns:
+            True if the edge was removed, False if it didn't exist.
+        """
+        key = self._key(edge)
+        if key is None:
+            return False
+        if key in self._buf_keys:
+            self._drop_buffered(key)
+            return True
+        pos = self._find(*key)
+        return pos >= 0 and self._kill(pos)
+
+    def iter_edges(self) -> Iterator[Edge]:
+        """Iterate over all edges, materializing them block by block."""
+        self._ensure_compact()
+        ids = self._ids
+        targets = self._targets
+        sources = np.repeat(
+            np.arange(len(self._indptr) - 1, dtype=targets.dtype), np.diff(self._indptr)
+        )
+        for start in range(0, len(targets), _ITER_BLOCK):
+            stop = start + _ITER_BLOCK
+            for pos, s, t in zip(
+                range(start, stop),
+                sources[start:stop].tolist(),
+                targets[start:stop].tolist(),
+            ):
+                yield self._edge(ids[s], ids[t], pos)
+
+    def iter_outgoing_edges(self, node_id: str) -> Iterator[Edge]:
+        """Iterate over the outgoing edges of a node.
+
+        Args:
+            node_id: The node identifier.
+
+        Returns:
+            Iterator over outgoing edges, sorted by target index.
+        """
+        if node_id not in self._index:
+            return iter(())
+        self._ensure_compact()
+        lo, hi = self._span(self._indptr, self._index[node_id])
+        ids = self._ids
+        return (
+            self._edge(node_id, ids[t], pos)
+            for pos, t in zip(range(lo, hi), self._targets[lo:hi].tolist())
+        )
+
+    def iter_incoming_edges(self, node_id: str) -> Iterator[Edge]:
+        """Iterate over the incoming edges of a node.
+
+        Args:
+            node_id: The node identifier.
+
+        Returns:
+            Iterator over incoming edges, sorted by source index.
+        """
+        if node_id not in self._index:
+            return iter(())
+        self._ensure_compact()
+        lo, hi = self._span(self._in_indptr, self._index[node_id])
+        ids = self._ids
+        return (
+            self._edge(ids[s], node_id, pos)
+            for pos, s in zip(
+                self._in_order[lo:hi].tolist(), self._in_sources[lo:hi].tolist()
+            )
+        )
+
+    def iter_neighbors(self, node_id: str, direction: str = "both") -> Iterator[str]:
+        """Iterate over neighboring node IDs without creating `Edge` objects.
+
+        Args:
+            node_id: The node identifier.
+            direction: "outgoing", "incoming", or "both".
+
+        Yields:
+            Neighboring node IDs, once per connecting edge.
+        """
+        if node_id not in self._index:
+            return
+        self._ensure_compact()
+        i = self._index[node_id]
+        ids = self._ids
+        if direction in ("outgoing", "both"):
+            lo, hi = self._span(self._indptr, i)
+            for t in self._targets[lo:hi].tolist():
+                yield ids[t]
+        if direction in ("incoming", "both"):
+            lo, hi = self._span(self._in_indptr, i)
+            for s in self._in_sources[lo:hi].tolist():
+                yield ids[s]
+
+    # -------------------------------------------------------------------------
+    # Filtering and Statistics
+    # -------------------------------------------------------------------------
+
+    def filter_edges(
+        self,
+        predicate: Optional[Callable[[Edge], bool]] = None,
+        relation: Optional[EdgeType] = None,
+        min_weight: Optional[float] = None,
+    ) -> List[Edge]:
+        """Filter edges by predicate or attributes.
+
+        The relation and weight filters run on the arrays, so only matching
+        edges are materialized.
+
+        Args:
+            predicate: Function that returns True for edges to include.
+            relation: Filter by relation type.
+            min_weight: Filter by minimum weight.
+
+        Returns:
+            List of matching edges.
+        """
+        self._ensure_compact()
+        mask = np.ones(len(self._targets), dtype=bool)
+        if relation is not None:
+            mask &= self._relations == _RELATION_CODES[EdgeType(relation)]
+        if min_weight is not None:
+            mask &= self._weights >= min_weight
+        positions = np.flatnonzero(mask)
+        sources = np.searchsorted(self._indptr, positions, side="right") - 1
+
+        ids = self._ids
+        result = []
+        for pos, s in zip(positions.tolist(), sources.tolist()):
+            edge = self._edge(ids[s], ids[self._targets[pos]], pos)
+            if predicate is None or predicate(edge):
+                result.append(edge)
+        return result
+
+    def get_edge_type_counts(self) -> Dict[EdgeType, int]:
+        """Get counts of edges by relation type.
+
+        Returns:
+            Dictionary mapping EdgeType to count.
+        """
+        self._ensure_compact()
+        counts = np.bincount(self._relations, minlength=len(_RELATIONS))
+        return {_RELATIONS[code]: int(n) for code, n in enumerate(counts) if n}
+
+    def get_degree(self, node_id: str, direction: str = "both") -> int:
+        """Get the degree of a node.
+
+        Args:
+            node_id: The node identifier.
+            direction: "outgoing", "incoming", or "both".
+
+        Returns:
+            The degree of the node (self-loops count once for "both").
+        """
+        if node_id not in self._index:
+            return 0
+        self._ensure_compact()
+        i = self._index[node_id]
+        lo, hi = self._span(self._indptr, i)
+        in_lo, in_hi = self._span(self._in_indptr, i)
+        if direction == "outgoing":
+            return hi - lo
+        if direction == "incoming":
+            return in_hi - in_lo
+        loops = int(np.count_nonzero(self._targets[lo:hi] == i))
+        return (hi - lo) + (in_hi - in_lo) - loops
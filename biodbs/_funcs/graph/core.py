@@ -53,6 +53,8 @@ from typing import (
 )
 
 if TYPE_CHECKING:
+    import os
+
     import pandas as pd
 
 
@@ -382,6 +384,10 @@ class KnowledgeGraph:
 
         # Internal storage
         self._nodes: Dict[str, Node] = {}
+        self._init_edge_storage()
+
+    def _init_edge_storage(self) -> None:
+        """Create the edge containers (overridden by other storage backends)."""
         self._edges: Set[Edge] = set()
         self._outgoing: Dict[str, Set[Edge]] = {}  # node_id -> outgoing edges
         self._incoming: Dict[str, Set[Edge]] = {}  # node_id -> incoming edges
@@ -405,8 +411,8 @@ class KnowledgeGraph:
     def __repr__(self) -> str:
         """Return a string representation."""
         return (
-            f"KnowledgeGraph(name='{self.name}', "
-            f"nodes={len(self._nodes)}, edges={len(self._edges)})"
+            f"{type(self).__name__}(name='{self.name}', "
+            f"nodes={len(self._nodes)}, edges={self.edge_count})"
         )
 
     @property
@@ -417,7 +423,7 @@ class KnowledgeGraph:
     @property
     def edges(self) -> List[Edge]:
         """Get all edges as a list."""
-        return list(self._edges)
+        return list(self.iter_edges())
 
     @property
     def node_count(self) -> int:
@@ -569,7 +575,7 @@ class KnowledgeGraph:
         Returns:
             The Edge if found, None otherwise.
         """
-        for edge in self._outgoing.get(source, set()):
+        for edge in self.iter_outgoing_edges(source):
             if edge.target == target:
                 if relation is None or edge.relation == relation:
                     return edge
@@ -607,6 +613,55 @@ class KnowledgeGraph:
         self._incoming[edge.target].discard(edge)
         return True
 
+    def iter_edges(self) -> Iterator[Edge]:
+        """Iterate over all edges without copying them into a list.
+
+        The graph must not be modified while iterating.
+        """
+        return iter(self._edges)
+
+    def iter_outgoing_edges(self, node_id: str) -> Iterator[Edge]:
+        """Iterate over the outgoing edges of a node without copying.
+
+        Args:
+            node_id: The node identifier.
+
+        Returns:
+            Iterator over outgoing edges (empty for unknown nodes).
+        """
+        return iter(self._outgoing.get(node_id, ()))
+
+    def iter_incoming_edges(self, node_id: str) -> Iterator[Edge]:
+        """Iterate over the incoming edges of a node without copying.
+
+        Args:
+            node_id: The node identifier.
+
+        Returns:
+            Iterator over incoming edges (empty for unknown nodes).
+        """
+        return iter(self._incoming.get(node_id, ()))
+
+    def iter_neighbors(self, node_id: str, direction: str = "both") -> Iterator[str]:
+        """Iterate over neighboring node IDs without building a set.
+
+        A neighbor is yielded once per connecting edge, so it can repeat
+        when several edges link the same pair of nodes.
+
+        Args:
+            node_id: The node identifier.
+            direction: "outgoing", "incoming", or "both".
+
+        Yields:
+            Neighboring node IDs.
+        """
+        if direction in ("outgoing", "both"):
+            for edge in self.iter_outgoing_edges(node_id):
+                yield edge.target
+        if direction in ("incoming", "both"):
+            for edge in self.iter_incoming_edges(node_id):
+                yield edge.source
+
     def get_outgoing_edges(self, node_id: str) -> List[Edge]:
         """Get all outgoing edges from a node.
 
@@ -616,7 +671,7 @@ class KnowledgeGraph:
         Returns:
             List of outgoing edges.
         """
-        return list(self._outgoing.get(node_id, set()))
+        return list(self.iter_outgoing_edges(node_id))
 
     def get_incoming_edges(self, node_id: str) -> List[Edge]:
         """Get all incoming edges to a node.
@@ -627,7 +682,7 @@ class KnowledgeGraph:
         Returns:
             List of incoming edges.
         """
-        return list(self._incoming.get(node_id, set()))
+        return list(self.iter_incoming_edges(node_id))
 
     def get_neighbors(
         self, node_id: str, direction: str = "both"
@@ -641,17 +696,7 @@ class KnowledgeGraph:
         Returns:
             List of neighboring node IDs.
         """
-        neighbors = set()
-
-        if direction in ("outgoing", "both"):
-            for edge in self._outgoing.get(node_id, set()):
-                neighbors.add(edge.target)
-
-        if direction in ("incoming", "both"):
-            for edge in self._incoming.get(node_id, set()):
-                neighbors.add(edge.source)
-
-        return list(neighbors)
+        return list(set(self.iter_neighbors(node_id, direction)))
 
     # -------------------------------------------------------------------------
     # Filtering
@@ -701,7 +746,7 @@ class KnowledgeGraph:
             List of matching edges.
         """
         result = []
-        for edge in self._edges:
+        for edge in self.iter_edges():
             if relation is not None and edge.relation != relation:
                 continue
             if min_weight is not None and edge.weight < min_weight:
@@ -746,7 +791,7 @@ class KnowledgeGraph:
         Returns:
             A new KnowledgeGraph containing the subgraph.
         """
-        subgraph = KnowledgeGraph(
+        subgraph = type(self)(
             name=f"{self.name}_subgraph",
             description=f"Subgraph of {self.name}",
             source=self.source,
@@ -759,7 +804,7 @@ class KnowledgeGraph:
                 subgraph.add_node(node)
 
         # Add edges where both endpoints are in the subgraph
-        for edge in self._edges:
+        for edge in self.iter_edges():
             if edge.source in node_ids and edge.target in node_ids:
                 subgraph.add_edge(edge)
 
@@ -789,20 +834,14 @@ class KnowledgeGraph:
         Returns:
             A new KnowledgeGraph containing all nodes and edges from both.
         """
-        merged = KnowledgeGraph(
+        merged = type(self)(
             name=f"{self.name}+{other.name}",
             description=f"Merged graph from {self.name} and {other.name}",
             source=self.source,
         )
 
-        # Add all nodes from both graphs
-        merged.add_nodes(self.nodes)
-        merged.add_nodes(other.nodes)
-
-        # Add all edges from both graphs
-        merged.add_edges(self.edges)
-        merged.add_edges(other.edges)
-
+        merged.update(self)
+        merged.update(other)
         return merged
 
     def update(self, other: "KnowledgeGraph") -> int:
@@ -816,8 +855,107 @@ class KnowledgeGraph:
         Returns:
             Total number of new nodes and edges added.
         """
-        count = self.add_nodes(other.nodes)
-        count += self.add_edges(other.edges)
+        count = self.add_nodes_bulk(other)
+        count += self.add_edges_bulk(other)
+        return count
+
+    # -------------------------------------------------------------------------
+    # Bulk Loading
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def from_frames(
+        cls,
+        nodes: Any,
+        edges: Any = None,
+        name: str = "KnowledgeGraph",
+        description: Optional[str] = None,
+        source: DataSource = DataSource.CUSTOM,
+    ) -> "KnowledgeGraph":
+        """Create a graph from columnar node and edge tables.
+
+        Tables can be pandas or polars DataFrames, pyarrow Tables, or
+        mappings of column name to array. See `add_nodes_bulk` and
+        `add_edges_bulk` for the columns.
+
+        Args:
+            nodes: Node table.
+            edges: Optional edge table.
+            name: Name of the graph.
+            description: Optional description.
+            source: Primary data source for this graph.
+
+        Returns:
+            A new graph of this class.
+
+        Example:
+            ```python
+            graph = KnowledgeGraph.from_frames(
+                pd.DataFrame({"id": ["A", "B"], "node_type": ["gene", "pathway"]}),
+                pd.DataFrame({"source": ["A"], "target": ["B"], "relation": ["participates_in"]}),
+            )
+            ```
+        """
+        graph = cls(name=name, description=description, source=source)
+        graph.add_nodes_bulk(nodes)
+        if edges is not None:
+            graph.add_edges_bulk(edges)
+        return graph
+
+    def add_nodes_bulk(self, nodes: Any) -> int:
+        """Add nodes from a columnar table or another graph.
+
+        The table needs an ``id`` column and may have ``label`` (defaults to
+        the ID), ``node_type``, ``source``, ``properties`` (dicts) and
+        ``xrefs`` (lists). Duplicate IDs are dropped by hashing, keeping
+        the first row, as are IDs already in the graph.
+
+        Args:
+            nodes: Node table, or a KnowledgeGraph whose nodes to add.
+
+        Returns:
+            Number of nodes actually added.
+        """
+        if isinstance(nodes, KnowledgeGraph):
+            return self.add_nodes(nodes)
+
+        from biodbs._funcs.graph.bulk import node_frame, nodes_from_frame
+
+        return self.add_nodes(nodes_from_frame(node_frame(nodes, exclude=self._nodes.keys())))
+
+    def add_edges_bulk(self, edges: Any) -> int:
+        """Add edges from a columnar table or another graph.
+
+        The table needs ``source`` and ``target`` columns and may have
+        ``relation`` (EdgeType or its value), ``weight``, ``evidence``
+        (lists) and ``properties`` (dicts). Duplicate (source, target,
+        relation) rows are dropped by hashing, keeping the first row, and
+        edges whose endpoints are not in the graph are dropped with a
+        semi-join on the node IDs.
+
+        Args:
+            edges: Edge table, or a KnowledgeGraph whose edges to add.
+
+        Returns:
+            Number of edges actually added.
+        """
+        if isinstance(edges, KnowledgeGraph):
+            candidates: Any = edges.iter_edges()
+        else:
+            from biodbs._funcs.graph.bulk import edge_frame, edges_from_frame
+
+            candidates = edges_from_frame(edge_frame(edges, self._nodes.keys()))
+
+        nodes, known = self._nodes, self._edges
+        outgoing, incoming = self._outgoing, self._incoming
+        count = 0
+        for edge in candidates:
+            if edge in known or edge.source not in nodes or edge.target not in nodes:
+                continue
+            known.add(edge)
+            outgoing[edge.source].add(edge)
+            incoming[edge.target].add(edge)
+            count += 1
         return count
 
     # -------------------------------------------------------------------------
@@ -842,7 +980,7 @@ class KnowledgeGraph:
             Dictionary mapping EdgeType to count.
         """
         counts: Dict[EdgeType, int] = {}
-        for edge in self._edges:
+        for edge in self.iter_edges():
             counts[edge.relation] = counts.get(edge.relation, 0) + 1
         return counts
 
@@ -918,7 +1056,7 @@ class KnowledgeGraph:
             "description": self.description,
             "source": self.source.value,
             "nodes": [node.to_dict() for node in self._nodes.values()],
-            "edges": [edge.to_dict() for edge in self._edges],
+            "edges": [edge.to_dict() for edge in self.iter_edges()],
         }
 
     @classmethod
@@ -947,6 +1085,49 @@ class KnowledgeGraph:
 
         return graph
 
+    def save(self, path: Union[str, "os.PathLike"]) -> None:
+        """Write the graph to a binary snapshot directory.
+
+        Node columns, interned IDs and the CSR/CSC edge arrays are written
+        as ``.npy`` files that `load` can memory-map. See
+        `biodbs._funcs.graph.snapshot` for the layout.
+
+        Args:
+            path: Directory to write; created if missing.
+
+        Example:
+            ```python
+            graph.save("integrated_graph")
+            graph = KnowledgeGraph.load("integrated_graph")
+            ```
+        """
+        from biodbs._funcs.graph.snapshot import save_snapshot
+
+        save_snapshot(self, path)
+
+    @classmethod
+    def load(cls, path: Union[str, "os.PathLike"], mmap: bool = True) -> "KnowledgeGraph":
+        """Open a snapshot written by `save`.
+
+        The snapshot is opened as a `CompactKnowledgeGraph` (or this class,
+        if it is a subclass of it) whose edge arrays are the snapshot files.
+        `Node` and `Edge` objects are created only when accessed.
+
+        Args:
+            path: Snapshot directory.
+            mmap: Memory-map the arrays read-only instead of reading them
+                into memory.
+
+        Returns:
+            A CompactKnowledgeGraph with the saved nodes and edges.
+        """
+        from biodbs._funcs.graph.compact import CompactKnowledgeGraph
+        from biodbs._funcs.graph.snapshot import load_snapshot
+
+        if issubclass(cls, CompactKnowledgeGraph):
+            return load_snapshot(path, mmap=mmap, cls=cls)
+        return load_snapshot(path, mmap=mmap)
+
     def nodes_as_dataframe(
         self, engine: str = "pandas"
     ) -> "pd.DataFrame":
@@ -980,7 +1161,7 @@ class KnowledgeGraph:
         Returns:
             DataFrame with edge data.
         """
-        data = [edge.to_dict() for edge in self._edges]
+        data = [edge.to_dict() for edge in self.iter_edges()]
 
         if engine == "pandas":
             import pandas as pd
@@ -9,6 +9,13 @@ Functions:
     to_rdf: Export to RDF format (Turtle or XML).
     to_neo4j_csv: Export CSV files for Neo4j import.
     to_cypher: Generate Cypher queries for Neo4j.
+    write_json_ld: Stream JSON-LD to a file or stream.
+    write_rdf: Stream N-Triples, N-Quads or Turtle without rdflib.
+    write_cypher: Stream Cypher queries to a file or stream.
+
+The write_* functions produce the same content as their to_* counterparts,
+but write it node by node (or batch by batch) instead of building it in
+memory, and can gzip the output.
 
 Dependencies:
     - networkx: Required for to_networkx()
@@ -18,18 +25,26 @@ Dependencies:
 from __future__ import annotations
 
 import csv
+import gzip
+import io
 import json
+import os
+import re
+from contextlib import contextmanager
 from pathlib import Path
 from typing import (
+    IO,
     TYPE_CHECKING,
     Any,
     Dict,
+    Iterator,
     List,
     Literal,
     Optional,
     Tuple,
     Union,
 )
+from urllib.parse import quote
 
 from biodbs._funcs.graph.core import (
     DataSource,
@@ -45,6 +60,37 @@ if TYPE_CHECKING:
     from rdflib import Graph as RDFGraph
 
 
+# =============================================================================
+# Output Streams
+# =============================================================================
+
+
+@contextmanager
+def _open_output(
+    output: Union[str, Path, IO[str], IO[bytes]], compress: Optional[bool]
+) -> Iterator[IO[str]]:
+    """Open a path or wrap a stream for writing text, optionally gzipped.
+
+    Paths are opened (and closed) here; streams are left open.
+    """
+    if isinstance(output, (str, os.PathLike)):
+        path = Path(output)
+        if compress is None:
+            compress = path.suffix == ".gz"
+        if compress:
+            with gzip.open(path, "wt", encoding="utf-8", newline="") as f:
+                yield f
+        else:
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                yield f
+    elif compress:
+        with gzip.GzipFile(fileobj=output, mode="wb") as gz:
+            with io.TextIOWrapper(gz, encoding="utf-8", newline="") as f:
+                yield f
+    else:
+        yield output
+
+
 # =============================================================================
 # NetworkX Export
 # =============================================================================
@@ -208,6 +254,53 @@ def to_json_ld(
         # schema:Dataset
         ```
     """
+    result = _json_ld_header(graph, include_context)
+    result["@graph"] = list(_json_ld_nodes(graph, base_uri, compact))
+    return result
+
+
+def write_json_ld(
+    graph: KnowledgeGraph,
+    output: Union[str, Path, IO[str]],
+    include_context: bool = True,
+    compact: bool = False,
+    base_uri: Optional[str] = None,
+    compress: Optional[bool] = None,
+) -> None:
+    """Write a KnowledgeGraph as JSON-LD to a file or stream.
+
+    Produces the same document as `to_json_ld`, but writes each node
+    object as soon as it is built, so memory use does not grow with the
+    graph. Node objects are written one per line.
+
+    Args:
+        graph: The KnowledgeGraph to export.
+        output: File path, or a text stream to write to.
+        include_context: Include JSON-LD @context.
+        compact: Use compact representation (less verbose).
+        base_uri: Base URI for node IDs.
+        compress: Gzip the output. Defaults to True for paths ending in
+            ".gz"; a stream must be binary when True.
+
+    Example:
+        ```python
+        from biodbs.graph import write_json_ld
+
+        write_json_ld(graph, "graph.jsonld.gz")
+        ```
+    """
+    header = json.dumps(_json_ld_header(graph, include_context))
+    with _open_output(output, compress) as f:
+        f.write(header[:-1] + ', "@graph": [')
+        separator = "\n"
+        for node_obj in _json_ld_nodes(graph, base_uri, compact):
+            f.write(separator + json.dumps(node_obj))
+            separator = ",\n"
+        f.write("\n]}\n")
+
+
+def _json_ld_header(graph: KnowledgeGraph, include_context: bool) -> Dict[str, Any]:
+    """JSON-LD document fields other than @graph."""
     result: Dict[str, Any] = {}
 
     # Add context
@@ -221,16 +314,20 @@ def to_json_ld(
         result["schema:description"] = graph.description
     result["schema:creator"] = "biodbs"
     result["schema:source"] = graph.source.value
+    return result
 
-    # Build nodes as @graph
-    nodes_list: List[Dict[str, Any]] = []
 
-    for node in graph.nodes:
+def _json_ld_nodes(
+    graph: KnowledgeGraph,
+    base_uri: Optional[str] = None,
+    compact: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """Yield the @graph node objects, with outgoing edges as properties."""
+    for node in graph:
         node_obj = _node_to_json_ld(node, base_uri, compact)
 
         # Add outgoing edges as properties
-        outgoing = graph.get_outgoing_edges(node.id)
-        for edge in outgoing:
+        for edge in graph.iter_outgoing_edges(node.id):
             relation_key = _edge_type_to_json_ld_key(edge.relation)
             target_id = _make_uri(edge.target, base_uri)
 
@@ -243,11 +340,7 @@ def to_json_ld(
             else:
                 node_obj[relation_key] = target_id
 
-        nodes_list.append(node_obj)
-
-    result["@graph"] = nodes_list
-
-    return result
+        yield node_obj
 
 
 def _node_to_json_ld(
@@ -348,7 +441,8 @@ def to_rdf(
 ) -> str:
     """Export a KnowledgeGraph to RDF format.
 
-    Requires the rdflib package to be installed.
+    Requires the rdflib package to be installed. For large graphs, use
+    `write_rdf`, which streams N-Triples/N-Quads/Turtle without rdflib.
 
     Args:
         graph: The KnowledgeGraph to export.
@@ -485,6 +579,180 @@ def _edge_type_to_rdf_predicate(
     return predicate_map.get(edge_type, BIOKG.relatedTo)
 
 
+class _IRINamespace:
+    """Minimal stand-in for an rdflib Namespace that builds IRI strings."""
+
+    def __init__(self, base: str):
+        self.base = base
+
+    def __getattr__(self, name: str) -> str:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self.base + name
+
+    def __getitem__(self, name: str) -> str:
+        return self.base + name
+
+
+_RDF = _IRINamespace("http://www.w3.org/1999/02/22-rdf-syntax-ns#")
+_RDFS = _IRINamespace("http://www.w3.org/2000/01/rdf-schema#")
+_XSD = _IRINamespace("http://www.w3.org/2001/XMLSchema#")
+_OBO = _IRINamespace("http://purl.obolibrary.org/obo/")
+_SCHEMA = _IRINamespace("http://schema.org/")
+
+# Characters not allowed unescaped in an N-Triples/Turtle IRI
+_IRI_UNSAFE = re.compile(r'[\x00-\x20<>"{}|^`\\]')
+# Turtle local names written as prefix:name (a conservative subset)
+_LOCAL_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_-]*\Z")
+_LITERAL_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+
+
+def _iri(iri: str) -> str:
+    """%-encode the characters an IRI reference cannot contain."""
+    return _IRI_UNSAFE.sub(lambda m: f"%{ord(m.group()):02X}", iri)
+
+
+def _node_iri(base_uri: str, node_id: str) -> str:
+    """IRI of a node, as in `to_rdf`."""
+    return _iri(base_uri + node_id.replace(":", "_"))
+
+
+def _rdf_literal(value: Any) -> str:
+    """N-Triples literal for a str, bool, int or float value."""
+    if isinstance(value, bool):
+        return f'"{str(value).lower()}"^^<{_XSD.boolean}>'
+    if isinstance(value, int):
+        return f'"{value}"^^<{_XSD.integer}>'
+    if isinstance(value, float):
+        return f'"{value!r}"^^<{_XSD.double}>'
+    return '"' + str(value).translate(_LITERAL_ESCAPES) + '"'
+
+
+def _rdf_node_triples(
+    graph: KnowledgeGraph,
+    node: Node,
+    base_uri: str,
+    biokg: _IRINamespace,
+    types: Dict[NodeType, str],
+    predicates: Dict[EdgeType, str],
+) -> Iterator[Tuple[str, str]]:
+    """Yield (predicate IRI, N-Triples object) pairs about one node.
+
+    The same statements `to_rdf` makes: the node's type, label, source,
+    definition, scalar properties and xrefs, then its outgoing edges.
+    """
+    yield _RDF.type, f"<{types[node.node_type]}>"
+    yield _RDFS.label, _rdf_literal(node.label)
+    yield biokg.source, _rdf_literal(node.source.value)
+
+    props = node.get_properties_dict()
+    if "definition" in props:
+        yield _SCHEMA.description, _rdf_literal(props["definition"])
+    for key, value in props.items():
+        if key != "definition" and isinstance(value, (str, int, float, bool)):
+            yield _iri(biokg[key]), _rdf_literal(value)
+
+    for xref in node.xrefs:
+        yield _OBO.hasDbXref, _rdf_literal(xref)
+
+    for edge in graph.iter_outgoing_edges(node.id):
+        yield predicates[edge.relation], f"<{_node_iri(base_uri, edge.target)}>"
+
+
+def write_rdf(
+    graph: KnowledgeGraph,
+    output: Union[str, Path, IO[str]],
+    format: Literal["nt", "nq", "turtle"] = "nt",
+    base_uri: str = "http://example.org/biokg/",
+    graph_uri: Optional[str] = None,
+    compress: Optional[bool] = None,
+) -> None:
+    """Write a KnowledgeGraph as RDF to a file or stream, without rdflib.
+
+    Emits the same triples as `to_rdf`, node by node, so memory use does
+    not grow with the graph. N-Triples and N-Quads have one statement per
+    line; Turtle groups each node's statements and uses prefixed names
+    where possible.
+
+    Args:
+        graph: The KnowledgeGraph to export.
+        output: File path, or a text stream to write to.
+        format: "nt" (N-Triples), "nq" (N-Quads) or "turtle".
+        base_uri: Base URI for node IRIs.
+        graph_uri: Named graph for N-Quads. Defaults to the base URI
+            followed by the graph name.
+        compress: Gzip the output. Defaults to True for paths ending in
+            ".gz"; a stream must be binary when True.
+
+    Raises:
+        ValueError: If the format is not supported.
+
+    Example:
+        ```python
+        from biodbs.graph import write_rdf
+
+        write_rdf(graph, "graph.nt.gz")
+        write_rdf(graph, "graph.ttl", format="turtle")
+        ```
+    """
+    if format not in ("nt", "nq", "turtle"):
+        raise ValueError(f"Unsupported format: {format!r} (expected 'nt', 'nq' or 'turtle')")
+
+    biokg = _IRINamespace(base_uri + "vocab/")
+    types = {node_type: _node_type_to_rdf_type(node_type, _OBO, _SCHEMA) for node_type in NodeType}
+    predicates = {
+        relation: _edge_type_to_rdf_predicate(relation, _OBO, _RDFS, biokg)
+        for relation in EdgeType
+    }
+    if format == "nq":
+        graph_iri = _iri(graph_uri or base_uri + quote(graph.name, safe=""))
+        end = f" <{graph_iri}> .\n"
+    else:
+        end = " .\n"
+
+    with _open_output(output, compress) as f:
+        if format == "turtle":
+            prefixes = {
+                "rdf": _RDF.base,
+                "rdfs": _RDFS.base,
+                "xsd": _XSD.base,
+                "obo": _OBO.base,
+                "schema": _SCHEMA.base,
+                "biokg": biokg.base,
+                "base": base_uri,
+            }
+            f.write("".join(f"@prefix {p}: <{iri}> .\n" for p, iri in prefixes.items()))
+            # Longest namespace first, so biokg: wins over base:
+            by_length = sorted(prefixes.items(), key=lambda item: -len(item[1]))
+
+            def term(iri: str) -> str:
+                for prefix, namespace in by_length:
+                    if iri.startswith(namespace) and _LOCAL_NAME.match(iri, len(namespace)):
+                        return f"{prefix}:{iri[len(namespace):]}"
+                return f"<{iri}>"
+
+            def value(obj: str) -> str:
+                if obj[0] == "<":
+                    return term(obj[1:-1])
+                if obj[-1] == ">":  # typed literal
+                    lexical, _, datatype = obj.rpartition("^^")
+                    return f"{lexical}^^{term(datatype[1:-1])}"
+                return obj
+
+            for node in graph:
+                triples = _rdf_node_triples(graph, node, base_uri, biokg, types, predicates)
+                statements = [
+                    ("a" if p == _RDF.type else term(p)) + " " + value(o) for p, o in triples
+                ]
+                subject = term(_node_iri(base_uri, node.id))
+                f.write(f"\n{subject} " + " ;\n    ".join(statements) + " .\n")
+        else:
+            for node in graph:
+                subject = f"<{_node_iri(base_uri, node.id)}> "
+                triples = _rdf_node_triples(graph, node, base_uri, biokg, types, predicates)
+                f.write("".join(f"{subject}<{p}> {o}{end}" for p, o in triples))
+
+
 # =============================================================================
 # Neo4j Export
 # =============================================================================
@@ -632,30 +900,73 @@ def to_cypher(
         # ...
         ```
     """
-    lines: List[str] = []
+    return "\n".join(_cypher_lines(graph, batch_size, use_merge))
+
+
+def write_cypher(
+    graph: KnowledgeGraph,
+    output: Union[str, Path, IO[str]],
+    batch_size: int = 100,
+    use_merge: bool = True,
+    compress: Optional[bool] = None,
+) -> None:
+    """Write the Cypher script of `to_cypher` to a file or stream.
+
+    Statements are generated and written one batch at a time, so memory
+    use does not grow with the graph.
+
+    Args:
+        graph: The KnowledgeGraph to export.
+        output: File path, or a text stream to write to.
+        batch_size: Number of statements per transaction (and per write).
+        use_merge: Use MERGE instead of CREATE (prevents duplicates).
+        compress: Gzip the output. Defaults to True for paths ending in
+            ".gz"; a stream must be binary when True.
+
+    Example:
+        ```python
+        from biodbs.graph import write_cypher
+
+        write_cypher(graph, "import.cypher")
+        # cypher-shell -f import.cypher
+        ```
+    """
+    with _open_output(output, compress) as f:
+        chunk: List[str] = []
+        for line in _cypher_lines(graph, batch_size, use_merge):
+            chunk.append(line)
+            if len(chunk) > batch_size:
+                f.write("\n".join(chunk) + "\n")
+                chunk = []
+        if chunk:
+            f.write("\n".join(chunk) + "\n")
+
+
+def _cypher_lines(graph: KnowledgeGraph, batch_size: int, use_merge: bool) -> Iterator[str]:
+    """Yield the lines of the Cypher script."""
     command = "MERGE" if use_merge else "CREATE"
 
     # Header comment
-    lines.append(f"// Cypher script generated from KnowledgeGraph: {graph.name}")
-    lines.append(f"// Nodes: {graph.node_count}, Edges: {graph.edge_count}")
-    lines.append("")
+    yield f"// Cypher script generated from KnowledgeGraph: {graph.name}"
+    yield f"// Nodes: {graph.node_count}, Edges: {graph.edge_count}"
+    yield ""
 
     # Create constraints for efficient MERGE
     if use_merge:
-        node_types_used = {node.node_type for node in graph.nodes}
+        node_types_used = {node.node_type for node in graph}
         for node_type in node_types_used:
             label = node_type.value.title().replace("_", "")
-            lines.append(
+            yield (
                 f"CREATE CONSTRAINT IF NOT EXISTS FOR (n:{label}) "
                 f"REQUIRE n.id IS UNIQUE;"
             )
-        lines.append("")
+        yield ""
 
     # Create nodes
-    lines.append("// Create nodes")
-    for i, node in enumerate(graph.nodes):
+    yield "// Create nodes"
+    for i, node in enumerate(graph):
         if i > 0 and i % batch_size == 0:
-            lines.append("")
+            yield ""
 
         label = node.node_type.value.title().replace("_", "")
         props = {
@@ -671,15 +982,15 @@ def to_cypher(
             for k, v in props.items()
         )
 
-        lines.append(f"{command} (:{label} {{{props_str}}});")
+        yield f"{command} (:{label} {{{props_str}}});"
 
-    lines.append("")
+    yield ""
 
     # Create relationships
-    lines.append("// Create relationships")
-    for i, edge in enumerate(graph.edges):
+    yield "// Create relationships"
+    for i, edge in enumerate(graph.iter_edges()):
         if i > 0 and i % batch_size == 0:
-            lines.append("")
+            yield ""
 
         rel_type = edge.relation.value.upper()
 
@@ -693,14 +1004,12 @@ def to_cypher(
             for k, v in props.items()
         )
 
-        lines.append(
+        yield (
             f"MATCH (a {{id: {_cypher_value(edge.source)}}}), "
             f"(b {{id: {_cypher_value(edge.target)}}}) "
             f"{command} (a)-[:{rel_type} {{{props_str}}}]->(b);"
         )
 
-    return "\n".join(lines)
-
 
 def _cypher_value(value: Any) -> str:
     """Convert a Python value to Cypher literal."""
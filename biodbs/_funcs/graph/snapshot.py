@@ -0,0 +1,351 @@
+"""Binary on-disk snapshots of knowledge graphs.
+
+This module provides:
+    - save_snapshot: Write a graph as a directory of ``.npy`` arrays
+    - load_snapshot: Open a snapshot as a `CompactKnowledgeGraph`
+
+A snapshot is a directory holding one ``.npy`` file per column plus a small
+``graph.json`` header:
+
+    - ``node_ids``/``node_labels``: UTF-8 strings joined by NUL bytes
+    - ``node_types``/``node_sources``: uint8 enum codes
+    - ``node_extras``: int32 code into ``node_extras.json`` (-1 for none),
+      the interned (properties, xrefs) combinations
+    - ``indptr``/``targets``/``relations``/``weights`` and
+      ``in_indptr``/``in_sources``/``in_order``: the CSR/CSC edge arrays of
+      `CompactKnowledgeGraph`
+    - ``edge_extras``: int32 code into ``edge_extras.json`` (-1 for none),
+      the interned (evidence, properties) combinations
+
+Loading with ``mmap=True`` maps the edge arrays read-only instead of reading
+them, so opening a graph costs little more than interning the node IDs.
+`Node` objects are built the first time they are accessed and `Edge`
+objects whenever they are returned, as for any `CompactKnowledgeGraph`.
+Edits after loading work as usual; changed arrays are rebuilt in memory and
+the files are never written to.
+
+The enum values are stored in the header, so snapshots stay readable if
+members are added to `NodeType`, `DataSource` or `EdgeType`.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+import numpy as np
+
+from biodbs._funcs.graph.compact import _RELATION_CODES, _RELATIONS, CompactKnowledgeGraph
+from biodbs._funcs.graph.core import DataSource, EdgeType, KnowledgeGraph, Node, NodeType
+
+FORMAT = "biodbs-graph"
+VERSION = 1
+HEADER = "graph.json"
+
+_EDGE_ARRAYS = (
+    "indptr",
+    "targets",
+    "relations",
+    "weights",
+    "in_indptr",
+    "in_sources",
+    "in_order",
+)
+
+
+# =============================================================================
+# Column Encoding
+# =============================================================================
+
+
+def _join(strings: Sequence[str], kind: str) -> np.ndarray:
+    """Encode strings as one NUL-separated UTF-8 byte array."""
+    joined = "\0".join(strings)
+    if joined.count("\0") != max(len(strings) - 1, 0):
+        raise ValueError(f"Node {kind}s cannot contain NUL characters")
+    return np.frombuffer(joined.encode("utf-8"), dtype=np.uint8)
+
+
+def _split(blob: np.ndarray, count: int) -> List[str]:
+    """Decode a byte array written by `_join`."""
+    if count == 0:
+        return []
+    return blob.tobytes().decode("utf-8").split("\0")
+
+
+def _codes(values: Sequence[Any], members: Sequence[Any]) -> np.ndarray:
+    """uint8 position of each value in ``members``."""
+    lookup = {member: i for i, member in enumerate(members)}
+    return np.fromiter((lookup[v] for v in values), dtype=np.uint8, count=len(values))
+
+
+def _intern(extras: Sequence[Optional[Tuple[FrozenSet, FrozenSet]]]) -> Tuple[np.ndarray, List]:
+    """int32 codes into the list of distinct non-empty pairs."""
+    table: Dict[Tuple[FrozenSet, FrozenSet], int] = {}
+    codes = np.full(len(extras), -1, dtype=np.int32)
+    for i, extra in enumerate(extras):
+        if extra is not None:
+            codes[i] = table.setdefault(extra, len(table))
+    return codes, list(table)
+
+
+def _thaw_json(value: Any) -> Any:
+    """Turn JSON arrays back into (hashable) tuples."""
+    if isinstance(value, list):
+        return tuple(_thaw_json(v) for v in value)
+    return value
+
+
+def _properties(data: Dict[str, Any]) -> FrozenSet[Tuple[str, Any]]:
+    return frozenset((key, _thaw_json(value)) for key, value in data.items())
+
+
+def _write(path: Path, name: str, array: np.ndarray) -> None:
+    np.save(path / f"{name}.npy", array, allow_pickle=False)
+
+
+def _write_json(path: Path, name: str, data: Any) -> None:
+    with open(path / name, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+def _read_json(path: Path, name: str) -> Any:
+    with open(path / name, encoding="utf-8") as f:
+        return json.load(f)
+
+
+# =============================================================================
+# Lazy Node Table
+# =============================================================================
+
+
+class _SnapshotNodes(MutableMapping):
+    """Node ID -> `Node` mapping that builds nodes from snapshot columns.
+
+    Nodes are created on first access and cached. Nodes added after
+    loading are stored in the cache; removed snapshot nodes are dropped
+    from the row index.
+    """
+
+    def __init__(self, path: Path, rows: Dict[str, int], mmap_mode: Optional[str], header: Dict):
+        self._path = path
+        self._rows = rows
+        self._cache: Dict[str, Node] = {}
+        self._added = 0
+        self._labels: Optional[List[str]] = None
+        self._types = [NodeType(value) for value in header["node_types"]]
+        self._sources = [DataSource(value) for value in header["sources"]]
+        self._type_codes = np.load(path / "node_types.npy", mmap_mode=mmap_mode)
+        self._source_codes = np.load(path / "node_sources.npy", mmap_mode=mmap_mode)
+        self._extra_codes = np.load(path / "node_extras.npy", mmap_mode=mmap_mode)
+        self._extras: Optional[List[Tuple[FrozenSet, FrozenSet]]] = None
+
+    def _materialize(self, node_id: str, row: int) -> Node:
+        if self._labels is None:
+            blob = np.load(self._path / "node_labels.npy")
+            self._labels = _split(blob, len(self._type_codes))
+            self._extras = [
+                (_properties(properties), frozenset(xrefs))
+                for properties, xrefs in _read_json(self._path, "node_extras.json")
+            ]
+        code = int(self._extra_codes[row])
+        properties, xrefs = self._extras[code] if code >= 0 else (frozenset(), frozenset())
+        return Node(
+            id=node_id,
+            label=self._labels[row],
+            node_type=self._types[self._type_codes[row]],
+            source=self._sources[self._source_codes[row]],
+            properties=properties,
+            xrefs=xrefs,
+        )
+
+    def __getitem__(self, node_id: str) -> Node:
+        node = self._cache.get(node_id)
+        if node is None:
+            node = self._materialize(node_id, self._rows[node_id])
+            self._cache[node_id] = node
+        return node
+
+    def __setitem__(self, node_id: str, node: Node) -> None:
+        if node_id not in self._rows and node_id not in self._cache:
+            self._added += 1
+        self._cache[node_id] = node
+
+    def __delitem__(self, node_id: str) -> None:
+        if node_id in self._rows:
+            del self._rows[node_id]
+            self._cache.pop(node_id, None)
+        else:
+            del self._cache[node_id]
+            self._added -= 1
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._rows or node_id in self._cache
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._rows
+        if self._added:
+            yield from (node_id for node_id in self._cache if node_id not in self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows) + self._added
+
+
+# =============================================================================
+# Save / Load
+# =============================================================================
+
+
+def save_snapshot(graph: KnowledgeGraph, path: Union[str, os.PathLike]) -> None:
+    """Write a graph to a snapshot directory.
+
+    Graphs that are not a `CompactKnowledgeGraph` are converted first.
+    Existing snapshot files in the directory are overwritten. The files are
+    written to a temporary directory next to ``path`` and then moved in, so
+    a graph loaded from ``path`` with ``mmap=True`` can be saved back to it.
+
+    Args:
+        graph: The graph to save.
+        path: Directory to write; created if missing.
+
+    Raises:
+        ValueError: If a node ID or label contains a NUL character.
+        TypeError: If a property value cannot be written as JSON.
+    """
+    if isinstance(graph, CompactKnowledgeGraph):
+        graph.compact()
+        compact = graph
+    else:
+        compact = CompactKnowledgeGraph.from_graph(graph)
+
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f".{path.name}.", dir=path.parent))
+    try:
+        _write_snapshot(compact, staging)
+        # Remove the header first, so an interrupted save cannot be loaded
+        (path / HEADER).unlink(missing_ok=True)
+        # Replacing (not rewriting) the files keeps arrays mapped from them valid
+        for file in sorted(staging.iterdir(), key=lambda f: f.name == HEADER):
+            os.replace(file, path / file.name)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def _write_snapshot(compact: CompactKnowledgeGraph, path: Path) -> None:
+    """Write the snapshot files of a compacted graph into ``path``."""
+    ids = compact._ids
+    nodes = [compact._nodes[node_id] for node_id in ids]
+    _write(path, "node_ids", _join(ids, "ID"))
+    _write(path, "node_labels", _join([node.label for node in nodes], "label"))
+    _write(path, "node_types", _codes([node.node_type for node in nodes], list(NodeType)))
+    _write(path, "node_sources", _codes([node.source for node in nodes], list(DataSource)))
+    codes, table = _intern(
+        [(node.properties, node.xrefs) if node.properties or node.xrefs else None for node in nodes]
+    )
+    _write(path, "node_extras", codes)
+    _write_json(
+        path,
+        "node_extras.json",
+        [[dict(properties), sorted(xrefs)] for properties, xrefs in table],
+    )
+
+    for name in _EDGE_ARRAYS:
+        _write(path, name, getattr(compact, f"_{name}"))
+    codes, table = _intern(compact._extras.tolist())
+    _write(path, "edge_extras", codes)
+    _write_json(
+        path,
+        "edge_extras.json",
+        [[sorted(evidence), dict(properties)] for evidence, properties in table],
+    )
+
+    _write_json(
+        path,
+        HEADER,
+        {
+            "format": FORMAT,
+            "version": VERSION,
+            "name": compact.name,
+            "description": compact.description,
+            "source": compact.source.value,
+            "node_count": len(ids),
+            "edge_count": compact.edge_count,
+            "node_types": [t.value for t in NodeType],
+            "sources": [s.value for s in DataSource],
+            "relations": [r.value for r in _RELATIONS],
+        },
+    )
+
+
+def load_snapshot(
+    path: Union[str, os.PathLike],
+    mmap: bool = True,
+    cls: Type[CompactKnowledgeGraph] = CompactKnowledgeGraph,
+) -> CompactKnowledgeGraph:
+    """Open a snapshot written by `save_snapshot`.
+
+    Args:
+        path: Snapshot directory.
+        mmap: Memory-map the edge arrays instead of reading them.
+        cls: CompactKnowledgeGraph (sub)class to create.
+
+    Returns:
+        A compacted graph backed by the snapshot arrays.
+
+    Raises:
+        FileNotFoundError: If ``path`` has no snapshot header.
+        ValueError: If the header is not a supported snapshot version.
+    """
+    path = Path(path)
+    header = _read_json(path, HEADER)
+    if header.get("format") != FORMAT or header.get("version") != VERSION:
+        raise ValueError(
+            f"{path} is not a version {VERSION} {FORMAT} snapshot "
+            f"(format={header.get('format')!r}, version={header.get('version')!r})"
+        )
+    mmap_mode = "r" if mmap else None
+    n, m = header["node_count"], header["edge_count"]
+
+    graph = cls(
+        name=header["name"],
+        description=header["description"],
+        source=DataSource(header["source"]),
+    )
+    ids = _split(np.load(path / "node_ids.npy", mmap_mode=mmap_mode), n)
+    rows = dict(zip(ids, range(n)))
+    graph._ids = ids
+    graph._index = dict(rows)
+    graph._nodes = _SnapshotNodes(path, rows, mmap_mode, header)
+
+    for name in _EDGE_ARRAYS:
+        setattr(graph, f"_{name}", np.load(path / f"{name}.npy", mmap_mode=mmap_mode))
+    if header["relations"] != [r.value for r in _RELATIONS]:
+        remap = np.array(
+            [_RELATION_CODES[EdgeType(value)] for value in header["relations"]], dtype=np.uint8
+        )
+        graph._relations = remap[graph._relations]
+
+    table = _read_json(path, "edge_extras.json")
+    extras = np.empty(len(table) + 1, dtype=object)  # last slot (code -1) stays None
+    for i, (evidence, properties) in enumerate(table):
+        extras[i] = (frozenset(evidence), _properties(properties))
+    graph._extras = extras[np.load(path / "edge_extras.npy", mmap_mode=mmap_mode)]
+    graph._edge_total = m
+    return graph
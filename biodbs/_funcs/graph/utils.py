@@ -1,8 +1,11 @@
 """Utility functions for knowledge graph analysis.
 
 This module provides graph algorithms and analysis utilities for
-KnowledgeGraph instances, implemented in pure Python without
-external dependencies.
+KnowledgeGraph instances. Whole-graph algorithms (components, betweenness)
+run on integer CSR arrays, taken without copying from a
+CompactKnowledgeGraph or built once from a KnowledgeGraph. Single-source
+searches run on the arrays for CompactKnowledgeGraph and walk the edge sets
+otherwise, so a short query does not pay for converting the whole graph.
 
 Functions:
     find_shortest_path: Find shortest path between two nodes.
@@ -29,17 +32,23 @@ Example:
 
 from __future__ import annotations
 
+import random
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from typing import (
     Any,
     Callable,
     Dict,
     List,
     Optional,
+    Sequence,
     Set,
     Tuple,
 )
 
+import numpy as np
+
+from biodbs._funcs.graph.compact import CompactKnowledgeGraph
 from biodbs._funcs.graph.core import (
     Edge,
     EdgeType,
@@ -49,6 +58,132 @@ from biodbs._funcs.graph.core import (
 )
 
 
+# =============================================================================
+# Array Kernels
+# =============================================================================
+
+
+def _adjacency(graph: KnowledgeGraph) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Get node IDs and CSR (indptr, indices) arrays for any graph.
+
+    Parallel edges with different relations are kept as repeated entries.
+    """
+    if isinstance(graph, CompactKnowledgeGraph):
+        csr = graph.to_scipy_sparse()
+        return graph.node_ids, csr.indptr, csr.indices
+
+    ids = [node.id for node in graph]
+    index = {node_id: i for i, node_id in enumerate(ids)}
+    pairs = np.fromiter(
+        (index[x] for edge in graph.iter_edges() for x in (edge.source, edge.target)),
+        dtype=np.int64,
+        count=2 * graph.edge_count,
+    ).reshape(-1, 2)
+    order = np.lexsort((pairs[:, 1], pairs[:, 0]))
+    indptr = np.zeros(len(ids) + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum(np.bincount(pairs[:, 0], minlength=len(ids)))
+    return ids, indptr, pairs[order, 1]
+
+
+def _expand(
+    indptr: np.ndarray, indices: np.ndarray, frontier: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Gather every edge leaving ``frontier`` as (source, target) arrays."""
+    starts = indptr[frontier].astype(np.int64)
+    counts = indptr[frontier + 1] - starts
+    total = int(counts.sum())
+    # Position of each gathered edge: its row start plus its offset in the row
+    offsets = np.arange(total) + np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return np.repeat(frontier, counts), indices[offsets]
+
+
+def _bfs_path(
+    adjacency: Sequence[Tuple[np.ndarray, np.ndarray]],
+    n: int,
+    source: int,
+    target: int,
+    max_depth: Optional[int],
+) -> Optional[List[int]]:
+    """Level-synchronous BFS with a predecessor array; returns node indices."""
+    pred = np.full(n, -1, dtype=np.int64)
+    pred[source] = source
+    frontier = np.array([source], dtype=np.int64)
+    depth = 0
+    while frontier.size and (max_depth is None or depth < max_depth):
+        gathered = [_expand(indptr, indices, frontier) for indptr, indices in adjacency]
+        src = np.concatenate([g[0] for g in gathered])
+        dst = np.concatenate([g[1] for g in gathered]).astype(np.int64)
+        new = pred[dst] < 0
+        dst, first = np.unique(dst[new], return_index=True)
+        pred[dst] = src[new][first]
+        if pred[target] >= 0:
+            path = [target]
+            while path[-1] != source:
+                path.append(int(pred[path[-1]]))
+            return path[::-1]
+        frontier = dst
+        depth += 1
+    return None
+
+
+def _brandes(indptr: np.ndarray, indices: np.ndarray, sources: Sequence[int]) -> np.ndarray:
+    """Unnormalized Brandes betweenness summed over ``sources``.
+
+    BFS runs one level at a time on whole arrays. The distance, path-count
+    and dependency arrays are allocated once and only the entries a source
+    reached are reset, so each source costs O(reached nodes + edges).
+    """
+    n = len(indptr) - 1
+    centrality = np.zeros(n)
+    dist = np.full(n, -1, dtype=np.int64)
+    sigma = np.zeros(n)
+    delta = np.zeros(n)
+
+    for s in sources:
+        dist[s] = 0
+        sigma[s] = 1.0
+        frontier = np.array([s], dtype=np.int64)
+        reached = [frontier]
+        levels = []
+        depth = 0
+        while frontier.size:
+            src, dst = _expand(indptr, indices, frontier)
+            unseen = dst[dist[dst] < 0]
+            frontier = np.unique(unseen).astype(np.int64)
+            dist[frontier] = depth + 1
+            on_path = dist[dst] == depth + 1
+            src, dst = src[on_path], dst[on_path]
+            np.add.at(sigma, dst, sigma[src])
+            levels.append((src, dst))
+            reached.append(frontier)
+            depth += 1
+
+        for src, dst in reversed(levels):
+            np.add.at(delta, src, sigma[src] / sigma[dst] * (1.0 + delta[dst]))
+
+        reached = np.concatenate(reached)
+        centrality[reached] += delta[reached]
+        centrality[s] -= delta[s]
+        dist[reached] = -1
+        sigma[reached] = 0.0
+        delta[reached] = 0.0
+
+    return centrality
+
+
+# Graph arrays of a betweenness worker process, set once by its initializer
+_worker_adjacency: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+
+def _init_betweenness_worker(indptr: np.ndarray, indices: np.ndarray) -> None:
+    global _worker_adjacency
+    _worker_adjacency = (indptr, indices)
+
+
+def _betweenness_chunk(sources: Sequence[int]) -> np.ndarray:
+    return _brandes(*_worker_adjacency, sources)
+
+
 # =============================================================================
 # Path Finding
 # =============================================================================
@@ -87,35 +222,43 @@ def find_shortest_path(
     if source == target:
         return [source]
 
-    # BFS with path tracking
-    queue: deque = deque([(source, [source])])
-    visited: Set[str] = {source}
-
-    while queue:
-        current, path = queue.popleft()
+    if isinstance(graph, CompactKnowledgeGraph):
+        csr = graph.to_scipy_sparse()
+        adjacency = [(csr.indptr, csr.indices)]
+        if not directed:
+            csc = graph.to_scipy_sparse("csc")
+            adjacency.append((csc.indptr, csc.indices))
+        path = _bfs_path(
+            adjacency,
+            graph.node_count,
+            graph.node_index(source),
+            graph.node_index(target),
+            max_depth,
+        )
+        return None if path is None else [graph.node_id(i) for i in path]
 
-        if max_depth is not None and len(path) > max_depth:
-            continue
+    direction = "outgoing" if directed else "both"
 
-        # Get neighbors
-        neighbors = set()
+    # BFS recording each node's predecessor; the path is rebuilt at the end
+    predecessor: Dict[str, Optional[str]] = {source: None}
+    queue: deque = deque([(source, 0)])
 
-        # Outgoing edges
-        for edge in graph.get_outgoing_edges(current):
-            neighbors.add(edge.target)
+    while queue:
+        current, depth = queue.popleft()
 
-        # Incoming edges (if undirected)
-        if not directed:
-            for edge in graph.get_incoming_edges(current):
-                neighbors.add(edge.source)
+        if max_depth is not None and depth >= max_depth:
+            continue
 
-        for neighbor in neighbors:
+        for neighbor in graph.iter_neighbors(current, direction):
+            if neighbor in predecessor:
+                continue
+            predecessor[neighbor] = current
             if neighbor == target:
-                return path + [neighbor]
-
-            if neighbor not in visited:
-                visited.add(neighbor)
-                queue.append((neighbor, path + [neighbor]))
+                path = [target]
+                while predecessor[path[-1]] is not None:
+                    path.append(predecessor[path[-1]])
+                return path[::-1]
+            queue.append((neighbor, depth + 1))
 
     return None
 
@@ -154,6 +297,7 @@ def find_all_paths(
         return []
 
     all_paths: List[List[str]] = []
+    direction = "outgoing" if directed else "both"
 
     def dfs(current: str, path: List[str], visited: Set[str]):
         if current == target:
@@ -163,15 +307,7 @@ def find_all_paths(
         if len(path) >= max_depth:
             return
 
-        # Get neighbors
-        neighbors = set()
-
-        for edge in graph.get_outgoing_edges(current):
-            neighbors.add(edge.target)
-
-        if not directed:
-            for edge in graph.get_incoming_edges(current):
-                neighbors.add(edge.source)
+        neighbors = set(graph.iter_neighbors(current, direction))
 
         for neighbor in neighbors:
             if neighbor not in visited:
@@ -248,7 +384,7 @@ def get_neighborhood(
 
         for current in current_level:
             # Outgoing edges
-            for edge in graph.get_outgoing_edges(current):
+            for edge in graph.iter_outgoing_edges(current):
                 if edge.target not in visited:
                     next_level.add(edge.target)
                     visited.add(edge.target)
@@ -257,7 +393,7 @@ def get_neighborhood(
 
             # Incoming edges (if undirected)
             if not directed:
-                for edge in graph.get_incoming_edges(current):
+                for edge in graph.iter_incoming_edges(current):
                     if edge.source not in visited:
                         next_level.add(edge.source)
                         visited.add(edge.source)
@@ -301,8 +437,20 @@ def get_connected_component(
     if node_id not in graph:
         return set()
 
+    if isinstance(graph, CompactKnowledgeGraph):
+        from scipy.sparse.csgraph import breadth_first_order
+
+        order = breadth_first_order(
+            graph.to_scipy_sparse(),
+            graph.node_index(node_id),
+            directed=directed,
+            return_predecessors=False,
+        )
+        return {graph.node_id(i) for i in order.tolist()}
+
     visited: Set[str] = set()
     queue: deque = deque([node_id])
+    direction = "outgoing" if directed else "both"
 
     while queue:
         current = queue.popleft()
@@ -311,16 +459,10 @@ def get_connected_component(
             continue
         visited.add(current)
 
-        # Outgoing edges
-        for edge in graph.get_outgoing_edges(current):
-            if edge.target not in visited:
-                queue.append(edge.target)
-
-        # Incoming edges (for undirected or weak connectivity)
-        if not directed:
-            for edge in graph.get_incoming_edges(current):
-                if edge.source not in visited:
-                    queue.append(edge.source)
+        # Incoming edges are followed too for undirected or weak connectivity
+        for neighbor in graph.iter_neighbors(current, direction):
+            if neighbor not in visited:
+                queue.append(neighbor)
 
     return visited
 
@@ -331,23 +473,34 @@ def get_all_connected_components(
 ) -> List[Set[str]]:
     """Get all connected components in the graph.
 
+    Labels every node in one pass with scipy.sparse.csgraph.
+
     Args:
         graph: The knowledge graph.
-        directed: If True, find strongly connected components.
+        directed: If True, find strongly connected components; otherwise
+            weakly connected ones.
 
     Returns:
         List of sets, each containing node IDs in a component.
     """
-    remaining = set(node.id for node in graph.nodes)
-    components: List[Set[str]] = []
+    import scipy.sparse as sp
+    from scipy.sparse.csgraph import connected_components
 
-    while remaining:
-        # Pick any remaining node
-        start = next(iter(remaining))
-        component = get_connected_component(graph, start, directed)
-        components.append(component)
-        remaining -= component
+    ids, indptr, indices = _adjacency(graph)
+    if not ids:
+        return []
 
+    n = len(ids)
+    # csgraph needs each node pair once; copy so the graph's arrays are untouched
+    matrix = sp.csr_matrix((np.ones(len(indices)), indices, indptr), shape=(n, n), copy=True)
+    matrix.sum_duplicates()
+    count, labels = connected_components(
+        matrix, directed=True, connection="strong" if directed else "weak"
+    )
+
+    components: List[Set[str]] = [set() for _ in range(count)]
+    for node_id, label in zip(ids, labels.tolist()):
+        components[label].add(node_id)
     return components
 
 
@@ -424,77 +577,60 @@ def compute_betweenness_centrality(
     graph: KnowledgeGraph,
     normalized: bool = True,
     sample_size: Optional[int] = None,
+    workers: int = 1,
+    seed: Optional[int] = None,
 ) -> Dict[str, float]:
     """Compute approximate betweenness centrality for all nodes.
 
-    Uses BFS-based algorithm. For large graphs, use sample_size
-    to compute approximate centrality.
+    Uses Brandes' algorithm on the graph's CSR arrays, following edge
+    direction. For large graphs, use sample_size to compute approximate
+    centrality, and workers to split the source nodes across processes.
 
     Args:
         graph: The knowledge graph.
         normalized: If True, normalize by (n-1)(n-2)/2.
         sample_size: If set, sample this many source nodes.
+        workers: Number of worker processes. Each process gets a copy of
+            the CSR arrays and a share of the sources; the partial sums
+            are added up at the end.
+        seed: Random seed for sampling source nodes.
 
     Returns:
         Dictionary mapping node_id to betweenness centrality score.
+
+    Example:
+        ```python
+        bc = compute_betweenness_centrality(graph, sample_size=2000, workers=8)
+        ```
     """
-    node_ids = [node.id for node in graph.nodes]
+    node_ids, indptr, indices = _adjacency(graph)
     n = len(node_ids)
 
     if n < 2:
         return {nid: 0.0 for nid in node_ids}
 
-    centrality: Dict[str, float] = {nid: 0.0 for nid in node_ids}
-
     # Select source nodes
     if sample_size and sample_size < n:
-        import random
-        sources = random.sample(node_ids, sample_size)
+        sources = random.Random(seed).sample(range(n), sample_size)
     else:
-        sources = node_ids
-
-    for source in sources:
-        # BFS from source
-        stack: List[str] = []
-        predecessors: Dict[str, List[str]] = {nid: [] for nid in node_ids}
-        sigma: Dict[str, int] = {nid: 0 for nid in node_ids}
-        sigma[source] = 1
-        distance: Dict[str, int] = {nid: -1 for nid in node_ids}
-        distance[source] = 0
-
-        queue: deque = deque([source])
-
-        while queue:
-            v = queue.popleft()
-            stack.append(v)
-
-            for edge in graph.get_outgoing_edges(v):
-                w = edge.target
-                if distance[w] < 0:
-                    queue.append(w)
-                    distance[w] = distance[v] + 1
-
-                if distance[w] == distance[v] + 1:
-                    sigma[w] += sigma[v]
-                    predecessors[w].append(v)
-
-        # Accumulation
-        delta: Dict[str, float] = {nid: 0.0 for nid in node_ids}
-
-        while stack:
-            w = stack.pop()
-            for v in predecessors[w]:
-                delta[v] += (sigma[v] / sigma[w]) * (1 + delta[w])
-
-            if w != source:
-                centrality[w] += delta[w]
+        sources = list(range(n))
+
+    if workers > 1 and len(sources) > 1:
+        chunks = np.array_split(np.asarray(sources), min(len(sources), workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_betweenness_worker,
+            initargs=(indptr, indices),
+        ) as pool:
+            centrality = sum(pool.map(_betweenness_chunk, [c.tolist() for c in chunks]))
+    else:
+        centrality = _brandes(indptr, indices, sources)
 
     # Normalization
     if normalized and n > 2:
-        norm = 2.0 / ((n - 1) * (n - 2))
-        centrality = {k: v * norm for k, v in centrality.items()}
+        centrality = centrality * (2.0 / ((n - 1) * (n - 2)))
 
-    return centrality
+    return dict(zip(node_ids, centrality.tolist()))
 
 
 # =============================================================================
@@ -569,7 +705,7 @@ def get_graph_statistics(
 
         # Self-loops
         stats["num_self_loops"] = sum(
-            1 for edge in graph.edges if edge.source == edge.target
+            1 for edge in graph.iter_edges() if edge.source == edge.target
         )
 
         # Compute centrality if requested
@@ -1,23 +1,28 @@
 """Translation/conversion functions for biological identifiers."""
 
-from biodbs._funcs.translate.genes import (
-    translate_gene_ids,
-    translate_gene_ids_kegg,
-)
-from biodbs._funcs.translate.chem import (
-    translate_chemical_ids,
-    translate_chemical_ids_kegg,
-    translate_chembl_to_pubchem,
-    translate_pubchem_to_chembl,
-)
-from biodbs._funcs.translate.proteins import (
-    translate_protein_ids,
-    translate_gene_to_uniprot,
-    translate_uniprot_to_gene,
-    translate_uniprot_to_pdb,
-    translate_uniprot_to_ensembl,
-    translate_uniprot_to_refseq,
-)
+from biodbs._lazy import lazy_exports
+
+# Imported on first access (PEP 562) to keep package import cheap.
+_EXPORTS = {
+    "biodbs._funcs.translate.genes": (
+        "translate_gene_ids",
+        "translate_gene_ids_kegg",
+    ),
+    "biodbs._funcs.translate.chem": (
+        "translate_chemical_ids",
+        "translate_chemical_ids_kegg",
+        "translate_chembl_to_pubchem",
+        "translate_pubchem_to_chembl",
+    ),
+    "biodbs._funcs.translate.proteins": (
+        "translate_protein_ids",
+        "translate_gene_to_uniprot",
+        "translate_uniprot_to_gene",
+        "translate_uniprot_to_pdb",
+        "translate_uniprot_to_ensembl",
+        "translate_uniprot_to_refseq",
+    ),
+}
 
 __all__ = [
     # Gene translation
@@ -36,3 +41,5 @@ __all__ = [
     "translate_uniprot_to_ensembl",
     "translate_uniprot_to_refseq",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, exports=_EXPORTS)
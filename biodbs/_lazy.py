@@ -0,0 +1,61 @@
+"""Lazy attribute loading for biodbs packages (PEP 562).
+
+Package ``__init__`` modules declare which module each public name lives in
+and install the returned ``__getattr__``/``__dir__``. The defining module is
+imported the first time a name is accessed, so ``import biodbs`` does not pay
+for fetchers, pydantic models, pandas, polars or aiohttp that are never used.
+
+Example:
+    >>> from biodbs._lazy import lazy_exports
+    >>> __getattr__, __dir__ = lazy_exports(
+    ...     __name__,
+    ...     submodules={"graph": "biodbs.graph"},
+    ...     exports={"biodbs._funcs.graph.core": ("KnowledgeGraph", "Node")},
+    ... )
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Tuple
+
+
+def lazy_exports(
+    package: str,
+    submodules: Optional[Mapping[str, str]] = None,
+    exports: Optional[Mapping[str, Iterable[str]]] = None,
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build module-level ``__getattr__`` and ``__dir__`` for a package.
+
+    Args:
+        package: The package's ``__name__``.
+        submodules: Attribute name -> module path, for attributes that are
+            modules themselves (e.g. ``{"funcs": "biodbs.fetch._func"}``).
+        exports: Module path -> names defined in that module.
+
+    Returns:
+        ``(__getattr__, __dir__)``. Resolved attributes are cached on the
+        package, so each name is looked up through ``__getattr__`` once.
+    """
+    submodules = dict(submodules or {})
+    origins = {
+        name: module
+        for module, names in (exports or {}).items()
+        for name in names
+    }
+
+    def __getattr__(name: str) -> Any:
+        if name in submodules:
+            value = importlib.import_module(submodules[name])
+        elif name in origins:
+            value = getattr(importlib.import_module(origins[name]), name)
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(submodules) | set(origins))
+
+    return __getattr__, __dir__
@@ -49,32 +49,46 @@ For more control, use the generic ora() function with custom pathway data:
     )
 """
 
-from biodbs._funcs.analysis import (
-    # Core ORA functions
-    ora,
-    ora_kegg,
-    ora_go,
-    ora_enrichr,
-    ora_reactome,
-    ora_reactome_local,
-    # Result classes
-    ORAResult,
-    ORATermResult,
-    Pathway,
-    # Enums
-    Species,
-    GOAspect,
-    CorrectionMethod,
-    TranslationDatabase,
-    PathwayDatabase,
-    # Utility functions
-    hypergeometric_test,
-    multiple_test_correction,
-)
+from biodbs._lazy import lazy_exports
+
+# Imported on first access (PEP 562) to keep package import cheap.
+_EXPORTS = {
+    "biodbs._funcs.analysis": (
+        # Core ORA functions
+        "ora",
+        "ora_batch",
+        "ora_kegg",
+        "ora_go",
+        "ora_enrichr",
+        "ora_reactome",
+        "ora_reactome_local",
+        # Result classes
+        "ORAResult",
+        "ORATermResult",
+        "Pathway",
+        # Gene set index
+        "GeneSetIndex",
+        # GO annotation ingest
+        "GOAnnotationAggregator",
+        "load_go_ancestors",
+        # Enums
+        "Species",
+        "GOAspect",
+        "CorrectionMethod",
+        "TranslationDatabase",
+        "PathwayDatabase",
+        # Utility functions
+        "hypergeometric_test",
+        "hypergeometric_test_batch",
+        "multiple_test_correction",
+        "multiple_test_correction_array",
+    ),
+}
 
 __all__ = [
     # Core ORA functions
     "ora",
+    "ora_batch",
     "ora_kegg",
     "ora_go",
     "ora_enrichr",
@@ -84,6 +98,11 @@ __all__ = [
     "ORAResult",
     "ORATermResult",
     "Pathway",
+    # Gene set index
+    "GeneSetIndex",
+    # GO annotation ingest
+    "GOAnnotationAggregator",
+    "load_go_ancestors",
     # Enums
     "Species",
     "GOAspect",
@@ -92,5 +111,9 @@ __all__ = [
     "PathwayDatabase",
     # Utility functions
     "hypergeometric_test",
+    "hypergeometric_test_batch",
     "multiple_test_correction",
+    "multiple_test_correction_array",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, exports=_EXPORTS)
@@ -1,7 +1,7 @@
 """BioMart fetched data and data manager classes."""
 
-from biodbs.data._base import BaseFetchedData, BaseDBManager
-from typing import Literal, Optional, List, Dict, Any
+from biodbs.data._base import BaseFetchedData, BaseDBManager, read_tsv
+from typing import Any, Dict, Iterable, List, Literal, Optional
 import pandas as pd
 import polars as pl
 import xml.etree.ElementTree as ET
@@ -43,28 +43,16 @@ def _tsv_to_dataframe(tsv_text: str, columns: Optional[List[str]] = None) -> pd.
     Returns:
         DataFrame with parsed data.
     """
-    lines = tsv_text.strip().split("\n")
-    if not lines or not lines[0]:
+    if not tsv_text or not tsv_text.strip():
         return pd.DataFrame()
+    return _frame_to_pandas(read_tsv(tsv_text, columns, has_header=columns is None, fill=""))
 
-    if columns is None:
-        # First line is header
-        columns = lines[0].split("\t")
-        data_lines = lines[1:]
-    else:
-        data_lines = lines
 
-    rows = [line.split("\t") for line in data_lines if line.strip()]
-    if not rows:
-        return pd.DataFrame(columns=columns)
-
-    # Ensure all rows have the same number of columns
-    max_cols = max(len(row) for row in rows)
-    if len(columns) < max_cols:
-        columns = columns + [f"col_{i}" for i in range(len(columns), max_cols)]
-
-    padded_rows = [row + [""] * (len(columns) - len(row)) for row in rows]
-    return pd.DataFrame(padded_rows, columns=columns)
+def _frame_to_pandas(frame: pl.DataFrame) -> pd.DataFrame:
+    """Convert a parsed TSV frame to pandas (without requiring pyarrow)."""
+    if frame.is_empty():
+        return pd.DataFrame(columns=frame.columns)
+    return pd.DataFrame(frame.to_dict(as_series=False))
 
 
 class BioMartRegistryData(BaseFetchedData):
@@ -329,38 +317,38 @@ class BioMartQueryData(BaseFetchedData):
         if content.startswith("Query ERROR") or content.startswith("Error"):
             return pd.DataFrame()
 
-        lines = content.strip().split("\n")
-        if not lines:
-            return pd.DataFrame(columns=columns) if columns else pd.DataFrame()
-
-        if has_header:
-            # Skip the header line
-            if columns is None:
-                # First line is header, use it as column names
-                columns = lines[0].split("\t")
-            data_lines = lines[1:]
-        else:
-            data_lines = lines
-
-        rows = [line.split("\t") for line in data_lines if line.strip()]
-        if not rows:
-            return pd.DataFrame(columns=columns) if columns else pd.DataFrame()
+        if columns or has_header:
+            columns = list(columns) if columns else None
+            return _frame_to_pandas(read_tsv(content, columns, has_header=has_header, fill=""))
 
-        # Handle column count mismatch
-        if columns:
-            max_cols = max(len(row) for row in rows)
-            if len(columns) < max_cols:
-                columns = list(columns) + [f"col_{i}" for i in range(len(columns), max_cols)]
-            padded_rows = [row + [""] * (len(columns) - len(row)) for row in rows]
-            return pd.DataFrame(padded_rows, columns=columns)
-        else:
-            return pd.DataFrame(rows)
+        # No names at all: keep positional columns and leave short rows null
+        df = _frame_to_pandas(read_tsv(content))
+        df.columns = range(len(df.columns))
+        return df
 
     @property
     def results(self) -> List[Dict[str, Any]]:
         """Get results as list of dictionaries."""
         return self._df.to_dict(orient="records")
 
+    @classmethod
+    def concat(cls, parts: Iterable["BioMartQueryData"]) -> "BioMartQueryData":
+        """Combine several query results with a single ``pd.concat``.
+
+        Repeated ``+=`` copies the accumulated frame on every call; this
+        copies each row once.
+
+        Raises:
+            ValueError: If no parts are given.
+        """
+        parts = [part for part in parts if part is not None]
+        if not parts:
+            raise ValueError("concat() requires at least one part")
+        combined = parts[0]
+        if len(parts) > 1:
+            combined._df = pd.concat([part._df for part in parts], ignore_index=True)
+        return combined
+
     def __iadd__(self, other: "BioMartQueryData") -> "BioMartQueryData":
         """Concatenate results from another BioMartQueryData."""
         self._df = pd.concat([self._df, other._df], ignore_index=True)
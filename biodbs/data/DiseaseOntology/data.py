@@ -1,12 +1,12 @@
 """Disease Ontology fetched data and data manager classes."""
 
-from biodbs.data._base import BaseFetchedData, BaseDBManager
+from biodbs.data._base import BaseFetchedData, BaseDBManager, LazyRecords, build_index
 from biodbs.data.DiseaseOntology._data_model import (
     DiseaseTerm,
     DiseaseTermDetailed,
     SearchResult,
 )
-from typing import Literal, Optional, List, Dict, Any, Union
+from typing import Literal, Optional, Iterable, List, Dict, Any, Union
 import pandas as pd
 import polars as pl
 
@@ -19,8 +19,13 @@ class DOFetchedData(BaseFetchedData):
         - Synonyms and cross-references
         - Ontology subset membership
 
+    Terms are parsed into models only when ``terms`` is indexed or
+    iterated; `get_doids` and `get_names` read the raw records and skip
+    validation, so a term that would be rejected is included until
+    ``terms`` has been parsed.
+
     Attributes:
-        terms: List of DiseaseTerm objects.
+        terms: Lazily parsed sequence of DiseaseTerm objects.
         total_count: Total number of terms.
     """
 
@@ -39,28 +44,58 @@ class DOFetchedData(BaseFetchedData):
         self.query_ids = query_ids or []
 
         # Parse response
+        self._ols = False
         if isinstance(content, dict):
             # Single term response from direct DO API
             if "id" in content or "doid" in content:
-                term = self._parse_term(content)
-                self.terms = [term] if term else []
+                raw = [content]
             # Single term response from OLS API (has obo_id or label)
             elif "obo_id" in content or "label" in content:
-                term = self._parse_ols_term(content)
-                self.terms = [term] if term else []
+                raw, self._ols = [content], True
             # OLS embedded response (list of terms)
             elif "_embedded" in content:
-                terms_data = content.get("_embedded", {}).get("terms", [])
-                self.terms = [t for t in (self._parse_ols_term(td) for td in terms_data) if t]
+                raw, self._ols = content.get("_embedded", {}).get("terms", []), True
             else:
-                self.terms = []
-            self.total_count = len(self.terms)
+                raw = []
         elif isinstance(content, list):
-            self.terms = [t for t in (self._parse_term(td) for td in content) if t]
-            self.total_count = len(self.terms)
+            raw = content
         else:
-            self.terms = []
-            self.total_count = 0
+            raw = []
+        self.terms = LazyRecords(
+            (d for d in raw if isinstance(d, dict)), self._parse_raw_term
+        )
+        self.total_count = len(self.terms)
+
+    @property
+    def terms(self) -> LazyRecords:
+        """Terms as DiseaseTerm models, parsed on first access."""
+        return self._terms
+
+    @terms.setter
+    def terms(self, terms: Iterable[DiseaseTerm]) -> None:
+        if not isinstance(terms, LazyRecords):
+            terms = LazyRecords.from_parsed(terms, parse=self._parse_raw_term)
+        self._terms = terms
+        self._invalidate_indexes()
+
+    def _parse_raw_term(self, data: Dict) -> Optional[DiseaseTerm]:
+        """Parse a raw term from whichever API the response came from."""
+        if getattr(self, "_ols", False):
+            return self._parse_ols_term(data)
+        return self._parse_term(data)
+
+    @staticmethod
+    def _raw_doid(data: Dict) -> Optional[str]:
+        """DOID of a raw record from either the DO API or OLS."""
+        return (
+            data.get("obo_id") or data.get("id") or data.get("doid")
+            or data.get("short_form", "").replace("_", ":")
+        )
+
+    @staticmethod
+    def _raw_name(data: Dict) -> str:
+        """Name of a raw record from either the DO API or OLS."""
+        return data.get("label") or data.get("name", "")
 
     def _parse_term(self, data: Dict) -> Optional[DiseaseTerm]:
         """Parse direct DO API term data."""
@@ -163,7 +198,7 @@ class DOFetchedData(BaseFetchedData):
 
     def __repr__(self) -> str:
         """Return a human-readable representation."""
-        n = len(self.terms)
+        n = len(self)
         parts = [f"DOFetchedData({n} terms"]
         if self.query_ids:
             parts.append(f", query={len(self.query_ids)} ids")
@@ -177,11 +212,12 @@ class DOFetchedData(BaseFetchedData):
     def __iadd__(self, other: "DOFetchedData") -> "DOFetchedData":
         """Concatenate results from another DOFetchedData."""
         self.terms.extend(other.terms)
+        self._invalidate_indexes()
         self.total_count += other.total_count
         return self
 
     @property
-    def results(self) -> List[DiseaseTerm]:
+    def results(self) -> LazyRecords:
         """Get disease term results."""
         return self.terms
 
@@ -255,21 +291,25 @@ class DOFetchedData(BaseFetchedData):
 
     def get_doids(self) -> List[str]:
         """Get list of DOIDs."""
-        return [t.doid for t in self.terms]
+        return list(self.terms.project(self._raw_doid, lambda t: t.doid))
 
     def get_names(self) -> List[str]:
         """Get list of disease names."""
-        return [t.name for t in self.terms]
+        return list(self.terms.project(self._raw_name, lambda t: t.name))
 
     def get_term(self, doid: str) -> Optional[DiseaseTerm]:
-        """Get a specific term by DOID."""
+        """Get a specific term by DOID, using a hash index built on first use."""
         # Normalize DOID format
         if not doid.startswith("DOID:"):
             doid = f"DOID:{doid}"
-        for t in self.terms:
-            if t.doid == doid:
-                return t
-        return None
+        index = self._lookup_index("doid", lambda: build_index(
+            (position, [term_id])
+            for position, term_id in self.terms.project(
+                self._raw_doid, lambda t: t.doid, positions=True
+            )
+        ))
+        position = index.get(doid)
+        return None if position is None else self.terms.parse_at(position)
 
     def get_term_by_name(self, name: str) -> Optional[DiseaseTerm]:
         """Get term by name (case-insensitive partial match)."""
@@ -288,12 +328,12 @@ class DOFetchedData(BaseFetchedData):
         Returns:
             New DOFetchedData with filtered terms.
         """
-        filtered = [t for t in self.terms if t.get_xref(database)]
         result = DOFetchedData.__new__(DOFetchedData)
         result._content = self._content
         result.query_ids = self.query_ids
-        result.terms = filtered
-        result.total_count = len(filtered)
+        result._ols = self._ols
+        result.terms = self.terms.select(lambda t: t.get_xref(database))
+        result.total_count = len(result.terms)
         return result
 
     def to_xref_mapping(self, database: str) -> Dict[str, str]:
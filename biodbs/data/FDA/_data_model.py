@@ -1,12 +1,14 @@
+from collections.abc import Mapping
 from enum import Enum
 from pathlib import Path
 import re
-import yaml
 from pydantic import BaseModel, model_validator, ConfigDict, ValidationError
 from typing import Dict, Any, Optional
 
 
 def _load_field_rules(field_rule_file_name) -> Dict[str, Dict[str, Any]]:
+    import yaml
+
     yaml_path = Path(__file__).parent / "field_rules" / field_rule_file_name
     with open(yaml_path, encoding="utf-8") as f:
         schema = yaml.safe_load(f)
@@ -54,6 +56,26 @@ def _load_field_rules(field_rule_file_name) -> Dict[str, Dict[str, Any]]:
     return rules
 
 
+class _FieldRules(Mapping):
+    """Endpoint -> search field rules, each YAML file parsed on first lookup."""
+
+    def __init__(self, files: Dict[Enum, str]):
+        self._files = files
+        self._rules: Dict[Enum, Dict[str, Dict[str, Any]]] = {}
+
+    def __getitem__(self, endpoint):
+        rules = self._rules.get(endpoint)
+        if rules is None:
+            rules = self._rules[endpoint] = _load_field_rules(self._files[endpoint])
+        return rules
+
+    def __iter__(self):
+        return iter(self._files)
+
+    def __len__(self):
+        return len(self._files)
+
+
 class FDACategory(Enum):
     animalandveterinary = "animalandveterinary"
     drug = "drug"
@@ -1317,34 +1339,32 @@ class FDATransparencyCRLSearchField(Enum):
     text = "text"
 
 
-SEARCH_FIELD_VALIDATION_RULES = {
-    FDAAnimalVeterinaryEndpoint.event: _load_field_rules(
-        "animalandveterinary_event_fields.yaml"
-    ),
-    FDADrugEndpoint.event: _load_field_rules("drug_event_fields.yaml"),
-    FDADrugEndpoint.enforcement: _load_field_rules("drug_enforcement_fields.yaml"),
-    FDADrugEndpoint.label: _load_field_rules("drug_label_fields.yaml"),
-    FDADrugEndpoint.ndc: _load_field_rules("drug_ndc_fields.yaml"),
-    FDADrugEndpoint.drugsfda: _load_field_rules("drug_drugsfda_fields.yaml"),
-    FDADrugEndpoint.shortages: _load_field_rules("drug_shortages_fields.yaml"),
-    FDADeviceEndpoint._510k: _load_field_rules("device_510k_fields.yaml"),
-    FDADeviceEndpoint.classification: _load_field_rules("device_classification_fields.yaml"),
-    FDADeviceEndpoint.enforcement: _load_field_rules("device_enforcement_fields.yaml"),
-    FDADeviceEndpoint.event: _load_field_rules("device_event_fields.yaml"),
-    FDADeviceEndpoint.pma: _load_field_rules("device_pma_fields.yaml"),
-    FDADeviceEndpoint.recall: _load_field_rules("device_recall_fields.yaml"),
-    FDADeviceEndpoint.registrationlisting: _load_field_rules("device_registrationlisting_fields.yaml"),
-    FDADeviceEndpoint.covid19serology: _load_field_rules("device_covid19serology_fields.yaml"),
-    FDADeviceEndpoint.udi: _load_field_rules("device_udi_fields.yaml"),
-    FDAFoodEndpoint.event: _load_field_rules("food_event_fields.yaml"),
-    FDAFoodEndpoint.enforcement: _load_field_rules("food_enforcement_fields.yaml"),
-    FDACosmeticEndpoint.event: _load_field_rules("cosmetic_event_fields.yaml"),
-    FDATobaccoEndpoint.problem: _load_field_rules("tobacco_problem_fields.yaml"),
-    FDAOtherEndpoint.historicaldocument: _load_field_rules("other_historicaldocument_fields.yaml"),
-    FDAOtherEndpoint.nsde: _load_field_rules("other_nsde_fields.yaml"),
-    FDAOtherEndpoint.substance: _load_field_rules("other_substance_fields.yaml"),
-    FDATransparencyEndpoint.crl: _load_field_rules("transparency_crl_fields.yaml"),
-}
+SEARCH_FIELD_VALIDATION_RULES = _FieldRules({
+    FDAAnimalVeterinaryEndpoint.event: "animalandveterinary_event_fields.yaml",
+    FDADrugEndpoint.event: "drug_event_fields.yaml",
+    FDADrugEndpoint.enforcement: "drug_enforcement_fields.yaml",
+    FDADrugEndpoint.label: "drug_label_fields.yaml",
+    FDADrugEndpoint.ndc: "drug_ndc_fields.yaml",
+    FDADrugEndpoint.drugsfda: "drug_drugsfda_fields.yaml",
+    FDADrugEndpoint.shortages: "drug_shortages_fields.yaml",
+    FDADeviceEndpoint._510k: "device_510k_fields.yaml",
+    FDADeviceEndpoint.classification: "device_classification_fields.yaml",
+    FDADeviceEndpoint.enforcement: "device_enforcement_fields.yaml",
+    FDADeviceEndpoint.event: "device_event_fields.yaml",
+    FDADeviceEndpoint.pma: "device_pma_fields.yaml",
+    FDADeviceEndpoint.recall: "device_recall_fields.yaml",
+    FDADeviceEndpoint.registrationlisting: "device_registrationlisting_fields.yaml",
+    FDADeviceEndpoint.covid19serology: "device_covid19serology_fields.yaml",
+    FDADeviceEndpoint.udi: "device_udi_fields.yaml",
+    FDAFoodEndpoint.event: "food_event_fields.yaml",
+    FDAFoodEndpoint.enforcement: "food_enforcement_fields.yaml",
+    FDACosmeticEndpoint.event: "cosmetic_event_fields.yaml",
+    FDATobaccoEndpoint.problem: "tobacco_problem_fields.yaml",
+    FDAOtherEndpoint.historicaldocument: "other_historicaldocument_fields.yaml",
+    FDAOtherEndpoint.nsde: "other_nsde_fields.yaml",
+    FDAOtherEndpoint.substance: "other_substance_fields.yaml",
+    FDATransparencyEndpoint.crl: "transparency_crl_fields.yaml",
+})
 
 
 SEARCH_FIELD_ENUMS = {
@@ -1425,20 +1445,20 @@ class FDAModel(BaseModel):
 
     @model_validator(mode="after")
     def check_valid_search_values(self):
-        search_field_enum_value_dic = {
-            k.value: v for k, v in SEARCH_FIELD_ENUMS.items() if k in VALID_ENDPOINTS[FDACategory(self.category)]
-        }
-        search_field_validation_rules = {
-            k.value: v for k, v in SEARCH_FIELD_VALIDATION_RULES.items()
-        }
-
-        if self.endpoint not in search_field_enum_value_dic:
+        category_endpoints = VALID_ENDPOINTS[FDACategory(self.category)]
+        endpoint = next(
+            (
+                k for k in SEARCH_FIELD_ENUMS
+                if k in category_endpoints and k.value == self.endpoint
+            ),
+            None,
+        )
+        if endpoint is None:
             raise ValueError(f"Invalid endpoint '{self.endpoint}'")
 
-        valid_field_values = {
-            field.value for field in search_field_enum_value_dic[self.endpoint]
-        }
-        rules_map = search_field_validation_rules[self.endpoint]
+        valid_field_values = {field.value for field in SEARCH_FIELD_ENUMS[endpoint]}
+        # Only this endpoint's rule file is parsed
+        rules_map = SEARCH_FIELD_VALIDATION_RULES.get(endpoint, {})
         for field_path, value in self.search.items():
             if field_path not in valid_field_values:
                 raise ValueError(
@@ -1,6 +1,9 @@
 """Human Protein Atlas fetched data and data manager classes."""
 
-from biodbs.data._base import BaseFetchedData, BaseDBManager
+from biodbs.data._base import (
+    BaseFetchedData, BaseDBManager, FrameRecords, as_record_list, build_index,
+    columnar_frame, read_tsv,
+)
 from typing import Literal, Optional, List, Dict, Any, Union
 import pandas as pd
 import polars as pl
@@ -30,7 +33,9 @@ class HPAFetchedData(BaseFetchedData):
         ]
 
     Attributes:
-        results: List of result records (normalized).
+        results: List of result records (normalized). TSV responses are
+            kept as a `FrameRecords` sequence whose dicts are built on first
+            iteration.
         raw_content: Original API response.
         format: The response format (json, tsv, xml).
         query_type: The type of query (entry, search, search_download).
@@ -70,25 +75,14 @@ class HPAFetchedData(BaseFetchedData):
             return [content]
         return []
 
-    def _parse_tsv(self, content: str) -> List[Dict[str, Any]]:
-        """Parse TSV content into list of dicts."""
-        lines = content.strip().split("\n")
-        if not lines:
-            return []
-
-        headers = lines[0].split("\t")
-        results = []
-        for line in lines[1:]:
-            if not line.strip():
-                continue
-            values = line.split("\t")
-            record = {h: v for h, v in zip(headers, values)}
-            results.append(record)
-        return results
+    def _parse_tsv(self, content: str) -> FrameRecords:
+        """Parse TSV content into a columnar frame of records."""
+        return FrameRecords(read_tsv(content, has_header=True, drop_extra=True))
 
     def __iadd__(self, other: "HPAFetchedData") -> "HPAFetchedData":
         """Concatenate results from another HPAFetchedData."""
         self.results.extend(other.results)
+        self._invalidate_indexes()
         return self
 
     def __len__(self) -> int:
@@ -132,7 +126,7 @@ class HPAFetchedData(BaseFetchedData):
     def as_dict(self, columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """Return results as list of dictionaries."""
         if columns is None:
-            return self.results
+            return as_record_list(self.results)
         return self.format_results(columns=columns)
 
     def _flatten_dict(
@@ -185,6 +179,15 @@ class HPAFetchedData(BaseFetchedData):
                     "Use .text_data attribute to access the raw XML content."
                 )
 
+        frame = columnar_frame(self.results)
+        if frame is not None and set(columns or []) <= set(frame.columns):
+            # TSV records are flat already
+            if columns:
+                frame = frame.select(columns)
+            if engine == "pandas":
+                return pd.DataFrame(frame.to_dict(as_series=False))
+            return frame
+
         data = self.as_dict(columns)
         if not data:
             return pd.DataFrame() if engine == "pandas" else pl.DataFrame()
@@ -224,6 +227,9 @@ class HPAFetchedData(BaseFetchedData):
 
     def show_columns(self) -> List[str]:
         """Show all available columns in the results."""
+        frame = columnar_frame(self.results)
+        if frame is not None:
+            return sorted(frame.columns)
         col_set = set()
         for record in self.results:
             col_set.update(self._show_valid_columns_helper(record))
@@ -242,9 +248,38 @@ class HPAFetchedData(BaseFetchedData):
         ]
 
     def filter(self, **kwargs) -> "HPAFetchedData":
-        """Filter results based on field values."""
+        """Filter results based on field values.
+
+        Equality filters on hashable values (e.g. ``Ensembl="ENSG..."``) are
+        answered from a per-field hash index built on first use; callable
+        filters are then checked on the matching records only.
+
+        Args:
+            **kwargs: Field name (dot-separated for nested fields) mapped to a
+                value to match, or a predicate called with the field value.
+
+        Returns:
+            New HPAFetchedData with the matching records.
+        """
+        candidates = range(len(self.results))
+        for key, value in kwargs.items():
+            if callable(value):
+                continue
+            try:
+                hash(value)
+            except TypeError:
+                continue
+            index = self._lookup_index(("field", key), lambda key=key: build_index(
+                ((i, [self._get_nested_value(record, key.split("."))])
+                 for i, record in enumerate(self.results)),
+                unique=False,
+            ))
+            candidates = index.get(value, [])
+            break
+
         filtered = []
-        for record in self.results:
+        for i in candidates:
+            record = self.results[i]
             match = True
             for key, value in kwargs.items():
                 record_value = self._get_nested_value(record, key.split("."))
@@ -365,10 +400,9 @@ class HPADataManager(BaseDBManager):
             Path to saved file.
         """
         if fmt == "csv" and data.results:
-            records = data.as_dict(columns) if columns else data.results
-            return self.save_csv(records, filename, key=key)
+            return self.save_csv(data.as_dict(columns), filename, key=key)
         elif fmt == "json":
-            return self.save_json(data.results, filename, key=key)
+            return self.save_json(data.as_dict(), filename, key=key)
         elif fmt == "jsonl" and data.results:
             return self.stream_json_lines(iter(data.results), filename, key=key)
         elif fmt == "tsv" and data.text_data:
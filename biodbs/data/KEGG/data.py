@@ -1,5 +1,9 @@
-from biodbs.data._base import BaseFetchedData, BaseDBManager
-from typing import Literal, Optional, Union, List, Dict, Any
+from bisect import bisect_left
+from biodbs.data._base import (
+    BaseFetchedData, BaseDBManager, FrameRecords, as_record_list, build_index,
+    columnar_frame, concat_records, read_tsv,
+)
+from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence, Union
 import pandas as pd
 import polars as pl
 
@@ -19,7 +23,8 @@ class KEGGFetchedData(BaseFetchedData):
 
     Handles multiple response formats:
         - **Tabular** (list, find, conv, link, ddi): Tab-separated values
-          parsed into list of dicts with appropriate column names.
+          parsed into a columnar frame with appropriate column names; the
+          record dicts are built only when first iterated.
         - **Text** (info, get flat file): Raw text, with optional flat-file
           parsing for GET responses.
         - **JSON** (get with json option): Parsed JSON dict.
@@ -29,8 +34,8 @@ class KEGGFetchedData(BaseFetchedData):
         operation: The KEGG operation that produced this data.
         format: The response format (``"tabular"``, ``"text"``, ``"json"``,
             ``"binary"``, ``"flat_file"``).
-        records: For tabular data, list of dicts. For flat_file, list of
-            parsed entry dicts.
+        records: For tabular data, a `FrameRecords` sequence of dicts. For
+            flat_file, list of parsed entry dicts.
         text: For text/flat_file formats, the raw text.
         json_data: For JSON format, the parsed dict.
         binary_data: For binary format (images), the raw bytes.
@@ -48,7 +53,7 @@ class KEGGFetchedData(BaseFetchedData):
 
         # Determine format and parse accordingly
         self.format: str = self._detect_format()
-        self.records: List[Dict[str, Any]] = []
+        self.records: Sequence[Dict[str, Any]] = []
         self.text: Optional[str] = None
         self.json_data: Optional[dict] = None
         self.binary_data: Optional[bytes] = None
@@ -98,21 +103,18 @@ class KEGGFetchedData(BaseFetchedData):
             self.text = content
 
     def _parse_tabular(self, content: str):
-        """Parse tab-separated KEGG response."""
+        """Parse tab-separated KEGG response into a columnar frame."""
         columns = KEGG_TABULAR_COLUMNS.get(self.operation, ["col1", "col2"])
-        lines = content.strip().split("\n") if content.strip() else []
-
-        for line in lines:
-            if not line.strip():
-                continue
-            parts = line.split("\t")
-            record = {}
-            for i, col in enumerate(columns):
-                record[col] = parts[i] if i < len(parts) else None
+        frame = read_tsv(content, columns)
+        extra = frame.columns[len(columns):]
+        if extra:
             # Handle extra columns for ddi which may have variable format
-            if len(parts) > len(columns):
-                record["extra"] = parts[len(columns):]
-            self.records.append(record)
+            extra_list = pl.concat_list(extra).list.drop_nulls()
+            frame = frame.select(
+                *columns,
+                pl.when(extra_list.list.len() > 0).then(extra_list).alias("extra"),
+            )
+        self.records = FrameRecords(frame, sparse=["extra"])
 
     def _parse_flat_file(self, content: str):
         """Parse KEGG flat file format into structured records.
@@ -193,6 +195,31 @@ class KEGGFetchedData(BaseFetchedData):
             }
             self.records.append(record)
 
+    @classmethod
+    def concat(cls, parts: Iterable["KEGGFetchedData"]) -> "KEGGFetchedData":
+        """Combine several results in one pass.
+
+        Tabular records are joined with a single frame concat, other
+        records with a single list build, and text with a single ``join``.
+
+        Raises:
+            ValueError: If no parts are given or their formats differ.
+        """
+        parts = [part for part in parts if part is not None]
+        if not parts:
+            raise ValueError("concat() requires at least one part")
+        formats = {part.format for part in parts}
+        if len(formats) > 1:
+            raise ValueError(
+                f"Cannot concatenate different formats: {sorted(formats)}"
+            )
+        combined = parts[0]
+        combined.records = concat_records(part.records for part in parts)
+        if combined.text:
+            combined.text = "\n".join(part.text for part in parts if part.text)
+        combined._invalidate_indexes()
+        return combined
+
     def __iadd__(self, other: "KEGGFetchedData") -> "KEGGFetchedData":
         """Concatenate records from another KEGGFetchedData."""
         if self.format != other.format:
@@ -200,6 +227,7 @@ class KEGGFetchedData(BaseFetchedData):
                 f"Cannot concatenate different formats: {self.format} vs {other.format}"
             )
         self.records.extend(other.records)
+        self._invalidate_indexes()
         if self.text and other.text:
             self.text += "\n" + other.text
         return self
@@ -228,9 +256,21 @@ class KEGGFetchedData(BaseFetchedData):
     def as_dict(self, columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """Return records as list of dicts, optionally filtered to columns."""
         if not columns:
-            return self.records
+            return as_record_list(self.records)
+        frame = columnar_frame(self.records)
+        if frame is not None and set(columns) <= set(frame.columns):
+            return frame.select(columns).to_dicts()
         return [{col: r.get(col) for col in columns} for r in self.records]
 
+    def _column(self, name: str) -> List[Any]:
+        """Values of one field across records, read from the frame if possible."""
+        frame = columnar_frame(self.records)
+        if frame is None:
+            return [record.get(name) for record in self.records]
+        if name in frame.columns:
+            return frame[name].to_list()
+        return [None] * frame.height
+
     def as_dataframe(
         self,
         columns: Optional[List[str]] = None,
@@ -270,6 +310,17 @@ class KEGGFetchedData(BaseFetchedData):
                     return pd.DataFrame(columns=cols)
                 return pl.DataFrame(schema={c: pl.Utf8 for c in cols})
 
+        frame = columnar_frame(self.records)
+        if frame is not None:
+            if columns:
+                frame = frame.select(
+                    pl.col(c) if c in frame.columns else pl.lit(None, pl.Utf8).alias(c)
+                    for c in columns
+                )
+            if engine == "pandas":
+                return pd.DataFrame(frame.to_dict(as_series=False))
+            return frame
+
         data = self.as_dict(columns)
         if engine == "pandas":
             return pd.DataFrame(data)
@@ -279,6 +330,9 @@ class KEGGFetchedData(BaseFetchedData):
         """Return list of available column names."""
         if not self.records:
             return KEGG_TABULAR_COLUMNS.get(self.operation, [])
+        frame = columnar_frame(self.records)
+        if frame is not None:
+            return sorted(frame.columns)
         cols = set()
         for r in self.records:
             cols.update(r.keys())
@@ -338,11 +392,43 @@ class KEGGFetchedData(BaseFetchedData):
                 f.write(self.binary_data)
 
     def get_entry(self, entry_id: str) -> Optional[Dict[str, Any]]:
-        """Get a specific entry by ID."""
-        for record in self.records:
-            if record.get("entry_id") == entry_id or record.get("ENTRY", "").startswith(entry_id):
-                return record
-        return None
+        """Get a specific entry by ID.
+
+        Matches the ``entry_id`` column of tabular records or the ENTRY field
+        of flat-file records, first by exact ID and then as an ENTRY prefix.
+        Both lookups use indexes built on first use.
+        """
+        position = self._lookup_index("entry", self._build_entry_index).get(entry_id)
+        if position is None:
+            position = self._entry_prefix_match(entry_id)
+        return None if position is None else self.records[position]
+
+    def _build_entry_index(self) -> Dict[str, int]:
+        def keys(entry_id, entry):
+            if entry_id:
+                yield entry_id
+            entry = (entry or "").split(None, 1)
+            if entry:
+                yield entry[0]
+
+        return build_index(
+            (i, keys(entry_id, entry))
+            for i, (entry_id, entry) in enumerate(
+                zip(self._column("entry_id"), self._column("ENTRY"))
+            )
+        )
+
+    def _entry_prefix_match(self, prefix: str) -> Optional[int]:
+        """Position of the first record whose ENTRY starts with ``prefix``."""
+        entries = self._lookup_index("entry_sorted", lambda: sorted(
+            (entry or "", i) for i, entry in enumerate(self._column("ENTRY"))
+        ))
+        matches = []
+        for entry, position in entries[bisect_left(entries, (prefix, -1)):]:
+            if not entry.startswith(prefix):
+                break
+            matches.append(position)
+        return min(matches) if matches else None
 
 
 class KEGGDataManager(BaseDBManager):
@@ -373,9 +459,9 @@ class KEGGDataManager(BaseDBManager):
             key: Optional cache key.
         """
         if fmt == "csv" and data.records:
-            return self.save_csv(data.records, filename, key=key)
+            return self.save_csv(data.as_dict(), filename, key=key)
         elif fmt == "json":
-            content = data.json_data if data.json_data else data.records
+            content = data.json_data if data.json_data else data.as_dict()
             return self.save_json(content, filename, key=key)
         elif fmt == "jsonl" and data.records:
             return self.stream_json_lines(iter(data.records), filename, key=key)
@@ -1,8 +1,8 @@
 """NCBI Datasets fetched data and data manager classes."""
 
-from biodbs.data._base import BaseFetchedData, BaseDBManager
+from biodbs.data._base import BaseFetchedData, BaseDBManager, LazyRecords
 from biodbs.data.NCBI._data_model import GeneReport, TaxonomyReport, GenomeReport
-from typing import Literal, Optional, List, Dict, Any, Union
+from typing import Literal, Optional, Iterable, List, Dict, Any, Union
 import pandas as pd
 import polars as pl
 
@@ -17,8 +17,13 @@ class NCBIGeneFetchedData(BaseFetchedData):
         - Transcript and protein information
         - Cross-references (UniProt, Ensembl, OMIM)
 
+    Gene reports are validated into `GeneReport` models only when ``genes``
+    is indexed or iterated. ID and symbol accessors read the raw reports
+    and skip validation: a report that would fail validation is included
+    until ``genes`` has been parsed.
+
     Attributes:
-        genes: List of GeneReport objects.
+        genes: Lazily parsed sequence of GeneReport objects.
         total_count: Total number of genes matching the query.
         next_page_token: Token for pagination.
     """
@@ -39,12 +44,12 @@ class NCBIGeneFetchedData(BaseFetchedData):
 
         # Parse response
         if isinstance(content, dict):
-            self.genes = self._parse_genes(content.get("reports", []))
+            self.genes = self._lazy_genes(content.get("reports", []))
             self.total_count = content.get("total_count", len(self.genes))
             self.next_page_token = content.get("next_page_token")
             self.warnings = content.get("warnings", [])
         elif isinstance(content, list):
-            self.genes = self._parse_genes(content)
+            self.genes = self._lazy_genes(content)
             self.total_count = len(self.genes)
             self.next_page_token = None
             self.warnings = []
@@ -54,25 +59,41 @@ class NCBIGeneFetchedData(BaseFetchedData):
             self.next_page_token = None
             self.warnings = []
 
-    def _parse_genes(self, reports: List[Dict]) -> List[GeneReport]:
-        """Parse gene report data into GeneReport objects."""
-        genes = []
-        for report in reports:
-            # Handle nested structure where 'gene' key contains the data
-            gene_data = report.get("gene", report)
-            try:
-                genes.append(GeneReport(**gene_data))
-            except Exception:
-                # Skip malformed entries
-                pass
-        return genes
+    @property
+    def genes(self) -> LazyRecords:
+        """Genes as GeneReport models, parsed on first access."""
+        return self._genes
+
+    @genes.setter
+    def genes(self, genes: Iterable[GeneReport]) -> None:
+        if not isinstance(genes, LazyRecords):
+            genes = LazyRecords.from_parsed(genes, parse=self._parse_gene)
+        self._genes = genes
+
+    def _lazy_genes(self, reports: List[Dict]) -> LazyRecords:
+        """Wrap gene reports for lazy parsing."""
+        # Handle nested structure where 'gene' key contains the data
+        raw = (report.get("gene", report) for report in reports)
+        return LazyRecords(
+            (gene for gene in raw if isinstance(gene, dict) and "geneId" in gene),
+            self._parse_gene,
+        )
+
+    @staticmethod
+    def _parse_gene(gene_data: Dict) -> Optional[GeneReport]:
+        """Parse gene report data into a GeneReport object."""
+        try:
+            return GeneReport.model_validate(gene_data)
+        except Exception:
+            # Skip malformed entries
+            return None
 
     def __len__(self) -> int:
         return len(self.genes)
 
     def __repr__(self) -> str:
         """Return a human-readable representation."""
-        n = len(self.genes)
+        n = len(self)
         parts = [f"NCBIGeneFetchedData({n} genes"]
         if self.query_ids:
             parts.append(f", query={len(self.query_ids)} ids")
@@ -91,7 +112,7 @@ class NCBIGeneFetchedData(BaseFetchedData):
         return self
 
     @property
-    def results(self) -> List[GeneReport]:
+    def results(self) -> LazyRecords:
         """Get gene results."""
         return self.genes
 
@@ -169,11 +190,12 @@ class NCBIGeneFetchedData(BaseFetchedData):
 
     def get_gene_ids(self) -> List[int]:
         """Get list of gene IDs."""
-        return [g.gene_id for g in self.genes]
+        return list(self.genes.project(lambda d: int(d["geneId"]), lambda g: g.gene_id))
 
     def get_gene_symbols(self) -> List[str]:
         """Get list of gene symbols."""
-        return [g.symbol for g in self.genes if g.symbol]
+        symbols = self.genes.project(lambda d: d.get("symbol"), lambda g: g.symbol)
+        return [symbol for symbol in symbols if symbol]
 
     def get_gene(self, gene_id: int) -> Optional[GeneReport]:
         """Get a specific gene by ID."""
@@ -199,23 +221,28 @@ class NCBIGeneFetchedData(BaseFetchedData):
         Returns:
             New NCBIGeneFetchedData with filtered genes.
         """
-        filtered = [g for g in self.genes if g.gene_type == gene_type]
         result = NCBIGeneFetchedData.__new__(NCBIGeneFetchedData)
         result._content = self._content
         result.query_ids = self.query_ids
-        result.genes = filtered
-        result.total_count = len(filtered)
+        result.genes = self.genes.select(lambda g: g.gene_type == gene_type)
+        result.total_count = len(result.genes)
         result.next_page_token = None
         result.warnings = self.warnings
         return result
 
     def to_id_mapping(self) -> Dict[str, int]:
         """Create a mapping from gene symbol to gene ID."""
-        return {g.symbol: g.gene_id for g in self.genes if g.symbol}
+        return {symbol: gene_id for gene_id, symbol in self._id_symbol_pairs() if symbol}
 
     def to_symbol_mapping(self) -> Dict[int, str]:
         """Create a mapping from gene ID to gene symbol."""
-        return {g.gene_id: g.symbol for g in self.genes if g.symbol}
+        return {gene_id: symbol for gene_id, symbol in self._id_symbol_pairs() if symbol}
+
+    def _id_symbol_pairs(self) -> Iterable[tuple]:
+        return self.genes.project(
+            lambda d: (int(d["geneId"]), d.get("symbol")),
+            lambda g: (g.gene_id, g.symbol),
+        )
 
     def summary(self) -> str:
         """Get a text summary of the results."""
@@ -14,7 +14,11 @@ from biodbs.data.QuickGO._data_model import (
     AnnotationEndpoint,
     GeneProductEndpoint,
 )
-from biodbs.data.QuickGO.data import QuickGOFetchedData, QuickGODataManager
+from biodbs.data.QuickGO.data import (
+    QuickGOFetchedData,
+    QuickGODataManager,
+    iter_annotation_file,
+)
 
 
 __all__ = [
@@ -34,4 +38,5 @@ __all__ = [
     "GeneProductEndpoint",
     "QuickGOFetchedData",
     "QuickGODataManager",
+    "iter_annotation_file",
 ]
@@ -308,6 +308,7 @@ class AnnotationSearchModel(QuickGOBaseModel):
 class AnnotationDownloadModel(AnnotationSearchModel):
     """Model for annotation download requests."""
     downloadFormat: DownloadFormat = DownloadFormat.tsv
+    downloadLimit: Optional[int] = None  # server default is 10000 annotations
 
     # TSV-specific options
     selectedFields: Optional[List[str]] = None
@@ -452,6 +453,7 @@ class QuickGOModel(BaseModel):
 
     # Download options
     downloadFormat: Optional[DownloadFormat] = None
+    downloadLimit: Optional[int] = None
     selectedFields: Optional[List[str]] = None
     includeFields: Optional[List[str]] = None
     excludeFields: Optional[List[str]] = None
@@ -611,6 +613,8 @@ class QuickGOModel(BaseModel):
         # Download options
         if self.downloadFormat:
             params["downloadFormat"] = self.downloadFormat
+        if self.downloadLimit is not None:
+            params["downloadLimit"] = self.downloadLimit
         if self.selectedFields:
             params["selectedFields"] = ",".join(self.selectedFields)
         if self.includeFields:
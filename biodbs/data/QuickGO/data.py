@@ -1,9 +1,29 @@
-from biodbs.data._base import BaseFetchedData, BaseDBManager
-from typing import Literal, Optional, Union, List, Dict, Any
+from biodbs.data._base import (
+    BaseFetchedData, BaseDBManager, FrameRecords, as_record_list, columnar_frame,
+    concat_records, iter_line_blocks, read_tsv,
+)
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Sequence, Union
+import gzip
 import pandas as pd
 import polars as pl
 
 
+GAF_COLUMNS = [
+    "db", "db_object_id", "db_object_symbol", "qualifier",
+    "go_id", "db_reference", "evidence_code", "with_from",
+    "aspect", "db_object_name", "db_object_synonym",
+    "db_object_type", "taxon", "date", "assigned_by",
+    "annotation_extension", "gene_product_form_id"
+]
+
+GPAD_COLUMNS = [
+    "db_object_id", "negation", "relation", "go_id",
+    "reference", "evidence_code", "with_from", "interacting_taxon_id",
+    "date", "assigned_by", "annotation_extension", "annotation_properties"
+]
+
+
 class QuickGOFetchedData(BaseFetchedData):
     """Fetched data from QuickGO API.
 
@@ -13,9 +33,13 @@ class QuickGOFetchedData(BaseFetchedData):
         - **GAF** (download with gaf format): GO Annotation File format.
         - **GPAD** (download with gpad format): Gene Product Association Data.
 
+    Tabular downloads are parsed into a columnar frame; the record dicts
+    are built only when first iterated.
+
     Attributes:
         format: The response format (``"json"``, ``"tsv"``, ``"gaf"``, ``"gpad"``).
-        results: List of result records (parsed from JSON or tabular data).
+        results: List of result records parsed from JSON, or a
+            `FrameRecords` sequence of dicts for tabular downloads.
         metadata: Response metadata (pageInfo, numberOfHits, etc.).
         text: Raw text for non-JSON formats.
     """
@@ -32,7 +56,7 @@ class QuickGOFetchedData(BaseFetchedData):
 
         # Determine format and parse
         self.format: str = self._detect_format()
-        self.results: List[Dict[str, Any]] = []
+        self.results: Sequence[Dict[str, Any]] = []
         self.metadata: Dict[str, Any] = {}
         self.text: Optional[str] = None
 
@@ -89,28 +113,14 @@ class QuickGOFetchedData(BaseFetchedData):
             self.metadata = {}
 
     def _parse_tsv(self, content: Union[str, bytes]):
-        """Parse TSV download format."""
-        if isinstance(content, bytes):
-            content = content.decode("utf-8")
-        self.text = content
-
-        lines = content.strip().split("\n")
-        if not lines:
-            return
-
+        """Parse TSV download format into a columnar frame."""
+        self.text = content.decode("utf-8") if isinstance(content, bytes) else content
         # First line is header
-        headers = lines[0].split("\t")
-        for line in lines[1:]:
-            if not line.strip() or line.startswith("!"):
-                continue
-            parts = line.split("\t")
-            record = {}
-            for i, header in enumerate(headers):
-                record[header] = parts[i] if i < len(parts) else None
-            self.results.append(record)
+        frame = read_tsv(content, has_header=True, comment_prefix="!", drop_extra=True)
+        self.results = FrameRecords(frame)
 
     def _parse_gaf(self, content: Union[str, bytes]):
-        """Parse GAF (GO Annotation File) format.
+        """Parse GAF (GO Annotation File) format into a columnar frame.
 
         GAF 2.2 columns:
         1. DB, 2. DB_Object_ID, 3. DB_Object_Symbol, 4. Qualifier,
@@ -119,53 +129,79 @@ class QuickGOFetchedData(BaseFetchedData):
         12. DB_Object_Type, 13. Taxon, 14. Date, 15. Assigned_By,
         16. Annotation_Extension, 17. Gene_Product_Form_ID
         """
-        if isinstance(content, bytes):
-            content = content.decode("utf-8")
-        self.text = content
-
-        gaf_columns = [
-            "db", "db_object_id", "db_object_symbol", "qualifier",
-            "go_id", "db_reference", "evidence_code", "with_from",
-            "aspect", "db_object_name", "db_object_synonym",
-            "db_object_type", "taxon", "date", "assigned_by",
-            "annotation_extension", "gene_product_form_id"
-        ]
-
-        for line in content.strip().split("\n"):
-            if not line.strip() or line.startswith("!"):
-                continue
-            parts = line.split("\t")
-            record = {}
-            for i, col in enumerate(gaf_columns):
-                record[col] = parts[i] if i < len(parts) else None
-            self.results.append(record)
+        self.text = content.decode("utf-8") if isinstance(content, bytes) else content
+        frame = read_tsv(content, GAF_COLUMNS, comment_prefix="!", drop_extra=True)
+        self.results = FrameRecords(frame)
 
     def _parse_gpad(self, content: Union[str, bytes]):
-        """Parse GPAD (Gene Product Association Data) format.
+        """Parse GPAD (Gene Product Association Data) format into a columnar frame.
 
         GPAD 2.0 columns:
         1. DB_Object_ID, 2. Negation, 3. Relation, 4. GO_ID,
         5. Reference, 6. Evidence_Code, 7. With/From, 8. Interacting_Taxon_ID,
         9. Date, 10. Assigned_By, 11. Annotation_Extension, 12. Annotation_Properties
         """
-        if isinstance(content, bytes):
-            content = content.decode("utf-8")
-        self.text = content
-
-        gpad_columns = [
-            "db_object_id", "negation", "relation", "go_id",
-            "reference", "evidence_code", "with_from", "interacting_taxon_id",
-            "date", "assigned_by", "annotation_extension", "annotation_properties"
-        ]
-
-        for line in content.strip().split("\n"):
-            if not line.strip() or line.startswith("!"):
-                continue
-            parts = line.split("\t")
-            record = {}
-            for i, col in enumerate(gpad_columns):
-                record[col] = parts[i] if i < len(parts) else None
-            self.results.append(record)
+        self.text = content.decode("utf-8") if isinstance(content, bytes) else content
+        frame = read_tsv(content, GPAD_COLUMNS, comment_prefix="!", drop_extra=True)
+        self.results = FrameRecords(frame)
+
+    @classmethod
+    def iter_chunks(
+        cls,
+        blocks: Iterable[bytes],
+        download_format: str,
+        endpoint: str = "downloadSearch",
+        block_size: int = 1 << 22,
+    ) -> Iterator["QuickGOFetchedData"]:
+        """Parse a TSV/GAF/GPAD byte stream into a series of bounded chunks.
+
+        Each chunk holds roughly ``block_size`` bytes of whole lines and is
+        parsed on its own, so memory stays bounded however long the stream
+        is. For TSV the header line is repeated into every chunk.
+
+        Args:
+            blocks: Raw byte chunks (e.g. ``response.iter_content()`` or file
+                reads); line boundaries need not be aligned.
+            download_format: ``"tsv"``, ``"gaf"`` or ``"gpad"``.
+            endpoint: Endpoint recorded on each chunk.
+            block_size: Approximate bytes of text per chunk.
+
+        Yields:
+            QuickGOFetchedData with columnar results, one per chunk.
+        """
+        header = None
+        for block in iter_line_blocks(blocks, block_size):
+            if download_format == "tsv":
+                if header is None:
+                    header, _, block = block.partition(b"\n")
+                    header += b"\n"
+                block = header + block
+            yield cls(block, endpoint=endpoint, download_format=download_format)
+
+    @classmethod
+    def concat(cls, parts: Iterable["QuickGOFetchedData"]) -> "QuickGOFetchedData":
+        """Combine several results in one pass.
+
+        Tabular results are joined with a single frame concat, other
+        results with a single list build, and text with a single ``join``.
+
+        Raises:
+            ValueError: If no parts are given or their formats differ.
+        """
+        parts = [part for part in parts if part is not None]
+        if not parts:
+            raise ValueError("concat() requires at least one part")
+        formats = {part.format for part in parts}
+        if len(formats) > 1:
+            raise ValueError(
+                f"Cannot concatenate different formats: {sorted(formats)}"
+            )
+        combined = parts[0]
+        combined.results = concat_records(part.results for part in parts)
+        if combined.text:
+            combined.text = "\n".join(part.text for part in parts if part.text)
+        combined._invalidate_indexes()
+        return combined
 
     def __iadd__(self, other: "QuickGOFetchedData") -> "QuickGOFetchedData":
         """Concatenate results from another QuickGOFetchedData."""
@@ -201,7 +237,10 @@ class QuickGOFetchedData(BaseFetchedData):
     def as_dict(self, columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """Return results as list of dicts, optionally filtered to columns."""
         if not columns:
-            return self.results
+            return as_record_list(self.results)
+        frame = columnar_frame(self.results)
+        if frame is not None and set(columns) <= set(frame.columns):
+            return frame.select(columns).to_dicts()
         return [{col: r.get(col) for col in columns} for r in self.results]
 
     def _flatten_dict(
@@ -256,6 +295,18 @@ class QuickGOFetchedData(BaseFetchedData):
                     return pd.DataFrame(columns=cols)
                 return pl.DataFrame(schema={c: pl.Utf8 for c in cols})
 
+        frame = columnar_frame(self.results)
+        if frame is not None:
+            # Tabular downloads are flat already
+            if columns:
+                frame = frame.select(
+                    pl.col(c) if c in frame.columns else pl.lit(None, pl.Utf8).alias(c)
+                    for c in columns
+                )
+            if engine == "pandas":
+                return pd.DataFrame(frame.to_dict(as_series=False))
+            return frame
+
         data = self.as_dict(columns)
 
         if flatten:
@@ -269,6 +320,9 @@ class QuickGOFetchedData(BaseFetchedData):
         """Return list of available column names."""
         if not self.results:
             return []
+        frame = columnar_frame(self.results)
+        if frame is not None:
+            return sorted(frame.columns)
         cols = set()
         for r in self.results:
             cols.update(r.keys())
@@ -317,6 +371,55 @@ class QuickGOFetchedData(BaseFetchedData):
         return self.metadata.get("numberOfHits", len(self.results))
 
 
+def _annotation_file_format(path: Union[str, Path]) -> str:
+    """Annotation format (``"gaf"``, ``"gpad"`` or ``"tsv"``) from a file name.
+
+    Raises:
+        ValueError: If the extension is not a known annotation format.
+    """
+    path = Path(path)
+    suffixes = [s.lstrip(".").lower() for s in path.suffixes if s.lower() != ".gz"]
+    download_format = suffixes[-1] if suffixes else None
+    if download_format not in ("gaf", "gpad", "tsv"):
+        raise ValueError(
+            f"Cannot infer annotation format from '{path.name}'; "
+            "pass download_format='gaf', 'gpad' or 'tsv'"
+        )
+    return download_format
+
+
+def iter_annotation_file(
+    path: Union[str, Path],
+    download_format: Optional[str] = None,
+    block_size: int = 1 << 22,
+) -> Iterator[QuickGOFetchedData]:
+    """Read a local GAF/GPAD/TSV annotation file in bounded chunks.
+
+    Args:
+        path: Annotation file, optionally gzip-compressed (``.gz``).
+        download_format: ``"gaf"``, ``"gpad"`` or ``"tsv"``. If None, it is
+            taken from the file extension (e.g. ``goa_human.gaf.gz``).
+        block_size: Approximate bytes of text per chunk.
+
+    Yields:
+        QuickGOFetchedData chunks, as from `QuickGOFetchedData.iter_chunks`.
+
+    Raises:
+        ValueError: If the format cannot be inferred from the file name.
+    """
+    path = Path(path)
+    if download_format is None:
+        download_format = _annotation_file_format(path)
+    opener = gzip.open if path.suffix.lower() == ".gz" else open
+    with opener(path, "rb") as f:
+        yield from QuickGOFetchedData.iter_chunks(
+            iter(lambda: f.read(1 << 20), b""),
+            download_format,
+            endpoint=str(path),
+            block_size=block_size,
+        )
+
+
 class QuickGODataManager(BaseDBManager):
     """Data manager for QuickGO data with QuickGO-specific convenience methods."""
 
@@ -345,9 +448,9 @@ class QuickGODataManager(BaseDBManager):
             key: Optional cache key.
         """
         if fmt == "csv" and data.results:
-            return self.save_csv(data.results, filename, key=key)
+            return self.save_csv(data.as_dict(), filename, key=key)
         elif fmt == "json":
-            content = data.results if data.results else data.metadata
+            content = data.as_dict() if data.results else data.metadata
             return self.save_json(content, filename, key=key)
         elif fmt == "jsonl" and data.results:
             return self.stream_json_lines(iter(data.results), filename, key=key)
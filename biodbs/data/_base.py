@@ -3,11 +3,20 @@ import logging
 import json
 import re
 import sqlite3
+from bisect import bisect_right
+from itertools import chain
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Union, Iterator, Generator
+from collections.abc import Sequence
+from typing import (
+    TYPE_CHECKING, Optional, Dict, Any, Callable, Hashable, Iterable, List, Union, Iterator,
+    Generator, get_args, get_origin,
+)
 from datetime import datetime, timedelta
 
+if TYPE_CHECKING:
+    import polars as pl
+
 
 
 class BaseFetchedData:
@@ -43,6 +52,48 @@ class BaseFetchedData:
         """Return string representation (same as repr by default)."""
         return self.__repr__()
 
+    @classmethod
+    def concat(cls, parts: Iterable["BaseFetchedData"]) -> "BaseFetchedData":
+        """Combine several results of this type into one, in order.
+
+        The first part is extended in place and returned, as with ``+=``.
+        The default folds the parts with ``+=``, which is a list extend for
+        record containers; classes whose ``+=`` copies (data frames, text)
+        override this to combine all parts in a single pass.
+
+        Args:
+            parts: Results to combine. None entries are skipped.
+
+        Returns:
+            The combined result.
+
+        Raises:
+            ValueError: If no parts are given.
+        """
+        parts = [part for part in parts if part is not None]
+        if not parts:
+            raise ValueError("concat() requires at least one part")
+        combined = parts[0]
+        for part in parts[1:]:
+            combined += part
+        return combined
+
+    def _lookup_index(self, name: Hashable, build: Callable[[], Dict]) -> Dict:
+        """Return the cached secondary index ``name``, building it on first use.
+
+        Subclasses must call `_invalidate_indexes` whenever their records
+        change (e.g. in ``__iadd__``).
+        """
+        indexes = self.__dict__.setdefault("_indexes", {})
+        index = indexes.get(name)
+        if index is None:
+            index = indexes[name] = build()
+        return index
+
+    def _invalidate_indexes(self) -> None:
+        """Drop all cached secondary indexes."""
+        self.__dict__.pop("_indexes", None)
+
     def to_json(self, file_name, mode="w"):
         with open(file_name, mode=mode) as f:
             json.dump(self._content, f)
@@ -61,6 +112,574 @@ class BaseFetchedData:
         raise NotImplementedError("This method should be implemented in subclass.")
 
 
+# Marks a raw record that has not been parsed yet
+_UNPARSED = object()
+
+
+class LazyRecords(Sequence):
+    """Sequence of parsed records that keeps the raw API dicts.
+
+    Records are parsed (e.g. validated into pydantic models) only when they
+    are first indexed or iterated, and each parsed record is cached. Indexing
+    parses just the requested records and ``len()`` is answered from the raw
+    list. Records the parser rejects (returns None for) are skipped, as eager
+    parsing did, but only once they have been parsed: until a rejection has
+    been seen, ``len()`` counts every raw record. After one, indexing and
+    ``len()`` go through the fully parsed list so positions stay consistent.
+    Code that only needs a few fields can read `raw` or `project` instead and
+    never pay for parsing; neither validates unparsed records.
+
+    Example:
+        >>> records = LazyRecords([{"id": 1}, {"id": 2}], parse=Item.model_validate)
+        >>> records.raw_count
+        2
+        >>> records[0]          # only the first record is parsed
+        Item(id=1)
+    """
+
+    __slots__ = ("_raw", "_parsed", "_starts", "_parsers", "_valid", "_rejected")
+
+    def __init__(
+        self,
+        raw: Iterable[Any] = (),
+        parse: Optional[Callable[[Any], Any]] = None,
+    ):
+        """Initialize LazyRecords.
+
+        Args:
+            raw: Raw records, usually JSON dicts.
+            parse: Function turning one raw record into a parsed record, or
+                None if the record is invalid. Defaults to identity.
+        """
+        self._raw: List[Any] = list(raw)
+        self._parsed: List[Any] = [_UNPARSED] * len(self._raw)
+        # Parser per run of records; runs start at the matching _starts entry
+        self._starts: List[int] = [0]
+        self._parsers: List[Callable[[Any], Any]] = [parse or (lambda record: record)]
+        self._valid: Optional[List[Any]] = None
+        # Number of records the parser is known to have rejected
+        self._rejected = 0
+
+    @classmethod
+    def from_parsed(
+        cls,
+        records: Iterable[Any],
+        raw: Optional[Iterable[Any]] = None,
+        parse: Optional[Callable[[Any], Any]] = None,
+    ) -> "LazyRecords":
+        """Wrap records that are already parsed.
+
+        Args:
+            records: Parsed records.
+            raw: Matching raw records, if known. Missing raw records are
+                stored as None and `project` reads the parsed record instead.
+            parse: Parser used for raw records added later.
+        """
+        records = list(records)
+        lazy = cls(raw if raw is not None else [None] * len(records), parse)
+        lazy._parsed = records
+        return lazy
+
+    @property
+    def raw(self) -> List[Any]:
+        """Raw records, including any the parser rejects."""
+        return self._raw
+
+    @property
+    def raw_count(self) -> int:
+        """Number of raw records, without parsing any."""
+        return len(self._raw)
+
+    @property
+    def is_parsed(self) -> bool:
+        """Whether every record has been parsed."""
+        return self._valid is not None
+
+    def parse_at(self, position: int) -> Any:
+        """Parse (or return the cached) record at a raw position.
+
+        Returns:
+            The parsed record, or None if the parser rejected it.
+        """
+        record = self._parsed[position]
+        if record is _UNPARSED:
+            parse = self._parsers[bisect_right(self._starts, position) - 1]
+            record = self._parsed[position] = parse(self._raw[position])
+            if record is None:
+                self._rejected += 1
+        return record
+
+    def _records(self) -> List[Any]:
+        if self._valid is None:
+            self._valid = [
+                r for r in map(self.parse_at, range(len(self._raw))) if r is not None
+            ]
+        return self._valid
+
+    def project(
+        self,
+        from_raw: Callable[[Any], Any],
+        from_record: Callable[[Any], Any],
+        positions: bool = False,
+    ) -> Iterator[Any]:
+        """Yield one value per record without forcing a parse.
+
+        Records that are already parsed are read with ``from_record``; all
+        others are read straight from the raw record with ``from_raw``.
+        Records known to be invalid are skipped.
+
+        Args:
+            from_raw: Reads the value from a raw record.
+            from_record: Reads the value from a parsed record.
+            positions: Yield ``(raw_position, value)`` pairs for use with
+                `parse_at`.
+        """
+        for position, (raw, record) in enumerate(zip(self._raw, self._parsed)):
+            if record is _UNPARSED:
+                value = from_raw(raw)
+            elif record is not None:
+                value = from_record(record)
+            else:
+                continue
+            yield (position, value) if positions else value
+
+    def select(self, predicate: Callable[[Any], bool]) -> "LazyRecords":
+        """Return the parsed records matching ``predicate``, keeping their raw dicts."""
+        raw, records = [], []
+        for position in range(len(self._raw)):
+            record = self.parse_at(position)
+            if record is not None and predicate(record):
+                raw.append(self._raw[position])
+                records.append(record)
+        return LazyRecords.from_parsed(records, raw, self._parsers[-1])
+
+    def extend(self, other: Iterable[Any]) -> None:
+        """Append records from another LazyRecords (lazily) or parsed records.
+
+        Unparsed records taken from another LazyRecords keep that
+        sequence's parser.
+        """
+        if not isinstance(other, LazyRecords):
+            other = LazyRecords.from_parsed(other, parse=self._parsers[-1])
+        offset = len(self._raw)
+        for start, parse in zip(other._starts, other._parsers):
+            if parse != self._parsers[-1]:
+                self._starts.append(offset + start)
+                self._parsers.append(parse)
+        self._raw.extend(other._raw)
+        self._parsed.extend(other._parsed)
+        self._rejected += other._rejected
+        if self._valid is not None and other._valid is not None:
+            self._valid.extend(other._valid)
+        else:
+            self._valid = None
+
+    def append(self, record: Any) -> None:
+        """Append one parsed record."""
+        self.extend([record])
+
+    def __len__(self) -> int:
+        if self._valid is None and not self._rejected:
+            return len(self._raw)
+        return len(self._records())
+
+    def __bool__(self) -> bool:
+        if self._valid is not None:
+            return bool(self._valid)
+        # Stops at the first record the parser accepts
+        return any(self.parse_at(p) is not None for p in range(len(self._raw)))
+
+    def __getitem__(self, index):
+        if self._valid is None and not self._rejected:
+            # Raw positions are record positions until a record is rejected
+            positions = range(len(self._raw))[index]
+            if isinstance(positions, int):
+                record = self.parse_at(positions)
+                if record is not None:
+                    return record
+            else:
+                records = [self.parse_at(position) for position in positions]
+                if not self._rejected:
+                    return records
+        return self._records()[index]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._records())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (LazyRecords, list)):
+            return self._records() == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        if self._valid is None:
+            return f"<LazyRecords: {len(self._raw)} records, unparsed>"
+        return repr(self._valid)
+
+
+class FrameRecords(Sequence):
+    """Sequence of record dicts backed by a columnar polars frame.
+
+    Tabular responses are parsed straight into a frame (see `read_tsv`).
+    Length, slicing and single rows are answered from the frame; the full
+    list of dicts is built only when records are iterated or mutated, after
+    which the list is authoritative. Frames of several sequences are
+    concatenated without building any dicts (see `concat_records`).
+
+    Columns listed in ``sparse`` hold fields that only some records have;
+    their null cells are left out of the record dicts instead of appearing
+    as ``None``.
+
+    Example:
+        >>> records = FrameRecords(read_tsv("a\\t1\\nb\\t2\\n", ["k", "v"]))
+        >>> len(records), records.row(1)
+        (2, {'k': 'b', 'v': '2'})
+    """
+
+    __slots__ = ("_frame", "_rows", "_sparse")
+
+    def __init__(self, frame: "pl.DataFrame", sparse: Iterable[str] = ()):
+        self._frame: Optional["pl.DataFrame"] = frame
+        self._rows: Optional[List[Dict[str, Any]]] = None
+        self._sparse = frozenset(sparse)
+
+    def _trim(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Drop the null fields of sparse columns from a row dict."""
+        if not self._sparse:
+            return row
+        return {k: v for k, v in row.items() if v is not None or k not in self._sparse}
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether the list of dicts has been built."""
+        return self._rows is not None
+
+    @property
+    def frame(self) -> "pl.DataFrame":
+        """The records as a polars frame, without building dicts if possible."""
+        if self._rows is None:
+            return self._frame
+        import polars as pl
+
+        return pl.DataFrame(self._rows)
+
+    @property
+    def columns(self) -> List[str]:
+        """Column names, in order."""
+        if self._rows is None:
+            return list(self._frame.columns)
+        return list(dict.fromkeys(chain.from_iterable(self._rows)))
+
+    def row(self, position: int) -> Dict[str, Any]:
+        """Return one record without building the others."""
+        if self._rows is None:
+            return self._trim(self._frame.row(position, named=True))
+        return self._rows[position]
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Build (once) and return the list of record dicts."""
+        if self._rows is None:
+            self._rows = list(map(self._trim, self._frame.to_dicts()))
+            self._frame = None
+        return self._rows
+
+    def extend(self, other: Iterable[Dict[str, Any]]) -> None:
+        """Append records; two unmaterialized frames are concatenated as frames."""
+        if isinstance(other, FrameRecords) and not (self.is_materialized or other.is_materialized):
+            import polars as pl
+
+            self._frame = pl.concat([self._frame, other._frame], how="diagonal")
+            self._sparse |= other._sparse
+        else:
+            self.to_list().extend(other)
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append one record dict."""
+        self.to_list().append(record)
+
+    def __len__(self) -> int:
+        return len(self._rows) if self._rows is not None else self._frame.height
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            if self._rows is None and index.step in (None, 1):
+                start, stop, _ = index.indices(len(self))
+                return FrameRecords(
+                    self._frame.slice(start, max(stop - start, 0)), self._sparse
+                )
+            return self.to_list()[index]
+        if self._rows is None:
+            return self.row(index)
+        return self._rows[index]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.to_list())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (FrameRecords, list)):
+            return self.to_list() == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        if self._rows is None:
+            return f"<FrameRecords: {self._frame.height} records, columnar>"
+        return repr(self._rows)
+
+
+def columnar_frame(records: Sequence) -> Optional["pl.DataFrame"]:
+    """Return the frame behind ``records`` if they have not been turned into dicts."""
+    if isinstance(records, FrameRecords) and not records.is_materialized:
+        return records.frame
+    return None
+
+
+def as_record_list(records: Sequence) -> List[Dict[str, Any]]:
+    """Return ``records`` as a plain list of dicts (e.g. for JSON output)."""
+    if isinstance(records, FrameRecords):
+        return records.to_list()
+    return records if isinstance(records, list) else list(records)
+
+
+def concat_records(parts: Iterable[Sequence]) -> Sequence:
+    """Concatenate record sequences in one pass.
+
+    Unmaterialized `FrameRecords` are joined with a single ``pl.concat``;
+    anything else is joined into one list.
+    """
+    parts = list(parts)
+    if parts and all(
+        isinstance(part, FrameRecords) and not part.is_materialized for part in parts
+    ):
+        if len(parts) == 1:
+            return parts[0]
+        import polars as pl
+
+        return FrameRecords(
+            pl.concat([part.frame for part in parts], how="diagonal"),
+            sparse=frozenset().union(*(part._sparse for part in parts)),
+        )
+    return list(chain.from_iterable(parts))
+
+
+# Control characters tried, in order, as the separator for reading lines
+_LINE_SEPARATORS = ("\x1f", "\x1e", "\x1d", "\x1c", "\x00")
+
+
+def read_tsv(
+    content: Union[str, bytes],
+    columns: Optional[List[str]] = None,
+    has_header: bool = False,
+    comment_prefix: Optional[str] = None,
+    fill: Optional[str] = None,
+    drop_extra: bool = False,
+) -> "pl.DataFrame":
+    """Parse tab-separated text into a polars frame of string columns.
+
+    The text is handed to ``polars.read_csv`` as one column of lines and
+    split into fields with vectorized expressions, so rows with missing or
+    extra fields are tolerated without a Python loop per line. Blank lines
+    are skipped and no quoting is applied.
+
+    Args:
+        content: TSV text or bytes.
+        columns: Column names. Rows with more fields than names get extra
+            ``col_{i}`` columns. If None and ``has_header`` is True, the
+            first row supplies the names.
+        has_header: Whether the first non-comment row is a header (it is
+            dropped either way).
+        comment_prefix: Skip lines starting with this prefix (e.g. ``"!"``
+            for GAF).
+        fill: Value for fields missing from short rows; None leaves nulls.
+        drop_extra: Ignore fields beyond the named columns instead of adding
+            ``col_{i}`` columns for them.
+
+    Returns:
+        DataFrame with one Utf8 column per field.
+    """
+    import io
+    import polars as pl
+
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    names = list(columns or [])
+    lines = None
+    if data and data.strip():
+        # Any byte absent from the text works as the "field" separator that
+        # makes polars read each line as a single field
+        separator = next((c for c in _LINE_SEPARATORS if c.encode() not in data), None)
+        if separator is not None:
+            lines = pl.read_csv(
+                io.BytesIO(data),
+                has_header=False,
+                new_columns=["line"],
+                separator=separator,
+                quote_char=None,
+                comment_prefix=comment_prefix,
+                infer_schema=False,
+            )["line"]
+        else:
+            lines = pl.Series(
+                "line",
+                [
+                    line.removesuffix("\r") for line in data.decode("utf-8").split("\n")
+                    if not (comment_prefix and line.startswith(comment_prefix))
+                ],
+                dtype=pl.Utf8,
+            )
+        lines = lines.filter(lines.str.strip_chars().str.len_bytes() > 0)
+    if lines is None or lines.is_empty():
+        return pl.DataFrame(schema={name: pl.Utf8 for name in names})
+
+    fields = lines.str.split("\t")
+    if has_header:
+        header = fields[0].to_list()
+        fields = fields.slice(1)
+        if columns is None:
+            names = header
+    names = _unique_names(names)
+    width = len(names) if drop_extra else max(len(names), fields.list.len().max() or 0)
+    names += [f"col_{i}" for i in range(len(names), width)]
+
+    frame = fields.to_frame("fields").select(
+        pl.col("fields").list.get(i, null_on_oob=True).alias(name)
+        for i, name in enumerate(names)
+    )
+    if fill is not None:
+        frame = frame.fill_null(fill)
+    return frame
+
+
+def iter_line_blocks(blocks: Iterable[bytes], block_size: int = 1 << 22) -> Iterator[bytes]:
+    """Regroup a byte stream into blocks that end on line boundaries.
+
+    Network chunks and file reads split lines arbitrarily; each yielded
+    block holds whole lines only (the last may lack a trailing newline) and
+    is at least ``block_size`` bytes unless it is the final one, so it can be
+    handed to `read_tsv` on its own.
+
+    Args:
+        blocks: Raw byte chunks, e.g. ``response.iter_content()``.
+        block_size: Minimum size of each yielded block in bytes.
+
+    Yields:
+        Byte blocks of complete lines.
+    """
+    pending: List[bytes] = []
+    size = 0
+    for block in blocks:
+        if not block:
+            continue
+        pending.append(block)
+        size += len(block)
+        if size < block_size:
+            continue
+        data = b"".join(pending)
+        cut = data.rfind(b"\n") + 1
+        if cut == 0:
+            pending = [data]
+            continue
+        yield data[:cut]
+        rest = data[cut:]
+        pending = [rest] if rest else []
+        size = len(rest)
+    tail = b"".join(pending)
+    if tail:
+        yield tail
+
+
+def _unique_names(names: List[str]) -> List[str]:
+    """Suffix repeated column names (``a``, ``a_1``, ...) as frames require."""
+    seen: Dict[str, int] = {}
+    unique = []
+    for name in names:
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}_{seen[name]}"
+        else:
+            seen[name] = 0
+        unique.append(name)
+    return unique
+
+
+def construct_model(model: type, data: Dict[str, Any]) -> Any:
+    """Build a pydantic model from trusted data without validating it.
+
+    Like ``model.model_construct`` but nested models (including lists and
+    optionals of models) are constructed too, so model properties that walk
+    nested fields keep working. Only use this for data known to match the
+    model, such as responses from the API the model describes.
+
+    Args:
+        model: Pydantic model class.
+        data: Raw field values, keyed by field name or alias.
+
+    Returns:
+        Model instance.
+    """
+    values = {}
+    for name, field in model.model_fields.items():
+        key = field.alias if field.alias and field.alias in data else name
+        if key in data:
+            values[name] = _construct_value(field.annotation, data[key])
+    return model.model_construct(**values)
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    """Construct nested models inside ``value`` according to ``annotation``."""
+    from pydantic import BaseModel
+
+    if value is None:
+        return None
+    origin = get_origin(annotation)
+    if origin is list and isinstance(value, list):
+        (item_type,) = get_args(annotation) or (Any,)
+        return [_construct_value(item_type, v) for v in value]
+    if origin is not None and origin is not dict:
+        # Optional[...] / Union[...]: use the first model member for dicts
+        for arg in get_args(annotation):
+            if get_origin(arg) is list and isinstance(value, list):
+                return _construct_value(arg, value)
+            if isinstance(arg, type) and issubclass(arg, BaseModel) and isinstance(value, dict):
+                return construct_model(arg, value)
+        return value
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel) and isinstance(value, dict):
+        return construct_model(annotation, value)
+    return value
+
+
+def build_index(
+    keyed_records: Iterable[tuple], unique: bool = True
+) -> Dict[Hashable, Any]:
+    """Map lookup keys to record positions.
+
+    Args:
+        keyed_records: ``(position, keys)`` pairs in record order, e.g. from
+            ``enumerate``. A record may have several keys (e.g. primary and
+            secondary accessions). Unhashable keys are skipped.
+        unique: If True, map each key to the position of the first record
+            that has it, matching a linear scan. Otherwise map each key to
+            the list of all positions.
+
+    Returns:
+        Dict mapping key -> position, or key -> list of positions.
+    """
+    index: Dict[Hashable, Any] = {}
+    for position, keys in keyed_records:
+        for key in keys:
+            try:
+                if unique:
+                    index.setdefault(key, position)
+                else:
+                    positions = index.setdefault(key, [])
+                    if not positions or positions[-1] != position:
+                        positions.append(position)
+            except TypeError:
+                continue
+    return index
+
+
 def _sanitize_identifier(name: str) -> str:
     """Validate and quote a SQL identifier (table or column name)."""
     if not re.match(r'^[A-Za-z_][A-Za-z0-9_.]*$', name):
@@ -68,6 +687,31 @@ def _sanitize_identifier(name: str) -> str:
     return f'"{name}"'
 
 
+class JsonLinesWriter:
+    """Incremental writer returned by `BaseDBManager.open_json_lines`."""
+
+    def __init__(self, f, path: Path, buffer_size: int = 100):
+        self._f = f
+        self.path = path
+        self.buffer_size = buffer_size
+        self.count = 0
+
+    def write(self, items: Iterable[Dict]) -> int:
+        """Append *items* to the file and return how many were written."""
+        buffer: list[str] = []
+        n = 0
+        for item in items:
+            buffer.append(json.dumps(item))
+            n += 1
+            if len(buffer) >= self.buffer_size:
+                self._f.write("\n".join(buffer) + "\n")
+                buffer.clear()
+        if buffer:
+            self._f.write("\n".join(buffer) + "\n")
+        self.count += n
+        return n
+
+
 class BaseDBManager:
     """Base class for managing data persistence to local storage (JSON, CSV, SQLite).
 
@@ -370,30 +1014,46 @@ class BaseDBManager:
         buffer_size: int = 100,
         **metadata_kwargs,
     ) -> Path:
-        filepath = self.storage_path / f"{filename}.jsonl"
-        count = 0
-        buffer: list[str] = []
+        with self.open_json_lines(
+            filename, key=key, buffer_size=buffer_size, **metadata_kwargs
+        ) as writer:
+            writer.write(data_stream)
+        return writer.path
 
+    @contextmanager
+    def open_json_lines(
+        self,
+        filename: str,
+        key: Optional[str] = None,
+        buffer_size: int = 100,
+        **metadata_kwargs,
+    ) -> Generator["JsonLinesWriter", None, None]:
+        """Open a JSON Lines file for incremental writing.
+
+        Unlike `stream_json_lines`, items can be written in several calls,
+        e.g. one call per fetched page, while the file stays open.
+        Metadata for *key* is recorded when the block exits.
+
+        Example::
+
+            with mgr.open_json_lines("events", key="events") as writer:
+                for page in pages:
+                    writer.write(page.results)
+        """
+        filepath = self.storage_path / f"{filename}.jsonl"
         with open(filepath, "w", encoding="utf-8") as f:
-            for item in data_stream:
-                buffer.append(json.dumps(item))
-                count += 1
-                if len(buffer) >= buffer_size:
-                    f.write("\n".join(buffer) + "\n")
-                    buffer.clear()
-            if buffer:
-                f.write("\n".join(buffer) + "\n")
+            writer = JsonLinesWriter(f, filepath, buffer_size=buffer_size)
+            yield writer
 
         if key:
             self._update_metadata(
                 key,
                 filepath=str(filepath),
                 format="jsonl",
-                item_count=count,
+                item_count=writer.count,
                 **metadata_kwargs,
             )
-        self.logger.info("Streamed %d items to %s", count, filepath)
-        return filepath
+        self.logger.info("Streamed %d items to %s", writer.count, filepath)
 
     def load_json_lines(
         self,
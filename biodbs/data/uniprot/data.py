@@ -1,8 +1,14 @@
 """UniProt fetched data and data manager classes."""
 
-from biodbs.data._base import BaseFetchedData, BaseDBManager
-from biodbs.data.uniprot._data_model import UniProtEntry
-from typing import Literal, Optional, List, Dict, Any, Union
+from biodbs.data._base import (
+    BaseFetchedData,
+    BaseDBManager,
+    LazyRecords,
+    build_index,
+    construct_model,
+)
+from biodbs.data.uniprot._data_model import EntryType, UniProtEntry
+from typing import Literal, Optional, Iterable, List, Dict, Any, Union
 import pandas as pd
 import polars as pl
 
@@ -16,8 +22,15 @@ class UniProtFetchedData(BaseFetchedData):
         - Sequence and features
         - Cross-references to other databases
 
+    Entries are kept as raw JSON dicts and validated into `UniProtEntry`
+    models only when ``entries`` is indexed or iterated. `get_accessions`,
+    `get_gene_names`, `to_accession_mapping` and `to_gene_mapping` read
+    the raw dicts and skip validation: an entry that would fail validation
+    is included until ``entries`` has been parsed. ``len()`` and
+    ``total_count`` likewise count raw entries until one is rejected.
+
     Attributes:
-        entries: List of UniProtEntry objects.
+        entries: Lazily parsed sequence of UniProtEntry objects.
         total_count: Total number of entries.
     """
 
@@ -25,50 +38,78 @@ class UniProtFetchedData(BaseFetchedData):
         self,
         content: Union[dict, list],
         query_ids: Optional[List[str]] = None,
+        trusted: bool = False,
     ):
         """Initialize UniProtFetchedData.
 
         Args:
             content: Raw API response.
             query_ids: Original query identifiers.
+            trusted: Build entries with ``model_construct`` instead of
+                validating them. Only for responses straight from UniProt.
         """
         super().__init__(content)
         self.query_ids = query_ids or []
+        self._trusted = trusted
 
         # Parse response
         if isinstance(content, dict):
             # Search response with results array
             if "results" in content:
-                self.entries = [self._parse_entry(e) for e in content.get("results", [])]
-                self.entries = [e for e in self.entries if e is not None]
+                raw = content.get("results", [])
             # Single entry response
             elif "primaryAccession" in content:
-                entry = self._parse_entry(content)
-                self.entries = [entry] if entry else []
+                raw = [content]
             else:
-                self.entries = []
-            self.total_count = len(self.entries)
+                raw = []
         elif isinstance(content, list):
-            self.entries = [e for e in (self._parse_entry(d) for d in content) if e]
-            self.total_count = len(self.entries)
+            raw = content
         else:
-            self.entries = []
-            self.total_count = 0
+            raw = []
+        self.entries = LazyRecords(
+            (d for d in raw if isinstance(d, dict) and "primaryAccession" in d),
+            self._parse_entry,
+        )
+        self.total_count = len(self.entries)
+
+    @property
+    def entries(self) -> LazyRecords:
+        """Entries as UniProtEntry models, parsed on first access."""
+        return self._entries
+
+    @entries.setter
+    def entries(self, entries: Iterable[UniProtEntry]) -> None:
+        if not isinstance(entries, LazyRecords):
+            entries = LazyRecords.from_parsed(entries, parse=self._parse_entry)
+        self._entries = entries
+        self._invalidate_indexes()
 
     def _parse_entry(self, data: Dict) -> Optional[UniProtEntry]:
         """Parse UniProt entry data."""
         try:
-            return UniProtEntry(**data)
+            if getattr(self, "_trusted", False):
+                return construct_model(UniProtEntry, data)
+            return UniProtEntry.model_validate(data)
         except Exception:
             return None
 
+    @staticmethod
+    def _raw_gene_name(data: Dict) -> Optional[str]:
+        genes = data.get("genes")
+        if genes:
+            return (genes[0].get("geneName") or {}).get("value")
+        return None
+
     def __len__(self) -> int:
         return len(self.entries)
 
     def __repr__(self) -> str:
         """Return a human-readable representation."""
-        n = len(self.entries)
-        reviewed = sum(1 for e in self.entries if e.is_reviewed)
+        n = len(self)
+        reviewed = sum(self.entries.project(
+            lambda d: d.get("entryType") == EntryType.SWISSPROT.value,
+            lambda e: e.is_reviewed,
+        ))
         parts = [f"UniProtFetchedData({n} entries"]
         if reviewed > 0:
             parts.append(f", {reviewed} reviewed")
@@ -84,17 +125,20 @@ class UniProtFetchedData(BaseFetchedData):
     def __iadd__(self, other: "UniProtFetchedData") -> "UniProtFetchedData":
         """Concatenate results from another UniProtFetchedData."""
         self.entries.extend(other.entries)
+        self._invalidate_indexes()
         self.total_count += other.total_count
         return self
 
     @property
-    def results(self) -> List[UniProtEntry]:
+    def results(self) -> LazyRecords:
         """Get entry results."""
         return self.entries
 
     def get_accessions(self) -> List[str]:
         """Get list of accessions."""
-        return [e.primaryAccession for e in self.entries]
+        return list(self.entries.project(
+            lambda d: d["primaryAccession"], lambda e: e.primaryAccession
+        ))
 
     def get_entry_names(self) -> List[str]:
         """Get list of entry names."""
@@ -106,39 +150,62 @@ class UniProtFetchedData(BaseFetchedData):
 
     def get_gene_names(self) -> List[str]:
         """Get list of primary gene names."""
-        return [e.gene_name for e in self.entries if e.gene_name]
+        names = self.entries.project(self._raw_gene_name, lambda e: e.gene_name)
+        return [name for name in names if name]
 
     def get_entry(self, accession: str) -> Optional[UniProtEntry]:
         """Get a specific entry by accession.
 
+        Primary and secondary accessions are looked up in a hash index that
+        is built on first use.
+
         Args:
             accession: UniProt accession.
 
         Returns:
             UniProtEntry or None.
         """
-        for e in self.entries:
-            if e.primaryAccession == accession:
-                return e
-            if e.secondaryAccessions and accession in e.secondaryAccessions:
-                return e
-        return None
+        position = self._lookup_index("accession", self._build_accession_index).get(accession)
+        return None if position is None else self.entries.parse_at(position)
 
     def get_entry_by_gene(self, gene_name: str) -> Optional[UniProtEntry]:
         """Get entry by gene name (case-insensitive).
 
+        Gene names and synonyms are looked up in a case-folded hash index
+        that is built on first use.
+
         Args:
             gene_name: Gene name to search.
 
         Returns:
             First matching UniProtEntry or None.
         """
-        gene_lower = gene_name.lower()
-        for e in self.entries:
-            for name in e.gene_names:
-                if name.lower() == gene_lower:
-                    return e
-        return None
+        position = self._lookup_index("gene", self._build_gene_index).get(gene_name.casefold())
+        return None if position is None else self.entries.parse_at(position)
+
+    def _build_accession_index(self) -> Dict[str, int]:
+        return build_index(self.entries.project(
+            lambda d: [d["primaryAccession"], *(d.get("secondaryAccessions") or [])],
+            lambda e: [e.primaryAccession, *(e.secondaryAccessions or [])],
+            positions=True,
+        ))
+
+    def _build_gene_index(self) -> Dict[str, int]:
+        return build_index(
+            (position, [name.casefold() for name in names if name])
+            for position, names in self.entries.project(
+                self._raw_gene_names, lambda e: e.gene_names, positions=True
+            )
+        )
+
+    @staticmethod
+    def _raw_gene_names(data: Dict) -> List[str]:
+        names = []
+        for gene in data.get("genes") or []:
+            if gene.get("geneName"):
+                names.append(gene["geneName"].get("value"))
+            names.extend(s.get("value") for s in gene.get("synonyms") or [])
+        return names
 
     def filter_reviewed(self) -> "UniProtFetchedData":
         """Filter to reviewed (Swiss-Prot) entries only.
@@ -146,13 +213,7 @@ class UniProtFetchedData(BaseFetchedData):
         Returns:
             New UniProtFetchedData with filtered entries.
         """
-        filtered = [e for e in self.entries if e.is_reviewed]
-        result = UniProtFetchedData.__new__(UniProtFetchedData)
-        result._content = self._content
-        result.query_ids = self.query_ids
-        result.entries = filtered
-        result.total_count = len(filtered)
-        return result
+        return self._filtered(lambda e: e.is_reviewed)
 
     def filter_by_organism(self, tax_id: int) -> "UniProtFetchedData":
         """Filter entries by organism taxonomy ID.
@@ -163,12 +224,16 @@ class UniProtFetchedData(BaseFetchedData):
         Returns:
             New UniProtFetchedData with filtered entries.
         """
-        filtered = [e for e in self.entries if e.tax_id == tax_id]
+        return self._filtered(lambda e: e.tax_id == tax_id)
+
+    def _filtered(self, predicate) -> "UniProtFetchedData":
+        """Return a copy holding only the entries matching ``predicate``."""
         result = UniProtFetchedData.__new__(UniProtFetchedData)
         result._content = self._content
         result.query_ids = self.query_ids
-        result.entries = filtered
-        result.total_count = len(filtered)
+        result._trusted = self._trusted
+        result.entries = self.entries.select(predicate)
+        result.total_count = len(result.entries)
         return result
 
     def to_accession_mapping(self) -> Dict[str, str]:
@@ -177,11 +242,11 @@ class UniProtFetchedData(BaseFetchedData):
         Returns:
             Dictionary mapping gene names to accessions.
         """
-        mapping = {}
-        for e in self.entries:
-            if e.gene_name:
-                mapping[e.gene_name] = e.primaryAccession
-        return mapping
+        pairs = self.entries.project(
+            lambda d: (self._raw_gene_name(d), d["primaryAccession"]),
+            lambda e: (e.gene_name, e.primaryAccession),
+        )
+        return {gene: accession for gene, accession in pairs if gene}
 
     def to_gene_mapping(self) -> Dict[str, str]:
         """Create mapping from accession to gene name.
@@ -189,7 +254,11 @@ class UniProtFetchedData(BaseFetchedData):
         Returns:
             Dictionary mapping accessions to gene names.
         """
-        return {e.primaryAccession: e.gene_name for e in self.entries if e.gene_name}
+        pairs = self.entries.project(
+            lambda d: (d["primaryAccession"], self._raw_gene_name(d)),
+            lambda e: (e.primaryAccession, e.gene_name),
+        )
+        return {accession: gene for accession, gene in pairs if gene}
 
     def as_dict(self, columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """Return entries as list of dicts.
@@ -323,6 +392,7 @@ class UniProtSearchResult(UniProtFetchedData):
         content: Dict,
         query: Optional[str] = None,
         next_cursor: Optional[str] = None,
+        trusted: bool = False,
     ):
         """Initialize UniProtSearchResult.
 
@@ -330,8 +400,9 @@ class UniProtSearchResult(UniProtFetchedData):
             content: Raw search response.
             query: Original search query.
             next_cursor: Cursor for next page.
+            trusted: Build entries without validation (see `UniProtFetchedData`).
         """
-        super().__init__(content)
+        super().__init__(content, trusted=trusted)
         self.query = query
         self.next_cursor = next_cursor
 
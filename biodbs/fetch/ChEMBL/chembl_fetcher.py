@@ -1,13 +1,22 @@
 """ChEMBL REST API fetcher following the standardized pattern."""
 
-from biodbs.fetch._base import BaseAPIConfig, NameSpace, BaseDataFetcher
+from biodbs.fetch._base import (
+    BaseAPIConfig,
+    BaseDataFetcher,
+    ConcatSink,
+    JsonLinesSink,
+    NameSpace,
+    PageSink,
+    RequestPlan,
+)
+from biodbs.fetch._rate_limit import async_request_with_retry, get_rate_limiter
+from biodbs.fetch._session import session_pool
 from biodbs.data.ChEMBL._data_model import ChEMBLModel
 from biodbs.data.ChEMBL.data import ChEMBLFetchedData, ChEMBLDataManager
 from biodbs.exceptions import raise_for_status
-from typing import Dict, Any, List, Literal, Optional, Union
+from typing import Dict, Any, AsyncIterator, Iterator, List, Literal, Optional, Union
 from pathlib import Path
 import logging
-import requests
 
 logger = logging.getLogger(__name__)
 
@@ -35,14 +44,12 @@ class ChEMBLNameSpace(NameSpace):
     def __init__(self):
         super().__init__(ChEMBLModel)
 
-    def validate(self, **kwargs):
-        """Validate and compute derived fields (path, query params)."""
-        is_valid, err_msg = super().validate(**kwargs)
-        if is_valid:
-            model = ChEMBLModel(**kwargs)
-            self._valid_params["_path"] = model.build_path()
-            self._valid_params["_query_params"] = model.build_query_params()
-        return is_valid, err_msg
+    def request_params(self, model: ChEMBLModel) -> Dict[str, Any]:
+        """Add derived fields (path, query params) from the validated model."""
+        params = super().request_params(model)
+        params["_path"] = model.build_path()
+        params["_query_params"] = model.build_query_params()
+        return params
 
 
 class ChEMBL_APIConfig(BaseAPIConfig):
@@ -92,11 +99,22 @@ class ChEMBL_Fetcher(BaseDataFetcher):
             similarity_threshold=70,
             limit=50
         )
+
+        # From async code, await many queries on one event loop
+        molecules = await asyncio.gather(
+            *(fetcher.aget(resource="molecule", chembl_id=i) for i in ["CHEMBL25", "CHEMBL521"])
+        )
         ```
     """
 
     DEFAULT_LIMIT = 20
 
+    # Host identifier for rate limiting
+    HOST = "www.ebi.ac.uk"
+
+    # Rate limit (requests per second)
+    RATE_LIMIT = 5
+
     def __init__(self, **data_manager_kws):
         super().__init__(ChEMBL_APIConfig(), ChEMBLNameSpace(), {})
         self._data_manager = (
@@ -104,6 +122,15 @@ class ChEMBL_Fetcher(BaseDataFetcher):
             if data_manager_kws
             else None
         )
+        get_rate_limiter().setdefault_rate(self.HOST, self.RATE_LIMIT)
+
+    def _build_request(self, **params: Any) -> RequestPlan:
+        """Validate parameters and return the request to send."""
+        valid_params = self._namespace.parse(**params)
+        return RequestPlan(
+            self._api_config.build_url(valid_params),
+            valid_params.get("_query_params", {}),
+        )
 
     def get(
         self,
@@ -133,7 +160,7 @@ class ChEMBL_Fetcher(BaseDataFetcher):
         Returns:
             ChEMBLFetchedData with parsed results.
         """
-        is_valid, err_msg = self._namespace.validate(
+        plan = self._build_request(
             resource=resource,
             chembl_id=chembl_id,
             search_query=search_query,
@@ -144,19 +171,13 @@ class ChEMBL_Fetcher(BaseDataFetcher):
             offset=offset,
             format=format,
         )
-        if not is_valid:
-            raise ValueError(err_msg)
 
-        self._api_config.update_params(**self._namespace.valid_params)
-        url = self._api_config.api_url
-        query_params = self._namespace.valid_params.get("_query_params", {})
-
-        response = requests.get(url, params=query_params)
+        response = session_pool.get(plan.url, params=plan.params)
         if response.status_code == 404:
             # Entry not found - return empty result
             return ChEMBLFetchedData({}, resource=resource)
         if response.status_code != 200:
-            raise_for_status(response, "ChEMBL", url=url)
+            raise_for_status(response, "ChEMBL", url=plan.url)
 
         return ChEMBLFetchedData(response.json(), resource=resource)
 
@@ -167,11 +188,62 @@ class ChEMBL_Fetcher(BaseDataFetcher):
         resource: str,
     ) -> ChEMBLFetchedData:
         """Thread-safe fetch for a single page."""
-        response = requests.get(url, params=query_params)
+        response = session_pool.get(url, params=query_params)
+        if response.status_code != 200:
+            raise_for_status(response, "ChEMBL", url=url)
+        return ChEMBLFetchedData(response.json(), resource=resource)
+
+    async def _afetch_page(
+        self,
+        url: str,
+        query_params: Dict[str, Any],
+        resource: str,
+        not_found_ok: bool = False,
+    ) -> ChEMBLFetchedData:
+        """Coroutine version of `_fetch_page`, paced by the host rate limiter."""
+        response = await async_request_with_retry(url, params=query_params)
+        if not_found_ok and response.status_code == 404:
+            return ChEMBLFetchedData({}, resource=resource)
         if response.status_code != 200:
             raise_for_status(response, "ChEMBL", url=url)
         return ChEMBLFetchedData(response.json(), resource=resource)
 
+    async def aget(
+        self,
+        resource: str,
+        chembl_id: Optional[str] = None,
+        search_query: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        smiles: Optional[str] = None,
+        similarity_threshold: Optional[int] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        format: str = "json",
+    ) -> ChEMBLFetchedData:
+        """Coroutine version of `get`.
+
+        Uses the event loop's shared aiohttp session and the per-host rate
+        limiter, so many queries can be awaited concurrently. Arguments are
+        the same as for `get`.
+
+        Returns:
+            ChEMBLFetchedData with parsed results (empty if the entry is not found).
+        """
+        plan = self._build_request(
+            resource=resource,
+            chembl_id=chembl_id,
+            search_query=search_query,
+            filters=filters,
+            smiles=smiles,
+            similarity_threshold=similarity_threshold,
+            limit=limit,
+            offset=offset,
+            format=format,
+        )
+        return await self._afetch_page(
+            plan.url, plan.params, resource, not_found_ok=True
+        )
+
     def get_all(
         self,
         resource: str,
@@ -181,6 +253,8 @@ class ChEMBL_Fetcher(BaseDataFetcher):
         rate_limit_per_second: int = 5,
         search_query: Optional[str] = None,
         filters: Optional[Dict[str, Any]] = None,
+        max_in_flight: Optional[int] = None,
+        ordered: bool = True,
         **kwargs: Any,
     ) -> Union[ChEMBLFetchedData, Path]:
         """Fetch multiple pages of results concurrently.
@@ -188,13 +262,17 @@ class ChEMBL_Fetcher(BaseDataFetcher):
         Args:
             resource: ChEMBL resource (molecule, activity, target, etc.).
             method: "concat" returns a single ChEMBLFetchedData.
-                "stream_to_storage" streams each batch to storage and
-                returns the output file Path.
+                "stream_to_storage" appends each page to storage as it
+                arrives and returns the output file Path.
             limit_per_page: Records per request (default 1000, max 1000).
             max_records: Total records to fetch. None means fetch all.
             rate_limit_per_second: Max concurrent requests per second.
             search_query: Optional full-text search query.
             filters: Optional field filters.
+            max_in_flight: Max pages requested or buffered at once; defaults
+                to ``rate_limit_per_second``.
+            ordered: Keep pages in offset order. ``False`` consumes pages in
+                completion order.
             **kwargs: Additional parameters.
 
         Returns:
@@ -204,12 +282,55 @@ class ChEMBL_Fetcher(BaseDataFetcher):
             raise ValueError(
                 "stream_to_storage requires storage_path in ChEMBL_Fetcher constructor"
             )
+        pages = self.iter_all(
+            resource,
+            limit_per_page=limit_per_page,
+            max_records=max_records,
+            rate_limit_per_second=rate_limit_per_second,
+            search_query=search_query,
+            filters=filters,
+            max_in_flight=max_in_flight,
+            ordered=ordered,
+            **kwargs,
+        )
+        return self.drain_pages(pages, self._page_sink(method, resource, max_records))
 
-        if limit_per_page > 1000:
-            limit_per_page = 1000
+    def iter_all(
+        self,
+        resource: str,
+        limit_per_page: int = 1000,
+        max_records: Optional[int] = None,
+        rate_limit_per_second: int = 5,
+        search_query: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        max_in_flight: Optional[int] = None,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[ChEMBLFetchedData]:
+        """Yield pages of results as they are fetched.
+
+        The first page is fetched to discover the total; the remaining pages
+        are requested concurrently with bounded look-ahead.
 
-        # Validate and build base URL
-        is_valid, err_msg = self._namespace.validate(
+        Args:
+            resource: ChEMBL resource (molecule, activity, target, etc.).
+            limit_per_page: Records per request (default 1000, max 1000).
+            max_records: Total records to fetch. None means fetch all.
+            rate_limit_per_second: Max requests per second.
+            search_query: Optional full-text search query.
+            filters: Optional field filters.
+            max_in_flight: Max pages requested or buffered at once; defaults
+                to ``rate_limit_per_second``.
+            ordered: Yield pages in offset order; ``False`` yields them in
+                completion order.
+            **kwargs: Additional parameters.
+
+        Returns:
+            Iterator of non-empty ChEMBLFetchedData pages. Failed pages are
+            logged and skipped.
+        """
+        limit_per_page = min(limit_per_page, 1000)
+        plan = self._build_request(
             resource=resource,
             search_query=search_query,
             filters=filters,
@@ -217,91 +338,190 @@ class ChEMBL_Fetcher(BaseDataFetcher):
             offset=0,
             **kwargs,
         )
-        if not is_valid:
-            raise ValueError(err_msg)
-
-        self._api_config.update_params(**self._namespace.valid_params)
-        base_url = self._api_config.api_url
-        base_query_params = self._namespace.valid_params.get("_query_params", {})
-
-        # First request to discover total
-        first_params = {**base_query_params, "limit": limit_per_page, "offset": 0}
-        first_page = self._fetch_page(base_url, first_params, resource)
-
-        if not first_page.results:
-            return ChEMBLFetchedData({}, resource=resource)
+        return self._iter_pages(
+            plan.url, plan.params, resource, limit_per_page, max_records,
+            rate_limit_per_second, max_in_flight, ordered,
+        )
 
-        # Get total from metadata
+    @staticmethod
+    def _plan_pages(
+        first_page: ChEMBLFetchedData, limit_per_page: int, max_records: Optional[int]
+    ) -> List[int]:
+        """Return the offsets of the pages still needed after ``first_page``."""
         total_available = first_page.get_total_count() or len(first_page.results)
         target = (
             min(max_records, total_available)
             if max_records is not None
             else total_available
         )
-        first_count = len(first_page.results)
-
-        # Compute remaining pages
-        if first_count >= target:
-            return self._finalise_chembl(method, [first_page], resource)
+        return list(range(len(first_page.results), target, limit_per_page))
 
-        # Calculate offsets for remaining pages
-        offsets = list(range(first_count, target, limit_per_page))
+    def _iter_pages(
+        self,
+        base_url: str,
+        base_query_params: Dict[str, Any],
+        resource: str,
+        limit_per_page: int,
+        max_records: Optional[int],
+        rate_limit_per_second: int,
+        max_in_flight: Optional[int],
+        ordered: bool,
+    ) -> Iterator[ChEMBLFetchedData]:
+        first_params = {**base_query_params, "limit": limit_per_page, "offset": 0}
+        first_page = self._fetch_page(base_url, first_params, resource)
+        if not first_page.results:
+            return
+        offsets = self._plan_pages(first_page, limit_per_page, max_records)
+        yield first_page
+        if not offsets:
+            return
 
         logger.info(
             "Fetching %d more pages concurrently (rate=%d/s)",
             len(offsets),
             rate_limit_per_second,
         )
-
-        def _fetch(offset):
-            params = {**base_query_params, "limit": limit_per_page, "offset": offset}
-            return self._fetch_page(base_url, params, resource)
-
-        remaining_results: list = self.schedule_process(
-            get_func=_fetch,
-            args_list=[(o,) for o in offsets],
+        for i, page in self.iter_process(
+            self._fetch_page,
+            args_list=[
+                (base_url, {**base_query_params, "limit": limit_per_page, "offset": o}, resource)
+                for o in offsets
+            ],
             rate_limit_per_second=rate_limit_per_second,
+            max_in_flight=max_in_flight,
+            ordered=ordered,
             return_exceptions=True,
-        )
+            host=self.HOST,
+        ):
+            if isinstance(page, Exception):
+                logger.warning("Page at offset %d failed: %s", offsets[i], page)
+            elif page.results:
+                yield page
+
+    async def aget_all(
+        self,
+        resource: str,
+        method: Literal["concat", "stream_to_storage"] = "concat",
+        limit_per_page: int = 1000,
+        max_records: Optional[int] = None,
+        max_concurrency: int = 8,
+        search_query: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Union[ChEMBLFetchedData, Path]:
+        """Coroutine version of `get_all`.
 
-        # Collect results
-        all_pages: List[ChEMBLFetchedData] = [first_page]
-        for i, result in enumerate(remaining_results):
-            if isinstance(result, Exception):
-                logger.warning("Page at offset %d failed: %s", offsets[i], result)
-                continue
-            if result.results:
-                all_pages.append(result)
+        Pages are requested concurrently on the running event loop and
+        paced by the shared per-host rate limiter.
 
-        return self._finalise_chembl(method, all_pages, resource, target)
+        Args:
+            resource: ChEMBL resource (molecule, activity, target, etc.).
+            method: "concat" or "stream_to_storage", as for `get_all`.
+            limit_per_page: Records per request (default 1000, max 1000).
+            max_records: Total records to fetch. None means fetch all.
+            max_concurrency: Maximum number of page requests in flight.
+            search_query: Optional full-text search query.
+            filters: Optional field filters.
+            ordered: Keep pages in offset order, as for `get_all`.
+            **kwargs: Additional parameters.
+
+        Returns:
+            Combined ChEMBLFetchedData or Path to output file.
+        """
+        if method == "stream_to_storage" and self._data_manager is None:
+            raise ValueError(
+                "stream_to_storage requires storage_path in ChEMBL_Fetcher constructor"
+            )
+        pages = self.aiter_all(
+            resource,
+            limit_per_page=limit_per_page,
+            max_records=max_records,
+            max_concurrency=max_concurrency,
+            search_query=search_query,
+            filters=filters,
+            ordered=ordered,
+            **kwargs,
+        )
+        return await self.adrain_pages(pages, self._page_sink(method, resource, max_records))
 
-    def _finalise_chembl(
+    def aiter_all(
         self,
-        method: str,
-        pages: List[ChEMBLFetchedData],
         resource: str,
+        limit_per_page: int = 1000,
         max_records: Optional[int] = None,
-    ) -> Union[ChEMBLFetchedData, Path]:
-        """Combine fetched pages into the requested output format."""
-        filename = f"chembl_{resource}"
+        max_concurrency: int = 8,
+        search_query: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChEMBLFetchedData]:
+        """Async iterator version of `iter_all`.
 
+        Args:
+            resource: ChEMBL resource (molecule, activity, target, etc.).
+            limit_per_page: Records per request (default 1000, max 1000).
+            max_records: Total records to fetch. None means fetch all.
+            max_concurrency: Max pages requested or buffered at once.
+            search_query: Optional full-text search query.
+            filters: Optional field filters.
+            ordered: Yield pages in offset order; ``False`` yields them in
+                completion order.
+            **kwargs: Additional parameters.
+        """
+        limit_per_page = min(limit_per_page, 1000)
+        plan = self._build_request(
+            resource=resource,
+            search_query=search_query,
+            filters=filters,
+            limit=limit_per_page,
+            offset=0,
+            **kwargs,
+        )
+        return self._aiter_pages(
+            plan.url, plan.params, resource, limit_per_page, max_records,
+            max_concurrency, ordered,
+        )
+
+    async def _aiter_pages(
+        self,
+        base_url: str,
+        base_query_params: Dict[str, Any],
+        resource: str,
+        limit_per_page: int,
+        max_records: Optional[int],
+        max_concurrency: int,
+        ordered: bool,
+    ) -> AsyncIterator[ChEMBLFetchedData]:
+        first_params = {**base_query_params, "limit": limit_per_page, "offset": 0}
+        first_page = await self._afetch_page(base_url, first_params, resource)
+        if not first_page.results:
+            return
+        offsets = self._plan_pages(first_page, limit_per_page, max_records)
+        yield first_page
+
+        async for i, page in self.aiter_process(
+            self._afetch_page,
+            args_list=[
+                (base_url, {**base_query_params, "limit": limit_per_page, "offset": o}, resource)
+                for o in offsets
+            ],
+            max_in_flight=max_concurrency,
+            ordered=ordered,
+            return_exceptions=True,
+        ):
+            if isinstance(page, Exception):
+                logger.warning("Page at offset %d failed: %s", offsets[i], page)
+            elif page.results:
+                yield page
+
+    def _page_sink(
+        self, method: str, resource: str, max_records: Optional[int] = None
+    ) -> PageSink:
+        """Return the consumer that turns fetched pages into the requested output."""
         if method == "concat":
-            result = pages[0]
-            for page in pages[1:]:
-                result += page
-            if max_records is not None:
-                result.results = result.results[:max_records]
-            return result
-
-        # stream_to_storage
-        for page in pages:
-            if page.results:
-                self._data_manager.stream_json_lines(
-                    iter(page.results), filename, key=filename
-                )
-
-        self._data_manager.flush_metadata()
-        return self._data_manager.storage_path / f"{filename}.jsonl"
+            return ConcatSink(lambda: ChEMBLFetchedData({}, resource=resource), max_records)
+        return JsonLinesSink(self._data_manager, f"chembl_{resource}", max_records)
 
     # Convenience methods for common operations
     def get_molecule(self, chembl_id: str) -> ChEMBLFetchedData:
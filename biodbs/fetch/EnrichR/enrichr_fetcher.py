@@ -2,9 +2,9 @@
 
 from typing import Dict, Any, List
 import logging
-import requests
 
 from biodbs.fetch._base import BaseAPIConfig, NameSpace, BaseDataFetcher
+from biodbs.fetch._session import session_pool
 from biodbs.exceptions import raise_for_status
 from biodbs.data.EnrichR._data_model import (
     EnrichRBase,
@@ -123,7 +123,7 @@ class EnrichR_Fetcher(BaseDataFetcher):
             "description": (None, model.description),
         }
 
-        response = requests.post(url, files=payload)
+        response = session_pool.post(url, files=payload)
         if response.status_code != 200:
             raise_for_status(response, "EnrichR", url=url)
 
@@ -146,7 +146,7 @@ class EnrichR_Fetcher(BaseDataFetcher):
             >>> print(kegg_libs.get_library_names())
         """
         url = self._api_config.get_url(EnrichREndpoint.DATASET_STATISTICS.value)
-        response = requests.get(url)
+        response = session_pool.get(url)
 
         if response.status_code != 200:
             raise_for_status(response, "EnrichR", url=url)
@@ -201,7 +201,7 @@ class EnrichR_Fetcher(BaseDataFetcher):
             "backgroundType": library,
         }
 
-        response = requests.get(url, params=params)
+        response = session_pool.get(url, params=params)
         if response.status_code != 200:
             raise_for_status(response, "EnrichR", url=url)
 
@@ -253,7 +253,7 @@ class EnrichR_Fetcher(BaseDataFetcher):
                 "backgroundType": library,
             }
 
-            response = requests.get(url, params=params)
+            response = session_pool.get(url, params=params)
             if response.status_code == 200:
                 data = response.json()
                 lib_results = data.get(library, [])
@@ -310,7 +310,7 @@ class EnrichR_Fetcher(BaseDataFetcher):
             "list": (None, "\n".join(genes)),
             "description": (None, description),
         }
-        response = requests.post(url, files=payload)
+        response = session_pool.post(url, files=payload)
         if response.status_code != 200:
             raise_for_status(response, "EnrichR", url=url)
         user_list_id = response.json()["userListId"]
@@ -318,7 +318,7 @@ class EnrichR_Fetcher(BaseDataFetcher):
         # Step 2: Add background
         url = f"{speed_base}/{EnrichREndpoint.SPEED_ADD_BACKGROUND.value}"
         payload = {"background": (None, "\n".join(background))}
-        response = requests.post(url, files=payload)
+        response = session_pool.post(url, files=payload)
         if response.status_code != 200:
             raise_for_status(response, "EnrichR", url=url)
         background_id = response.json()["backgroundid"]
@@ -330,7 +330,7 @@ class EnrichR_Fetcher(BaseDataFetcher):
             "backgroundid": (None, str(background_id)),
             "backgroundType": (None, library),
         }
-        response = requests.post(url, files=payload)
+        response = session_pool.post(url, files=payload)
         if response.status_code != 200:
             raise_for_status(response, "EnrichR", url=url)
 
@@ -356,7 +356,7 @@ class EnrichR_Fetcher(BaseDataFetcher):
         url = self._api_config.get_url(EnrichREndpoint.VIEW.value)
         params = {"userListId": user_list_id}
 
-        response = requests.get(url, params=params)
+        response = session_pool.get(url, params=params)
         if response.status_code != 200:
             raise_for_status(response, "EnrichR", url=url)
 
@@ -376,7 +376,7 @@ class EnrichR_Fetcher(BaseDataFetcher):
         url = self._api_config.get_url(EnrichREndpoint.GEN_MAP.value)
         params = {"gene": gene, "backgroundType": library}
 
-        response = requests.get(url, params=params)
+        response = session_pool.get(url, params=params)
         if response.status_code != 200:
             raise_for_status(response, "EnrichR", url=url)
 
@@ -405,7 +405,7 @@ class EnrichR_Fetcher(BaseDataFetcher):
             "filename": filename,
         }
 
-        response = requests.get(url, params=params)
+        response = session_pool.get(url, params=params)
         if response.status_code != 200:
             raise_for_status(response, "EnrichR", url=url)
 
@@ -1,13 +1,22 @@
-from biodbs.fetch._base import BaseAPIConfig, NameSpace, BaseDataFetcher
+from biodbs.fetch._base import (
+    BaseAPIConfig,
+    BaseDataFetcher,
+    ConcatSink,
+    JsonLinesSink,
+    NameSpace,
+    PageSink,
+)
+from biodbs.fetch._rate_limit import async_request_with_retry, get_rate_limiter
+from biodbs.fetch._session import session_pool
 from biodbs.data.FDA._data_model import FDAModel
 from biodbs.data.FDA.data import FDAFetchedData, FDADataManager
 from biodbs.exceptions import raise_for_status
 
-from typing import Any, Literal, Optional, Union
+from typing import Any, AsyncIterator, Iterator, List, Literal, Optional, Union
+from functools import partial
 from pathlib import Path
 import logging
 
-import requests
 
 logger = logging.getLogger(__name__)
 
@@ -59,9 +68,18 @@ class FDA_Fetcher(BaseDataFetcher):
             search={"openfda.brand_name": "TYLENOL"},
             limit=5
         )
+
+        # From async code, await many queries on one event loop
+        events = await fetcher.aget(category="drug", endpoint="event", limit=10)
         ```
     """
 
+    # Host identifier for rate limiting
+    HOST = "api.fda.gov"
+
+    # Rate limit (requests per second) - 240 requests/min
+    RATE_LIMIT = 4
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -80,6 +98,7 @@ class FDA_Fetcher(BaseDataFetcher):
         self._api_key = api_key
         self._limit = limit
         self._data_manager = FDADataManager(**data_manager_kws)
+        get_rate_limiter().setdefault_rate(self.HOST, self.RATE_LIMIT)
 
     def get(
         self,
@@ -119,19 +138,9 @@ class FDA_Fetcher(BaseDataFetcher):
         kwargs["api_key"] = self._api_key if kwargs.get("api_key") is None else kwargs.get("api_key")
         kwargs["limit"] = self._limit if kwargs.get("limit") is None else kwargs.get("limit")
 
-        is_valid, err_msg = self._namespace.validate(category=category, 
-                                                     endpoint=endpoint, 
-                                                     search=kwargs.get("search"),
-                                                     limit=kwargs.get("limit"),
-                                                     sort=kwargs.get("sort"),
-                                                     count=kwargs.get("count"),
-                                                     skip=kwargs.get("skip"))
-        if not is_valid:
-            raise ValueError(err_msg)
-        self._api_config.update_params(**self._namespace.valid_params)
-        url = self._api_config.api_url
-
-        response = requests.get(url, params=kwargs, stream=stream)
+        url = self._resolve_url(category, endpoint, **kwargs)
+
+        response = session_pool.get(url, params=kwargs, stream=stream)
         if response.status_code != 200:
             raise_for_status(response, "FDA", url=url)
         
@@ -139,14 +148,62 @@ class FDA_Fetcher(BaseDataFetcher):
     
     def _fetch_page(self, url: str, **params) -> FDAFetchedData:
         """Thread-safe page fetch — no shared state mutation."""
-        response = requests.get(url, params=params)
+        response = session_pool.get(url, params=params)
+        if response.status_code != 200:
+            raise_for_status(response, "FDA", url=url)
+        return FDAFetchedData(response.json())
+
+    async def _afetch_page(self, url: str, **params) -> FDAFetchedData:
+        """Coroutine version of `_fetch_page`, paced by the host rate limiter."""
+        response = await async_request_with_retry(url, params=params)
         if response.status_code != 200:
             raise_for_status(response, "FDA", url=url)
         return FDAFetchedData(response.json())
 
+    def _apply_defaults(self, kwargs: dict) -> dict:
+        """Return a copy of ``kwargs`` with the fetcher's api_key and limit filled in."""
+        req_kwargs = dict(kwargs)
+        req_kwargs["api_key"] = (
+            self._api_key if req_kwargs.get("api_key") is None else req_kwargs["api_key"]
+        )
+        req_kwargs["limit"] = (
+            self._limit if req_kwargs.get("limit") is None else req_kwargs["limit"]
+        )
+        return req_kwargs
+
+    async def aget(
+        self,
+        category: str,
+        endpoint: str,
+        **kwargs: Any,
+    ) -> FDAFetchedData:
+        """Coroutine version of `get`.
+
+        Uses the event loop's shared aiohttp session and the per-host rate
+        limiter, so many queries can be awaited concurrently.
+
+        Args:
+            category: FDA category (e.g., "drug", "device", "food").
+            endpoint: Category endpoint (e.g., "event", "label", "enforcement").
+            **kwargs: Query parameters, as for `get`.
+
+        Returns:
+            FDAFetchedData with query results.
+
+        Example:
+            >>> fetcher = FDA_Fetcher()
+            >>> aspirin, ibuprofen = await asyncio.gather(
+            ...     fetcher.aget("drug", "event", search={"patient.drug.medicinalproduct": "aspirin"}),
+            ...     fetcher.aget("drug", "event", search={"patient.drug.medicinalproduct": "ibuprofen"}),
+            ... )
+        """
+        req_kwargs = self._apply_defaults(kwargs)
+        url = self._resolve_url(category, endpoint, **req_kwargs)
+        return await self._afetch_page(url, **req_kwargs)
+
     def _resolve_url(self, category, endpoint, **kwargs):
         """Validate params once and return the resolved base URL."""
-        is_valid, err_msg = self._namespace.validate(
+        params = self._namespace.parse(
             category=category,
             endpoint=endpoint,
             search=kwargs.get("search"),
@@ -155,10 +212,7 @@ class FDA_Fetcher(BaseDataFetcher):
             count=kwargs.get("count"),
             skip=kwargs.get("skip"),
         )
-        if not is_valid:
-            raise ValueError(err_msg)
-        self._api_config.update_params(**self._namespace.valid_params)
-        return self._api_config.api_url
+        return self._api_config.build_url(params)
 
     def get_all(
         self,
@@ -168,53 +222,103 @@ class FDA_Fetcher(BaseDataFetcher):
         batch_size: int = 1000,
         max_records: Optional[int] = None,
         rate_limit_per_second: int = 4,
+        max_in_flight: Optional[int] = None,
+        ordered: bool = True,
         **kwargs: Any,
     ) -> Union[FDAFetchedData, Path]:
         """Fetch multiple pages of results concurrently.
 
-        Uses :meth:`schedule_process` to dispatch page requests across
-        threads while staying within the FDA rate limit.
+        Pages are fetched by `iter_all` and consumed as they complete, with
+        at most ``max_in_flight`` pages requested or buffered at a time.
 
         Args:
             category: FDA category (e.g. ``"drug"``).
             endpoint: FDA endpoint (e.g. ``"event"``).
             method: ``"concat"`` accumulates all results in memory and returns
                 a single :class:`FDAFetchedData`.  ``"stream_to_storage"``
-                streams each batch to the data manager as JSON Lines and
-                returns the output file :class:`Path`.
+                appends each page to a JSON Lines file as it arrives, so peak
+                memory is a few pages, and returns the output file :class:`Path`.
             batch_size: Records per request (max 1000).
             max_records: Total records to fetch.  ``None`` means fetch all
                 available records.
             rate_limit_per_second: Max concurrent requests per second
                 (FDA default: 240/min ≈ 4/sec).
+            max_in_flight: Max pages requested or buffered at once; defaults
+                to ``rate_limit_per_second``.
+            ordered: Keep pages in offset order. ``False`` writes pages in
+                completion order, which avoids waiting on a slow page.
             **kwargs: Forwarded to the API (``search``, ``sort``, etc.).
 
         Note — openFDA rate limits:
             Without an API key: 240 req/min, 1 000 req/day per IP.
             With an API key: 240 req/min, 120 000 req/day per key.
         """
-        if batch_size > 1000:
-            raise ValueError("Upper limit = 1000 per request")
         if method not in ("concat", "stream_to_storage"):
             raise ValueError(f"Unknown method: {method!r}")
-
-        # -- resolve URL and apply defaults --------------------------------
-        req_kwargs = dict(kwargs)
-        req_kwargs["api_key"] = (
-            self._api_key if req_kwargs.get("api_key") is None else req_kwargs["api_key"]
-        )
-        req_kwargs["limit"] = (
-            self._limit if req_kwargs.get("limit") is None else req_kwargs["limit"]
+        pages = self.iter_all(
+            category, endpoint,
+            batch_size=batch_size,
+            max_records=max_records,
+            rate_limit_per_second=rate_limit_per_second,
+            max_in_flight=max_in_flight,
+            ordered=ordered,
+            **kwargs,
         )
-        url = self._resolve_url(category, endpoint, **req_kwargs)
+        return self.drain_pages(pages, self._page_sink(method, category, endpoint, max_records))
 
-        # -- first request: discover total ---------------------------------
-        first_params = {**req_kwargs, "limit": batch_size, "skip": 0}
-        first_page = self._fetch_page(url, **first_params)
+    def iter_all(
+        self,
+        category: str,
+        endpoint: str,
+        batch_size: int = 1000,
+        max_records: Optional[int] = None,
+        rate_limit_per_second: int = 4,
+        max_in_flight: Optional[int] = None,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[FDAFetchedData]:
+        """Yield pages of results as they are fetched.
 
-        if not first_page.results:
-            return FDAFetchedData({"meta": {}, "results": []})
+        The first page is fetched to discover the total; the remaining pages
+        are requested concurrently with bounded look-ahead, so iterating
+        slowly slows down fetching instead of piling pages up in memory.
+
+        Args:
+            category: FDA category (e.g. ``"drug"``).
+            endpoint: FDA endpoint (e.g. ``"event"``).
+            batch_size: Records per request (max 1000).
+            max_records: Total records to fetch. ``None`` means fetch all.
+            rate_limit_per_second: Max requests per second.
+            max_in_flight: Max pages requested or buffered at once; defaults
+                to ``rate_limit_per_second``.
+            ordered: Yield pages in offset order; ``False`` yields them in
+                completion order.
+            **kwargs: Forwarded to the API (``search``, ``sort``, etc.).
+
+        Returns:
+            Iterator of non-empty :class:`FDAFetchedData` pages. Failed pages
+            are logged and skipped.
+        """
+        if batch_size > 1000:
+            raise ValueError("Upper limit = 1000 per request")
+        req_kwargs = self._apply_defaults(kwargs)
+        url = self._resolve_url(category, endpoint, **req_kwargs)
+        return self._iter_pages(
+            url, req_kwargs, batch_size, max_records,
+            rate_limit_per_second, max_in_flight, ordered,
+        )
 
+    def _plan_pages(
+        self,
+        first_page: FDAFetchedData,
+        req_kwargs: dict,
+        batch_size: int,
+        max_records: Optional[int],
+    ) -> List[dict]:
+        """Return request parameters for the pages after ``first_page``.
+
+        Truncates ``first_page`` in place when it already covers the target.
+        """
         total_available = (
             first_page.metadata.get("results", {}).get("total")
             or len(first_page.results)
@@ -224,77 +328,166 @@ class FDA_Fetcher(BaseDataFetcher):
             if max_records is not None
             else total_available
         )
-        first_count = len(first_page.results)
-
-        # -- compute remaining page offsets --------------------------------
-        offsets = list(range(first_count, target, batch_size))
-        if not offsets:
-            # First page already covers everything.
-            if max_records is not None:
-                first_page.results = first_page.results[:target]
-            return self._finalise(method, [first_page], category, endpoint)
-
-        page_kwargs_list = [
+        if len(first_page.results) >= target:
+            first_page.results = first_page.results[:target]
+            return []
+        return [
             {**req_kwargs, "limit": min(batch_size, target - offset), "skip": offset}
-            for offset in offsets
+            for offset in range(len(first_page.results), target, batch_size)
         ]
 
-        # -- concurrent fetch via schedule_process -------------------------
+    def _iter_pages(
+        self,
+        url: str,
+        req_kwargs: dict,
+        batch_size: int,
+        max_records: Optional[int],
+        rate_limit_per_second: int,
+        max_in_flight: Optional[int],
+        ordered: bool,
+    ) -> Iterator[FDAFetchedData]:
+        first_page = self._fetch_page(url, **{**req_kwargs, "limit": batch_size, "skip": 0})
+        if not first_page.results:
+            return
+        page_kwargs_list = self._plan_pages(first_page, req_kwargs, batch_size, max_records)
+        yield first_page
+        if not page_kwargs_list:
+            return
+
         logger.info(
             "Fetching %d remaining pages concurrently (rate=%d/s)",
             len(page_kwargs_list),
             rate_limit_per_second,
         )
-
-        def _fetch(page_params):
-            return self._fetch_page(url, **page_params)
-
-        remaining_pages: list = self.schedule_process(
-            get_func=_fetch,
-            args_list=[(kw,) for kw in page_kwargs_list],
+        for i, page in self.iter_process(
+            partial(self._fetch_page, url),
+            kwargs_list=page_kwargs_list,
             rate_limit_per_second=rate_limit_per_second,
+            max_in_flight=max_in_flight,
+            ordered=ordered,
             return_exceptions=True,
+            host=self.HOST,
+        ):
+            if isinstance(page, Exception):
+                logger.warning("Page at skip=%d failed: %s", page_kwargs_list[i]["skip"], page)
+            elif page.results:
+                yield page
+
+    async def aget_all(
+        self,
+        category: str,
+        endpoint: str,
+        method: Literal["concat", "stream_to_storage"] = "concat",
+        batch_size: int = 1000,
+        max_records: Optional[int] = None,
+        max_concurrency: int = 8,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Union[FDAFetchedData, Path]:
+        """Coroutine version of `get_all`.
+
+        Pages are requested concurrently on the running event loop and
+        paced by the shared per-host rate limiter (``RATE_LIMIT`` requests
+        per second unless configured otherwise).
+
+        Args:
+            category: FDA category (e.g. ``"drug"``).
+            endpoint: FDA endpoint (e.g. ``"event"``).
+            method: ``"concat"`` or ``"stream_to_storage"``, as for `get_all`.
+            batch_size: Records per request (max 1000).
+            max_records: Total records to fetch. ``None`` means fetch all.
+            max_concurrency: Maximum number of page requests in flight.
+            ordered: Keep pages in offset order, as for `get_all`.
+            **kwargs: Forwarded to the API (``search``, ``sort``, etc.).
+
+        Returns:
+            Combined FDAFetchedData or Path to output file.
+        """
+        if method not in ("concat", "stream_to_storage"):
+            raise ValueError(f"Unknown method: {method!r}")
+        pages = self.aiter_all(
+            category, endpoint,
+            batch_size=batch_size,
+            max_records=max_records,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+            **kwargs,
         )
+        return await self.adrain_pages(pages, self._page_sink(method, category, endpoint, max_records))
 
-        # -- collect results in order --------------------------------------
-        all_pages: list[FDAFetchedData] = [first_page]
-        for i, page in enumerate(remaining_pages):
-            if isinstance(page, Exception):
-                logger.warning(
-                    "Page at skip=%d failed: %s", offsets[i], page
-                )
-                continue
-            if page.results:
-                all_pages.append(page)
+    def aiter_all(
+        self,
+        category: str,
+        endpoint: str,
+        batch_size: int = 1000,
+        max_records: Optional[int] = None,
+        max_concurrency: int = 8,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> AsyncIterator[FDAFetchedData]:
+        """Async iterator version of `iter_all`.
+
+        Usage::
 
-        return self._finalise(method, all_pages, category, endpoint, target)
+            async for page in fetcher.aiter_all("drug", "event", search=...):
+                handle(page.results)
 
-    def _finalise(
+        Args:
+            category: FDA category (e.g. ``"drug"``).
+            endpoint: FDA endpoint (e.g. ``"event"``).
+            batch_size: Records per request (max 1000).
+            max_records: Total records to fetch. ``None`` means fetch all.
+            max_concurrency: Max pages requested or buffered at once.
+            ordered: Yield pages in offset order; ``False`` yields them in
+                completion order.
+            **kwargs: Forwarded to the API (``search``, ``sort``, etc.).
+        """
+        if batch_size > 1000:
+            raise ValueError("Upper limit = 1000 per request")
+        req_kwargs = self._apply_defaults(kwargs)
+        url = self._resolve_url(category, endpoint, **req_kwargs)
+        return self._aiter_pages(url, req_kwargs, batch_size, max_records, max_concurrency, ordered)
+
+    async def _aiter_pages(
+        self,
+        url: str,
+        req_kwargs: dict,
+        batch_size: int,
+        max_records: Optional[int],
+        max_concurrency: int,
+        ordered: bool,
+    ) -> AsyncIterator[FDAFetchedData]:
+        first_page = await self._afetch_page(url, **{**req_kwargs, "limit": batch_size, "skip": 0})
+        if not first_page.results:
+            return
+        page_kwargs_list = self._plan_pages(first_page, req_kwargs, batch_size, max_records)
+        yield first_page
+
+        async for i, page in self.aiter_process(
+            partial(self._afetch_page, url),
+            kwargs_list=page_kwargs_list,
+            max_in_flight=max_concurrency,
+            ordered=ordered,
+            return_exceptions=True,
+        ):
+            if isinstance(page, Exception):
+                logger.warning("Page at skip=%d failed: %s", page_kwargs_list[i]["skip"], page)
+            elif page.results:
+                yield page
+
+    def _page_sink(
         self,
         method: str,
-        pages: list[FDAFetchedData],
         category: str,
         endpoint: str,
         max_records: Optional[int] = None,
-    ) -> Union[FDAFetchedData, Path]:
-        """Combine fetched pages into the requested output format."""
-        filename = f"{category}_{endpoint}"
-
+    ) -> PageSink:
+        """Return the consumer that turns fetched pages into the requested output."""
         if method == "concat":
-            result = pages[0]
-            for page in pages[1:]:
-                result += page
-            if max_records is not None:
-                result.results = result.results[:max_records]
-            return result
-
-        # stream_to_storage
-        for page in pages:
-            self._data_manager.stream_json_lines(
-                iter(page.results), filename, key=filename,
+            return ConcatSink(
+                lambda: FDAFetchedData({"meta": {}, "results": []}), max_records
             )
-        self._data_manager.flush_metadata()
-        return self._data_manager.storage_path / f"{filename}.jsonl"
+        return JsonLinesSink(self._data_manager, f"{category}_{endpoint}", max_records)
 
 
 if __name__ == "__main__":
@@ -17,6 +17,7 @@ Reference:
 """
 
 from biodbs.fetch._base import BaseAPIConfig, NameSpace, BaseDataFetcher
+from biodbs.fetch._session import session_pool
 from biodbs.exceptions import raise_for_status
 from biodbs.data.HPA._data_model import (
     HPAEntryModel,
@@ -33,7 +34,6 @@ from biodbs.data.HPA.data import HPAFetchedData, HPADataManager
 from typing import Dict, Any, List, Literal, Optional, Union
 from pathlib import Path
 import logging
-import requests
 import gzip
 
 logger = logging.getLogger(__name__)
@@ -60,13 +60,11 @@ class HPAEntryNameSpaceValidator(NameSpace):
     def __init__(self):
         super().__init__(HPAEntryModel)
 
-    def validate(self, **kwargs):
-        """Validate and compute URL."""
-        is_valid, err_msg = super().validate(**kwargs)
-        if is_valid:
-            model = HPAEntryModel(**kwargs)
-            self._valid_params["_url"] = model.build_url()
-        return is_valid, err_msg
+    def request_params(self, model: HPAEntryModel) -> Dict[str, Any]:
+        """Add the entry URL from the validated model."""
+        params = super().request_params(model)
+        params["_url"] = model.build_url()
+        return params
 
 
 class HPASearchNameSpaceValidator(NameSpace):
@@ -75,14 +73,12 @@ class HPASearchNameSpaceValidator(NameSpace):
     def __init__(self):
         super().__init__(HPASearchModel)
 
-    def validate(self, **kwargs):
-        """Validate and compute URL and query params."""
-        is_valid, err_msg = super().validate(**kwargs)
-        if is_valid:
-            model = HPASearchModel(**kwargs)
-            self._valid_params["_url"] = model.build_url()
-            self._valid_params["_query_params"] = model.build_query_params()
-        return is_valid, err_msg
+    def request_params(self, model: HPASearchModel) -> Dict[str, Any]:
+        """Add the URL and query params from the validated model."""
+        params = super().request_params(model)
+        params["_url"] = model.build_url()
+        params["_query_params"] = model.build_query_params()
+        return params
 
 
 class HPASearchDownloadNameSpaceValidator(NameSpace):
@@ -91,14 +87,12 @@ class HPASearchDownloadNameSpaceValidator(NameSpace):
     def __init__(self):
         super().__init__(HPASearchDownloadModel)
 
-    def validate(self, **kwargs):
-        """Validate and compute URL and query params."""
-        is_valid, err_msg = super().validate(**kwargs)
-        if is_valid:
-            model = HPASearchDownloadModel(**kwargs)
-            self._valid_params["_url"] = model.build_url()
-            self._valid_params["_query_params"] = model.build_query_params()
-        return is_valid, err_msg
+    def request_params(self, model: HPASearchDownloadModel) -> Dict[str, Any]:
+        """Add the URL and query params from the validated model."""
+        params = super().request_params(model)
+        params["_url"] = model.build_url()
+        params["_query_params"] = model.build_query_params()
+        return params
 
 
 class HPAEntryAPIConfig(BaseAPIConfig):
@@ -161,6 +155,9 @@ class HPA_Fetcher(BaseDataFetcher):
         ```
     """
 
+    # Host identifier for rate limiting
+    HOST = "www.proteinatlas.org"
+
     def __init__(self, **data_manager_kws):
         super().__init__(
             HPAEntryAPIConfig(),
@@ -192,17 +189,13 @@ class HPA_Fetcher(BaseDataFetcher):
         Returns:
             HPAFetchedData with gene information.
         """
-        is_valid, err_msg = self._namespace.validate(
+        params = self._namespace.parse(
             ensembl_id=ensembl_id,
             format=format,
         )
-        if not is_valid:
-            raise ValueError(err_msg)
-
-        self._api_config.update_params(**self._namespace.valid_params)
-        url = self._api_config.api_url
+        url = self._api_config.build_url(params)
 
-        response = requests.get(url, headers=self._headers)
+        response = session_pool.get(url, headers=self._headers)
         if response.status_code == 404:
             return HPAFetchedData([], format=format, query_type="entry")
         if response.status_code != 200:
@@ -249,6 +242,7 @@ class HPA_Fetcher(BaseDataFetcher):
             args_list=[(ens_id,) for ens_id in ensembl_ids[1:]],
             rate_limit_per_second=rate_limit_per_second,
             return_exceptions=True,
+            host=self.HOST,
         )
 
         # Combine results
@@ -276,19 +270,15 @@ class HPA_Fetcher(BaseDataFetcher):
         Returns:
             HPAFetchedData with search results.
         """
-        is_valid, err_msg = self._search_namespace.validate(
+        params = self._search_namespace.parse(
             query=query,
             format=format,
             compress=compress,
         )
-        if not is_valid:
-            raise ValueError(err_msg)
-
-        self._search_api_config.update_params(**self._search_namespace.valid_params)
-        url = self._search_api_config.api_url
-        query_params = self._search_namespace.valid_params.get("_query_params", {})
+        url = self._search_api_config.build_url(params)
+        query_params = params.get("_query_params", {})
 
-        response = requests.get(url, params=query_params, headers=self._headers)
+        response = session_pool.get(url, params=query_params, headers=self._headers)
         if response.status_code != 200:
             raise_for_status(response, "HPA", url=url)
 
@@ -336,22 +326,16 @@ class HPA_Fetcher(BaseDataFetcher):
         if columns is None:
             columns = DEFAULT_GENE_COLUMNS
 
-        is_valid, err_msg = self._search_download_namespace.validate(
+        params = self._search_download_namespace.parse(
             search=search,
             format=format,
             columns=columns,
             compress=compress,
         )
-        if not is_valid:
-            raise ValueError(err_msg)
-
-        self._search_download_api_config.update_params(
-            **self._search_download_namespace.valid_params
-        )
-        url = self._search_download_api_config.api_url
-        query_params = self._search_download_namespace.valid_params.get("_query_params", {})
+        url = self._search_download_api_config.build_url(params)
+        query_params = params.get("_query_params", {})
 
-        response = requests.get(url, params=query_params, headers=self._headers)
+        response = session_pool.get(url, params=query_params, headers=self._headers)
         if response.status_code == 400:
             # HPA returns 400 for excessive results or bad requests
             raise ValueError(
@@ -577,7 +561,7 @@ class HPA_Fetcher(BaseDataFetcher):
             raise ValueError("output_path required when data_manager not configured")
 
         logger.info("Downloading HPA bulk data from %s", url)
-        response = requests.get(url, stream=True)
+        response = session_pool.get(url, stream=True)
         if response.status_code != 200:
             raise_for_status(response, "HPA", url=url)
 
@@ -1,17 +1,67 @@
-from biodbs.fetch._base import BaseAPIConfig, NameSpace, BaseDataFetcher
+from biodbs.fetch._base import (
+    BaseAPIConfig,
+    BaseDataFetcher,
+    ConcatSink,
+    NameSpace,
+    PageSink,
+)
+from biodbs.fetch._rate_limit import async_request_with_retry, get_rate_limiter
 from biodbs.data.KEGG._data_model import (
     KEGGModel, KEGGOperation, KEGGDatabase,
 )
 from biodbs.data.KEGG.data import KEGGFetchedData, KEGGDataManager
 from biodbs.exceptions import raise_for_status
 from biodbs.utils import get_rsp
-from typing import Dict, Any, List, Literal, Optional, Union
+from typing import Dict, Any, AsyncIterator, Iterator, List, Literal, Optional, Union
+from contextlib import ExitStack
 from pathlib import Path
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+class _KEGGStorageSink(PageSink):
+    """Write KEGG batches to storage as they arrive.
+
+    Parsed records go to ``{filename}.jsonl``; flat-file text (e.g. ``get``
+    entries) goes to ``{filename}.txt`` with KEGG's ``///`` separator. The
+    format of the first batch decides which file is returned.
+    """
+
+    def __init__(self, data_manager: KEGGDataManager, filename: str):
+        self._data_manager = data_manager
+        self._filename = filename
+        self._stack = ExitStack()
+        self._writer = None
+        self._text = None
+        self._records_first: Optional[bool] = None
+
+    def add(self, batch: KEGGFetchedData) -> None:
+        if self._records_first is None:
+            self._records_first = bool(batch.records)
+        if batch.records:
+            if self._writer is None:
+                self._writer = self._stack.enter_context(
+                    self._data_manager.open_json_lines(self._filename, key=self._filename)
+                )
+            self._writer.write(batch.records)
+        elif batch.text:
+            if self._text is None:
+                path = self._data_manager.storage_path / f"{self._filename}.txt"
+                self._text = self._stack.enter_context(open(path, "w", encoding="utf-8"))
+            self._text.write(batch.text)
+            self._text.write("\n///\n")  # KEGG entry separator
+
+    def finish(self) -> Path:
+        self._stack.close()
+        self._data_manager.flush_metadata()
+        suffix = "txt" if self._records_first is False else "jsonl"
+        return self._data_manager.storage_path / f"{self._filename}.{suffix}"
+
+    def close(self) -> None:
+        self._stack.close()
+
+
 def _build_kegg_url(params: Dict[str, Any]) -> str:
     """Build KEGG REST API URL from validated parameters.
 
@@ -135,12 +185,21 @@ class KEGG_Fetcher(BaseDataFetcher):
 
         # Convert KEGG IDs to NCBI Gene IDs
         mapping = fetcher.get("conv", target_db="ncbi-geneid", dbentries=["hsa:7157"])
+
+        # From async code, await many queries on one event loop
+        pathways = await fetcher.aget("list", database="pathway", organism="hsa")
         ```
     """
 
     # Default batch size for operations that use dbentries
     DEFAULT_BATCH_SIZE = 10  # KEGG API limit
 
+    # Host identifier for rate limiting
+    HOST = "rest.kegg.jp"
+
+    # Rate limit (requests per second) - conservative for KEGG
+    RATE_LIMIT = 3
+
     def __init__(self, **data_manager_kws: Any):
         """Initialize KEGG fetcher.
 
@@ -154,6 +213,7 @@ class KEGG_Fetcher(BaseDataFetcher):
             if data_manager_kws
             else None
         )
+        get_rate_limiter().setdefault_rate(self.HOST, self.RATE_LIMIT)
 
     def get(self, operation: str, **kwargs: Any) -> KEGGFetchedData:
         """Fetch data from KEGG REST API.
@@ -165,14 +225,21 @@ class KEGG_Fetcher(BaseDataFetcher):
         Returns:
             KEGGFetchedData with parsed results.
         """
-        is_valid, err_msg = self._namespace.validate(operation=operation, **kwargs)
-        if not is_valid:
-            raise ValueError(err_msg)
-        self._api_config.update_params(**self._namespace.valid_params)
-        url = self._api_config.api_url
+        params = self._namespace.parse(operation=operation, **kwargs)
+        url = self._api_config.build_url(params)
         get_option = kwargs.get("get_option")
 
         response = get_rsp(url, safe_check=False)
+        return self._parse_response(response, url, operation, get_option)
+
+    @staticmethod
+    def _parse_response(
+        response: Any,
+        url: str,
+        operation: str,
+        get_option: Optional[str] = None,
+    ) -> KEGGFetchedData:
+        """Wrap a KEGG response according to the requested output option."""
         if response.status_code != 200:
             raise_for_status(response, "KEGG", url=url)
 
@@ -187,6 +254,25 @@ class KEGG_Fetcher(BaseDataFetcher):
 
         return KEGGFetchedData(content, operation=operation, get_option=get_option)
 
+    async def aget(self, operation: str, **kwargs: Any) -> KEGGFetchedData:
+        """Coroutine version of `get`.
+
+        Uses the event loop's shared aiohttp session and the per-host rate
+        limiter, so many queries can be awaited concurrently.
+
+        Args:
+            operation: KEGG operation (info, list, find, get, conv, link, ddi).
+            **kwargs: Operation-specific parameters (database, query, dbentries, etc.).
+
+        Returns:
+            KEGGFetchedData with parsed results.
+        """
+        params = self._namespace.parse(operation=operation, **kwargs)
+        url = self._api_config.build_url(params)
+
+        response = await async_request_with_retry(url)
+        return self._parse_response(response, url, operation, kwargs.get("get_option"))
+
     def _fetch_batch(
         self,
         operation: str,
@@ -194,10 +280,7 @@ class KEGG_Fetcher(BaseDataFetcher):
         get_option: Optional[str] = None,
         **kwargs,
     ) -> KEGGFetchedData:
-        """Thread-safe fetch for a batch of entries.
-
-        Builds URL directly without mutating shared state.
-        """
+        """Thread-safe fetch for a batch of entries."""
         # Build params for this batch
         params = {
             "operation": operation,
@@ -207,26 +290,10 @@ class KEGG_Fetcher(BaseDataFetcher):
         if get_option:
             params["get_option"] = get_option
 
-        # Validate
-        is_valid, err_msg = self._namespace.validate(**params)
-        if not is_valid:
-            raise ValueError(err_msg)
-
-        # Build URL using the url_builder directly
-        url = _build_kegg_url(self._namespace.valid_params)
+        url = self._api_config.build_url(self._namespace.parse(**params))
 
         response = get_rsp(url, safe_check=False)
-        if response.status_code != 200:
-            raise_for_status(response, "KEGG", url=url)
-
-        if get_option == "image":
-            content = response.content
-        elif get_option == "json":
-            content = response.json()
-        else:
-            content = response.text
-
-        return KEGGFetchedData(content, operation=operation, get_option=get_option)
+        return self._parse_response(response, url, operation, get_option)
 
     def get_all(
         self,
@@ -236,6 +303,8 @@ class KEGG_Fetcher(BaseDataFetcher):
         batch_size: int = DEFAULT_BATCH_SIZE,
         rate_limit_per_second: int = 3,
         get_option: Optional[str] = None,
+        max_in_flight: Optional[int] = None,
+        ordered: bool = True,
         **kwargs: Any,
     ) -> Union[KEGGFetchedData, Path]:
         """Fetch data for many entries by batching and concurrent requests.
@@ -248,14 +317,18 @@ class KEGG_Fetcher(BaseDataFetcher):
             operation: KEGG operation (``get``, ``conv``, ``link``, ``ddi``).
             dbentries: List of database entry IDs to fetch.
             method: ``"concat"`` returns a single :class:`KEGGFetchedData`.
-                ``"stream_to_storage"`` writes batches to storage and returns
-                the output file :class:`Path` (requires ``storage_path`` in
-                constructor).
+                ``"stream_to_storage"`` writes each batch to storage as it
+                arrives and returns the output file :class:`Path` (requires
+                ``storage_path`` in constructor).
             batch_size: Entries per request (default 10, KEGG's limit).
             rate_limit_per_second: Max requests per second (default 3 to be
                 conservative with KEGG).
             get_option: For ``get`` operation, the output format (aaseq,
                 ntseq, image, json, etc.).
+            max_in_flight: Max batches requested or buffered at once; defaults
+                to ``rate_limit_per_second``.
+            ordered: Keep batches in input order. ``False`` consumes batches
+                in completion order.
             **kwargs: Additional parameters (target_db for conv/link, etc.).
 
         Returns:
@@ -268,99 +341,198 @@ class KEGG_Fetcher(BaseDataFetcher):
             data = fetcher.get_all("get", genes)
             print(len(data.records))
         """
-        if operation not in ("get", "conv", "link", "ddi"):
-            raise ValueError(
-                f"get_all only supports operations with dbentries: get, conv, link, ddi. "
-                f"Got: {operation}"
-            )
+        self._check_batch_operation(operation, "get_all")
         if method == "stream_to_storage" and self._data_manager is None:
             raise ValueError(
                 "stream_to_storage requires storage_path in KEGG_Fetcher constructor"
             )
-        if not dbentries:
-            return KEGGFetchedData("", operation=operation, get_option=get_option)
+        batches = self.iter_all(
+            operation, dbentries,
+            batch_size=batch_size,
+            rate_limit_per_second=rate_limit_per_second,
+            get_option=get_option,
+            max_in_flight=max_in_flight,
+            ordered=ordered,
+            **kwargs,
+        )
+        return self.drain_pages(batches, self._page_sink(method, operation, get_option))
 
-        # Split entries into batches
-        batches = [
-            dbentries[i : i + batch_size]
-            for i in range(0, len(dbentries), batch_size)
-        ]
+    def iter_all(
+        self,
+        operation: str,
+        dbentries: List[str],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        rate_limit_per_second: int = 3,
+        get_option: Optional[str] = None,
+        max_in_flight: Optional[int] = None,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[KEGGFetchedData]:
+        """Yield per-batch results as they are fetched.
+
+        Args:
+            operation: KEGG operation (``get``, ``conv``, ``link``, ``ddi``).
+            dbentries: List of database entry IDs to fetch.
+            batch_size: Entries per request (default 10, KEGG's limit).
+            rate_limit_per_second: Max requests per second.
+            get_option: For ``get`` operation, the output format.
+            max_in_flight: Max batches requested or buffered at once; defaults
+                to ``rate_limit_per_second``.
+            ordered: Yield batches in input order; ``False`` yields them in
+                completion order.
+            **kwargs: Additional parameters (target_db for conv/link, etc.).
 
+        Returns:
+            Iterator of KEGGFetchedData batches. The first batch establishes
+            the result format, so its failure is raised; other failed batches
+            are logged and skipped.
+        """
+        self._check_batch_operation(operation, "iter_all")
+        batches = self._split_batches(dbentries, batch_size)
         logger.info(
             "Fetching %d entries in %d batches (rate=%d/s)",
             len(dbentries),
             len(batches),
             rate_limit_per_second,
         )
-
-        # Fetch first batch to establish format
-        first_batch = self._fetch_batch(
-            operation, batches[0], get_option=get_option, **kwargs
+        results = self.iter_process(
+            self._fetch_batch,
+            args_list=[(operation, batch) for batch in batches],
+            kwargs_list=[{**kwargs, "get_option": get_option}] * len(batches),
+            rate_limit_per_second=rate_limit_per_second,
+            max_in_flight=max_in_flight,
+            ordered=ordered,
+            return_exceptions=True,
+            host=self.HOST,
         )
+        return self._skip_failed_batches(results)
 
-        if len(batches) == 1:
-            return self._finalise_kegg(
-                method, [first_batch], operation, get_option
-            )
-
-        # Concurrent fetch remaining batches
-        def _fetch(batch_entries):
-            return self._fetch_batch(
-                operation, batch_entries, get_option=get_option, **kwargs
+    @staticmethod
+    def _check_batch_operation(operation: str, caller: str):
+        if operation not in ("get", "conv", "link", "ddi"):
+            raise ValueError(
+                f"{caller} only supports operations with dbentries: get, conv, link, ddi. "
+                f"Got: {operation}"
             )
 
-        remaining_results: list = self.schedule_process(
-            get_func=_fetch,
-            args_list=[(batch,) for batch in batches[1:]],
-            rate_limit_per_second=rate_limit_per_second,
-            return_exceptions=True,
-        )
+    @staticmethod
+    def _split_batches(dbentries: List[str], batch_size: int) -> List[List[str]]:
+        return [
+            dbentries[i : i + batch_size]
+            for i in range(0, len(dbentries), batch_size)
+        ]
 
-        # Collect results
-        all_batches: List[KEGGFetchedData] = [first_batch]
-        for i, result in enumerate(remaining_results):
+    @staticmethod
+    def _skip_failed_batches(results: Iterator[tuple]) -> Iterator[KEGGFetchedData]:
+        for i, result in results:
             if isinstance(result, Exception):
-                logger.warning(
-                    "Batch %d failed: %s", i + 1, result
-                )
-                continue
-            all_batches.append(result)
+                # The first batch establishes the result format, so it must succeed
+                if i == 0:
+                    raise result
+                logger.warning("Batch %d failed: %s", i, result)
+            else:
+                yield result
+
+    async def aget_all(
+        self,
+        operation: str,
+        dbentries: List[str],
+        method: Literal["concat", "stream_to_storage"] = "concat",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = 3,
+        get_option: Optional[str] = None,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Union[KEGGFetchedData, Path]:
+        """Coroutine version of `get_all`.
+
+        Batches are requested concurrently on the running event loop and
+        paced by the shared per-host rate limiter.
+
+        Args:
+            operation: KEGG operation (``get``, ``conv``, ``link``, ``ddi``).
+            dbentries: List of database entry IDs to fetch.
+            method: ``"concat"`` or ``"stream_to_storage"``, as for `get_all`.
+            batch_size: Entries per request (default 10, KEGG's limit).
+            max_concurrency: Maximum number of batch requests in flight.
+            get_option: For ``get`` operation, the output format.
+            ordered: Keep batches in input order, as for `get_all`.
+            **kwargs: Additional parameters (target_db for conv/link, etc.).
 
-        return self._finalise_kegg(method, all_batches, operation, get_option)
+        Returns:
+            Combined KEGGFetchedData or Path to output file.
+        """
+        self._check_batch_operation(operation, "aget_all")
+        if method == "stream_to_storage" and self._data_manager is None:
+            raise ValueError(
+                "stream_to_storage requires storage_path in KEGG_Fetcher constructor"
+            )
+        batches = self.aiter_all(
+            operation, dbentries,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+            get_option=get_option,
+            ordered=ordered,
+            **kwargs,
+        )
+        return await self.adrain_pages(batches, self._page_sink(method, operation, get_option))
 
-    def _finalise_kegg(
+    def aiter_all(
         self,
-        method: str,
-        batches: List[KEGGFetchedData],
         operation: str,
-        get_option: Optional[str],
-    ) -> Union[KEGGFetchedData, Path]:
-        """Combine fetched batches into the requested output format."""
-        if method == "concat":
-            result = batches[0]
-            for batch in batches[1:]:
-                result += batch
-            return result
+        dbentries: List[str],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = 3,
+        get_option: Optional[str] = None,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> AsyncIterator[KEGGFetchedData]:
+        """Async iterator version of `iter_all`.
+
+        Args:
+            operation: KEGG operation (``get``, ``conv``, ``link``, ``ddi``).
+            dbentries: List of database entry IDs to fetch.
+            batch_size: Entries per request (default 10, KEGG's limit).
+            max_concurrency: Max batches requested or buffered at once.
+            get_option: For ``get`` operation, the output format.
+            ordered: Yield batches in input order; ``False`` yields them in
+                completion order.
+            **kwargs: Additional parameters (target_db for conv/link, etc.).
+        """
+        self._check_batch_operation(operation, "aiter_all")
+        if get_option:
+            kwargs["get_option"] = get_option
+        batches = self._split_batches(dbentries, batch_size)
+        results = self.aiter_process(
+            self.aget,
+            args_list=[(operation,)] * len(batches),
+            kwargs_list=[{**kwargs, "dbentries": batch} for batch in batches],
+            max_in_flight=max_concurrency,
+            ordered=ordered,
+            return_exceptions=True,
+        )
+        return self._askip_failed_batches(results)
 
-        # stream_to_storage
+    @staticmethod
+    async def _askip_failed_batches(results: AsyncIterator[tuple]) -> AsyncIterator[KEGGFetchedData]:
+        async for i, result in results:
+            if isinstance(result, Exception):
+                if i == 0:
+                    raise result
+                logger.warning("Batch %d failed: %s", i, result)
+            else:
+                yield result
+
+    def _page_sink(
+        self, method: str, operation: str, get_option: Optional[str]
+    ) -> PageSink:
+        """Return the consumer that turns fetched batches into the requested output."""
+        if method == "concat":
+            return ConcatSink(
+                lambda: KEGGFetchedData("", operation=operation, get_option=get_option)
+            )
         filename = f"kegg_{operation}"
         if get_option:
             filename += f"_{get_option}"
+        return _KEGGStorageSink(self._data_manager, filename)
 
-        for batch in batches:
-            if batch.records:
-                self._data_manager.stream_json_lines(
-                    iter(batch.records), filename, key=filename
-                )
-            elif batch.text:
-                # Append text data
-                filepath = self._data_manager.storage_path / f"{filename}.txt"
-                with open(filepath, "a", encoding="utf-8") as f:
-                    f.write(batch.text)
-                    f.write("\n///\n")  # KEGG entry separator
-
-        self._data_manager.flush_metadata()
-
-        if batches[0].records:
-            return self._data_manager.storage_path / f"{filename}.jsonl"
-        return self._data_manager.storage_path / f"{filename}.txt"
@@ -5,6 +5,7 @@ import logging
 import os
 
 from biodbs.fetch._base import BaseAPIConfig, NameSpace, BaseDataFetcher
+from biodbs.fetch._chunking import get_chunk_planner
 from biodbs.fetch._rate_limit import request_with_retry, get_rate_limiter
 from biodbs.exceptions import raise_for_status
 from biodbs.data.NCBI._data_model import (
@@ -174,15 +175,21 @@ class NCBI_Fetcher(BaseDataFetcher):
         page_size: int = 100,
         query: Optional[str] = None,
         types: Optional[List[str]] = None,
+        max_workers: int = 4,
     ) -> NCBIGeneFetchedData:
         """Get gene data reports by NCBI Gene IDs.
 
+        The IDs are sent in the URL, so long lists are split into chunks
+        that fit the URL length limit and one page of results, fetched
+        concurrently and merged in input order.
+
         Args:
             gene_ids: List of NCBI Gene IDs (e.g., [7157, 672]).
             returned_content: Content type (COMPLETE, IDS_ONLY, COUNTS_ONLY).
-            page_size: Results per page (max 1000).
+            page_size: Results per page (max 1000); also caps IDs per request.
             query: Additional search query.
             types: Gene type filter (e.g., ["PROTEIN_CODING"]).
+            max_workers: Maximum number of chunk requests in flight.
 
         Returns:
             NCBIGeneFetchedData with gene reports.
@@ -196,10 +203,6 @@ class NCBI_Fetcher(BaseDataFetcher):
         if not gene_ids:
             return NCBIGeneFetchedData({}, query_ids=[])
 
-        # Build endpoint with gene IDs
-        ids_str = ",".join(str(gid) for gid in gene_ids)
-        endpoint = NCBIGeneEndpoint.GENE_BY_ID.value.format(gene_ids=ids_str)
-
         params = {"page_size": page_size}
         if returned_content:
             params["returned_content"] = returned_content
@@ -208,8 +211,23 @@ class NCBI_Fetcher(BaseDataFetcher):
         if types:
             params["types"] = types
 
-        data = self._make_request(endpoint, params=params)
-        return NCBIGeneFetchedData(data, query_ids=gene_ids)
+        def fetch_chunk(chunk: List[int]) -> NCBIGeneFetchedData:
+            ids_str = ",".join(str(gid) for gid in chunk)
+            endpoint = NCBIGeneEndpoint.GENE_BY_ID.value.format(gene_ids=ids_str)
+            return NCBIGeneFetchedData(self._make_request(endpoint, params=params))
+
+        parts = self.chunked_process(
+            fetch_chunk,
+            list(gene_ids),
+            get_chunk_planner("ncbi.gene_id"),
+            max_workers=max_workers,
+            max_items=page_size,
+        )
+        warnings = [w for part in parts for w in part.warnings]
+        genes = NCBIGeneFetchedData.concat(parts)
+        genes.query_ids = gene_ids
+        genes.warnings = warnings
+        return genes
 
     def get_genes_by_symbol(
         self,
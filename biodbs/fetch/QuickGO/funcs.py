@@ -1,6 +1,6 @@
 """Convenience functions for QuickGO data fetching."""
 
-from typing import List, Optional, Union
+from typing import Iterator, List, Optional, Union
 from biodbs.data.QuickGO.data import QuickGOFetchedData
 from biodbs.fetch.QuickGO.quickgo_fetcher import QuickGO_Fetcher
 
@@ -222,6 +222,40 @@ def quickgo_download_annotations(
     )
 
 
+def quickgo_iter_annotations(
+    go_id: Optional[str] = None,
+    taxon_id: Optional[int] = None,
+    download_format: str = "gaf",
+    block_size: int = 1 << 22,
+    **kwargs,
+) -> Iterator[QuickGOFetchedData]:
+    """Stream downloaded GO annotations in bounded chunks.
+
+    Unlike `quickgo_download_annotations`, the response is parsed as it
+    arrives and never held in memory as a whole.
+
+    Args:
+        go_id (Optional[str]): GO term ID to filter by.
+        taxon_id (Optional[int]): NCBI taxonomy ID.
+        download_format (str): Output format ("gaf", "gpad", or "tsv").
+        block_size (int): Approximate bytes of text per chunk.
+        **kwargs: Additional filter parameters (goEvidence, aspect, downloadLimit, etc.).
+
+    Returns:
+        Iterator of QuickGOFetchedData chunks with columnar results.
+
+    Example:
+        >>> chunks = quickgo_iter_annotations(taxon_id=9606, goEvidence=["IDA"])
+        >>> print(sum(len(chunk) for chunk in chunks))
+    """
+    params = dict(kwargs)
+    if go_id:
+        params["goId"] = go_id
+    if taxon_id:
+        params["taxonId"] = taxon_id
+    return _get_fetcher().iter_download(download_format, block_size=block_size, **params)
+
+
 def quickgo_get_gene_product(gene_product_id: str) -> QuickGOFetchedData:
     """Get gene product information by ID.
 
@@ -1,11 +1,20 @@
-from biodbs.fetch._base import BaseAPIConfig, NameSpace, BaseDataFetcher
+from biodbs.fetch._base import (
+    BaseAPIConfig,
+    BaseDataFetcher,
+    ConcatSink,
+    JsonLinesSink,
+    NameSpace,
+    PageSink,
+    RequestPlan,
+)
+from biodbs.fetch._rate_limit import async_request_with_retry, get_rate_limiter
+from biodbs.fetch._session import session_pool
 from biodbs.exceptions import raise_for_status
 from biodbs.data.QuickGO._data_model import QuickGOModel, QuickGOCategory
 from biodbs.data.QuickGO.data import QuickGOFetchedData, QuickGODataManager
-from typing import Dict, Any, List, Literal, Optional, Union
+from typing import Dict, Any, AsyncIterator, Iterator, List, Literal, Optional, Tuple, Union
 from pathlib import Path
 import logging
-import requests
 
 logger = logging.getLogger(__name__)
 
@@ -35,15 +44,12 @@ class QuickGONameSpace(NameSpace):
     def __init__(self):
         super().__init__(QuickGOModel)
 
-    def validate(self, **kwargs):
-        """Validate and also compute derived fields (path, query params)."""
-        is_valid, err_msg = super().validate(**kwargs)
-        if is_valid:
-            # Build path and query params from the validated model
-            model = QuickGOModel(**kwargs)
-            self._valid_params["_path"] = model.build_path()
-            self._valid_params["_query_params"] = model.build_query_params()
-        return is_valid, err_msg
+    def request_params(self, model: QuickGOModel) -> Dict[str, Any]:
+        """Add derived fields (path, query params) from the validated model."""
+        params = super().request_params(model)
+        params["_path"] = model.build_path()
+        params["_query_params"] = model.build_query_params()
+        return params
 
 
 class QuickGO_APIConfig(BaseAPIConfig):
@@ -100,11 +106,20 @@ class QuickGO_Fetcher(BaseDataFetcher):
             taxonId=9606
         )
         df = data.as_dataframe()
+
+        # From async code, await many queries on one event loop
+        data = await fetcher.aget(category="ontology", endpoint="search", query="autophagy")
         ```
     """
 
     DEFAULT_LIMIT = 100
 
+    # Host identifier for rate limiting
+    HOST = "www.ebi.ac.uk"
+
+    # Rate limit (requests per second)
+    RATE_LIMIT = 5
+
     def __init__(self, **data_manager_kws: Any):
         """Initialize QuickGO fetcher.
 
@@ -118,6 +133,44 @@ class QuickGO_Fetcher(BaseDataFetcher):
             if data_manager_kws
             else None
         )
+        get_rate_limiter().setdefault_rate(self.HOST, self.RATE_LIMIT)
+
+    def _build_request(
+        self, category: str, endpoint: str, **kwargs: Any
+    ) -> RequestPlan:
+        """Validate parameters and return the request to send."""
+        params = self._namespace.parse(category=category, endpoint=endpoint, **kwargs)
+        download_format = kwargs.get("downloadFormat")
+
+        # Set Accept header for download requests
+        headers = {}
+        if endpoint == "downloadSearch" and download_format:
+            accept_map = {
+                "tsv": "text/tsv",
+                "gaf": "text/gaf",
+                "gpad": "text/gpad",
+            }
+            headers["Accept"] = accept_map.get(download_format, "text/tsv")
+        return RequestPlan(
+            self._api_config.build_url(params),
+            params.get("_query_params", {}),
+            headers,
+        )
+
+    @staticmethod
+    def _parse_response(
+        response: Any, endpoint: str, download_format: Optional[str] = None
+    ) -> QuickGOFetchedData:
+        """Wrap a successful response according to its content type."""
+        content_type = response.headers.get("Content-Type", "")
+        if "application/json" in content_type:
+            content = response.json()
+        else:
+            content = response.text
+
+        return QuickGOFetchedData(
+            content, endpoint=endpoint, download_format=download_format
+        )
 
     def get(
         self,
@@ -135,41 +188,56 @@ class QuickGO_Fetcher(BaseDataFetcher):
         Returns:
             QuickGOFetchedData with parsed results.
         """
-        is_valid, err_msg = self._namespace.validate(
-            category=category, endpoint=endpoint, **kwargs
-        )
-        if not is_valid:
-            raise ValueError(err_msg)
+        plan = self._build_request(category, endpoint, **kwargs)
 
-        self._api_config.update_params(**self._namespace.valid_params)
-        url = self._api_config.api_url
-        query_params = self._namespace.valid_params.get("_query_params", {})
-        download_format = kwargs.get("downloadFormat")
+        response = session_pool.get(plan.url, params=plan.params, headers=plan.headers)
+        if response.status_code != 200:
+            raise_for_status(response, "QuickGO", url=plan.url)
 
-        # Set Accept header for download requests
-        headers = {}
-        if endpoint == "downloadSearch" and download_format:
-            accept_map = {
-                "tsv": "text/tsv",
-                "gaf": "text/gaf",
-                "gpad": "text/gpad",
-            }
-            headers["Accept"] = accept_map.get(download_format, "text/tsv")
+        return self._parse_response(response, endpoint, kwargs.get("downloadFormat"))
 
-        response = requests.get(url, params=query_params, headers=headers)
-        if response.status_code != 200:
-            raise_for_status(response, "QuickGO", url=url)
+    def iter_download(
+        self,
+        download_format: Literal["gaf", "gpad", "tsv"] = "gaf",
+        block_size: int = 1 << 22,
+        **kwargs: Any,
+    ) -> Iterator[QuickGOFetchedData]:
+        """Stream an annotation ``downloadSearch`` in bounded chunks.
 
-        # Handle different response types
-        content_type = response.headers.get("Content-Type", "")
-        if "application/json" in content_type:
-            content = response.json()
-        else:
-            content = response.text
+        The response body is read incrementally and parsed a block of lines
+        at a time, so whole-proteome downloads never sit in memory at once.
 
-        return QuickGOFetchedData(
-            content, endpoint=endpoint, download_format=download_format
+        Args:
+            download_format: ``"gaf"``, ``"gpad"`` or ``"tsv"``.
+            block_size: Approximate bytes of text per yielded chunk.
+            **kwargs: Annotation filters (taxonId, goEvidence, aspect,
+                downloadLimit, etc.).
+
+        Yields:
+            QuickGOFetchedData chunks with columnar results.
+
+        Example:
+            ```python
+            for chunk in fetcher.iter_download("gaf", taxonId=9606, goEvidence=["IDA"]):
+                print(len(chunk))
+            ```
+        """
+        plan = self._build_request(
+            "annotation", "downloadSearch", downloadFormat=download_format, **kwargs
+        )
+        response = session_pool.get(
+            plan.url, params=plan.params, headers=plan.headers, stream=True
         )
+        try:
+            if response.status_code != 200:
+                raise_for_status(response, "QuickGO", url=plan.url)
+            yield from QuickGOFetchedData.iter_chunks(
+                response.iter_content(chunk_size=1 << 16),
+                download_format,
+                block_size=block_size,
+            )
+        finally:
+            response.close()
 
     def _fetch_page(
         self,
@@ -179,18 +247,50 @@ class QuickGO_Fetcher(BaseDataFetcher):
         download_format: Optional[str] = None,
     ) -> QuickGOFetchedData:
         """Thread-safe fetch for a single page."""
-        response = requests.get(url, params=query_params)
+        response = session_pool.get(url, params=query_params)
         if response.status_code != 200:
             raise_for_status(response, "QuickGO", url=url)
+        return self._parse_response(response, endpoint, download_format)
 
-        content_type = response.headers.get("Content-Type", "")
-        if "application/json" in content_type:
-            content = response.json()
-        else:
-            content = response.text
+    async def _afetch_page(
+        self,
+        url: str,
+        query_params: Dict[str, Any],
+        endpoint: str,
+        download_format: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> QuickGOFetchedData:
+        """Coroutine version of `_fetch_page`, paced by the host rate limiter."""
+        response = await async_request_with_retry(
+            url, params=query_params, headers=headers or None
+        )
+        if response.status_code != 200:
+            raise_for_status(response, "QuickGO", url=url)
+        return self._parse_response(response, endpoint, download_format)
 
-        return QuickGOFetchedData(
-            content, endpoint=endpoint, download_format=download_format
+    async def aget(
+        self,
+        category: str,
+        endpoint: str,
+        **kwargs: Any,
+    ) -> QuickGOFetchedData:
+        """Coroutine version of `get`.
+
+        Uses the event loop's shared aiohttp session and the per-host rate
+        limiter, so many queries can be awaited concurrently.
+
+        Args:
+            category: QuickGO category (ontology, annotation, geneproduct).
+            endpoint: API endpoint (search, terms/{ids}, downloadSearch, etc.).
+            **kwargs: Endpoint-specific parameters.
+
+        Returns:
+            QuickGOFetchedData with parsed results.
+        """
+        plan = self._build_request(category, endpoint, **kwargs)
+        return await self._afetch_page(
+            plan.url, plan.params, endpoint, kwargs.get("downloadFormat"),
+            headers=plan.headers,
         )
 
     def get_all(
@@ -201,6 +301,8 @@ class QuickGO_Fetcher(BaseDataFetcher):
         limit_per_page: int = DEFAULT_LIMIT,
         max_records: Optional[int] = None,
         rate_limit_per_second: int = 5,
+        max_in_flight: Optional[int] = None,
+        ordered: bool = True,
         **kwargs: Any,
     ) -> Union[QuickGOFetchedData, Path]:
         """Fetch multiple pages of results concurrently.
@@ -210,49 +312,96 @@ class QuickGO_Fetcher(BaseDataFetcher):
             endpoint: API endpoint (search, etc.). Note: downloadSearch
                 doesn't support pagination, use get() directly.
             method: ``"concat"`` returns a single QuickGOFetchedData.
-                ``"stream_to_storage"`` streams each batch to storage and
-                returns the output file Path.
+                ``"stream_to_storage"`` appends each page to storage as it
+                arrives and returns the output file Path.
             limit_per_page: Records per request (default 100, max 10000).
             max_records: Total records to fetch. None means fetch all.
             rate_limit_per_second: Max concurrent requests per second.
+            max_in_flight: Max pages requested or buffered at once; defaults
+                to ``rate_limit_per_second``.
+            ordered: Keep pages in page order. ``False`` consumes pages in
+                completion order.
             **kwargs: Forwarded to the API (goId, taxonId, etc.).
 
         Returns:
             Combined QuickGOFetchedData or Path to output file.
         """
-        if endpoint == "downloadSearch":
-            raise ValueError(
-                "downloadSearch doesn't support pagination. Use get() instead."
-            )
-
         if method == "stream_to_storage" and self._data_manager is None:
             raise ValueError(
                 "stream_to_storage requires storage_path in QuickGO_Fetcher constructor"
             )
+        pages = self.iter_all(
+            category, endpoint,
+            limit_per_page=limit_per_page,
+            max_records=max_records,
+            rate_limit_per_second=rate_limit_per_second,
+            max_in_flight=max_in_flight,
+            ordered=ordered,
+            **kwargs,
+        )
+        return self.drain_pages(
+            pages, self._page_sink(method, category, endpoint, max_records, kwargs)
+        )
 
-        # Validate and build URL
-        kwargs["limit"] = limit_per_page
-        kwargs["page"] = 1
+    def iter_all(
+        self,
+        category: str,
+        endpoint: str,
+        limit_per_page: int = DEFAULT_LIMIT,
+        max_records: Optional[int] = None,
+        rate_limit_per_second: int = 5,
+        max_in_flight: Optional[int] = None,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[QuickGOFetchedData]:
+        """Yield pages of results as they are fetched.
 
-        is_valid, err_msg = self._namespace.validate(
-            category=category, endpoint=endpoint, **kwargs
-        )
-        if not is_valid:
-            raise ValueError(err_msg)
+        The first page is fetched to discover the total; the remaining pages
+        are requested concurrently with bounded look-ahead.
 
-        self._api_config.update_params(**self._namespace.valid_params)
-        base_url = self._api_config.api_url
-        base_query_params = self._namespace.valid_params.get("_query_params", {})
-        download_format = kwargs.get("downloadFormat")
+        Args:
+            category: QuickGO category (ontology, annotation, geneproduct).
+            endpoint: API endpoint (search, etc.).
+            limit_per_page: Records per request (default 100, max 10000).
+            max_records: Total records to fetch. None means fetch all.
+            rate_limit_per_second: Max requests per second.
+            max_in_flight: Max pages requested or buffered at once; defaults
+                to ``rate_limit_per_second``.
+            ordered: Yield pages in page order; ``False`` yields them in
+                completion order.
+            **kwargs: Forwarded to the API (goId, taxonId, etc.).
 
-        # First request to discover total
-        first_params = {**base_query_params, "limit": limit_per_page, "page": 1}
-        first_page = self._fetch_page(base_url, first_params, endpoint, download_format)
+        Returns:
+            Iterator of non-empty QuickGOFetchedData pages. Failed pages are
+            logged and skipped.
+        """
+        self._check_paginated(endpoint)
+        request = self._build_paged_request(category, endpoint, limit_per_page, kwargs)
+        return self._iter_pages(
+            *request, limit_per_page, max_records,
+            rate_limit_per_second, max_in_flight, ordered,
+        )
 
-        if not first_page.results:
-            return QuickGOFetchedData({}, endpoint=endpoint, download_format=download_format)
+    @staticmethod
+    def _check_paginated(endpoint: str):
+        if endpoint == "downloadSearch":
+            raise ValueError(
+                "downloadSearch doesn't support pagination. Use get() instead."
+            )
 
-        # Get total from metadata
+    def _build_paged_request(
+        self, category: str, endpoint: str, limit_per_page: int, kwargs: dict
+    ) -> Tuple[str, dict, str, Optional[str]]:
+        kwargs["limit"] = limit_per_page
+        kwargs["page"] = 1
+        plan = self._build_request(category, endpoint, **kwargs)
+        return plan.url, plan.params, endpoint, kwargs.get("downloadFormat")
+
+    @staticmethod
+    def _plan_pages(
+        first_page: QuickGOFetchedData, limit_per_page: int, max_records: Optional[int]
+    ) -> List[int]:
+        """Return the (1-based) page numbers still needed after ``first_page``."""
         total_available = first_page.get_total_hits()
         target = (
             min(max_records, total_available)
@@ -260,71 +409,178 @@ class QuickGO_Fetcher(BaseDataFetcher):
             else total_available
         )
         first_count = len(first_page.results)
-
-        # Compute remaining pages
         if first_count >= target:
-            return self._finalise_quickgo(method, [first_page], category, endpoint)
-
-        # QuickGO uses 1-based page numbers
+            return []
         remaining_pages_needed = (target - first_count + limit_per_page - 1) // limit_per_page
-        page_numbers = list(range(2, 2 + remaining_pages_needed))
+        return list(range(2, 2 + remaining_pages_needed))
+
+    def _iter_pages(
+        self,
+        base_url: str,
+        base_query_params: dict,
+        endpoint: str,
+        download_format: Optional[str],
+        limit_per_page: int,
+        max_records: Optional[int],
+        rate_limit_per_second: int,
+        max_in_flight: Optional[int],
+        ordered: bool,
+    ) -> Iterator[QuickGOFetchedData]:
+        first_params = {**base_query_params, "limit": limit_per_page, "page": 1}
+        first_page = self._fetch_page(base_url, first_params, endpoint, download_format)
+        if not first_page.results:
+            return
+        page_numbers = self._plan_pages(first_page, limit_per_page, max_records)
+        yield first_page
+        if not page_numbers:
+            return
 
         logger.info(
             "Fetching %d more pages concurrently (rate=%d/s)",
             len(page_numbers),
             rate_limit_per_second,
         )
-
-        def _fetch(page_num):
-            params = {**base_query_params, "limit": limit_per_page, "page": page_num}
-            return self._fetch_page(base_url, params, endpoint, download_format)
-
-        remaining_results: list = self.schedule_process(
-            get_func=_fetch,
-            args_list=[(p,) for p in page_numbers],
+        for i, page in self.iter_process(
+            self._fetch_page,
+            args_list=[
+                (base_url, {**base_query_params, "limit": limit_per_page, "page": p},
+                 endpoint, download_format)
+                for p in page_numbers
+            ],
             rate_limit_per_second=rate_limit_per_second,
+            max_in_flight=max_in_flight,
+            ordered=ordered,
             return_exceptions=True,
-        )
+            host=self.HOST,
+        ):
+            if isinstance(page, Exception):
+                logger.warning("Page %d failed: %s", page_numbers[i], page)
+            elif page.results:
+                yield page
+
+    async def aget_all(
+        self,
+        category: str,
+        endpoint: str,
+        method: Literal["concat", "stream_to_storage"] = "concat",
+        limit_per_page: int = DEFAULT_LIMIT,
+        max_records: Optional[int] = None,
+        max_concurrency: int = 8,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Union[QuickGOFetchedData, Path]:
+        """Coroutine version of `get_all`.
+
+        Pages are requested concurrently on the running event loop and
+        paced by the shared per-host rate limiter.
 
-        # Collect results
-        all_pages: List[QuickGOFetchedData] = [first_page]
-        for i, result in enumerate(remaining_results):
-            if isinstance(result, Exception):
-                logger.warning("Page %d failed: %s", page_numbers[i], result)
-                continue
-            if result.results:
-                all_pages.append(result)
+        Args:
+            category: QuickGO category (ontology, annotation, geneproduct).
+            endpoint: API endpoint (search, etc.).
+            method: ``"concat"`` or ``"stream_to_storage"``, as for `get_all`.
+            limit_per_page: Records per request (default 100, max 10000).
+            max_records: Total records to fetch. None means fetch all.
+            max_concurrency: Maximum number of page requests in flight.
+            ordered: Keep pages in page order, as for `get_all`.
+            **kwargs: Forwarded to the API (goId, taxonId, etc.).
 
-        return self._finalise_quickgo(method, all_pages, category, endpoint, target)
+        Returns:
+            Combined QuickGOFetchedData or Path to output file.
+        """
+        if method == "stream_to_storage" and self._data_manager is None:
+            raise ValueError(
+                "stream_to_storage requires storage_path in QuickGO_Fetcher constructor"
+            )
+        pages = self.aiter_all(
+            category, endpoint,
+            limit_per_page=limit_per_page,
+            max_records=max_records,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+            **kwargs,
+        )
+        return await self.adrain_pages(
+            pages, self._page_sink(method, category, endpoint, max_records, kwargs)
+        )
 
-    def _finalise_quickgo(
+    def aiter_all(
         self,
-        method: str,
-        pages: List[QuickGOFetchedData],
         category: str,
         endpoint: str,
+        limit_per_page: int = DEFAULT_LIMIT,
         max_records: Optional[int] = None,
-    ) -> Union[QuickGOFetchedData, Path]:
-        """Combine fetched pages into the requested output format."""
-        filename = f"quickgo_{category}_{endpoint.replace('/', '_')}"
+        max_concurrency: int = 8,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> AsyncIterator[QuickGOFetchedData]:
+        """Async iterator version of `iter_all`.
+
+        Args:
+            category: QuickGO category (ontology, annotation, geneproduct).
+            endpoint: API endpoint (search, etc.).
+            limit_per_page: Records per request (default 100, max 10000).
+            max_records: Total records to fetch. None means fetch all.
+            max_concurrency: Max pages requested or buffered at once.
+            ordered: Yield pages in page order; ``False`` yields them in
+                completion order.
+            **kwargs: Forwarded to the API (goId, taxonId, etc.).
+        """
+        self._check_paginated(endpoint)
+        request = self._build_paged_request(category, endpoint, limit_per_page, kwargs)
+        return self._aiter_pages(*request, limit_per_page, max_records, max_concurrency, ordered)
+
+    async def _aiter_pages(
+        self,
+        base_url: str,
+        base_query_params: dict,
+        endpoint: str,
+        download_format: Optional[str],
+        limit_per_page: int,
+        max_records: Optional[int],
+        max_concurrency: int,
+        ordered: bool,
+    ) -> AsyncIterator[QuickGOFetchedData]:
+        first_params = {**base_query_params, "limit": limit_per_page, "page": 1}
+        first_page = await self._afetch_page(base_url, first_params, endpoint, download_format)
+        if not first_page.results:
+            return
+        page_numbers = self._plan_pages(first_page, limit_per_page, max_records)
+        yield first_page
+
+        async for i, page in self.aiter_process(
+            self._afetch_page,
+            args_list=[
+                (base_url, {**base_query_params, "limit": limit_per_page, "page": p},
+                 endpoint, download_format)
+                for p in page_numbers
+            ],
+            max_in_flight=max_concurrency,
+            ordered=ordered,
+            return_exceptions=True,
+        ):
+            if isinstance(page, Exception):
+                logger.warning("Page %d failed: %s", page_numbers[i], page)
+            elif page.results:
+                yield page
 
+    def _page_sink(
+        self,
+        method: str,
+        category: str,
+        endpoint: str,
+        max_records: Optional[int],
+        kwargs: dict,
+    ) -> PageSink:
+        """Return the consumer that turns fetched pages into the requested output."""
         if method == "concat":
-            result = pages[0]
-            for page in pages[1:]:
-                result += page
-            if max_records is not None:
-                result.results = result.results[:max_records]
-            return result
-
-        # stream_to_storage
-        for page in pages:
-            if page.results:
-                self._data_manager.stream_json_lines(
-                    iter(page.results), filename, key=filename
-                )
-
-        self._data_manager.flush_metadata()
-        return self._data_manager.storage_path / f"{filename}.jsonl"
+            return ConcatSink(
+                lambda: QuickGOFetchedData(
+                    {}, endpoint=endpoint, download_format=kwargs.get("downloadFormat")
+                ),
+                max_records,
+            )
+        filename = f"quickgo_{category}_{endpoint.replace('/', '_')}"
+        return JsonLinesSink(self._data_manager, filename, max_records)
 
 
 if __name__ == "__main__":
@@ -482,6 +482,8 @@ def reactome_get_all_pathways_with_genes(
     species: str = "Homo sapiens",
     id_type: str = "gene_symbol",
     include_hierarchy: bool = True,
+    max_in_flight: Optional[int] = None,
+    use_bulk: bool = True,
 ) -> Dict[str, tuple]:
     """Get all pathways with their gene members for a species.
 
@@ -492,6 +494,9 @@ def reactome_get_all_pathways_with_genes(
         species: Species name (e.g., "Homo sapiens").
         id_type: Gene ID type ("gene_symbol" or "uniprot").
         include_hierarchy: Include all pathways in hierarchy.
+        max_in_flight: Maximum number of pathway requests in flight.
+        use_bulk: Use the single-request bulk download when available
+            (human gene symbols).
 
     Returns:
         Dict mapping pathway_id -> (pathway_name, set of gene IDs).
@@ -508,14 +513,16 @@ def reactome_get_all_pathways_with_genes(
         R-HSA-499943: A]TP hydrolysis by myosin VI... (8 genes)
 
     Note:
-        This makes many API calls and may take several minutes on first run.
-        Results are cached for subsequent calls.
+        Outside the bulk download this makes one API call per pathway and
+        may take several minutes on first run.
     """
     fetcher = _get_fetcher()
     return fetcher.get_all_pathways_with_genes(
         species=species,
         id_type=id_type,
         include_hierarchy=include_hierarchy,
+        max_in_flight=max_in_flight,
+        use_bulk=use_bulk,
     )
 
 
@@ -1,11 +1,22 @@
 """Reactome API fetcher following the standardized pattern."""
 
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Set, Tuple
+import io
 import logging
+import time
+import zipfile
+
 import requests
 
 from biodbs.fetch._base import BaseAPIConfig, NameSpace, BaseDataFetcher
-from biodbs.exceptions import raise_for_status
+from biodbs.fetch._rate_limit import get_rate_limiter
+from biodbs.fetch._session import session_pool
+from biodbs.exceptions import (
+    APIRateLimitError,
+    APIServerError,
+    APITimeoutError,
+    raise_for_status,
+)
 from biodbs.data.Reactome._data_model import (
     ReactomeBase,
     ReactomeAnalysisEndpoint,
@@ -18,8 +29,21 @@ from biodbs.data.Reactome.data import (
     ReactomeSpeciesData,
 )
 
+if TYPE_CHECKING:
+    from biodbs._funcs.analysis._cache import PathwayDBManager
+
 logger = logging.getLogger(__name__)
 
+# Errors worth retrying when fanning out per-pathway requests
+_TRANSIENT_ERRORS = (
+    APIServerError,
+    APIRateLimitError,
+    APITimeoutError,
+    ConnectionError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
 
 class Reactome_APIConfig(BaseAPIConfig):
     """API configuration for Reactome."""
@@ -74,6 +98,16 @@ class Reactome_Fetcher(BaseDataFetcher):
         ```
     """
 
+    # Host identifier for rate limiting
+    HOST = "reactome.org"
+
+    # Rate limit (requests per second) shared by all Reactome requests
+    RATE_LIMIT = 10
+
+    # Bulk gene-set file (gene symbols, human pathways only)
+    BULK_GMT_URL = "https://reactome.org/download/current/ReactomePathways.gmt.zip"
+    BULK_SPECIES = "Homo sapiens"
+
     def __init__(self, species: str = "Homo sapiens"):
         """Initialize Reactome fetcher.
 
@@ -83,6 +117,7 @@ class Reactome_Fetcher(BaseDataFetcher):
         self._species = species
         self._api_config = Reactome_APIConfig()
         super().__init__(self._api_config, NameSpace(AnalysisRequestModel), {})
+        get_rate_limiter().setdefault_rate(self.HOST, self.RATE_LIMIT)
 
     def set_species(self, species: str):
         """Change the default species.
@@ -158,7 +193,7 @@ class Reactome_Fetcher(BaseDataFetcher):
         headers = {"Content-Type": "text/plain"}
         params = model.get_params()
 
-        response = requests.post(
+        response = session_pool.post(
             url,
             data=model.get_identifiers_string(),
             params=params,
@@ -229,7 +264,7 @@ class Reactome_Fetcher(BaseDataFetcher):
         headers = {"Content-Type": "text/plain"}
         params = model.get_params()
 
-        response = requests.post(
+        response = session_pool.post(
             url,
             data=model.get_identifiers_string(),
             params=params,
@@ -274,7 +309,7 @@ class Reactome_Fetcher(BaseDataFetcher):
             "species": species,
         }
 
-        response = requests.get(url, params=params)
+        response = session_pool.get(url, params=params)
 
         if response.status_code != 200:
             raise_for_status(response, "Reactome", url=url)
@@ -328,7 +363,7 @@ class Reactome_Fetcher(BaseDataFetcher):
         if species:
             params["species"] = species
 
-        response = requests.get(url, params=params)
+        response = session_pool.get(url, params=params)
 
         if response.status_code != 200:
             raise_for_status(response, "Reactome", url=url)
@@ -359,7 +394,7 @@ class Reactome_Fetcher(BaseDataFetcher):
         )
         url = self._api_config.get_analysis_url(endpoint)
 
-        response = requests.get(url)
+        response = session_pool.get(url)
 
         if response.status_code != 200:
             raise_for_status(response, "Reactome", url=url)
@@ -378,7 +413,7 @@ class Reactome_Fetcher(BaseDataFetcher):
         endpoint = ReactomeAnalysisEndpoint.TOKEN_NOT_FOUND.value.format(token=token)
         url = self._api_config.get_analysis_url(endpoint)
 
-        response = requests.get(url)
+        response = session_pool.get(url)
 
         if response.status_code != 200:
             raise_for_status(response, "Reactome", url=url)
@@ -399,7 +434,7 @@ class Reactome_Fetcher(BaseDataFetcher):
         endpoint = ReactomeAnalysisEndpoint.DOWNLOAD_JSON.value.format(token=token)
         url = self._api_config.get_analysis_url(endpoint)
 
-        response = requests.get(url)
+        response = session_pool.get(url)
 
         if response.status_code != 200:
             raise_for_status(response, "Reactome", url=url)
@@ -427,7 +462,7 @@ class Reactome_Fetcher(BaseDataFetcher):
         headers = {"Content-Type": "text/plain"}
         params = {"interactors": str(interactors).lower()}
 
-        response = requests.post(
+        response = session_pool.post(
             url,
             data="\n".join(identifiers),
             params=params,
@@ -460,7 +495,7 @@ class Reactome_Fetcher(BaseDataFetcher):
         endpoint = ReactomeContentEndpoint.PATHWAYS_TOP.value.format(species=species)
         url = self._api_config.get_content_url(endpoint)
 
-        response = requests.get(url, headers={"Accept": "application/json"})
+        response = session_pool.get(url, headers={"Accept": "application/json"})
 
         if response.status_code != 200:
             raise_for_status(response, "Reactome", url=url)
@@ -484,7 +519,7 @@ class Reactome_Fetcher(BaseDataFetcher):
         endpoint = ReactomeContentEndpoint.EVENTS_HIERARCHY.value.format(species=species)
         url = self._api_config.get_content_url(endpoint)
 
-        response = requests.get(url, headers={"Accept": "application/json"})
+        response = session_pool.get(url, headers={"Accept": "application/json"})
 
         if response.status_code != 200:
             raise_for_status(response, "Reactome", url=url)
@@ -506,7 +541,7 @@ class Reactome_Fetcher(BaseDataFetcher):
         endpoint = ReactomeContentEndpoint.PATHWAYS_LOW_ENTITY.value.format(id=entity_id)
         url = self._api_config.get_content_url(endpoint)
 
-        response = requests.get(url, headers={"Accept": "application/json"})
+        response = session_pool.get(url, headers={"Accept": "application/json"})
 
         if response.status_code != 200:
             raise_for_status(response, "Reactome", url=url)
@@ -528,7 +563,7 @@ class Reactome_Fetcher(BaseDataFetcher):
             ReactomeContentEndpoint.SPECIES_ALL.value
         )
 
-        response = requests.get(url, headers={"Accept": "application/json"})
+        response = session_pool.get(url, headers={"Accept": "application/json"})
 
         if response.status_code != 200:
             raise_for_status(response, "Reactome", url=url)
@@ -545,7 +580,7 @@ class Reactome_Fetcher(BaseDataFetcher):
             ReactomeContentEndpoint.SPECIES_MAIN.value
         )
 
-        response = requests.get(url, headers={"Accept": "application/json"})
+        response = session_pool.get(url, headers={"Accept": "application/json"})
 
         if response.status_code != 200:
             raise_for_status(response, "Reactome", url=url)
@@ -562,7 +597,7 @@ class Reactome_Fetcher(BaseDataFetcher):
             ReactomeAnalysisEndpoint.DATABASE_VERSION.value
         )
 
-        response = requests.get(url)
+        response = session_pool.get(url)
 
         if response.status_code != 200:
             raise_for_status(response, "Reactome", url=url)
@@ -581,7 +616,7 @@ class Reactome_Fetcher(BaseDataFetcher):
         endpoint = ReactomeContentEndpoint.QUERY.value.format(id=entry_id)
         url = self._api_config.get_content_url(endpoint)
 
-        response = requests.get(url, headers={"Accept": "application/json"})
+        response = session_pool.get(url, headers={"Accept": "application/json"})
 
         if response.status_code != 200:
             raise_for_status(response, "Reactome", url=url)
@@ -610,7 +645,7 @@ class Reactome_Fetcher(BaseDataFetcher):
         endpoint = ReactomeContentEndpoint.PARTICIPANTS.value.format(id=event_id)
         url = self._api_config.get_content_url(endpoint)
 
-        response = requests.get(url, headers={"Accept": "application/json"})
+        response = session_pool.get(url, headers={"Accept": "application/json"})
 
         if response.status_code != 200:
             raise_for_status(response, "Reactome", url=url)
@@ -633,7 +668,7 @@ class Reactome_Fetcher(BaseDataFetcher):
         )
         url = self._api_config.get_content_url(endpoint)
 
-        response = requests.get(url, headers={"Accept": "application/json"})
+        response = session_pool.get(url, headers={"Accept": "application/json"})
 
         if response.status_code != 200:
             raise_for_status(response, "Reactome", url=url)
@@ -669,7 +704,7 @@ class Reactome_Fetcher(BaseDataFetcher):
         )
         url = self._api_config.get_content_url(endpoint)
 
-        response = requests.get(url, headers={"Accept": "application/json"})
+        response = session_pool.get(url, headers={"Accept": "application/json"})
 
         if response.status_code != 200:
             raise_for_status(response, "Reactome", url=url)
@@ -731,17 +766,28 @@ class Reactome_Fetcher(BaseDataFetcher):
         species: Optional[str] = None,
         id_type: str = "gene_symbol",
         include_hierarchy: bool = True,
+        max_in_flight: Optional[int] = None,
+        max_retries: int = 3,
+        checkpoint: Optional["PathwayDBManager"] = None,
+        checkpoint_key: Optional[str] = None,
+        use_bulk: bool = True,
     ) -> Dict[str, tuple]:
         """Get all pathways with their gene members for a species.
 
         This method builds a complete pathway-gene mapping suitable for
-        local over-representation analysis.
+        local over-representation analysis. See `build_pathway_gene_sets`
+        for how the mapping is fetched.
 
         Args:
             species: Species name (e.g., "Homo sapiens").
             id_type: Gene ID type ("gene_symbol" or "uniprot").
             include_hierarchy: If True, include all pathways in hierarchy.
                 If False, only top-level pathways.
+            max_in_flight: Maximum number of pathway requests in flight.
+            max_retries: Retry rounds for pathways that failed transiently.
+            checkpoint: Pathway manager used to save partial progress.
+            checkpoint_key: Cache key for partial progress.
+            use_bulk: Try the single-request bulk download first.
 
         Returns:
             Dict mapping pathway_id -> (pathway_name, set of gene IDs).
@@ -753,33 +799,220 @@ class Reactome_Fetcher(BaseDataFetcher):
             ...     print(f"{pid}: {name} ({len(genes)} genes)")
 
         Note:
-            This method makes many API calls and may take several minutes
-            for species with many pathways. Results should be cached.
+            Outside the bulk fast path this makes one API call per pathway,
+            which can take several minutes. Results should be cached.
+        """
+        return self.build_pathway_gene_sets(
+            species,
+            id_type=id_type,
+            include_hierarchy=include_hierarchy,
+            max_in_flight=max_in_flight,
+            max_retries=max_retries,
+            checkpoint=checkpoint,
+            checkpoint_key=checkpoint_key,
+            use_bulk=use_bulk,
+        )
+
+    def build_pathway_gene_sets(
+        self,
+        species: Optional[str] = None,
+        id_type: str = "gene_symbol",
+        include_hierarchy: bool = True,
+        max_in_flight: Optional[int] = None,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        checkpoint: Optional["PathwayDBManager"] = None,
+        checkpoint_key: Optional[str] = None,
+        checkpoint_every: int = 100,
+        use_bulk: bool = True,
+    ) -> Dict[str, Tuple[str, Set[str]]]:
+        """Build the pathway -> genes mapping for a species concurrently.
+
+        For human gene symbols the whole library is first fetched from
+        Reactome's bulk GMT download in a single request. Otherwise (or if
+        the download fails) ``get_pathway_genes`` is fanned out over all
+        pathways with at most ``max_in_flight`` requests running, paced by the
+        shared ``reactome.org`` rate limiter. Pathways that fail with a
+        transient error (5xx, 429, timeouts, connection errors) are retried
+        in up to ``max_retries`` further rounds with exponential backoff;
+        any other failure skips the pathway.
+
+        If ``checkpoint`` is given, completed pathways are saved to it under
+        ``checkpoint_key`` every ``checkpoint_every`` pathways and when the
+        build is interrupted. A later call with the same checkpoint only
+        fetches the pathways that are still missing. The checkpoint is
+        cleared once every pathway has been fetched.
+
+        Args:
+            species: Species name (e.g., "Homo sapiens").
+            id_type: Gene ID type ("gene_symbol" or "uniprot").
+            include_hierarchy: If True, include all pathways in hierarchy.
+                If False, only top-level pathways.
+            max_in_flight: Maximum number of pathway requests running or
+                buffered; defaults to ``RATE_LIMIT``.
+            max_retries: Retry rounds for pathways that failed transiently.
+            retry_delay: Delay before the first retry round, in seconds.
+            checkpoint: Pathway manager used to save partial progress.
+            checkpoint_key: Cache key for partial progress. Defaults to
+                ``reactome_partial_<species>_<id_type>``.
+            checkpoint_every: Number of completed pathways between saves.
+            use_bulk: Try the single-request bulk download first.
+
+        Returns:
+            Dict mapping pathway_id -> (pathway_name, set of gene IDs).
+            Pathways without genes are left out.
+
+        Example:
+            >>> from biodbs._funcs.analysis._cache import PathwayDBManager
+            >>> fetcher = Reactome_Fetcher()
+            >>> pathways = fetcher.build_pathway_gene_sets(
+            ...     "Mus musculus",
+            ...     checkpoint=PathwayDBManager("~/.biodbs/cache"),
+            ... )
         """
         species = species or self._species
+        if id_type not in ("gene_symbol", "uniprot"):
+            raise ValueError(f"Unknown id_type: {id_type}")
 
-        # Get all pathways
-        if include_hierarchy:
-            hierarchy = self.get_events_hierarchy(species)
-            pathway_ids = self._extract_pathway_ids_from_hierarchy(hierarchy)
-        else:
-            top_pathways = self.get_pathways_top(species)
-            pathway_ids = [
-                (p.get("stId"), p.get("displayName", p.get("name", "")))
-                for p in top_pathways.pathways
-            ]
-
-        result = {}
-        for pathway_id, pathway_name in pathway_ids:
+        if use_bulk and species == self.BULK_SPECIES and id_type == "gene_symbol":
             try:
-                genes = self.get_pathway_genes(pathway_id, id_type=id_type)
-                if genes:
-                    result[pathway_id] = (pathway_name, set(genes))
-            except ConnectionError:
-                logger.warning(f"Failed to get genes for pathway: {pathway_id}")
-                continue
+                bulk = self.get_bulk_gene_sets()
+            except Exception as e:
+                logger.warning(
+                    "Reactome bulk download failed, fetching per pathway: %s", e
+                )
+            else:
+                if not include_hierarchy:
+                    top_ids = {pid for pid, _ in self._list_pathways(species, False)}
+                    bulk = {pid: v for pid, v in bulk.items() if pid in top_ids}
+                return bulk
+
+        pathway_ids = self._list_pathways(species, include_hierarchy)
+
+        if checkpoint is not None and checkpoint_key is None:
+            checkpoint_key = (
+                f"reactome_partial_{species.replace(' ', '_').lower()}_{id_type}"
+            )
+        done: Dict[str, Tuple[str, Set[str]]] = {}
+        if checkpoint is not None:
+            saved = checkpoint.load_pathways(checkpoint_key, use_cache=False)
+            if saved:
+                done = {pid: (name, set(genes)) for pid, (name, genes) in saved.items()}
+                logger.info(
+                    "Resuming Reactome build from %d checkpointed pathways", len(done)
+                )
+
+        def save_checkpoint():
+            checkpoint.save_pathways(
+                done, checkpoint_key, database="Reactome", species=species,
+                gene_type=id_type,
+            )
+
+        pending = list(dict.fromkeys(
+            (pid, name) for pid, name in pathway_ids if pid not in done
+        ))
+        unsaved = 0
+        attempt = 0
+        try:
+            while pending:
+                failed = []
+                results = self.iter_process(
+                    self.get_pathway_genes,
+                    args_list=[(pid, id_type) for pid, _ in pending],
+                    rate_limit_per_second=self.RATE_LIMIT,
+                    max_in_flight=max_in_flight or self.RATE_LIMIT,
+                    ordered=False,
+                    return_exceptions=True,
+                    host=self.HOST,
+                )
+                for i, genes in results:
+                    pathway_id, pathway_name = pending[i]
+                    if isinstance(genes, _TRANSIENT_ERRORS):
+                        failed.append(pending[i])
+                        continue
+                    if isinstance(genes, Exception):
+                        logger.warning(
+                            "Failed to get genes for pathway %s: %s", pathway_id, genes
+                        )
+                        continue
+                    done[pathway_id] = (pathway_name, set(genes))
+                    unsaved += 1
+                    if checkpoint is not None and unsaved >= checkpoint_every:
+                        save_checkpoint()
+                        unsaved = 0
+
+                if failed and attempt >= max_retries:
+                    logger.warning(
+                        "Giving up on %d Reactome pathways after %d retries",
+                        len(failed), max_retries,
+                    )
+                    break
+                if failed:
+                    time.sleep(retry_delay * 2 ** attempt)
+                    attempt += 1
+                pending = failed
+        finally:
+            if checkpoint is not None and unsaved:
+                save_checkpoint()
+
+        if checkpoint is not None and not pending:
+            checkpoint.clear_cache(checkpoint_key)
+
+        return {pid: entry for pid, entry in done.items() if entry[1]}
+
+    def get_bulk_gene_sets(self) -> Dict[str, Tuple[str, Set[str]]]:
+        """Download every human pathway gene set in a single request.
+
+        Reads Reactome's ``ReactomePathways.gmt.zip`` download, which lists
+        the gene symbols of each lowest-level and parent pathway.
 
-        return result
+        Returns:
+            Dict mapping pathway_id -> (pathway_name, set of gene symbols).
+
+        Raises:
+            APIError: If the download fails.
+            ValueError: If the archive contains no GMT file.
+        """
+        url = self.BULK_GMT_URL
+        response = session_pool.get(url, timeout=120)
+
+        if response.status_code != 200:
+            raise_for_status(response, "Reactome", url=url)
+
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            names = [n for n in archive.namelist() if n.endswith(".gmt")]
+            if not names:
+                raise ValueError(f"No GMT file found in {url}")
+            text = archive.read(names[0]).decode("utf-8")
+
+        return self._parse_gmt(text)
+
+    @staticmethod
+    def _parse_gmt(text: str) -> Dict[str, Tuple[str, Set[str]]]:
+        """Parse GMT lines (``name<TAB>id<TAB>gene...``) into gene sets."""
+        gene_sets = {}
+        for line in text.splitlines():
+            fields = line.rstrip("\n").split("\t")
+            if len(fields) < 3:
+                continue
+            name, pathway_id = fields[0], fields[1]
+            genes = {g for g in fields[2:] if g}
+            if genes:
+                gene_sets[pathway_id] = (name, genes)
+        return gene_sets
+
+    def _list_pathways(
+        self, species: str, include_hierarchy: bool
+    ) -> List[tuple]:
+        """List (pathway_id, pathway_name) tuples for a species."""
+        if include_hierarchy:
+            hierarchy = self.get_events_hierarchy(species)
+            return self._extract_pathway_ids_from_hierarchy(hierarchy)
+        top_pathways = self.get_pathways_top(species)
+        return [
+            (p.get("stId"), p.get("displayName", p.get("name", "")))
+            for p in top_pathways.pathways
+        ]
 
     def _extract_pathway_ids_from_hierarchy(
         self, hierarchy: List[Dict[str, Any]]
@@ -824,7 +1057,7 @@ class Reactome_Fetcher(BaseDataFetcher):
         endpoint = ReactomeContentEndpoint.EVENT_ANCESTORS.value.format(id=event_id)
         url = self._api_config.get_content_url(endpoint)
 
-        response = requests.get(url, headers={"Accept": "application/json"})
+        response = session_pool.get(url, headers={"Accept": "application/json"})
 
         if response.status_code != 200:
             raise_for_status(response, "Reactome", url=url)
@@ -847,7 +1080,7 @@ class Reactome_Fetcher(BaseDataFetcher):
         endpoint = ReactomeContentEndpoint.COMPLEX_SUBUNITS.value.format(id=complex_id)
         url = self._api_config.get_content_url(endpoint)
 
-        response = requests.get(url, headers={"Accept": "application/json"})
+        response = session_pool.get(url, headers={"Accept": "application/json"})
 
         if response.status_code != 200:
             raise_for_status(response, "Reactome", url=url)
@@ -866,7 +1099,7 @@ class Reactome_Fetcher(BaseDataFetcher):
         endpoint = ReactomeContentEndpoint.ENTITY_COMPONENT_OF.value.format(id=entity_id)
         url = self._api_config.get_content_url(endpoint)
 
-        response = requests.get(url, headers={"Accept": "application/json"})
+        response = session_pool.get(url, headers={"Accept": "application/json"})
 
         if response.status_code != 200:
             raise_for_status(response, "Reactome", url=url)
@@ -885,7 +1118,7 @@ class Reactome_Fetcher(BaseDataFetcher):
         endpoint = ReactomeContentEndpoint.ENTITY_OTHER_FORMS.value.format(id=entity_id)
         url = self._api_config.get_content_url(endpoint)
 
-        response = requests.get(url, headers={"Accept": "application/json"})
+        response = session_pool.get(url, headers={"Accept": "application/json"})
 
         if response.status_code != 200:
             raise_for_status(response, "Reactome", url=url)
@@ -906,7 +1139,7 @@ class Reactome_Fetcher(BaseDataFetcher):
             ReactomeContentEndpoint.DISEASES.value
         )
 
-        response = requests.get(url, headers={"Accept": "application/json"})
+        response = session_pool.get(url, headers={"Accept": "application/json"})
 
         if response.status_code != 200:
             raise_for_status(response, "Reactome", url=url)
@@ -923,7 +1156,7 @@ class Reactome_Fetcher(BaseDataFetcher):
             ReactomeContentEndpoint.DISEASES_DOID.value
         )
 
-        response = requests.get(url, headers={"Accept": "application/json"})
+        response = session_pool.get(url, headers={"Accept": "application/json"})
 
         if response.status_code != 200:
             raise_for_status(response, "Reactome", url=url)
@@ -951,7 +1184,7 @@ class Reactome_Fetcher(BaseDataFetcher):
         )
         url = self._api_config.get_content_url(endpoint)
 
-        response = requests.get(url, headers={"Accept": "application/json"})
+        response = session_pool.get(url, headers={"Accept": "application/json"})
 
         if response.status_code != 200:
             raise_for_status(response, "Reactome", url=url)
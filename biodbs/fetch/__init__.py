@@ -23,22 +23,250 @@ For analysis functions, use biodbs.analysis:
     from biodbs.analysis import ora_kegg, ora_go
 """
 
-from biodbs.fetch._func import *
-from biodbs.fetch import _func as funcs
-from biodbs.fetch._rate_limit import (
-    RateLimiter,
-    get_rate_limiter,
-    request_with_retry,
-    retry_with_backoff,
-)
+from biodbs._lazy import lazy_exports
+
+# Public names are imported on first access (PEP 562), so importing
+# biodbs.fetch does not load every fetcher and its dependencies.
+_EXPORTS = {
+    "biodbs.fetch._rate_limit": (
+        "RateLimiter",
+        "TokenBucket",
+        "get_rate_limiter",
+        "request_with_retry",
+        "retry_with_backoff",
+    ),
+    "biodbs.fetch._session": (
+        "SessionPool",
+        "configure_session_pool",
+        "get_session_pool",
+    ),
+    "biodbs.fetch._http_cache": (
+        "ResponseCache",
+        "disable_response_cache",
+        "enable_response_cache",
+        "get_response_cache",
+    ),
+    "biodbs.fetch._coalesce": (
+        "RequestCoalescer",
+        "disable_request_coalescing",
+        "enable_request_coalescing",
+        "get_request_coalescer",
+    ),
+    "biodbs.fetch._chunking": (
+        "ChunkLimits",
+        "ChunkPlanner",
+        "get_chunk_planner",
+        "register_chunk_limits",
+    ),
+    # PubChem functions
+    "biodbs.fetch.pubchem.funcs": (
+        "pubchem_get_compound",
+        "pubchem_get_compounds",
+        "pubchem_search_by_name",
+        "pubchem_search_by_smiles",
+        "pubchem_search_by_inchikey",
+        "pubchem_search_by_formula",
+        "pubchem_get_properties",
+        "pubchem_get_synonyms",
+        "pubchem_get_description",
+        "pubchem_get_safety",
+        "pubchem_get_pharmacology",
+        "pubchem_get_drug_info",
+    ),
+    # BioMart/Ensembl functions
+    "biodbs.fetch.biomart.funcs": (
+        "biomart_get_genes",
+        "biomart_get_genes_by_name",
+        "biomart_get_genes_by_region",
+        "biomart_get_transcripts",
+        "biomart_get_go_annotations",
+        "biomart_get_homologs",
+        "biomart_convert_ids",
+        "biomart_query",
+        "biomart_list_datasets",
+        "biomart_list_attributes",
+        "biomart_list_filters",
+    ),
+    # Human Protein Atlas (HPA) functions
+    "biodbs.fetch.HPA.funcs": (
+        "hpa_get_gene",
+        "hpa_get_genes",
+        "hpa_get_tissue_expression",
+        "hpa_get_blood_expression",
+        "hpa_get_brain_expression",
+        "hpa_get_subcellular_location",
+        "hpa_get_pathology",
+        "hpa_get_protein_class",
+        "hpa_search",
+    ),
+    # ChEMBL functions
+    "biodbs.fetch.ChEMBL.funcs": (
+        "chembl_get_molecule",
+        "chembl_get_target",
+        "chembl_search_molecules",
+        "chembl_get_activities_for_target",
+        "chembl_get_activities_for_molecule",
+        "chembl_get_approved_drugs",
+        "chembl_get_drug_indications",
+        "chembl_get_mechanisms",
+    ),
+    # KEGG functions
+    "biodbs.fetch.KEGG.funcs": (
+        "kegg_info",
+        "kegg_list",
+        "kegg_find",
+        "kegg_get",
+        "kegg_get_batch",
+        "kegg_conv",
+        "kegg_link",
+        "kegg_ddi",
+    ),
+    # QuickGO functions
+    "biodbs.fetch.QuickGO.funcs": (
+        "quickgo_search_terms",
+        "quickgo_get_terms",
+        "quickgo_get_term_children",
+        "quickgo_get_term_ancestors",
+        "quickgo_search_annotations",
+        "quickgo_search_annotations_all",
+        "quickgo_download_annotations",
+        "quickgo_iter_annotations",
+        "quickgo_get_gene_product",
+    ),
+    # FDA functions
+    "biodbs.fetch.FDA.funcs": (
+        "fda_search",
+        "fda_search_all",
+        "fda_drug_events",
+        "fda_drug_labels",
+        "fda_drug_enforcement",
+        "fda_drug_ndc",
+        "fda_drug_drugsfda",
+        "fda_device_events",
+        "fda_device_classification",
+        "fda_device_510k",
+        "fda_device_pma",
+        "fda_device_recall",
+        "fda_device_udi",
+        "fda_food_events",
+        "fda_food_enforcement",
+        "fda_animalandveterinary_events",
+        "fda_tobacco_problem",
+    ),
+    # EnrichR functions
+    "biodbs.fetch.EnrichR.funcs": (
+        "enrichr_get_libraries",
+        "enrichr_enrich",
+        "enrichr_enrich_multiple",
+        "enrichr_enrich_with_background",
+        "enrichr_kegg",
+        "enrichr_go_bp",
+        "enrichr_go_mf",
+        "enrichr_go_cc",
+        "enrichr_reactome",
+        "enrichr_wikipathways",
+    ),
+    # Reactome functions
+    "biodbs.fetch.Reactome.funcs": (
+        "reactome_analyze",
+        "reactome_analyze_projection",
+        "reactome_get_pathways_top",
+        "reactome_get_species",
+        "reactome_get_found_entities",
+        "reactome_get_database_version",
+    ),
+    # NCBI Datasets functions
+    "biodbs.fetch.NCBI.funcs": (
+        "ncbi_get_gene",
+        "ncbi_symbol_to_id",
+        "ncbi_id_to_symbol",
+        "ncbi_get_taxonomy",
+        "ncbi_translate_gene_ids",
+    ),
+    # Ensembl REST API functions
+    "biodbs.fetch.ensembl.funcs": (
+        "ensembl_lookup",
+        "ensembl_lookup_batch",
+        "ensembl_lookup_symbol",
+        "ensembl_get_sequence",
+        "ensembl_get_sequence_batch",
+        "ensembl_get_sequence_region",
+        "ensembl_get_overlap_id",
+        "ensembl_get_overlap_region",
+        "ensembl_get_xrefs",
+        "ensembl_get_xrefs_symbol",
+        "ensembl_get_homology",
+        "ensembl_get_homology_symbol",
+        "ensembl_get_variation",
+        "ensembl_vep_hgvs",
+        "ensembl_vep_id",
+        "ensembl_vep_region",
+        "ensembl_map_assembly",
+        "ensembl_get_phenotype_gene",
+        "ensembl_get_phenotype_region",
+        "ensembl_get_ontology_term",
+        "ensembl_get_ontology_ancestors",
+        "ensembl_get_ontology_descendants",
+        "ensembl_get_genetree",
+        "ensembl_get_genetree_member",
+        "ensembl_get_assembly_info",
+        "ensembl_get_species_info",
+    ),
+    # Disease Ontology functions
+    "biodbs.fetch.DiseaseOntology.funcs": (
+        "do_get_term",
+        "do_get_terms",
+        "do_search",
+        "do_get_parents",
+        "do_get_children",
+        "do_get_ancestors",
+        "do_get_descendants",
+        "doid_to_mesh",
+        "doid_to_umls",
+        "doid_to_icd10",
+        "do_xref_mapping",
+    ),
+    # UniProt functions
+    "biodbs.fetch.uniprot.funcs": (
+        "uniprot_get_entry",
+        "uniprot_get_entries",
+        "uniprot_search",
+        "uniprot_search_by_gene",
+        "uniprot_search_by_keyword",
+        "gene_to_uniprot",
+        "uniprot_to_gene",
+        "uniprot_get_sequences",
+        "uniprot_map_ids",
+    ),
+}
 
 __all__ = [
     "funcs",
     # Rate limiting utilities
     "RateLimiter",
+    "TokenBucket",
     "get_rate_limiter",
     "request_with_retry",
     "retry_with_backoff",
+    # Session pool
+    "SessionPool",
+    "get_session_pool",
+    "configure_session_pool",
+    # Response cache
+    "ResponseCache",
+    "enable_response_cache",
+    "disable_response_cache",
+    "get_response_cache",
+    # Request coalescing
+    "RequestCoalescer",
+    "enable_request_coalescing",
+    "disable_request_coalescing",
+    "get_request_coalescer",
+    # Batch chunking
+    "ChunkLimits",
+    "ChunkPlanner",
+    "get_chunk_planner",
+    "register_chunk_limits",
     # PubChem
     "pubchem_get_compound",
     "pubchem_get_compounds",
@@ -100,6 +328,7 @@ __all__ = [
     "quickgo_search_annotations",
     "quickgo_search_annotations_all",
     "quickgo_download_annotations",
+    "quickgo_iter_annotations",
     "quickgo_get_gene_product",
     # FDA
     "fda_search",
@@ -193,3 +422,7 @@ __all__ = [
     "uniprot_get_sequences",
     "uniprot_map_ids",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__, submodules={"funcs": "biodbs.fetch._func"}, exports=_EXPORTS
+)
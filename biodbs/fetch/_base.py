@@ -1,8 +1,18 @@
 from __future__ import annotations
 from pydantic import BaseModel, ValidationError
-from typing import Tuple, List, Dict, Any, Callable, Optional
+from typing import Tuple, List, Dict, Any, AsyncIterator, Callable, Iterable, Iterator, Optional, Sequence
 import asyncio
 import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import ExitStack, nullcontext
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+
+from biodbs.fetch._chunking import ChunkPlanner
+from biodbs.fetch._http_cache import get_response_cache
+from biodbs.fetch._rate_limit import TokenBucket, get_rate_limiter
+from biodbs.fetch._session import deferred_pacing
 
 
 class BaseAPIConfig:
@@ -40,16 +50,24 @@ class BaseAPIConfig:
     def update_params(self, **kwargs):
         self._params.update(kwargs)
 
-    @property
-    def api_url(self) -> str:
+    def build_url(self, params: Dict[str, Any]) -> str:
+        """Build the URL for ``params`` without touching this config.
+
+        Fetchers call this once per request, so a single config (and
+        fetcher) can be shared by many threads or coroutines.
+        """
         if self._url_builder is not None:
-            return self._url_builder(self._params)
+            return self._url_builder(params)
         if self._url_format is not None:
-            return self._url_format.format(**self._params)
+            return self._url_format.format(**params)
         raise NotImplementedError(
             "Subclass must provide url_format, url_builder, or override api_url"
         )
 
+    @property
+    def api_url(self) -> str:
+        return self.build_url(self._params)
+
     def copy(self):
         new = self.__class__()
         new._url_format = self._url_format
@@ -63,25 +81,80 @@ class BaseAPIConfig:
         return new_api
 
 
+@dataclass(frozen=True)
+class RequestPlan:
+    """One fully built HTTP request.
+
+    Fetchers build a plan per call from validated parameters instead of
+    writing them into shared state, so concurrent calls on the same fetcher
+    cannot see each other's URL or query. ``params`` and ``headers`` are
+    copied on construction; use `with_params` to derive a variant (e.g. the
+    next page) rather than mutating them.
+
+    Attributes:
+        url: Request URL without the query string.
+        params: Query parameters.
+        headers: Extra request headers.
+        body: JSON body for POST requests, or None.
+        method: HTTP method.
+    """
+
+    url: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: Optional[Any] = None
+    method: str = "GET"
+
+    def __post_init__(self):
+        object.__setattr__(self, "params", dict(self.params))
+        object.__setattr__(self, "headers", dict(self.headers))
+
+    def with_params(self, **params: Any) -> "RequestPlan":
+        """Return a copy of this plan with ``params`` merged into the query."""
+        return replace(self, params={**self.params, **params})
+
+
 class NameSpace:
+    """Validates request parameters against a pydantic model.
+
+    Validation is stateless: `parse` returns the request parameters for
+    each call instead of storing them, so one namespace can serve
+    concurrent requests.
+    """
+
     def __init__(self, model: type[BaseModel]):
         self._model = model
-        self._valid_params = {}
-    
+
     def validate(self, **kwargs) -> Tuple[bool, str]:
         err_msg = "No error found"
         try:
-            ins = self._model(**kwargs)
-            self._valid_params = ins.model_dump()
+            self._model(**kwargs)
         except ValidationError as e:
             err_msg = str(e)
             return False, err_msg
-        
+
         return True, err_msg
-    
-    @property
-    def valid_params(self):
-        return self._valid_params
+
+    def parse(self, **kwargs) -> Dict[str, Any]:
+        """Validate ``kwargs`` and return the request parameters.
+
+        Raises:
+            ValueError: If the parameters do not validate; the message is
+                the pydantic error.
+        """
+        try:
+            ins = self._model(**kwargs)
+        except ValidationError as e:
+            raise ValueError(str(e)) from None
+        return self.request_params(ins)
+
+    def request_params(self, model: BaseModel) -> Dict[str, Any]:
+        """Turn a validated model into request parameters.
+
+        Subclasses extend this with derived fields (path, query params)
+        built from the model.
+        """
+        return model.model_dump()
 
 
 class BaseDataFetcher:
@@ -100,7 +173,8 @@ class BaseDataFetcher:
         kwargs_list: Optional[List[dict]] = None,
         rate_limit_per_second: int = 10,
         return_exceptions: bool = False,
-        progress_callback: Optional[Callable[[int, int], None]] = None
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        host: Optional[str] = None,
     ) -> List[Any]:
         """
         Execute multiple async/sync function calls with rate limiting.
@@ -109,9 +183,17 @@ class BaseDataFetcher:
             get_func: The function to call (can be sync or async)
             args_list: List of positional arguments for each call
             kwargs_list: List of keyword arguments for each call
-            rate_limit_per_second: Maximum number of requests per second
+            rate_limit_per_second: Maximum number of requests per second; also
+                bounds the number of calls in flight
             return_exceptions: If True, exceptions are returned instead of raised
             progress_callback: Optional callback function(completed, total) for progress tracking
+            host: API host the calls go to. When given, calls draw from the
+                host's bucket in the global `RateLimiter` (registering
+                ``rate_limit_per_second`` if the host has no rate yet), so
+                they share its budget with every other caller. Leave unset
+                when ``get_func`` already goes through `request_with_retry`.
+                While a response cache is enabled, a call is only charged a
+                token if it actually sends a request.
             
         Returns:
             List of results from all function calls
@@ -119,51 +201,48 @@ class BaseDataFetcher:
         Raises:
             ValueError: If args_list and kwargs_list have different lengths
         """
-        args_list = args_list or []
-        kwargs_list = kwargs_list or []
-        
-        # Determine total tasks
-        total_tasks = max(len(args_list), len(kwargs_list))
+        args_list, kwargs_list = self._pad_call_lists(args_list, kwargs_list)
+        total_tasks = len(args_list)
         if total_tasks == 0:
             return []
         
-        # Validate list lengths match
-        if args_list and kwargs_list and len(args_list) != len(kwargs_list):
-            raise ValueError("args_list and kwargs_list must have the same length")
-        
-        # Pad shorter list with empty values
-        if len(args_list) < total_tasks:
-            args_list.extend([()] * (total_tasks - len(args_list)))
-        if len(kwargs_list) < total_tasks:
-            kwargs_list.extend([{}] * (total_tasks - len(kwargs_list)))
-        
         # Check if function is async
         is_async = asyncio.iscoroutinefunction(get_func)
         
+        # Pace calls with a token bucket: the host's shared one if known,
+        # otherwise a private bucket for this batch
+        if host is not None:
+            limiter = get_rate_limiter()
+            limiter.setdefault_rate(host, rate_limit_per_second)
+            bucket = limiter.bucket(host)
+        else:
+            bucket = TokenBucket(rate_limit_per_second)
+        cached = get_response_cache() is not None
+
         async def limited_gather():
             # Semaphore for concurrent request limiting
-            semaphore = asyncio.Semaphore(rate_limit_per_second)
-            
-            # Track time for rate limiting
-            last_batch_time = time.time()
+            semaphore = asyncio.Semaphore(max(1, int(rate_limit_per_second)))
             completed_count = 0
             
             async def rate_limited_call(index: int, args: tuple, kwargs: dict):
-                nonlocal completed_count, last_batch_time
+                nonlocal completed_count
                 
                 async with semaphore:
-                    # Rate limiting: ensure we don't exceed requests per second
-                    if index > 0 and index % rate_limit_per_second == 0:
-                        elapsed = time.time() - last_batch_time
-                        if elapsed < 1.0:
-                            await asyncio.sleep(1.0 - elapsed)
-                        last_batch_time = time.time()
+                    if cached:
+                        # Draw the token only when the call misses the cache
+                        pacing = deferred_pacing(bucket)
+                    else:
+                        pacing = nullcontext()
+                        delay = bucket.reserve()
+                        if delay > 0:
+                            await asyncio.sleep(delay)
                     
                     # Execute function (handle both sync and async)
-                    if is_async:
-                        result = await get_func(*args, **kwargs)
-                    else:
-                        result = await asyncio.to_thread(get_func, *args, **kwargs)
+                    with pacing:
+                        if is_async:
+                            result = await get_func(*args, **kwargs)
+                        else:
+                            result = await asyncio.to_thread(get_func, *args, **kwargs)
                     
                     # Update progress
                     completed_count += 1
@@ -181,5 +260,461 @@ class BaseDataFetcher:
             # Execute with optional exception handling
             return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
         
-        # Run the async gather
-        return asyncio.run(limited_gather())
\ No newline at end of file
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(limited_gather())
+
+        # Called from inside a running loop (Jupyter, async web apps), where
+        # asyncio.run is not allowed: run the batch on a private loop in a
+        # worker thread. Prefer the native ``aget``/``aget_all`` there.
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, limited_gather()).result()
+
+    async def aschedule_process(
+        self,
+        get_func: Callable,
+        args_list: Optional[List[tuple]] = None,
+        kwargs_list: Optional[List[dict]] = None,
+        max_concurrency: int = 10,
+        return_exceptions: bool = False,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[Any]:
+        """
+        Await many coroutine calls on the running event loop.
+
+        Native counterpart of `schedule_process` for the ``aget``/``aget_all``
+        API: no threads and no nested event loop, so it can be awaited from
+        Jupyter or an async web framework. Request pacing is left to the
+        per-host rate limiter used by the coroutines themselves; this method
+        only bounds how many calls are in flight at once.
+
+        Args:
+            get_func: Coroutine function to call
+            args_list: List of positional arguments for each call
+            kwargs_list: List of keyword arguments for each call
+            max_concurrency: Maximum number of calls awaiting at once
+            return_exceptions: If True, exceptions are returned instead of raised
+            progress_callback: Optional callback function(completed, total) for progress tracking
+
+        Returns:
+            List of results from all calls, in input order
+
+        Raises:
+            ValueError: If args_list and kwargs_list have different lengths
+        """
+        args_list, kwargs_list = self._pad_call_lists(args_list, kwargs_list)
+        total_tasks = len(args_list)
+        if total_tasks == 0:
+            return []
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        completed_count = 0
+
+        async def bounded_call(args: tuple, kwargs: dict):
+            nonlocal completed_count
+            async with semaphore:
+                result = await get_func(*args, **kwargs)
+            completed_count += 1
+            if progress_callback:
+                progress_callback(completed_count, total_tasks)
+            return result
+
+        return await asyncio.gather(
+            *(bounded_call(a, k) for a, k in zip(args_list, kwargs_list)),
+            return_exceptions=return_exceptions,
+        )
+
+    @staticmethod
+    def _pad_call_lists(
+        args_list: Optional[List[tuple]],
+        kwargs_list: Optional[List[dict]],
+    ) -> Tuple[List[tuple], List[dict]]:
+        """Copy the call lists, padding the shorter one with empty args/kwargs.
+
+        Raises:
+            ValueError: If both lists are given with different lengths
+        """
+        args_list = list(args_list or [])
+        kwargs_list = list(kwargs_list or [])
+        total = max(len(args_list), len(kwargs_list))
+        if args_list and kwargs_list and len(args_list) != len(kwargs_list):
+            raise ValueError("args_list and kwargs_list must have the same length")
+        args_list.extend([()] * (total - len(args_list)))
+        kwargs_list.extend([{}] * (total - len(kwargs_list)))
+        return args_list, kwargs_list
+
+    @staticmethod
+    def _outcome(future: Any, return_exceptions: bool) -> Any:
+        # Works for both concurrent.futures.Future and finished asyncio tasks
+        exc = future.exception()
+        if exc is None:
+            return future.result()
+        if return_exceptions and isinstance(exc, Exception):
+            return exc
+        raise exc
+
+    def iter_process(
+        self,
+        get_func: Callable,
+        args_list: Optional[List[tuple]] = None,
+        kwargs_list: Optional[List[dict]] = None,
+        rate_limit_per_second: float = 10,
+        max_in_flight: Optional[int] = None,
+        ordered: bool = True,
+        return_exceptions: bool = False,
+        host: Optional[str] = None,
+    ) -> Iterator[Tuple[int, Any]]:
+        """
+        Run many synchronous calls on worker threads and yield results as they finish.
+
+        Streaming counterpart of `schedule_process`: at most ``max_in_flight``
+        calls are running or waiting to be consumed at any time, and new
+        calls are only started as the caller pulls results. A slow consumer
+        (e.g. one writing pages to disk) therefore applies backpressure, and
+        memory stays bounded by ``max_in_flight`` results regardless of the
+        number of calls.
+
+        Args:
+            get_func: Synchronous function to call
+            args_list: List of positional arguments for each call
+            kwargs_list: List of keyword arguments for each call
+            rate_limit_per_second: Maximum number of calls started per second
+            max_in_flight: Maximum number of calls running or buffered;
+                defaults to ``rate_limit_per_second``
+            ordered: Yield in input order. If False, yield in completion order.
+            return_exceptions: If True, exceptions are yielded instead of raised
+            host: API host the calls go to, as for `schedule_process`
+
+        Yields:
+            ``(index, result)`` tuples, where ``index`` is the call's position
+            in the input lists
+
+        Raises:
+            ValueError: If args_list and kwargs_list have different lengths
+        """
+        args_list, kwargs_list = self._pad_call_lists(args_list, kwargs_list)
+        total = len(args_list)
+        if total == 0:
+            return
+        if max_in_flight is None:
+            max_in_flight = max(1, int(rate_limit_per_second))
+
+        if host is not None:
+            limiter = get_rate_limiter()
+            limiter.setdefault_rate(host, rate_limit_per_second)
+            bucket = limiter.bucket(host)
+        else:
+            bucket = TokenBucket(rate_limit_per_second)
+        cached = get_response_cache() is not None
+
+        def paced_call(args: tuple, kwargs: dict):
+            if cached:
+                with deferred_pacing(bucket):
+                    return get_func(*args, **kwargs)
+            delay = bucket.reserve()
+            if delay > 0:
+                time.sleep(delay)
+            return get_func(*args, **kwargs)
+
+        executor = ThreadPoolExecutor(max_workers=max_in_flight)
+        futures: Dict[int, Future] = {}
+        next_index = 0
+        try:
+            while futures or next_index < total:
+                while next_index < total and len(futures) < max_in_flight:
+                    futures[next_index] = executor.submit(
+                        paced_call, args_list[next_index], kwargs_list[next_index]
+                    )
+                    next_index += 1
+
+                if ordered:
+                    index = min(futures)
+                    result = self._outcome(futures[index], return_exceptions)
+                    del futures[index]
+                    yield index, result
+                else:
+                    done, _ = wait(futures.values(), return_when=FIRST_COMPLETED)
+                    ready = sorted(i for i, f in futures.items() if f in done)
+                    for index in ready:
+                        result = self._outcome(futures.pop(index), return_exceptions)
+                        yield index, result
+        finally:
+            # Consumer stopped early or a call raised: drop queued calls
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def aiter_process(
+        self,
+        get_func: Callable,
+        args_list: Optional[List[tuple]] = None,
+        kwargs_list: Optional[List[dict]] = None,
+        max_in_flight: int = 10,
+        ordered: bool = True,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[Tuple[int, Any]]:
+        """
+        Await many coroutine calls and yield results as they finish.
+
+        Async counterpart of `iter_process`. At most ``max_in_flight`` calls
+        are running or waiting to be consumed; the next call starts only
+        after the consumer takes a result. Request pacing is left to the
+        per-host rate limiter used by the coroutines, as in
+        `aschedule_process`.
+
+        Args:
+            get_func: Coroutine function to call
+            args_list: List of positional arguments for each call
+            kwargs_list: List of keyword arguments for each call
+            max_in_flight: Maximum number of calls running or buffered
+            ordered: Yield in input order. If False, yield in completion order.
+            return_exceptions: If True, exceptions are yielded instead of raised
+
+        Yields:
+            ``(index, result)`` tuples, where ``index`` is the call's position
+            in the input lists
+
+        Raises:
+            ValueError: If args_list and kwargs_list have different lengths
+        """
+        args_list, kwargs_list = self._pad_call_lists(args_list, kwargs_list)
+        total = len(args_list)
+        tasks: Dict[int, asyncio.Task] = {}
+        next_index = 0
+        try:
+            while tasks or next_index < total:
+                while next_index < total and len(tasks) < max_in_flight:
+                    tasks[next_index] = asyncio.ensure_future(
+                        get_func(*args_list[next_index], **kwargs_list[next_index])
+                    )
+                    next_index += 1
+
+                if ordered:
+                    index = min(tasks)
+                    await asyncio.wait([tasks[index]])
+                    yield index, self._outcome(tasks.pop(index), return_exceptions)
+                else:
+                    done, _ = await asyncio.wait(
+                        tasks.values(), return_when=asyncio.FIRST_COMPLETED
+                    )
+                    ready = sorted(i for i, t in tasks.items() if t in done)
+                    for index in ready:
+                        yield index, self._outcome(tasks.pop(index), return_exceptions)
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+    def chunked_process(
+        self,
+        get_func: Callable[[Sequence], Any],
+        items: Sequence,
+        planner: ChunkPlanner,
+        max_workers: int = 4,
+        max_items: Optional[int] = None,
+        rate_limit_per_second: float = 10,
+        host: Optional[str] = None,
+    ) -> List[Any]:
+        """
+        Fetch a long ID list in adaptively sized chunks, concurrently.
+
+        Chunks are cut by ``planner`` as the previous ones finish, so sizes
+        follow what the endpoint has shown it can handle. A chunk that times
+        out or is rejected as too large (413/414) is split and retried, and
+        the planner shrinks for later chunks. A 400 is treated as a possible
+        size rejection once: if the halves are refused too, the error is
+        raised; if a half succeeds, the planner's ceiling drops as for a 413.
+
+        Args:
+            get_func: Called with one chunk (a slice of ``items``)
+            items: IDs to fetch
+            planner: The endpoint's `ChunkPlanner`
+            max_workers: Maximum number of chunks in flight
+            max_items: Optional cap on IDs per chunk (e.g. a page size)
+            rate_limit_per_second: Rate registered for ``host`` if it has none
+            host: API host the calls go to, as for `schedule_process`; leave
+                unset when ``get_func`` already goes through
+                `request_with_retry`
+
+        Returns:
+            One ``get_func`` result per chunk, in input order
+
+        Raises:
+            Exception: The first error that splitting cannot resolve
+        """
+        total = len(items)
+        if total == 0:
+            return []
+
+        bucket = None
+        if host is not None:
+            limiter = get_rate_limiter()
+            limiter.setdefault_rate(host, rate_limit_per_second)
+            bucket = limiter.bucket(host)
+
+        def timed_call(chunk: Sequence) -> Tuple[Any, float]:
+            start = time.perf_counter()
+            with deferred_pacing(bucket) if bucket is not None else nullcontext():
+                result = get_func(chunk)
+            return result, time.perf_counter() - start
+
+        # (start, end, retried_after_400) spans waiting to be sent again
+        retry: deque = deque()
+        results: Dict[int, Any] = {}
+        futures: Dict[Future, Tuple[int, int, bool]] = {}
+        next_start = 0
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            while futures or retry or next_start < total:
+                while len(futures) < max_workers and (retry or next_start < total):
+                    if retry:
+                        start, end, rejected = retry.popleft()
+                        # The planner may have shrunk since this span was queued
+                        cut = planner.take(items, start, max_items)
+                        if cut < end:
+                            retry.appendleft((cut, end, rejected))
+                            end = cut
+                    else:
+                        start, rejected = next_start, False
+                        end = next_start = planner.take(items, start, max_items)
+                    future = executor.submit(timed_call, items[start:end])
+                    futures[future] = (start, end, rejected)
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    start, end, rejected = futures.pop(future)
+                    try:
+                        results[start], seconds = future.result()
+                    except Exception as e:
+                        kind = planner.failure_kind(e)
+                        if kind is None or end - start == 1 or (kind == "rejected" and rejected):
+                            raise
+                        planner.record_failure(end - start, oversize=kind == "oversize")
+                        half = (end - start + 1) // 2
+                        while start < end:
+                            split = min(start + half, planner.take(items, start, max_items))
+                            retry.append((start, split, kind == "rejected"))
+                            start = split
+                    else:
+                        if rejected:
+                            # The 400 went away after splitting: it was about size
+                            planner.record_rejection_cleared(end - start)
+                        planner.record_success(end - start, seconds)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return [results[start] for start in sorted(results)]
+
+    @staticmethod
+    def drain_pages(pages: Iterable[Any], sink: "PageSink") -> Any:
+        """Feed every page from ``pages`` into ``sink`` and return its result.
+
+        The sink's resources are released even if fetching a page fails.
+        """
+        try:
+            for page in pages:
+                sink.add(page)
+        except BaseException:
+            sink.close()
+            raise
+        return sink.finish()
+
+    @staticmethod
+    async def adrain_pages(pages: AsyncIterator[Any], sink: "PageSink") -> Any:
+        """Async counterpart of `drain_pages` for ``aiter_all`` page streams."""
+        try:
+            async for page in pages:
+                sink.add(page)
+        except BaseException:
+            sink.close()
+            raise
+        return sink.finish()
+
+
+class PageSink:
+    """Consumer of fetched pages used by the ``get_all`` finalisers.
+
+    Pages are handed over one at a time as they arrive, so a sink decides
+    how much of the result is kept in memory.
+    """
+
+    def add(self, page: Any) -> None:
+        raise NotImplementedError("This method should be implemented in subclass.")
+
+    def finish(self) -> Any:
+        raise NotImplementedError("This method should be implemented in subclass.")
+
+    def close(self) -> None:
+        """Release resources without producing a result."""
+
+
+class ConcatSink(PageSink):
+    """Concatenate pages in memory (``method="concat"``).
+
+    Pages are combined once, with the page class's ``concat``, when the
+    stream finishes.
+
+    Args:
+        empty: Factory for the result returned when no page arrives.
+        max_records: Truncate the ``results`` of the combined page to this
+            many records.
+    """
+
+    def __init__(self, empty: Callable[[], Any], max_records: Optional[int] = None):
+        self._empty = empty
+        self._max_records = max_records
+        self._pages: List[Any] = []
+
+    def add(self, page: Any) -> None:
+        self._pages.append(page)
+
+    def finish(self) -> Any:
+        if not self._pages:
+            return self._empty()
+        result = type(self._pages[0]).concat(self._pages)
+        self._pages = []
+        if self._max_records is not None:
+            result.results = result.results[:self._max_records]
+        return result
+
+
+class JsonLinesSink(PageSink):
+    """Write each page's records to a JSON Lines file as it arrives (``method="stream_to_storage"``).
+
+    Only the page being written is held by the sink, so peak memory is the
+    pages in flight rather than the whole result.
+
+    Args:
+        data_manager: `BaseDBManager` that owns the output file.
+        filename: Output file name without extension; also the metadata key.
+        max_records: Stop writing after this many records.
+        records_attr: Page attribute holding the list of records.
+    """
+
+    def __init__(
+        self,
+        data_manager: Any,
+        filename: str,
+        max_records: Optional[int] = None,
+        records_attr: str = "results",
+    ):
+        self._data_manager = data_manager
+        self._max_records = max_records
+        self._records_attr = records_attr
+        self._stack = ExitStack()
+        self._writer = self._stack.enter_context(
+            data_manager.open_json_lines(filename, key=filename)
+        )
+
+    def add(self, page: Any) -> None:
+        records = getattr(page, self._records_attr)
+        if self._max_records is not None:
+            records = records[:max(0, self._max_records - self._writer.count)]
+        self._writer.write(records)
+
+    def finish(self) -> Path:
+        self._stack.close()
+        self._data_manager.flush_metadata()
+        return self._writer.path
+
+    def close(self) -> None:
+        self._stack.close()
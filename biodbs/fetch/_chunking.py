@@ -0,0 +1,241 @@
+"""Adaptive ID-list chunking for batch endpoints.
+
+This module provides:
+    - ChunkLimits: Per-endpoint limits on IDs and bytes per request
+    - ChunkPlanner: Cuts ID lists into request-sized chunks and adapts the
+      chunk size to observed latency, timeouts and size rejections
+    - get_chunk_planner: Shared planner for a registered endpoint
+    - register_chunk_limits: Set or override an endpoint's limits
+
+Planners are shared by every fetcher and thread that calls an endpoint, so
+what one call learns (a 414 at 800 IDs, or 30-second responses) is used by
+the next. `BaseDataFetcher.chunked_process` runs the chunks concurrently,
+splits chunks the server rejects and returns results in input order.
+
+Example::
+
+    from biodbs.fetch import get_chunk_planner, register_chunk_limits
+
+    register_chunk_limits("ensembl.lookup_id", max_items=200)
+    planner = get_chunk_planner("ensembl.lookup_id")
+    planner.split(ids)      # [[...200 IDs], [...200 IDs], ...]
+    planner.chunk_size      # current adaptive size
+"""
+
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import requests
+
+from biodbs.exceptions import APITimeoutError
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses that mean "request too large"
+_OVERSIZE_STATUSES = (413, 414)
+
+
+@dataclass(frozen=True)
+class ChunkLimits:
+    """Request-size limits of one batch endpoint.
+
+    Attributes:
+        max_items: Most IDs the endpoint accepts per request.
+        max_bytes: Most bytes of joined IDs per request, for endpoints that
+            put the IDs in the URL. None means no byte limit.
+        separator: Separator used when counting joined bytes.
+        target_seconds: Chunks answered faster than a quarter of this grow
+            back towards ``max_items``; slower ones are halved.
+    """
+
+    max_items: int
+    max_bytes: Optional[int] = None
+    separator: str = ","
+    target_seconds: float = 10.0
+
+    def __post_init__(self):
+        if self.max_items < 1:
+            raise ValueError(f"max_items must be at least 1, got {self.max_items}")
+
+
+# Documented limits of the batch endpoints that send ID lists
+ENDPOINT_CHUNK_LIMITS: Dict[str, ChunkLimits] = {
+    "ensembl.lookup_id": ChunkLimits(max_items=1000),
+    "ensembl.sequence_id": ChunkLimits(max_items=50),
+    # IDs are joined into the URL path
+    "ncbi.gene_id": ChunkLimits(max_items=1000, max_bytes=4000),
+}
+
+
+class ChunkPlanner:
+    """Chooses how many IDs to send per request for one endpoint.
+
+    The chunk size starts at ``limits.max_items``. It is halved after a
+    timeout or a slow response and doubled (up to the ceiling) after fast
+    full-size responses. A size rejection (HTTP 413/414, or a 400 that goes
+    away when the chunk is split) also lowers the ceiling, so the planner
+    does not grow back to a size the server refused.
+
+    Attributes:
+        limits: The endpoint's `ChunkLimits`.
+    """
+
+    def __init__(self, limits: ChunkLimits):
+        """Initialize the planner at the endpoint's maximum chunk size.
+
+        Args:
+            limits: The endpoint's limits.
+        """
+        self.limits = limits
+        self._lock = threading.Lock()
+        self._size = limits.max_items
+        self._ceiling = limits.max_items
+
+    def __repr__(self) -> str:
+        return f"<ChunkPlanner size={self._size} ceiling={self._ceiling}>"
+
+    @property
+    def chunk_size(self) -> int:
+        """Current number of IDs per request."""
+        return self._size
+
+    def take(self, items: Sequence, start: int, max_items: Optional[int] = None) -> int:
+        """Return the end index of the next chunk of ``items`` from ``start``.
+
+        Args:
+            items: The full ID list.
+            start: Index of the chunk's first ID.
+            max_items: Optional caller cap on IDs per chunk (e.g. a page
+                size).
+
+        Returns:
+            End index (exclusive); the chunk holds at least one ID.
+        """
+        size = self._size if max_items is None else min(self._size, max_items)
+        end = min(len(items), start + max(1, size))
+        max_bytes = self.limits.max_bytes
+        if max_bytes is not None:
+            sep = len(self.limits.separator.encode())
+            used = -sep
+            for i in range(start, end):
+                used += sep + len(str(items[i]).encode())
+                if used > max_bytes and i > start:
+                    return i
+        return end
+
+    def split(self, items: Sequence, max_items: Optional[int] = None) -> List[Sequence]:
+        """Cut ``items`` into chunks of the current size.
+
+        Args:
+            items: IDs to split.
+            max_items: Optional caller cap on IDs per chunk.
+
+        Returns:
+            List of consecutive slices of ``items``.
+        """
+        chunks = []
+        start = 0
+        while start < len(items):
+            end = self.take(items, start, max_items)
+            chunks.append(items[start:end])
+            start = end
+        return chunks
+
+    def record_success(self, size: int, seconds: float):
+        """Adapt to a chunk of ``size`` IDs answered in ``seconds``."""
+        target = self.limits.target_seconds
+        with self._lock:
+            if seconds > target:
+                self._size = max(1, min(self._size, size // 2))
+            elif seconds < target / 4 and size >= self._size:
+                self._size = min(self._ceiling, self._size * 2)
+
+    def record_failure(self, size: int, oversize: bool):
+        """Shrink after a chunk of ``size`` IDs failed.
+
+        Args:
+            size: IDs in the failed chunk.
+            oversize: True for a size rejection, which also caps future
+                growth; False for a timeout.
+        """
+        with self._lock:
+            half = max(1, size // 2)
+            if oversize:
+                self._ceiling = min(self._ceiling, half)
+            self._size = min(self._size, half)
+        logger.debug("Chunk of %d IDs failed; chunk size now %d", size, self._size)
+
+    def record_rejection_cleared(self, size: int):
+        """Cap growth at ``size`` IDs after a split 400-rejected chunk succeeded.
+
+        Args:
+            size: IDs in the half that the server accepted.
+        """
+        with self._lock:
+            self._ceiling = min(self._ceiling, max(1, size))
+            self._size = min(self._size, self._ceiling)
+
+    @staticmethod
+    def failure_kind(error: BaseException) -> Optional[str]:
+        """Classify an exception raised for a chunk.
+
+        Returns:
+            ``"oversize"`` for HTTP 413/414, ``"rejected"`` for HTTP 400
+            (possibly caused by size), ``"timeout"`` for timeouts, or None
+            when splitting the chunk cannot help.
+        """
+        if isinstance(error, (APITimeoutError, requests.exceptions.Timeout, asyncio.TimeoutError)):
+            return "timeout"
+        status = getattr(error, "status_code", None)
+        if status in _OVERSIZE_STATUSES:
+            return "oversize"
+        if status == 400:
+            return "rejected"
+        return None
+
+
+_planners: Dict[str, ChunkPlanner] = {}
+_planners_lock = threading.Lock()
+
+
+def get_chunk_planner(endpoint: str) -> ChunkPlanner:
+    """Get the shared planner for a registered batch endpoint.
+
+    Args:
+        endpoint: Endpoint name, e.g. ``"ensembl.lookup_id"``.
+
+    Raises:
+        ValueError: If the endpoint has no registered limits.
+    """
+    planner = _planners.get(endpoint)
+    if planner is None:
+        limits = ENDPOINT_CHUNK_LIMITS.get(endpoint)
+        if limits is None:
+            raise ValueError(
+                f"No chunk limits registered for '{endpoint}'. "
+                f"Known: {sorted(ENDPOINT_CHUNK_LIMITS)}"
+            )
+        with _planners_lock:
+            planner = _planners.setdefault(endpoint, ChunkPlanner(limits))
+    return planner
+
+
+def register_chunk_limits(endpoint: str, max_items: int, **kwargs) -> ChunkPlanner:
+    """Set an endpoint's chunk limits and reset its planner.
+
+    Args:
+        endpoint: Endpoint name, e.g. ``"ncbi.gene_id"``.
+        max_items: Most IDs per request.
+        **kwargs: Other `ChunkLimits` fields.
+
+    Returns:
+        The endpoint's new planner.
+    """
+    limits = ChunkLimits(max_items=max_items, **kwargs)
+    with _planners_lock:
+        ENDPOINT_CHUNK_LIMITS[endpoint] = limits
+        planner = _planners[endpoint] = ChunkPlanner(limits)
+    return planner
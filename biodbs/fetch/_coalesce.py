@@ -0,0 +1,254 @@
+"""Single-flight coalescing of identical in-flight HTTP requests.
+
+This module provides:
+    - RequestCoalescer: Merges concurrent identical requests (same method,
+      URL, query, body and headers) into one network call and hands the
+      response to every caller
+    - get_request_coalescer: Access the global coalescer
+    - enable_request_coalescing: Turn coalescing on (the default)
+    - disable_request_coalescing: Turn it off
+
+Like the response cache, the coalescer sits inside the shared `SessionPool`
+(see `biodbs.fetch._session`), so every fetcher benefits without code
+changes. Threads coalesce with other threads and coroutines with other
+coroutines on the same event loop. Only the call that actually goes to the
+network draws a rate-limit token; the others wait for its response, so a
+burst of identical lookups costs one request of the host's budget.
+
+Example::
+
+    from biodbs.fetch import get_request_coalescer
+
+    coalescer = get_request_coalescer()
+    ...  # run many concurrent queries
+    print(coalescer.stats())
+    # {'requests': 40, 'executed': 3, 'coalesced': 37, 'in_flight': 0}
+"""
+
+import asyncio
+import threading
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from biodbs.fetch._http_cache import ResponseCache
+
+T = TypeVar("T")
+
+
+class _Flight:
+    """One in-flight request shared by a leader thread and its followers."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class RequestCoalescer:
+    """Merge concurrent identical requests into a single network call.
+
+    The first caller for a key (the leader) sends the request; callers that
+    arrive with the same key while it is in flight wait for its outcome and
+    receive the same response, or the same exception. Streaming requests,
+    file uploads and requests with options that affect the transport
+    (``auth``, ``cookies``, ``verify``, ...) are never coalesced.
+
+    Attributes:
+        methods: HTTP methods eligible for coalescing.
+        enabled: Whether coalescing is active.
+
+    Example::
+
+        coalescer = RequestCoalescer()
+        key = coalescer.key("GET", "https://rest.kegg.jp/link/pathway/hsa")
+        response, shared = coalescer.run(key, send)
+    """
+
+    # Methods coalesced by default; POST bodies are part of the key
+    DEFAULT_METHODS = ("GET", "HEAD", "POST")
+    # Request options that may differ without making requests distinct
+    _KEY_OPTIONS = frozenset({"params", "data", "json", "headers", "timeout", "allow_redirects"})
+
+    def __init__(self, methods: Iterable[str] = DEFAULT_METHODS, enabled: bool = True):
+        """Initialize the coalescer.
+
+        Args:
+            methods: HTTP methods eligible for coalescing.
+            enabled: Start enabled.
+        """
+        self.methods = frozenset(m.upper() for m in methods)
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._tasks: Dict[Tuple[Any, Hashable], "asyncio.Task"] = {}
+        self._requests = 0
+        self._coalesced = 0
+
+    def __repr__(self) -> str:
+        state = "enabled" if self.enabled else "disabled"
+        return (
+            f"<RequestCoalescer {state} requests={self._requests} "
+            f"coalesced={self._coalesced}>"
+        )
+
+    def key(self, method: str, url: str, **kwargs: Any) -> Optional[Hashable]:
+        """Return the coalescing key for a request, or None if it must run alone.
+
+        Args:
+            method: HTTP method.
+            url: Request URL.
+            **kwargs: ``requests``-style options (``params``, ``data``,
+                ``json``, ``headers``, ...).
+        """
+        method = method.upper()
+        if not self.enabled or method not in self.methods:
+            return None
+        if any(value for name, value in kwargs.items() if name not in self._KEY_OPTIONS):
+            return None
+        data = kwargs.get("data")
+        if data is not None and not isinstance(data, (str, bytes, Mapping)):
+            return None
+        try:
+            digest, _ = ResponseCache.make_key(
+                method, url, kwargs.get("params"), data, kwargs.get("json")
+            )
+        except (TypeError, ValueError):
+            return None
+        headers = kwargs.get("headers") or {}
+        return digest, tuple(sorted((str(k).lower(), str(v)) for k, v in headers.items()))
+
+    def run(self, key: Hashable, send: Callable[[], T]) -> Tuple[T, bool]:
+        """Call ``send`` unless an identical request is already in flight.
+
+        Args:
+            key: Key from `key`.
+            send: Sends the request and returns the response.
+
+        Returns:
+            Tuple of (response, shared). ``shared`` is True when the response
+            came from another caller's request.
+
+        Raises:
+            Exception: Whatever ``send`` raised, in the leader and in every
+                caller that waited for it.
+        """
+        with self._lock:
+            self._requests += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, True
+
+        try:
+            flight.result = send()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result, False
+
+    async def arun(
+        self, key: Hashable, send: Callable[[], Awaitable[T]]
+    ) -> Tuple[T, bool]:
+        """Coroutine version of `run` for requests on the running event loop.
+
+        The request runs as its own task, so a waiter being cancelled does
+        not cancel the request for the others.
+        """
+        loop = asyncio.get_running_loop()
+        task_key = (loop, key)
+        with self._lock:
+            self._requests += 1
+            task = self._tasks.get(task_key)
+            shared = task is not None
+            if shared:
+                self._coalesced += 1
+            else:
+                task = loop.create_task(send())
+                self._tasks[task_key] = task
+                task.add_done_callback(lambda done: self._forget(task_key, done))
+        return await asyncio.shield(task), shared
+
+    def _forget(self, task_key: Tuple[Any, Hashable], task: "asyncio.Task"):
+        with self._lock:
+            if self._tasks.get(task_key) is task:
+                del self._tasks[task_key]
+        if not task.cancelled():
+            task.exception()  # retrieved by the waiters, or by nobody
+
+    def stats(self) -> Dict[str, int]:
+        """Return coalescing counters.
+
+        Returns:
+            Dict with ``requests`` (calls seen), ``executed`` (calls sent to
+            the network), ``coalesced`` (calls answered by another caller's
+            request) and ``in_flight`` (requests currently running).
+        """
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "executed": self._requests - self._coalesced,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._flights) + len(self._tasks),
+            }
+
+    def reset_stats(self):
+        """Zero the ``requests`` and ``coalesced`` counters."""
+        with self._lock:
+            self._requests = 0
+            self._coalesced = 0
+
+
+# Global coalescer used by the shared session pool
+_request_coalescer = RequestCoalescer()
+
+
+def get_request_coalescer() -> RequestCoalescer:
+    """Get the global request coalescer."""
+    return _request_coalescer
+
+
+def enable_request_coalescing(methods: Optional[Iterable[str]] = None) -> RequestCoalescer:
+    """Coalesce identical in-flight requests made through the session pool.
+
+    Coalescing is on by default; call this to turn it back on or to change
+    which methods are coalesced.
+
+    Args:
+        methods: HTTP methods to coalesce; None keeps the current set.
+
+    Returns:
+        The global `RequestCoalescer`.
+    """
+    if methods is not None:
+        _request_coalescer.methods = frozenset(m.upper() for m in methods)
+    _request_coalescer.enabled = True
+    return _request_coalescer
+
+
+def disable_request_coalescing():
+    """Send every request separately, even when identical ones are in flight."""
+    _request_coalescer.enabled = False
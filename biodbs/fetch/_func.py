@@ -124,6 +124,7 @@ from biodbs.fetch.QuickGO.funcs import (
     quickgo_search_annotations,
     quickgo_search_annotations_all,
     quickgo_download_annotations,
+    quickgo_iter_annotations,
     quickgo_get_gene_product,
 )
 
@@ -315,6 +316,7 @@ __all__ = [
     "quickgo_search_annotations",
     "quickgo_search_annotations_all",
     "quickgo_download_annotations",
+    "quickgo_iter_annotations",
     "quickgo_get_gene_product",
     # FDA
     "fda_search",
@@ -0,0 +1,540 @@
+"""Persistent on-disk HTTP response cache for API fetchers.
+
+This module provides:
+    - ResponseCache: SQLite-backed response store with per-host TTLs,
+      ``ETag`` / ``Last-Modified`` revalidation and size-bounded LRU eviction
+    - CachedResponse: A stored response as returned by `ResponseCache.lookup`
+    - enable_response_cache: Turn the cache on for every fetcher
+    - disable_response_cache: Turn it off again
+    - get_response_cache: Access the active cache (``None`` when disabled)
+
+The cache sits below the fetchers, inside the shared `SessionPool`
+(see `biodbs.fetch._session`), so every fetcher benefits without code
+changes. It is opt-in: nothing is cached until `enable_response_cache` is
+called. Fresh hits are answered from disk without touching the network or
+the per-host rate limiter; stale entries that carry a validator are
+revalidated with a conditional request, and a ``304 Not Modified`` reply
+refreshes the stored copy instead of downloading the body again.
+
+`ResponseCache` is a `BaseDBManager`, so it lives in the same storage
+directory layout as the fetchers' data managers::
+
+    from biodbs.fetch import enable_response_cache
+
+    cache = enable_response_cache("~/.biodbs", default_ttl=86400)
+    cache.set_ttl("rest.kegg.jp", 7 * 86400)   # KEGG releases are monthly
+    cache.set_ttl("www.ebi.ac.uk", 3600)
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, Union
+
+from biodbs.data._base import BaseDBManager
+
+logger = logging.getLogger(__name__)
+
+
+class CachedResponse:
+    """A response stored in the `ResponseCache`.
+
+    Attributes:
+        key: Cache key (see `ResponseCache.make_key`).
+        url: Final URL of the original request.
+        status_code: HTTP status code.
+        headers: Response headers.
+        content: Raw response body.
+        etag: ``ETag`` validator, if the server sent one.
+        last_modified: ``Last-Modified`` validator, if the server sent one.
+        expires_at: Epoch seconds after which the entry must be revalidated.
+    """
+
+    __slots__ = (
+        "key", "url", "status_code", "headers", "content",
+        "etag", "last_modified", "expires_at",
+    )
+
+    def __init__(
+        self,
+        key: str,
+        url: str,
+        status_code: int,
+        headers: Dict[str, str],
+        content: bytes,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        expires_at: float,
+    ):
+        self.key = key
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+
+    def __repr__(self) -> str:
+        state = "fresh" if self.is_fresh else "stale"
+        return f"<CachedResponse [{self.status_code}] {state} {self.url}>"
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    @property
+    def can_revalidate(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers that turn a request into a revalidation of this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache(BaseDBManager):
+    """SQLite-backed HTTP response cache.
+
+    Responses are keyed by method, fully encoded URL (including query
+    parameters), request body and the content negotiation headers
+    (``Accept``, ``Accept-Language``, ``Content-Type``), so identical
+    queries from any fetcher share one entry while e.g. FASTA and JSON
+    representations of the same URL are kept apart. Each entry expires after the TTL of its host (see
+    `set_ttl`), falling back to ``default_ttl``. The total stored body size
+    is bounded by ``max_bytes``; when it is exceeded the least recently used
+    entries are evicted.
+
+    One SQLite connection is shared by all threads and guarded by a lock;
+    the database runs in WAL mode so other processes can read it
+    concurrently.
+
+    Example::
+
+        cache = ResponseCache("/data/biodbs", max_bytes=256 * 1024 * 1024)
+        cache.set_ttl("rest.kegg.jp", 7 * 86400)
+        cache.stats()
+    """
+
+    # Default lifetime of an entry, in seconds
+    DEFAULT_TTL = 24 * 3600
+    # Default upper bound on the summed size of stored bodies, in bytes
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+    # Eviction trims the cache to this fraction of max_bytes so that a full
+    # cache does not evict on every store
+    EVICT_TO = 0.9
+    # Only requests with these methods are looked up and stored
+    DEFAULT_METHODS = ("GET",)
+    # Only responses with these status codes are stored
+    DEFAULT_STATUSES = (200, 203, 300, 301, 404, 410)
+    # Request headers that select a representation and so belong in the key
+    KEY_HEADERS = ("accept", "accept-language", "content-type")
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            method TEXT NOT NULL,
+            url TEXT NOT NULL,
+            host TEXT NOT NULL,
+            status INTEGER NOT NULL,
+            headers TEXT NOT NULL,
+            body BLOB NOT NULL,
+            etag TEXT,
+            last_modified TEXT,
+            stored_at REAL NOT NULL,
+            expires_at REAL NOT NULL,
+            accessed_at REAL NOT NULL,
+            size INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at);
+        CREATE INDEX IF NOT EXISTS idx_responses_host ON responses (host);
+    """
+
+    def __init__(
+        self,
+        storage_path: Union[str, Path],
+        db_name: str = "http_cache",
+        default_ttl: float = DEFAULT_TTL,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        host_ttls: Optional[Mapping[str, float]] = None,
+        methods: Iterable[str] = DEFAULT_METHODS,
+        statuses: Iterable[int] = DEFAULT_STATUSES,
+    ):
+        """Open (or create) the cache database.
+
+        Args:
+            storage_path: Directory holding ``{db_name}.db``.
+            db_name: Database file name without extension.
+            default_ttl: Lifetime in seconds for hosts without their own TTL.
+            max_bytes: Upper bound on the total size of stored bodies.
+            host_ttls: Mapping of host -> TTL in seconds. A host also
+                matches its subdomains (``"ebi.ac.uk"`` covers
+                ``"www.ebi.ac.uk"``); a TTL of 0 disables caching for it.
+            methods: HTTP methods whose responses are cached. Add ``"POST"``
+                for APIs whose POST queries are pure reads.
+            statuses: HTTP status codes that are cached.
+        """
+        super().__init__(Path(storage_path).expanduser(), db_name=db_name)
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self.methods = frozenset(m.upper() for m in methods)
+        self.statuses = frozenset(statuses)
+        self._host_ttls: Dict[str, float] = dict(host_ttls or {})
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._revalidated = 0
+
+        self.db_path = self.storage_path / f"{db_name}.db"
+        self._conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self._SCHEMA)
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    @classmethod
+    def from_manager(cls, manager: BaseDBManager, **kwargs: Any) -> "ResponseCache":
+        """Create a cache in the storage directory of an existing data manager.
+
+        Args:
+            manager: Any `BaseDBManager` (e.g. a fetcher's data manager).
+            **kwargs: Forwarded to `ResponseCache`.
+        """
+        return cls(manager.storage_path, **kwargs)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ResponseCache path='{self.db_path}' entries={len(self)} "
+            f"bytes={self._total_bytes}>"
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def close(self):
+        """Close the database connection."""
+        conn = getattr(self, "_conn", None)
+        if conn is not None:
+            conn.close()
+            self._conn = None
+
+    # -- configuration ----------------------------------------------------
+
+    def set_ttl(self, host: str, seconds: float):
+        """Set the lifetime of entries for ``host`` and its subdomains.
+
+        Args:
+            host: Host name (e.g. ``"rest.kegg.jp"``).
+            seconds: TTL in seconds; 0 disables caching for the host.
+        """
+        self._host_ttls[host] = seconds
+
+    def ttl_for(self, host: str) -> float:
+        """Return the TTL that applies to ``host``."""
+        candidate = host
+        while candidate:
+            if candidate in self._host_ttls:
+                return self._host_ttls[candidate]
+            _, _, candidate = candidate.partition(".")
+        return self.default_ttl
+
+    # -- keys -------------------------------------------------------------
+
+    @classmethod
+    def make_key(
+        cls,
+        method: str,
+        url: str,
+        params: Optional[Any] = None,
+        data: Optional[Any] = None,
+        json_body: Optional[Any] = None,
+        headers: Optional[Mapping[str, Any]] = None,
+    ) -> Tuple[str, str]:
+        """Build the cache key for a request.
+
+        The URL is encoded with the same rules ``requests`` uses to send it,
+        so ``params`` given as a dict or already baked into the URL produce
+        the same key.
+
+        Args:
+            method: HTTP method.
+            url: Request URL.
+            params: Query parameters.
+            data: Form or raw request body.
+            json_body: JSON request body.
+            headers: Request headers; only the `KEY_HEADERS` are used.
+
+        Returns:
+            Tuple of (hex digest key, fully encoded URL).
+        """
+        from requests.models import PreparedRequest
+
+        prepared = PreparedRequest()
+        prepared.prepare_url(url, params)
+        full_url = prepared.url
+
+        if json_body is not None:
+            body = json.dumps(json_body, sort_keys=True, separators=(",", ":")).encode()
+        elif isinstance(data, Mapping):
+            body = json.dumps(sorted(data.items()), default=str).encode()
+        elif isinstance(data, str):
+            body = data.encode()
+        else:
+            body = data or b""
+
+        digest = hashlib.sha256()
+        digest.update(method.upper().encode())
+        digest.update(b"\n")
+        digest.update(full_url.encode())
+        digest.update(b"\n")
+        digest.update(body)
+        negotiation = sorted(
+            (str(name).lower(), str(value))
+            for name, value in (headers or {}).items()
+            if str(name).lower() in cls.KEY_HEADERS and value is not None
+        )
+        for name, value in negotiation:
+            digest.update(f"\n{name}: {value}".encode())
+        return digest.hexdigest(), full_url
+
+    def is_cacheable_request(self, method: str, **kwargs: Any) -> bool:
+        """Whether a request with these ``requests`` keyword arguments may be cached.
+
+        Streaming downloads and multipart uploads always bypass the cache.
+        """
+        if method.upper() not in self.methods:
+            return False
+        if kwargs.get("stream") or kwargs.get("files"):
+            return False
+        data = kwargs.get("data")
+        return data is None or isinstance(data, (str, bytes, Mapping))
+
+    # -- lookup / store ---------------------------------------------------
+
+    def lookup(self, key: str) -> Optional[CachedResponse]:
+        """Return the entry for ``key`` (fresh or stale), or ``None``."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status, headers, body, etag, last_modified, expires_at "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            entry = CachedResponse(
+                key, row[0], row[1], json.loads(row[2]), bytes(row[3]),
+                row[4], row[5], row[6],
+            )
+            if entry.is_fresh:
+                self._hits += 1
+                self._conn.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+            else:
+                self._misses += 1
+        return entry
+
+    def store(
+        self,
+        key: str,
+        method: str,
+        url: str,
+        status_code: int,
+        headers: Mapping[str, str],
+        content: bytes,
+    ) -> bool:
+        """Store a response, honouring per-host TTLs and ``Cache-Control: no-store``.
+
+        Args:
+            key: Key from `make_key`.
+            method: HTTP method of the request.
+            url: Final response URL.
+            status_code: HTTP status code.
+            headers: Response headers.
+            content: Response body.
+
+        Returns:
+            True if the response was stored.
+        """
+        from urllib.parse import urlsplit
+
+        if status_code not in self.statuses:
+            return False
+        if "no-store" in headers.get("Cache-Control", "").lower():
+            return False
+        host = urlsplit(url).netloc
+        ttl = self.ttl_for(host)
+        size = len(content)
+        if ttl <= 0 or size > self.max_bytes:
+            return False
+
+        now = time.time()
+        stored_headers = {
+            k: v for k, v in headers.items()
+            # The body is stored decoded, so transfer encodings no longer apply
+            if k.lower() not in ("content-encoding", "transfer-encoding", "content-length")
+        }
+        with self._lock:
+            old = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key, method.upper(), url, host, status_code,
+                    json.dumps(stored_headers), sqlite3.Binary(content),
+                    headers.get("ETag"), headers.get("Last-Modified"),
+                    now, now + ttl, now, size,
+                ),
+            )
+            self._total_bytes += size - (old[0] if old else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict(int(self.max_bytes * self.EVICT_TO))
+        return True
+
+    def refresh(self, entry: CachedResponse, headers: Mapping[str, str]):
+        """Extend a stale entry after the server answered ``304 Not Modified``.
+
+        Args:
+            entry: The revalidated entry; its ``expires_at`` is updated in place.
+            headers: Headers of the 304 response (may carry new validators).
+        """
+        from urllib.parse import urlsplit
+
+        now = time.time()
+        entry.expires_at = now + self.ttl_for(urlsplit(entry.url).netloc)
+        entry.etag = headers.get("ETag") or entry.etag
+        entry.last_modified = headers.get("Last-Modified") or entry.last_modified
+        with self._lock:
+            self._revalidated += 1
+            self._conn.execute(
+                "UPDATE responses SET expires_at = ?, accessed_at = ?, etag = ?, "
+                "last_modified = ? WHERE key = ?",
+                (entry.expires_at, now, entry.etag, entry.last_modified, entry.key),
+            )
+
+    def _evict(self, target_bytes: int):
+        # Caller holds the lock
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        )
+        victims = []
+        total = self._total_bytes
+        for key, size in rows:
+            if total <= target_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self._total_bytes = total
+        logger.debug("Evicted %d cached responses", len(victims))
+
+    # -- cache management -------------------------------------------------
+
+    def clear_cache(self, key: Optional[str] = None):
+        """Delete cached responses.
+
+        Args:
+            key: A cache key or a host name; deletes every entry when omitted.
+        """
+        with self._lock:
+            if key is None:
+                self._conn.execute("DELETE FROM responses")
+            else:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key = ? OR host = ?", (key, key)
+                )
+            self._total_bytes = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+
+    def purge_expired(self) -> int:
+        """Delete expired entries that cannot be revalidated.
+
+        Returns:
+            Number of deleted entries.
+        """
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM responses WHERE expires_at <= ? "
+                "AND etag IS NULL AND last_modified IS NULL",
+                (time.time(),),
+            )
+            self._total_bytes = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+        return cur.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and size information."""
+        return {
+            "entries": len(self),
+            "total_bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "revalidated": self._revalidated,
+        }
+
+
+# Active response cache; None while caching is disabled
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Get the active response cache, or ``None`` if caching is disabled."""
+    return _response_cache
+
+
+def enable_response_cache(
+    storage_path: Union[str, Path, BaseDBManager, ResponseCache] = "~/.biodbs",
+    **kwargs: Any,
+) -> ResponseCache:
+    """Enable the persistent response cache for all fetchers.
+
+    Args:
+        storage_path: Directory for the cache database, a `BaseDBManager`
+            whose storage directory should be reused, or a ready
+            `ResponseCache`.
+        **kwargs: Forwarded to `ResponseCache` (``default_ttl``,
+            ``max_bytes``, ``host_ttls``, ``methods``, ``statuses``).
+
+    Returns:
+        The active `ResponseCache`.
+    """
+    global _response_cache
+    if isinstance(storage_path, ResponseCache):
+        cache = storage_path
+    elif isinstance(storage_path, BaseDBManager):
+        cache = ResponseCache.from_manager(storage_path, **kwargs)
+    else:
+        cache = ResponseCache(storage_path, **kwargs)
+    _response_cache = cache
+    return cache
+
+
+def disable_response_cache():
+    """Disable the response cache; the database is kept on disk."""
+    global _response_cache
+    _response_cache = None
@@ -1,19 +1,25 @@
 """Rate limiting and retry utilities for API fetchers.
 
 This module provides:
-    - RateLimiter: Per-host rate limiting to prevent API throttling
+    - TokenBucket: Token bucket with burst capacity and adaptive back-off
+    - RateLimiter: Per-host token buckets shared by threads and coroutines
     - retry_with_backoff: Decorator for automatic retry with exponential backoff
     - request_with_retry: Helper function for making rate-limited requests with retry
+      over the shared session pool (see `biodbs.fetch._session`)
+    - async_request_with_retry: Coroutine counterpart of `request_with_retry`
+      for the native asyncio fetcher API
 """
 
+import asyncio
 import time
 import logging
 import threading
-from collections import defaultdict
 from typing import Callable, Optional, TypeVar, Any, Dict
+from contextlib import nullcontext
 from functools import wraps
 import requests
 
+from biodbs.fetch._session import AsyncResponse, deferred_pacing, session_pool
 from biodbs.exceptions import (
     APIServerError,
     APIRateLimitError,
@@ -27,11 +33,120 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+class TokenBucket:
+    """Token bucket for a single host.
+
+    The bucket holds up to ``capacity`` tokens and refills at the effective
+    rate (tokens per second). A caller *reserves* a token and is told how
+    long to wait for it: when the bucket is empty it goes into debt, so
+    waiting happens outside the lock and callers are served in arrival
+    order whether they are threads or coroutines.
+
+    Back-off is additive-increase / multiplicative-decrease: `penalize`
+    (on HTTP 429) halves the effective rate, down to ``MIN_RATE_FACTOR`` of
+    the configured rate, and stops refilling until any ``Retry-After`` has
+    passed; each `recover` (on success) restores ``RECOVERY_STEP`` of the
+    configured rate.
+
+    Attributes:
+        rate: Configured requests per second.
+        capacity: Maximum burst size in requests.
+        effective_rate: Current rate after back-off.
+        tokens: Available tokens; negative while callers are queued.
+    """
+
+    # Floor for the effective rate, as a fraction of the configured rate
+    MIN_RATE_FACTOR = 0.1
+    # Fraction of the configured rate regained per successful response
+    RECOVERY_STEP = 0.1
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.effective_rate = self.rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"<TokenBucket rate={self.effective_rate:g}/{self.rate:g} "
+            f"capacity={self.capacity:g} tokens={self.tokens:.2f}>"
+        )
+
+    def _refill(self, now: float):
+        if now > self.updated:
+            self.tokens = min(
+                self.capacity,
+                self.tokens + (now - self.updated) * self.effective_rate,
+            )
+            self.updated = now
+
+    def configure(self, rate: float, capacity: float):
+        """Change the configured rate and burst, clearing any back-off."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = self.effective_rate = float(rate)
+            self.capacity = float(capacity)
+            self.tokens = min(self.tokens, self.capacity)
+
+    def reserve(self) -> float:
+        """Take one token and return the seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1.0
+            return (
+                max(0.0, self.updated - now)
+                + max(0.0, -self.tokens) / self.effective_rate
+            )
+
+    def try_take(self) -> bool:
+        """Take one token only if it can be used right now."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self.updated <= now and self.tokens >= 1.0:
+                self.tokens -= 1.0
+                return True
+            return False
+
+    def penalize(self, retry_after: Optional[float] = None):
+        """Back off after a 429 response.
+
+        Args:
+            retry_after: Seconds the server asked us to wait, if given.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.effective_rate = max(
+                self.rate * self.MIN_RATE_FACTOR, self.effective_rate / 2
+            )
+            self.tokens = min(self.tokens, 1.0)
+            if retry_after:
+                self.updated = max(self.updated, now + retry_after)
+
+    def recover(self):
+        """Step the effective rate back towards the configured rate."""
+        if self.effective_rate >= self.rate:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self.effective_rate = min(
+                self.rate, self.effective_rate + self.rate * self.RECOVERY_STEP
+            )
+
+
 class RateLimiter:
-    """Thread-safe rate limiter that enforces requests per second limits.
+    """Thread-safe per-host rate limiter shared by all fetchers.
 
-    Uses a token bucket algorithm to smooth out request rates.
-    Each API host can have its own rate limit.
+    Each API host gets a `TokenBucket` with its own rate and burst size.
+    Threads (`acquire`), coroutines (`acquire_async`) and `schedule_process`
+    all draw from the same buckets, so mixed sync/async workloads against
+    one host stay within its limit. Responses feed back into the buckets:
+    `report_rate_limited` backs off on HTTP 429 and honours ``Retry-After``,
+    `report_success` ramps the rate back up.
 
     This class follows the Open-Closed Principle: it provides generic
     rate limiting without knowledge of specific APIs. Each fetcher
@@ -41,9 +156,14 @@ class RateLimiter:
 
         limiter = RateLimiter()
         limiter.set_rate("api.ncbi.nlm.nih.gov", 5)  # 5 requests per second
+        limiter.set_rate("rest.ensembl.org", 15, burst=5)
 
         # Before each request:
         limiter.acquire("api.ncbi.nlm.nih.gov")
+
+        # Or, without blocking:
+        if limiter.try_acquire("rest.ensembl.org"):
+            ...
     """
 
     # Global instance for sharing across fetchers
@@ -52,6 +172,8 @@ class RateLimiter:
 
     # Default fallback rate when no specific rate is registered
     DEFAULT_RATE = 10
+    # Default burst size; 1 spaces requests strictly at 1/rate
+    DEFAULT_BURST = 1
 
     def __new__(cls) -> "RateLimiter":
         """Singleton pattern to share rate limiter across all fetchers."""
@@ -66,38 +188,106 @@ class RateLimiter:
         if self._initialized:
             return
         self._initialized = True
-        self._rates: Dict[str, float] = {}  # host -> requests per second
-        self._last_request: Dict[str, float] = defaultdict(float)  # host -> timestamp
-        self._request_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+        self._rates: Dict[str, float] = {}  # registered host -> requests per second
+        self._bursts: Dict[str, float] = {}  # registered host -> burst size
+        self._resolved: Dict[str, Optional[str]] = {}  # host -> registered host
+        self._buckets: Dict[str, TokenBucket] = {}  # host -> bucket
         self._global_lock = threading.Lock()
 
-    def set_rate(self, host: str, requests_per_second: float):
+    def _resolve(self, host: str) -> Optional[str]:
+        """Map a host to the registered host whose limits apply to it.
+
+        The substring scan over registered hosts runs once per host; the
+        answer is cached until the set of registered hosts changes, so
+        per-request lookups are O(1).
+        """
+        try:
+            return self._resolved[host]
+        except KeyError:
+            pass
+        with self._global_lock:
+            if host in self._rates:
+                key = host
+            else:
+                key = next(
+                    (r for r in self._rates if r in host or host in r), None
+                )
+            self._resolved[host] = key
+        return key
+
+    def set_rate(
+        self,
+        host: str,
+        requests_per_second: float,
+        burst: Optional[float] = None,
+    ):
         """Set rate limit for a specific host.
 
         Args:
             host: API hostname (e.g., "api.ncbi.nlm.nih.gov")
-            requests_per_second: Maximum requests per second
+            requests_per_second: Maximum sustained requests per second
+            burst: Maximum number of requests that may be sent back to back
+                (default `DEFAULT_BURST`)
         """
         with self._global_lock:
+            is_new = host not in self._rates
             self._rates[host] = requests_per_second
+            self._bursts[host] = burst if burst is not None else self.DEFAULT_BURST
+            if is_new:
+                self._resolved.clear()
+            buckets = list(self._buckets.items())
+        for bucket_host, bucket in buckets:
+            if self._resolve(bucket_host) == host:
+                bucket.configure(requests_per_second, self._bursts[host])
 
-    def get_rate(self, host: str) -> float:
-        """Get rate limit for a host.
+    def setdefault_rate(self, host: str, requests_per_second: float) -> float:
+        """Register a rate for a host unless one was set explicitly.
+
+        Lets callers supply a fallback rate without overriding limits set by
+        fetchers or by the test/CI configuration.
 
         Args:
             host: API hostname
+            requests_per_second: Rate to use if none is registered
 
         Returns:
-            Requests per second limit (DEFAULT_RATE if not set)
+            The rate now in effect for the host.
         """
         with self._global_lock:
             if host in self._rates:
                 return self._rates[host]
-            # Check if any registered host is a substring match
-            for registered_host, rate in self._rates.items():
-                if registered_host in host or host in registered_host:
-                    return rate
+        self.set_rate(host, requests_per_second)
+        return requests_per_second
+
+    def get_rate(self, host: str) -> float:
+        """Get rate limit for a host.
+
+        Args:
+            host: API hostname
+
+        Returns:
+            Requests per second limit (DEFAULT_RATE if not set)
+        """
+        key = self._resolve(host)
+        if key is None:
             return self.DEFAULT_RATE
+        return self._rates.get(key, self.DEFAULT_RATE)
+
+    def get_burst(self, host: str) -> float:
+        """Get the burst size for a host (DEFAULT_BURST if not set)."""
+        key = self._resolve(host)
+        if key is None:
+            return self.DEFAULT_BURST
+        return self._bursts.get(key, self.DEFAULT_BURST)
+
+    def bucket(self, host: str) -> TokenBucket:
+        """Return the token bucket for a host, creating it on first use."""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            rate, burst = self.get_rate(host), self.get_burst(host)
+            with self._global_lock:
+                bucket = self._buckets.setdefault(host, TokenBucket(rate, burst))
+        return bucket
 
     def acquire(self, host: str):
         """Acquire permission to make a request, blocking if necessary.
@@ -108,26 +298,52 @@ class RateLimiter:
         Args:
             host: API hostname
         """
-        rate = self.get_rate(host)
-        min_interval = 1.0 / rate
+        delay = self.bucket(host).reserve()
+        if delay > 0:
+            logger.debug(f"Rate limiting {host}: sleeping {delay:.3f}s")
+            time.sleep(delay)
 
-        # Get lock for this specific host
-        with self._global_lock:
-            if host not in self._request_locks:
-                self._request_locks[host] = threading.Lock()
-            lock = self._request_locks[host]
+    def try_acquire(self, host: str) -> bool:
+        """Take a request slot only if one is available immediately.
 
-        with lock:
-            now = time.time()
-            last = self._last_request[host]
-            elapsed = now - last
+        Args:
+            host: API hostname
+
+        Returns:
+            True if the caller may send a request now, False otherwise.
+        """
+        return self.bucket(host).try_take()
+
+    async def acquire_async(self, host: str):
+        """Coroutine version of `acquire` that never blocks the event loop.
+
+        Args:
+            host: API hostname
+        """
+        delay = self.bucket(host).reserve()
+        if delay > 0:
+            logger.debug(f"Rate limiting {host}: awaiting {delay:.3f}s")
+            await asyncio.sleep(delay)
+
+    def report_rate_limited(self, host: str, retry_after: Optional[float] = None):
+        """Back off a host after an HTTP 429 response.
 
-            if elapsed < min_interval:
-                sleep_time = min_interval - elapsed
-                logger.debug(f"Rate limiting {host}: sleeping {sleep_time:.3f}s")
-                time.sleep(sleep_time)
+        Halves the host's effective rate and, if the server sent a
+        ``Retry-After``, holds all further requests to the host until it
+        has elapsed.
 
-            self._last_request[host] = time.time()
+        Args:
+            host: API hostname
+            retry_after: Seconds from the ``Retry-After`` header, if any
+        """
+        logger.debug(f"Backing off {host} (retry_after={retry_after})")
+        self.bucket(host).penalize(retry_after)
+
+    def report_success(self, host: str):
+        """Let a backed-off host ramp its rate back up after a good response."""
+        bucket = self._buckets.get(host)
+        if bucket is not None:
+            bucket.recover()
 
     def reset(self, host: Optional[str] = None):
         """Reset rate limiter state.
@@ -137,9 +353,10 @@ class RateLimiter:
         """
         with self._global_lock:
             if host:
-                self._last_request[host] = 0
+                self._buckets.pop(host, None)
             else:
-                self._last_request.clear()
+                self._buckets.clear()
+                self._resolved.clear()
 
 
 # Global rate limiter instance
@@ -151,6 +368,17 @@ def get_rate_limiter() -> RateLimiter:
     return _rate_limiter
 
 
+def _parse_retry_after(response: Any) -> Optional[float]:
+    """Return the ``Retry-After`` header in seconds, if present and numeric."""
+    raw = response.headers.get("Retry-After")
+    if raw:
+        try:
+            return float(raw)
+        except ValueError:
+            pass
+    return None
+
+
 def retry_with_backoff(
     max_retries: int = 3,
     initial_delay: float = 1.0,
@@ -296,27 +524,15 @@ def request_with_retry(
 
     for attempt in range(max_retries + 1):
         try:
-            # Apply rate limiting
-            if rate_limit:
-                limiter.acquire(host)
-
-            # Make request
-            if method.upper() == "GET":
-                response = requests.get(
-                    url, params=params, headers=headers, timeout=timeout
-                )
-            elif method.upper() == "POST":
-                response = requests.post(
-                    url,
-                    params=params,
-                    headers=headers,
-                    data=data,
-                    json=json,
-                    timeout=timeout,
-                )
-            else:
-                response = requests.request(
-                    method,
+            # Apply rate limiting; the token is only drawn if the request goes
+            # to the network (not answered by the response cache or by an
+            # identical request already in flight)
+            pacing = deferred_pacing(limiter.bucket(host)) if rate_limit else nullcontext()
+
+            # Make request over the shared keep-alive session for this host
+            with pacing:
+                response = session_pool.request(
+                    method.upper(),
                     url,
                     params=params,
                     headers=headers,
@@ -324,29 +540,23 @@ def request_with_retry(
                     json=json,
                     timeout=timeout,
                 )
+            if getattr(response, "from_cache", False) is True:
+                return response
 
             # Check for rate limiting response
             if response.status_code == 429:
+                retry_after = _parse_retry_after(response)
+                if rate_limit:
+                    # Slow every caller of this host down, not just this one
+                    limiter.report_rate_limited(host, retry_after)
                 if attempt == max_retries:
-                    retry_after_val = None
-                    raw = response.headers.get("Retry-After")
-                    if raw:
-                        try:
-                            retry_after_val = float(raw)
-                        except ValueError:
-                            pass
                     raise APIRateLimitError(
                         service=host,
-                        retry_after=retry_after_val,
+                        retry_after=retry_after,
                         url=url,
                     )
-                # Get retry-after header if available
-                retry_after = response.headers.get("Retry-After")
-                if retry_after:
-                    try:
-                        delay = float(retry_after)
-                    except ValueError:
-                        pass
+                if retry_after is not None:
+                    delay = retry_after
 
                 logger.warning(
                     f"Rate limited (429), retrying in {delay:.1f}s "
@@ -373,6 +583,8 @@ def request_with_retry(
                 delay = min(delay * 2, 60.0)
                 continue
 
+            if rate_limit:
+                limiter.report_success(host)
             return response
 
         except requests.exceptions.Timeout as e:
@@ -411,3 +623,135 @@ def request_with_retry(
             url=url,
         )
     raise RuntimeError("Unexpected request loop exit")
+
+
+async def async_request_with_retry(
+    url: str,
+    method: str = "GET",
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    data: Optional[Any] = None,
+    json: Optional[Dict[str, Any]] = None,
+    max_retries: int = 3,
+    initial_delay: float = 1.0,
+    rate_limit: bool = True,
+    timeout: float = 30.0,
+) -> AsyncResponse:
+    """Coroutine version of `request_with_retry`.
+
+    Sends the request over the event loop's shared aiohttp session, waits
+    for the host's rate limiter without blocking the loop, and retries 429
+    and 5xx responses with the same backoff policy as the sync helper.
+
+    Args:
+        url: Request URL
+        method: HTTP method (GET, POST, etc.)
+        params: Query parameters
+        headers: Request headers
+        data: Request body data
+        json: JSON body data
+        max_retries: Maximum retry attempts
+        initial_delay: Initial retry delay in seconds
+        rate_limit: Whether to apply rate limiting
+        timeout: Request timeout in seconds
+
+    Returns:
+        AsyncResponse with the body already read
+
+    Raises:
+        APIRateLimitError: If still rate limited after all retries
+        APIServerError: If the server keeps failing after all retries
+        APITimeoutError: If the request keeps timing out
+        APIError: On connection failures after all retries
+    """
+    import aiohttp
+    from urllib.parse import urlparse
+
+    host = urlparse(url).netloc
+    limiter = get_rate_limiter()
+    delay = initial_delay
+
+    for attempt in range(max_retries + 1):
+        try:
+            pacing = deferred_pacing(limiter.bucket(host)) if rate_limit else nullcontext()
+
+            with pacing:
+                response = await session_pool.arequest(
+                    method.upper(),
+                    url,
+                    params=params,
+                    headers=headers,
+                    data=data,
+                    json=json,
+                    timeout=timeout,
+                )
+            if getattr(response, "from_cache", False) is True:
+                return response
+
+            if response.status_code == 429:
+                retry_after = _parse_retry_after(response)
+                if rate_limit:
+                    limiter.report_rate_limited(host, retry_after)
+                if attempt == max_retries:
+                    raise APIRateLimitError(
+                        service=host,
+                        retry_after=retry_after,
+                        url=url,
+                    )
+                if retry_after is not None:
+                    delay = retry_after
+                logger.warning(
+                    f"Rate limited (429), retrying in {delay:.1f}s "
+                    f"(attempt {attempt + 1}/{max_retries})"
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 60.0)
+                continue
+
+            if response.status_code >= 500:
+                if attempt == max_retries:
+                    raise APIServerError(
+                        service=host,
+                        status_code=response.status_code,
+                        url=url,
+                        response_text=response.text[:500],
+                    )
+                logger.warning(
+                    f"Server error ({response.status_code}), retrying in {delay:.1f}s "
+                    f"(attempt {attempt + 1}/{max_retries})"
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 60.0)
+                continue
+
+            if rate_limit:
+                limiter.report_success(host)
+            return response
+
+        except asyncio.TimeoutError as e:
+            if attempt == max_retries:
+                raise APITimeoutError(
+                    service=host, url=url, timeout=timeout
+                ) from e
+            logger.warning(
+                f"Request timed out, retrying in {delay:.1f}s "
+                f"(attempt {attempt + 1}/{max_retries})"
+            )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 60.0)
+
+        except aiohttp.ClientError as e:
+            if attempt == max_retries:
+                raise APIError(
+                    f"Request to {host} failed after {max_retries} retries: {e}",
+                    service=host,
+                    url=url,
+                ) from e
+            logger.warning(
+                f"Request failed ({e}), retrying in {delay:.1f}s "
+                f"(attempt {attempt + 1}/{max_retries})"
+            )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 60.0)
+
+    raise RuntimeError("Unexpected request loop exit")
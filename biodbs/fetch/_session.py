@@ -0,0 +1,491 @@
+"""Shared HTTP session pool for API fetchers.
+
+This module provides:
+    - SessionPool: Per-host keep-alive ``requests.Session`` objects with
+      configurable connection pools, shared by all fetchers and threads,
+      plus one ``aiohttp.ClientSession`` per event loop for the async API
+    - AsyncResponse: Buffered aiohttp response with the ``requests.Response``
+      attributes used by the fetchers and `raise_for_status`
+    - get_session_pool: Access the global pool
+    - configure_session_pool: Change pool sizes for all hosts
+    - deferred_pacing: Charge a rate-limit token only when a request
+      actually goes to the network
+
+When a response cache is enabled (see `biodbs.fetch._http_cache`), every
+request made through the pool is looked up in it first; fresh hits are
+returned without opening a connection. Concurrent identical requests are
+coalesced into one network call (see `biodbs.fetch._coalesce`).
+
+Fetchers call ``session_pool.get(...)`` / ``session_pool.post(...)`` exactly
+like ``requests.get`` / ``requests.post``; the difference is that TCP and TLS
+connections are reused across calls instead of being re-established for
+every request.
+
+Example::
+
+    from biodbs.fetch._session import configure_session_pool, session_pool
+
+    configure_session_pool(pool_maxsize=64)  # e.g. many worker threads
+    response = session_pool.get("https://rest.kegg.jp/info/pathway")
+"""
+
+import contextvars
+import json as _json
+import logging
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Mapping, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from biodbs.fetch._coalesce import get_request_coalescer
+from biodbs.fetch._http_cache import CachedResponse, get_response_cache
+
+logger = logging.getLogger(__name__)
+
+# Token bucket to draw from before the next request that misses the cache
+_pending_bucket: contextvars.ContextVar = contextvars.ContextVar(
+    "biodbs_pending_bucket", default=None
+)
+
+
+@contextmanager
+def deferred_pacing(bucket: Any) -> Iterator[None]:
+    """Charge ``bucket`` for the first network request made inside the block.
+
+    Used by the rate-limited helpers while a response cache is enabled: the
+    token is reserved by the pool right before a request is sent, so calls
+    answered from the cache never wait for (or consume) the rate limit.
+
+    Args:
+        bucket: Object with a ``reserve() -> delay`` method, typically a
+            `TokenBucket`.
+    """
+    token = _pending_bucket.set(bucket)
+    try:
+        yield
+    finally:
+        _pending_bucket.reset(token)
+
+
+def _pending_delay() -> float:
+    bucket = _pending_bucket.get()
+    if bucket is None:
+        return 0.0
+    _pending_bucket.set(None)
+    return bucket.reserve()
+
+
+def _cached_requests_response(entry: CachedResponse) -> requests.Response:
+    response = requests.Response()
+    response.status_code = entry.status_code
+    response.headers = CaseInsensitiveDict(entry.headers)
+    response.url = entry.url
+    response._content = entry.content
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.from_cache = True
+    return response
+
+
+class AsyncResponse:
+    """Fully read response returned by the async request helpers.
+
+    The body is buffered before the aiohttp response is released, so the
+    object can be parsed after the connection has gone back to the pool.
+    It exposes the subset of ``requests.Response`` that the fetchers use
+    (``status_code``, ``headers``, ``url``, ``content``, ``text``, ``json()``),
+    which lets the same parsing and `raise_for_status` code serve both the
+    sync and async paths.
+    """
+
+    # True when the response was served by the response cache
+    from_cache = False
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: Mapping[str, str],
+        url: str,
+        content: bytes,
+        encoding: Optional[str] = None,
+    ):
+        self.status_code = status_code
+        self.headers = headers
+        self.url = url
+        self.content = content
+        self.encoding = encoding or "utf-8"
+
+    def __repr__(self) -> str:
+        return f"<AsyncResponse [{self.status_code}]>"
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self) -> Any:
+        return _json.loads(self.content)
+
+
+def _cached_async_response(entry: CachedResponse) -> "AsyncResponse":
+    response = AsyncResponse(
+        entry.status_code,
+        CaseInsensitiveDict(entry.headers),
+        entry.url,
+        entry.content,
+        encoding=requests.utils.get_encoding_from_headers(entry.headers),
+    )
+    response.from_cache = True
+    return response
+
+
+def _shared_requests_response(response: requests.Response) -> requests.Response:
+    # Each coalesced caller gets its own object over the same buffered body
+    shared = requests.Response()
+    shared.status_code = response.status_code
+    shared.headers = CaseInsensitiveDict(response.headers)
+    shared.url = response.url
+    shared._content = response.content
+    shared.encoding = response.encoding
+    shared.reason = response.reason
+    shared.request = response.request
+    shared.elapsed = response.elapsed
+    shared.history = list(response.history)
+    shared.from_cache = getattr(response, "from_cache", False) is True
+    return shared
+
+
+def _shared_async_response(response: AsyncResponse) -> AsyncResponse:
+    shared = AsyncResponse(
+        response.status_code,
+        CaseInsensitiveDict(response.headers),
+        response.url,
+        response.content,
+        encoding=response.encoding,
+    )
+    shared.from_cache = response.from_cache
+    return shared
+
+
+class SessionPool:
+    """Thread-safe pool of keep-alive sessions, one per scheme and host.
+
+    Each host gets its own ``requests.Session`` whose ``HTTPAdapter`` keeps up
+    to ``pool_maxsize`` idle connections, so concurrent threads hitting the
+    same API reuse sockets rather than opening new ones.
+
+    Retries are deliberately disabled at the adapter level; they are handled
+    by `request_with_retry` and the fetchers so that rate limiting applies
+    to every attempt.
+
+    Example::
+
+        pool = SessionPool(pool_maxsize=16)
+        response = pool.get("https://www.ebi.ac.uk/QuickGO/services/ontology/go/terms/GO:0008150")
+        pool.close()
+    """
+
+    # Default number of per-host connection pools kept by each adapter
+    DEFAULT_POOL_CONNECTIONS = 10
+    # Default number of connections kept alive per host
+    DEFAULT_POOL_MAXSIZE = 32
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+    ):
+        """Initialize the pool.
+
+        Args:
+            pool_connections: Number of urllib3 connection pools per adapter.
+            pool_maxsize: Maximum connections kept alive per host.
+            pool_block: If True, block when all connections to a host are in
+                use instead of opening (and discarding) extra ones.
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+        self._aiohttp_sessions: "weakref.WeakKeyDictionary[Any, Any]" = weakref.WeakKeyDictionary()
+
+    def __repr__(self) -> str:
+        return (
+            f"<SessionPool hosts={len(self._sessions)} "
+            f"pool_maxsize={self.pool_maxsize}>"
+        )
+
+    @staticmethod
+    def _host_key(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=0,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def session(self, url: str) -> requests.Session:
+        """Return the shared session for the host of ``url``.
+
+        Args:
+            url: Any URL on the target host.
+
+        Returns:
+            The host's keep-alive session.
+        """
+        key = self._host_key(url)
+        session = self._sessions.get(key)
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(key)
+                if session is None:
+                    session = self._new_session()
+                    self._sessions[key] = session
+                    logger.debug("Opened HTTP session for %s", key)
+        return session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request through the host's pooled session.
+
+        Accepts the same keyword arguments as ``requests.request``. With a
+        response cache enabled, fresh cached responses are returned directly
+        (with ``from_cache = True``) and stale ones are revalidated. A request
+        identical to one already in flight waits for that request's response
+        instead of being sent again (see `biodbs.fetch._coalesce`).
+        """
+        coalescer = get_request_coalescer()
+        key = coalescer.key(method, url, **kwargs)
+        if key is None:
+            return self._send(method, url, kwargs)
+        response, shared = coalescer.run(key, lambda: self._send(method, url, kwargs))
+        return _shared_requests_response(response) if shared else response
+
+    def _send(self, method: str, url: str, kwargs: Dict[str, Any]) -> requests.Response:
+        cache = get_response_cache()
+        if cache is None or not cache.is_cacheable_request(method, **kwargs):
+            self._pace()
+            return self.session(url).request(method, url, **kwargs)
+
+        key, _ = cache.make_key(
+            method, url, kwargs.get("params"), kwargs.get("data"), kwargs.get("json"),
+            headers=kwargs.get("headers"),
+        )
+        entry = cache.lookup(key)
+        if entry is not None:
+            if entry.is_fresh:
+                return _cached_requests_response(entry)
+            if entry.can_revalidate:
+                kwargs["headers"] = {**(kwargs.get("headers") or {}), **entry.conditional_headers()}
+
+        self._pace()
+        response = self.session(url).request(method, url, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            cache.refresh(entry, response.headers)
+            return _cached_requests_response(entry)
+        cache.store(key, method, response.url, response.status_code, response.headers, response.content)
+        return response
+
+    @staticmethod
+    def _pace():
+        delay = _pending_delay()
+        if delay > 0:
+            time.sleep(delay)
+
+    def get(self, url: str, params: Optional[Any] = None, **kwargs: Any) -> requests.Response:
+        """Pooled equivalent of ``requests.get``."""
+        return self.request("GET", url, params=params, **kwargs)
+
+    def post(
+        self,
+        url: str,
+        data: Optional[Any] = None,
+        json: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Pooled equivalent of ``requests.post``."""
+        return self.request("POST", url, data=data, json=json, **kwargs)
+
+    def configure(
+        self,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        pool_block: Optional[bool] = None,
+    ) -> None:
+        """Change pool settings; existing sessions are closed and recreated lazily.
+
+        Args:
+            pool_connections: Number of urllib3 connection pools per adapter.
+            pool_maxsize: Maximum connections kept alive per host.
+            pool_block: Whether to block when a host's pool is exhausted.
+        """
+        if pool_connections is not None:
+            self.pool_connections = pool_connections
+        if pool_maxsize is not None:
+            self.pool_maxsize = pool_maxsize
+        if pool_block is not None:
+            self.pool_block = pool_block
+        self.close()
+
+    def close(self) -> None:
+        """Close all pooled sessions and their connections."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def aiohttp_session(self) -> Any:
+        """Return the ``aiohttp.ClientSession`` shared within the running loop.
+
+        All coroutines on one event loop share a single session, so the
+        connector keeps at most ``pool_maxsize`` connections per host alive
+        and reuses them across queries. Sessions are bound to their loop and
+        are created lazily on first use.
+
+        Returns:
+            aiohttp.ClientSession bound to the current event loop.
+
+        Raises:
+            RuntimeError: If called outside a running event loop.
+        """
+        import asyncio
+
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        session = self._aiohttp_sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_connections * self.pool_maxsize,
+                limit_per_host=self.pool_maxsize,
+            )
+            session = aiohttp.ClientSession(connector=connector)
+            self._aiohttp_sessions[loop] = session
+            logger.debug("Opened aiohttp session for loop %r", loop)
+        return session
+
+    async def arequest(self, method: str, url: str, **kwargs: Any) -> AsyncResponse:
+        """Send a request through the loop's shared aiohttp session.
+
+        ``params`` are encoded exactly as ``requests`` would encode them
+        (``None`` values dropped, sequences repeated), so sync and async
+        calls hit identical URLs.
+
+        Args:
+            method: HTTP method.
+            url: Request URL.
+            **kwargs: ``params``, ``headers``, ``data``, ``json`` and
+                ``timeout`` (seconds).
+
+        Returns:
+            AsyncResponse with the body already read.
+        """
+        coalescer = get_request_coalescer()
+        key = coalescer.key(method, url, **kwargs)
+        if key is None:
+            return await self._asend(method, url, kwargs)
+        response, shared = await coalescer.arun(key, lambda: self._asend(method, url, kwargs))
+        return _shared_async_response(response) if shared else response
+
+    async def _asend(self, method: str, url: str, kwargs: Dict[str, Any]) -> AsyncResponse:
+        import asyncio
+
+        import aiohttp
+        from yarl import URL
+
+        params = kwargs.pop("params", None)
+        timeout = kwargs.pop("timeout", None)
+        if params:
+            prepared = requests.models.PreparedRequest()
+            prepared.prepare_url(url, params)
+            url = prepared.url
+        if timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+        kwargs = {k: v for k, v in kwargs.items() if v is not None}
+
+        cache = get_response_cache()
+        entry = key = None
+        if cache is not None and cache.is_cacheable_request(method, **kwargs):
+            key, _ = cache.make_key(
+                method, url, None, kwargs.get("data"), kwargs.get("json"),
+                headers=kwargs.get("headers"),
+            )
+            entry = cache.lookup(key)
+            if entry is not None:
+                if entry.is_fresh:
+                    return _cached_async_response(entry)
+                if entry.can_revalidate:
+                    kwargs["headers"] = {**(kwargs.get("headers") or {}), **entry.conditional_headers()}
+
+        delay = _pending_delay()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        session = self.aiohttp_session()
+        async with session.request(method, URL(url, encoded=True), **kwargs) as resp:
+            content = await resp.read()
+            response = AsyncResponse(
+                resp.status, resp.headers, str(resp.url), content,
+                encoding=resp.get_encoding() if content else None,
+            )
+        if key is not None:
+            if response.status_code == 304 and entry is not None:
+                cache.refresh(entry, response.headers)
+                return _cached_async_response(entry)
+            cache.store(key, method, response.url, response.status_code, response.headers, content)
+        return response
+
+    async def aclose(self) -> None:
+        """Close the aiohttp session bound to the running loop, if any."""
+        import asyncio
+
+        session = self._aiohttp_sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+
+
+# Global session pool shared by all fetchers
+session_pool = SessionPool()
+
+
+def get_session_pool() -> SessionPool:
+    """Get the global session pool instance."""
+    return session_pool
+
+
+def configure_session_pool(
+    pool_connections: Optional[int] = None,
+    pool_maxsize: Optional[int] = None,
+    pool_block: Optional[bool] = None,
+) -> None:
+    """Configure the global session pool.
+
+    Args:
+        pool_connections: Number of urllib3 connection pools per adapter.
+        pool_maxsize: Maximum connections kept alive per host. Raise this when
+            fetching with more worker threads than the default (32).
+        pool_block: Whether to block when a host's pool is exhausted.
+    """
+    session_pool.configure(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+    )
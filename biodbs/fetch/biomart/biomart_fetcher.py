@@ -13,6 +13,7 @@ Reference:
 """
 
 from biodbs.fetch._base import BaseAPIConfig, NameSpace, BaseDataFetcher
+from biodbs.fetch._session import session_pool
 from biodbs.exceptions import APIServerError, APIError
 from biodbs.data.BioMart._data_model import (
     BioMartHost,
@@ -54,14 +55,12 @@ class BioMartNameSpaceValidator(NameSpace):
         super().__init__(model_class)
         self._model_class = model_class
 
-    def validate(self, **kwargs):
-        """Validate and compute URL and query params."""
-        is_valid, err_msg = super().validate(**kwargs)
-        if is_valid:
-            model = self._model_class(**kwargs)
-            self._valid_params["_url"] = model.build_url()
-            self._valid_params["_query_params"] = model.build_query_params()
-        return is_valid, err_msg
+    def request_params(self, model) -> Dict[str, Any]:
+        """Add the URL and query params from the validated model."""
+        params = super().request_params(model)
+        params["_url"] = model.build_url()
+        params["_query_params"] = model.build_query_params()
+        return params
 
 
 class BioMartAPIConfig(BaseAPIConfig):
@@ -174,7 +173,7 @@ class BioMart_Fetcher(BaseDataFetcher):
         last_error = None
         for attempt in range(retries):
             try:
-                response = requests.get(url, params=params, timeout=120)
+                response = session_pool.get(url, params=params, timeout=120)
                 if response.status_code == 200:
                     # Check for error in response content
                     if response.text.startswith("Query ERROR"):
@@ -434,11 +433,7 @@ class BioMart_Fetcher(BaseDataFetcher):
         if not results:
             return BioMartQueryData("", columns=attributes)
 
-        combined = results[0]
-        for result in results[1:]:
-            combined += result
-
-        return combined.drop_duplicates()
+        return BioMartQueryData.concat(results).drop_duplicates()
 
     # =========================================================================
     # Convenience methods
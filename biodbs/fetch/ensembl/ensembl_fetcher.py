@@ -1,13 +1,15 @@
 """Ensembl REST API fetcher following the standardized pattern."""
 
-from biodbs.fetch._base import BaseAPIConfig, NameSpace, BaseDataFetcher
+from biodbs.fetch._base import BaseAPIConfig, NameSpace, BaseDataFetcher, RequestPlan
+from biodbs.fetch._chunking import get_chunk_planner
+from biodbs.fetch._session import session_pool
 from biodbs.data.Ensembl._data_model import (
     EnsemblModel,
     EnsemblEndpoint,
 )
 from biodbs.data.Ensembl.data import EnsemblFetchedData, EnsemblDataManager
 from biodbs.exceptions import raise_for_status, APIValidationError
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Sequence, Union
 import logging
 import requests
 
@@ -22,22 +24,39 @@ def _build_ensembl_url(params: Dict[str, Any]) -> str:
     return f"{BASE_URL}/{path}"
 
 
+def _merge_batch_responses(responses: List[Any]) -> Any:
+    """Merge raw batch responses for consecutive ID chunks, in order.
+
+    Batch lookups answer with an object keyed by ID, batch sequence requests
+    with a list or FASTA text. Empty responses (404 chunks) are dropped.
+    """
+    responses = [r for r in responses if r]
+    if not responses:
+        return {}
+    if all(isinstance(r, str) for r in responses):
+        return "\n".join(r.rstrip("\n") for r in responses) + "\n"
+    if all(isinstance(r, dict) for r in responses):
+        merged: Dict[str, Any] = {}
+        for r in responses:
+            merged.update(r)
+        return merged
+    return [item for r in responses for item in (r if isinstance(r, list) else [r])]
+
+
 class EnsemblNameSpace(NameSpace):
     """Namespace that validates parameters via EnsemblModel."""
 
     def __init__(self):
         super().__init__(EnsemblModel)
 
-    def validate(self, **kwargs):
-        """Validate and compute derived fields (path, query params)."""
-        is_valid, err_msg = super().validate(**kwargs)
-        if is_valid:
-            model = EnsemblModel(**kwargs)
-            self._valid_params["_path"] = model.build_path()
-            self._valid_params["_query_params"] = model.build_query_params()
-            self._valid_params["_is_batch"] = model.is_batch_request()
-            self._valid_params["_request_body"] = model.build_request_body()
-        return is_valid, err_msg
+    def request_params(self, model: EnsemblModel) -> Dict[str, Any]:
+        """Add derived fields (path, query params, batch body) from the model."""
+        params = super().request_params(model)
+        params["_path"] = model.build_path()
+        params["_query_params"] = model.build_query_params()
+        params["_is_batch"] = model.is_batch_request()
+        params["_request_body"] = model.build_request_body()
+        return params
 
 
 class Ensembl_APIConfig(BaseAPIConfig):
@@ -86,6 +105,10 @@ class Ensembl_Fetcher(BaseDataFetcher):
         ```
     """
 
+    # Host identifier and requests per second for rate limiting
+    HOST = "rest.ensembl.org"
+    RATE_LIMIT = 15
+
     def __init__(self, **data_manager_kws):
         super().__init__(Ensembl_APIConfig(), EnsemblNameSpace(), {})
         self._data_manager = (
@@ -93,21 +116,11 @@ class Ensembl_Fetcher(BaseDataFetcher):
             if data_manager_kws
             else None
         )
-        self._session = requests.Session()
-        self._session.headers.update({
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        })
 
-    def _make_request(
-        self,
-        url: str,
-        query_params: Dict[str, Any],
-        is_batch: bool = False,
-        request_body: Optional[Dict] = None,
-        content_type: str = "json",
-    ) -> requests.Response:
-        """Make HTTP request to Ensembl API."""
+    def _build_request(
+        self, params: Dict[str, Any], content_type: str = "json"
+    ) -> RequestPlan:
+        """Build the request for validated parameters."""
         headers = {}
 
         if content_type == "fasta":
@@ -117,13 +130,29 @@ class Ensembl_Fetcher(BaseDataFetcher):
         else:
             headers["Accept"] = "application/json"
 
-        if is_batch and request_body:
+        request_body = params.get("_request_body")
+        if params.get("_is_batch", False) and request_body:
             headers["Content-Type"] = "application/json"
-            response = requests.post(url, json=request_body, params=query_params, headers=headers)
+            method = "POST"
         else:
-            response = requests.get(url, params=query_params, headers=headers)
+            request_body = None
+            method = "GET"
+
+        return RequestPlan(
+            self._api_config.build_url(params),
+            params.get("_query_params", {}),
+            headers,
+            body=request_body,
+            method=method,
+        )
 
-        return response
+    def _make_request(self, plan: RequestPlan) -> requests.Response:
+        """Make HTTP request to Ensembl API."""
+        if plan.method == "POST":
+            return session_pool.post(
+                plan.url, json=plan.body, params=plan.params, headers=plan.headers
+            )
+        return session_pool.get(plan.url, params=plan.params, headers=plan.headers)
 
     def get(
         self,
@@ -155,7 +184,7 @@ class Ensembl_Fetcher(BaseDataFetcher):
         Returns:
             EnsemblFetchedData with parsed results.
         """
-        is_valid, err_msg = self._namespace.validate(
+        params = self._namespace.parse(
             endpoint=endpoint,
             id=id,
             ids=ids,
@@ -166,18 +195,10 @@ class Ensembl_Fetcher(BaseDataFetcher):
             name=name,
             **kwargs,
         )
-        if not is_valid:
-            raise ValueError(err_msg)
+        plan = self._build_request(params, content_type)
+        url = plan.url
 
-        self._api_config.update_params(**self._namespace.valid_params)
-        url = self._api_config.api_url
-        query_params = self._namespace.valid_params.get("_query_params", {})
-        is_batch = self._namespace.valid_params.get("_is_batch", False)
-        request_body = self._namespace.valid_params.get("_request_body")
-
-        response = self._make_request(
-            url, query_params, is_batch, request_body, content_type
-        )
+        response = self._make_request(plan)
 
         if response.status_code == 404:
             return EnsemblFetchedData({}, endpoint=endpoint)
@@ -193,6 +214,41 @@ class Ensembl_Fetcher(BaseDataFetcher):
 
         return EnsemblFetchedData(response.json(), endpoint=endpoint)
 
+    def _get_batch(
+        self,
+        endpoint: str,
+        ids: Sequence[str],
+        content_type: str = "json",
+        max_workers: int = 4,
+        **kwargs: Any,
+    ) -> EnsemblFetchedData:
+        """POST ``ids`` to a batch endpoint in chunks within its ID limit.
+
+        Chunks are sized by the endpoint's shared `ChunkPlanner`, sent
+        concurrently and merged in input order, so the result matches a
+        single request for all IDs.
+        """
+        ids = list(ids)
+        if not ids:
+            return self.get(endpoint=endpoint, ids=ids, content_type=content_type, **kwargs)
+        parts = self.chunked_process(
+            lambda chunk: self.get(
+                endpoint=endpoint, ids=list(chunk), content_type=content_type, **kwargs
+            ),
+            ids,
+            get_chunk_planner(f"ensembl.{EnsemblEndpoint(endpoint).name}"),
+            max_workers=max_workers,
+            rate_limit_per_second=self.RATE_LIMIT,
+            host=self.HOST,
+        )
+        if len(parts) == 1:
+            return parts[0]
+        return EnsemblFetchedData(
+            _merge_batch_responses([part.raw_response for part in parts]),
+            endpoint=endpoint,
+            content_type=content_type,
+        )
+
     # =========================================================================
     # Lookup Methods
     # =========================================================================
@@ -242,22 +298,28 @@ class Ensembl_Fetcher(BaseDataFetcher):
         expand: bool = False,
         format: str = "full",
         db_type: str = "core",
+        max_workers: int = 4,
     ) -> EnsemblFetchedData:
         """Look up multiple Ensembl stable IDs in batch.
 
+        Lists longer than the endpoint's limit (1000 IDs) are split into
+        concurrent requests automatically.
+
         Args:
-            ids: List of Ensembl stable IDs (max 1000).
+            ids: List of Ensembl stable IDs.
             species: Species name/alias.
             expand: Include connected features.
             format: Response format.
             db_type: Database type.
+            max_workers: Maximum number of chunk requests in flight.
 
         Returns:
             EnsemblFetchedData with results for each ID.
         """
-        return self.get(
-            endpoint=EnsemblEndpoint.lookup_id,
-            ids=ids,
+        return self._get_batch(
+            EnsemblEndpoint.lookup_id,
+            ids,
+            max_workers=max_workers,
             species=species,
             expand=expand,
             format=format,
@@ -348,25 +410,31 @@ class Ensembl_Fetcher(BaseDataFetcher):
         sequence_type: str = "genomic",
         species: Optional[str] = None,
         format: str = "fasta",
+        max_workers: int = 4,
     ) -> EnsemblFetchedData:
         """Get sequences for multiple Ensembl IDs in batch.
 
+        Lists longer than the endpoint's limit (50 IDs) are split into
+        concurrent requests automatically.
+
         Args:
-            ids: List of Ensembl stable IDs (max 50).
+            ids: List of Ensembl stable IDs.
             sequence_type: Type of sequence.
             species: Species name.
             format: Output format.
+            max_workers: Maximum number of chunk requests in flight.
 
         Returns:
             EnsemblFetchedData with sequences.
         """
         content_type = "fasta" if format == "fasta" else "json"
-        return self.get(
-            endpoint=EnsemblEndpoint.sequence_id,
-            ids=ids,
+        return self._get_batch(
+            EnsemblEndpoint.sequence_id,
+            ids,
+            content_type=content_type,
+            max_workers=max_workers,
             species=species,
             sequence_type=sequence_type,
-            content_type=content_type,
         )
 
     def get_sequence_region(
@@ -58,7 +58,8 @@ def ensembl_lookup_batch(
     """Look up multiple Ensembl stable IDs in batch.
 
     Args:
-        ids (List[str]): List of Ensembl stable IDs (max 1000).
+        ids (List[str]): List of Ensembl stable IDs. Lists over the
+            endpoint's 1000-ID limit are split into concurrent requests.
         species (Optional[str]): Species name/alias.
         expand (bool): If True, include connected features.
 
@@ -147,7 +148,8 @@ def ensembl_get_sequence_batch(
     """Get sequences for multiple Ensembl IDs in batch.
 
     Args:
-        ids (List[str]): List of Ensembl stable IDs (max 50).
+        ids (List[str]): List of Ensembl stable IDs. Lists over the
+            endpoint's 50-ID limit are split into concurrent requests.
         sequence_type (str): Type of sequence ("genomic", "cds", "cdna", "protein").
         species (Optional[str]): Species name.
         format (str): Output format ("fasta" or "json").
@@ -9,7 +9,17 @@ PubChem provides two REST APIs:
    https://pubchem.ncbi.nlm.nih.gov/rest/pug_view/data/{record_type}/{record_id}/{output}
 """
 
-from biodbs.fetch._base import BaseAPIConfig, NameSpace, BaseDataFetcher
+from biodbs.fetch._base import (
+    BaseAPIConfig,
+    BaseDataFetcher,
+    ConcatSink,
+    JsonLinesSink,
+    NameSpace,
+    PageSink,
+    RequestPlan,
+)
+from biodbs.fetch._rate_limit import async_request_with_retry, get_rate_limiter
+from biodbs.fetch._session import session_pool
 from biodbs.exceptions import raise_for_status
 from biodbs.data.PubChem._data_model import (
     PUGRestModel, PUGViewModel, PUGViewHeading,
@@ -18,10 +28,9 @@ from biodbs.data.PubChem.data import (
     PUGRestFetchedData, PUGViewFetchedData,
     PubChemFetchedData, PubChemDataManager,
 )
-from typing import Dict, Any, List, Literal, Optional, Union
+from typing import Dict, Any, AsyncIterator, Iterator, List, Literal, Optional, Union
 from pathlib import Path
 import logging
-import requests
 
 logger = logging.getLogger(__name__)
 
@@ -54,14 +63,12 @@ class PUGRestNameSpaceValidator(NameSpace):
     def __init__(self):
         super().__init__(PUGRestModel)
 
-    def validate(self, **kwargs):
-        """Validate and compute derived fields (path, query params)."""
-        is_valid, err_msg = super().validate(**kwargs)
-        if is_valid:
-            model = PUGRestModel(**kwargs)
-            self._valid_params["_path"] = model.build_path()
-            self._valid_params["_query_params"] = model.build_query_params()
-        return is_valid, err_msg
+    def request_params(self, model: PUGRestModel) -> Dict[str, Any]:
+        """Add derived fields (path, query params) from the validated model."""
+        params = super().request_params(model)
+        params["_path"] = model.build_path()
+        params["_query_params"] = model.build_query_params()
+        return params
 
 
 class PUGViewNameSpaceValidator(NameSpace):
@@ -70,14 +77,12 @@ class PUGViewNameSpaceValidator(NameSpace):
     def __init__(self):
         super().__init__(PUGViewModel)
 
-    def validate(self, **kwargs):
-        """Validate and compute derived fields (path, query params)."""
-        is_valid, err_msg = super().validate(**kwargs)
-        if is_valid:
-            model = PUGViewModel(**kwargs)
-            self._valid_params["_path"] = model.build_path()
-            self._valid_params["_query_params"] = model.build_query_params()
-        return is_valid, err_msg
+    def request_params(self, model: PUGViewModel) -> Dict[str, Any]:
+        """Add derived fields (path, query params) from the validated model."""
+        params = super().request_params(model)
+        params["_path"] = model.build_path()
+        params["_query_params"] = model.build_query_params()
+        return params
 
 
 # Backwards compatibility alias
@@ -152,9 +157,18 @@ class PubChem_Fetcher(BaseDataFetcher):
 
         # Get pharmacology info
         pharma = fetcher.get_pharmacology(2244)
+
+        # From async code, await many queries on one event loop
+        data = await fetcher.aget(domain="compound", namespace="cid", identifiers=2244)
         ```
     """
 
+    # Host identifier for rate limiting
+    HOST = "pubchem.ncbi.nlm.nih.gov"
+
+    # Rate limit (requests per second) - PubChem allows 5 requests/s
+    RATE_LIMIT = 5
+
     def __init__(self, **data_manager_kws):
         super().__init__(PUGRestAPIConfig(), PUGRestNameSpaceValidator(), {})
         # Secondary configs for PUG View API
@@ -165,6 +179,7 @@ class PubChem_Fetcher(BaseDataFetcher):
             if data_manager_kws
             else None
         )
+        get_rate_limiter().setdefault_rate(self.HOST, self.RATE_LIMIT)
 
     def get(
         self,
@@ -194,11 +209,7 @@ class PubChem_Fetcher(BaseDataFetcher):
         Returns:
             PUGRestFetchedData with parsed results.
         """
-        # Normalize identifiers to list format for validation
-        if identifiers is not None and not isinstance(identifiers, list):
-            identifiers = [identifiers]
-
-        is_valid, err_msg = self._namespace.validate(
+        plan = self._build_request(
             domain=domain,
             namespace=namespace,
             identifiers=identifiers,
@@ -209,29 +220,81 @@ class PubChem_Fetcher(BaseDataFetcher):
             threshold=threshold,
             max_records=max_records,
         )
-        if not is_valid:
-            raise ValueError(err_msg)
 
-        self._api_config.update_params(**self._namespace.valid_params)
-        url = self._api_config.api_url
-        query_params = self._namespace.valid_params.get("_query_params", {})
+        response = session_pool.get(plan.url, params=plan.params)
+        return self._parse_response(response, plan.url, output, domain, operation)
 
-        # Determine if binary response expected
-        is_binary = output.upper() in ["PNG", "SDF"]
+    def _build_request(self, **params: Any) -> RequestPlan:
+        """Validate PUG REST parameters and return the request to send."""
+        # Normalize identifiers to list format for validation
+        identifiers = params.get("identifiers")
+        if identifiers is not None and not isinstance(identifiers, list):
+            params["identifiers"] = [identifiers]
 
-        response = requests.get(url, params=query_params)
+        valid_params = self._namespace.parse(**params)
+        return RequestPlan(
+            self._api_config.build_url(valid_params),
+            valid_params.get("_query_params", {}),
+        )
+
+    @staticmethod
+    def _parse_response(
+        response: Any,
+        url: str,
+        output: str,
+        domain: str,
+        operation: Optional[str],
+    ) -> PUGRestFetchedData:
+        """Wrap a PUG REST response; 404 yields an empty result."""
         if response.status_code == 404:
             return PUGRestFetchedData({}, domain=domain, operation=operation)
         if response.status_code != 200:
             raise_for_status(response, "PubChem", url=url)
 
-        if is_binary:
+        # Binary formats are returned as raw bytes
+        if output.upper() in ["PNG", "SDF"]:
             content = response.content
         else:
             content = response.json()
 
         return PUGRestFetchedData(content, domain=domain, operation=operation)
 
+    async def aget(
+        self,
+        domain: str,
+        namespace: str,
+        identifiers: Optional[Union[str, int, List[Union[str, int]]]] = None,
+        operation: Optional[str] = None,
+        properties: Optional[List[str]] = None,
+        output: str = "JSON",
+        search_type: Optional[str] = None,
+        threshold: Optional[int] = None,
+        max_records: Optional[int] = None,
+    ) -> PUGRestFetchedData:
+        """Coroutine version of `get`.
+
+        Uses the event loop's shared aiohttp session and the per-host rate
+        limiter, so many queries can be awaited concurrently. Arguments are
+        the same as for `get`.
+
+        Returns:
+            PUGRestFetchedData with parsed results.
+        """
+        plan = self._build_request(
+            domain=domain,
+            namespace=namespace,
+            identifiers=identifiers,
+            operation=operation,
+            properties=properties,
+            output=output,
+            search_type=search_type,
+            threshold=threshold,
+            max_records=max_records,
+        )
+
+        response = await async_request_with_retry(plan.url, params=plan.params)
+        return self._parse_response(response, plan.url, output, domain, operation)
+
     def _fetch_batch(
         self,
         url: str,
@@ -240,7 +303,7 @@ class PubChem_Fetcher(BaseDataFetcher):
         operation: Optional[str] = None,
     ) -> PUGRestFetchedData:
         """Thread-safe fetch for a batch."""
-        response = requests.get(url, params=query_params)
+        response = session_pool.get(url, params=query_params)
         if response.status_code != 200:
             raise_for_status(response, "PubChem", url=url)
         return PUGRestFetchedData(response.json(), domain=domain, operation=operation)
@@ -255,6 +318,8 @@ class PubChem_Fetcher(BaseDataFetcher):
         rate_limit_per_second: int = 5,
         operation: Optional[str] = None,
         properties: Optional[List[str]] = None,
+        max_in_flight: Optional[int] = None,
+        ordered: bool = True,
         **kwargs: Any,
     ) -> Union[PUGRestFetchedData, Path]:
         """Fetch data for many identifiers by batching.
@@ -266,11 +331,16 @@ class PubChem_Fetcher(BaseDataFetcher):
             domain: PubChem domain.
             namespace: Identifier namespace.
             identifiers: List of IDs to fetch.
-            method: "concat" or "stream_to_storage".
+            method: "concat" or "stream_to_storage". The latter appends each
+                batch to storage as it arrives.
             batch_size: IDs per request (default 100).
             rate_limit_per_second: Max requests per second.
             operation: Operation to perform.
             properties: Properties for property operation.
+            max_in_flight: Max batches requested or buffered at once; defaults
+                to ``rate_limit_per_second``.
+            ordered: Keep batches in input order. ``False`` consumes batches
+                in completion order.
             **kwargs: Additional parameters.
 
         Returns:
@@ -280,92 +350,206 @@ class PubChem_Fetcher(BaseDataFetcher):
             raise ValueError(
                 "stream_to_storage requires storage_path in PubChem_Fetcher constructor"
             )
+        batches = self.iter_all(
+            domain, namespace, identifiers,
+            batch_size=batch_size,
+            rate_limit_per_second=rate_limit_per_second,
+            operation=operation,
+            properties=properties,
+            max_in_flight=max_in_flight,
+            ordered=ordered,
+            **kwargs,
+        )
+        return self.drain_pages(batches, self._page_sink(method, domain, operation))
 
-        if not identifiers:
-            return PUGRestFetchedData({}, domain=domain, operation=operation)
+    def iter_all(
+        self,
+        domain: str,
+        namespace: str,
+        identifiers: List[Union[str, int]],
+        batch_size: int = 100,
+        rate_limit_per_second: int = 5,
+        operation: Optional[str] = None,
+        properties: Optional[List[str]] = None,
+        max_in_flight: Optional[int] = None,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[PubChemFetchedData]:
+        """Yield per-batch results as they are fetched.
 
-        # Split into batches
-        batches = [
-            identifiers[i:i + batch_size]
-            for i in range(0, len(identifiers), batch_size)
-        ]
+        Args:
+            domain: PubChem domain.
+            namespace: Identifier namespace.
+            identifiers: List of IDs to fetch.
+            batch_size: IDs per request (default 100).
+            rate_limit_per_second: Max requests per second.
+            operation: Operation to perform.
+            properties: Properties for property operation.
+            max_in_flight: Max batches requested or buffered at once; defaults
+                to ``rate_limit_per_second``.
+            ordered: Yield batches in input order; ``False`` yields them in
+                completion order.
+            **kwargs: Additional parameters.
 
+        Returns:
+            Iterator of PubChemFetchedData batches. The first batch
+            establishes the result format, so its failure is raised; other
+            failed batches are logged and skipped.
+        """
+        batches = self._split_batches(identifiers, batch_size)
         logger.info(
             "Fetching %d identifiers in %d batches (rate=%d/s)",
             len(identifiers),
             len(batches),
             rate_limit_per_second,
         )
-
-        # Fetch first batch
-        first_batch = self.get(
+        common = dict(
             domain=domain,
             namespace=namespace,
-            identifiers=batches[0],
             operation=operation,
             properties=properties,
             **kwargs,
         )
-
-        if len(batches) == 1:
-            return self._finalise_pubchem(method, [first_batch], domain, operation)
-
-        # Fetch remaining batches
-        def _fetch(batch_ids):
-            return self.get(
-                domain=domain,
-                namespace=namespace,
-                identifiers=batch_ids,
-                operation=operation,
-                properties=properties,
-                **kwargs,
-            )
-
-        remaining_results: list = self.schedule_process(
-            get_func=_fetch,
-            args_list=[(batch,) for batch in batches[1:]],
+        results = self.iter_process(
+            self.get,
+            kwargs_list=[{**common, "identifiers": batch} for batch in batches],
             rate_limit_per_second=rate_limit_per_second,
+            max_in_flight=max_in_flight,
+            ordered=ordered,
             return_exceptions=True,
+            host=self.HOST,
         )
+        return self._skip_failed_batches(results)
+
+    @staticmethod
+    def _split_batches(identifiers: List[Union[str, int]], batch_size: int) -> List[list]:
+        return [
+            identifiers[i:i + batch_size]
+            for i in range(0, len(identifiers), batch_size)
+        ]
 
-        # Collect results
-        all_batches: List[PubChemFetchedData] = [first_batch]
-        for i, result in enumerate(remaining_results):
+    @staticmethod
+    def _skip_failed_batches(results: Iterator[tuple]) -> Iterator[PubChemFetchedData]:
+        for i, result in results:
             if isinstance(result, Exception):
-                logger.warning("Batch %d failed: %s", i + 1, result)
-                continue
-            if result.results:
-                all_batches.append(result)
+                # The first batch establishes the result format, so it must succeed
+                if i == 0:
+                    raise result
+                logger.warning("Batch %d failed: %s", i, result)
+            elif i == 0 or result.results:
+                yield result
+
+    async def aget_all(
+        self,
+        domain: str,
+        namespace: str,
+        identifiers: List[Union[str, int]],
+        method: Literal["concat", "stream_to_storage"] = "concat",
+        batch_size: int = 100,
+        max_concurrency: int = 5,
+        operation: Optional[str] = None,
+        properties: Optional[List[str]] = None,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Union[PUGRestFetchedData, Path]:
+        """Coroutine version of `get_all`.
+
+        Batches are requested concurrently on the running event loop and
+        paced by the shared per-host rate limiter.
 
-        return self._finalise_pubchem(method, all_batches, domain, operation)
+        Args:
+            domain: PubChem domain.
+            namespace: Identifier namespace.
+            identifiers: List of IDs to fetch.
+            method: "concat" or "stream_to_storage".
+            batch_size: IDs per request (default 100).
+            max_concurrency: Maximum number of batch requests in flight.
+            operation: Operation to perform.
+            properties: Properties for property operation.
+            ordered: Keep batches in input order, as for `get_all`.
+            **kwargs: Additional parameters.
+
+        Returns:
+            Combined PUGRestFetchedData or Path to output file.
+        """
+        if method == "stream_to_storage" and self._data_manager is None:
+            raise ValueError(
+                "stream_to_storage requires storage_path in PubChem_Fetcher constructor"
+            )
+        batches = self.aiter_all(
+            domain, namespace, identifiers,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+            operation=operation,
+            properties=properties,
+            ordered=ordered,
+            **kwargs,
+        )
+        return await self.adrain_pages(batches, self._page_sink(method, domain, operation))
 
-    def _finalise_pubchem(
+    def aiter_all(
         self,
-        method: str,
-        batches: List[PUGRestFetchedData],
         domain: str,
-        operation: Optional[str],
-    ) -> Union[PUGRestFetchedData, Path]:
-        """Combine fetched batches into the requested output format."""
+        namespace: str,
+        identifiers: List[Union[str, int]],
+        batch_size: int = 100,
+        max_concurrency: int = 5,
+        operation: Optional[str] = None,
+        properties: Optional[List[str]] = None,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> AsyncIterator[PubChemFetchedData]:
+        """Async iterator version of `iter_all`.
+
+        Args:
+            domain: PubChem domain.
+            namespace: Identifier namespace.
+            identifiers: List of IDs to fetch.
+            batch_size: IDs per request (default 100).
+            max_concurrency: Max batches requested or buffered at once.
+            operation: Operation to perform.
+            properties: Properties for property operation.
+            ordered: Yield batches in input order; ``False`` yields them in
+                completion order.
+            **kwargs: Additional parameters.
+        """
+        common = dict(
+            domain=domain,
+            namespace=namespace,
+            operation=operation,
+            properties=properties,
+            **kwargs,
+        )
+        results = self.aiter_process(
+            self.aget,
+            kwargs_list=[
+                {**common, "identifiers": batch}
+                for batch in self._split_batches(identifiers, batch_size)
+            ],
+            max_in_flight=max_concurrency,
+            ordered=ordered,
+            return_exceptions=True,
+        )
+        return self._askip_failed_batches(results)
+
+    @staticmethod
+    async def _askip_failed_batches(results: AsyncIterator[tuple]) -> AsyncIterator[PubChemFetchedData]:
+        async for i, result in results:
+            if isinstance(result, Exception):
+                if i == 0:
+                    raise result
+                logger.warning("Batch %d failed: %s", i, result)
+            elif i == 0 or result.results:
+                yield result
+
+    def _page_sink(self, method: str, domain: str, operation: Optional[str]) -> PageSink:
+        """Return the consumer that turns fetched batches into the requested output."""
+        if method == "concat":
+            return ConcatSink(lambda: PUGRestFetchedData({}, domain=domain, operation=operation))
         filename = f"pubchem_{domain}"
         if operation:
             filename += f"_{operation}"
-
-        if method == "concat":
-            result = batches[0]
-            for batch in batches[1:]:
-                result += batch
-            return result
-
-        # stream_to_storage
-        for batch in batches:
-            if batch.results:
-                self._data_manager.stream_json_lines(
-                    iter(batch.results), filename, key=filename
-                )
-
-        self._data_manager.flush_metadata()
-        return self._data_manager.storage_path / f"{filename}.jsonl"
+        return JsonLinesSink(self._data_manager, filename)
 
     # =========================================================================
     # PUG REST Convenience methods
@@ -568,20 +752,15 @@ class PubChem_Fetcher(BaseDataFetcher):
         Returns:
             PUGViewFetchedData with hierarchical annotation data.
         """
-        is_valid, err_msg = self._view_namespace.validate(
+        params = self._view_namespace.parse(
             record_type=record_type,
             record_id=record_id,
             heading=heading,
             output=output,
         )
-        if not is_valid:
-            raise ValueError(err_msg)
-
-        self._view_api_config.update_params(**self._view_namespace.valid_params)
-        url = self._view_api_config.api_url
-        query_params = self._view_namespace.valid_params.get("_query_params", {})
+        url = self._view_api_config.build_url(params)
 
-        response = requests.get(url, params=query_params)
+        response = session_pool.get(url, params=params.get("_query_params", {}))
         if response.status_code == 404:
             return PUGViewFetchedData({}, record_type=record_type)
         if response.status_code != 200:
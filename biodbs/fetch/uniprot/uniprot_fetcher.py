@@ -6,7 +6,12 @@ import time
 import re
 
 from biodbs.fetch._base import BaseAPIConfig, NameSpace, BaseDataFetcher
-from biodbs.fetch._rate_limit import request_with_retry, get_rate_limiter
+from biodbs.fetch._rate_limit import (
+    async_request_with_retry,
+    get_rate_limiter,
+    request_with_retry,
+)
+from biodbs.fetch._session import session_pool
 from biodbs.exceptions import raise_for_status
 from biodbs.data.uniprot._data_model import (
     UniProtBase,
@@ -91,11 +96,21 @@ class UniProt_Fetcher(BaseDataFetcher):
             from_db="UniProtKB_AC-ID",
             to_db="GeneID"
         )
+
+        # From async code, await many queries on one event loop
+        entry = await fetcher.aget_entry("P05067")
         ```
     """
 
-    def __init__(self):
-        """Initialize UniProt fetcher."""
+    def __init__(self, trusted_responses: bool = False):
+        """Initialize UniProt fetcher.
+
+        Args:
+            trusted_responses: Build entry models without pydantic validation
+                (``model_construct``). Faster for large result sets; responses
+                are assumed to match the UniProtKB schema.
+        """
+        self._trusted = trusted_responses
         self._api_config = UniProt_APIConfig()
         super().__init__(
             self._api_config, NameSpace(UniProtSearchRequest), self._api_config.get_headers()
@@ -125,22 +140,51 @@ class UniProt_Fetcher(BaseDataFetcher):
             ConnectionError: If the request fails after retries.
         """
         url = self._api_config.get_url(endpoint)
-        headers = {"Accept": accept}
-
-        if method == "POST" and data:
-            headers["Content-Type"] = "application/x-www-form-urlencoded"
-
         response = request_with_retry(
             url=url,
             method=method,
             params=params,
-            headers=headers,
+            headers=self._request_headers(method, data, accept),
             data=data,
             max_retries=3,
             initial_delay=1.0,
             rate_limit=True,
         )
+        return self._parse_response(response, url, accept)
+
+    async def _amake_request(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        method: str = "GET",
+        data: Optional[Dict[str, Any]] = None,
+        accept: str = "application/json",
+    ) -> Any:
+        """Coroutine version of `_make_request`."""
+        url = self._api_config.get_url(endpoint)
+        response = await async_request_with_retry(
+            url=url,
+            method=method,
+            params=params,
+            headers=self._request_headers(method, data, accept),
+            data=data,
+            max_retries=3,
+            initial_delay=1.0,
+            rate_limit=True,
+        )
+        return self._parse_response(response, url, accept)
+
+    @staticmethod
+    def _request_headers(
+        method: str, data: Optional[Dict[str, Any]], accept: str
+    ) -> Dict[str, str]:
+        headers = {"Accept": accept}
+        if method == "POST" and data:
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+        return headers
 
+    @staticmethod
+    def _parse_response(response: Any, url: str, accept: str) -> Any:
         if response.status_code not in (200, 303):
             raise_for_status(response, "UniProt", url=url)
 
@@ -197,7 +241,28 @@ class UniProt_Fetcher(BaseDataFetcher):
             params["fields"] = fields
 
         data = self._make_request(endpoint, params=params)
-        return UniProtFetchedData(data, query_ids=[accession])
+        return UniProtFetchedData(data, query_ids=[accession], trusted=self._trusted)
+
+    async def aget_entry(
+        self,
+        accession: str,
+        fields: Optional[str] = None,
+    ) -> UniProtFetchedData:
+        """Coroutine version of `get_entry`.
+
+        Example:
+            ```python
+            fetcher = UniProt_Fetcher()
+            entries = await asyncio.gather(
+                *(fetcher.aget_entry(acc) for acc in ["P05067", "P04637"])
+            )
+            ```
+        """
+        endpoint = UniProtEndpoint.ENTRY.value.format(accession=accession)
+        params = {"fields": fields} if fields else {}
+
+        data = await self._amake_request(endpoint, params=params)
+        return UniProtFetchedData(data, query_ids=[accession], trusted=self._trusted)
 
     def get_entries(
         self,
@@ -227,6 +292,18 @@ class UniProt_Fetcher(BaseDataFetcher):
         accession_query = " OR ".join(f"accession:{acc}" for acc in accessions)
         return self.search(accession_query, fields=fields, size=len(accessions))
 
+    async def aget_entries(
+        self,
+        accessions: List[str],
+        fields: Optional[str] = None,
+    ) -> UniProtFetchedData:
+        """Coroutine version of `get_entries`."""
+        if not accessions:
+            return UniProtFetchedData([], query_ids=[])
+
+        accession_query = " OR ".join(f"accession:{acc}" for acc in accessions)
+        return await self.asearch(accession_query, fields=fields, size=len(accessions))
+
     # ----- Search Methods -----
 
     def search(
@@ -258,6 +335,64 @@ class UniProt_Fetcher(BaseDataFetcher):
             print(results.as_dataframe())
             ```
         """
+        params = self._search_params(query, fields, sort, size, include_isoform, cursor)
+        url = self._api_config.get_url(UniProtEndpoint.SEARCH.value)
+
+        response = request_with_retry(
+            url=url,
+            method="GET",
+            params=params,
+            headers={"Accept": "application/json"},
+            max_retries=3,
+            rate_limit=True,
+        )
+        return self._parse_search(response, url, query)
+
+    async def asearch(
+        self,
+        query: str,
+        fields: Optional[str] = None,
+        sort: Optional[str] = None,
+        size: int = 25,
+        include_isoform: bool = False,
+        cursor: Optional[str] = None,
+    ) -> UniProtSearchResult:
+        """Coroutine version of `search`.
+
+        Uses the event loop's shared aiohttp session and the per-host rate
+        limiter, so many searches can be awaited concurrently.
+
+        Example:
+            ```python
+            fetcher = UniProt_Fetcher()
+            tp53, brca1 = await asyncio.gather(
+                fetcher.asearch("gene:TP53 AND organism_id:9606"),
+                fetcher.asearch("gene:BRCA1 AND organism_id:9606"),
+            )
+            ```
+        """
+        params = self._search_params(query, fields, sort, size, include_isoform, cursor)
+        url = self._api_config.get_url(UniProtEndpoint.SEARCH.value)
+
+        response = await async_request_with_retry(
+            url=url,
+            method="GET",
+            params=params,
+            headers={"Accept": "application/json"},
+            max_retries=3,
+            rate_limit=True,
+        )
+        return self._parse_search(response, url, query)
+
+    @staticmethod
+    def _search_params(
+        query: str,
+        fields: Optional[str],
+        sort: Optional[str],
+        size: int,
+        include_isoform: bool,
+        cursor: Optional[str],
+    ) -> Dict[str, Any]:
         params = {
             "query": query,
             "size": min(size, 500),
@@ -270,24 +405,19 @@ class UniProt_Fetcher(BaseDataFetcher):
             params["includeIsoform"] = "true"
         if cursor:
             params["cursor"] = cursor
+        return params
 
-        response = request_with_retry(
-            url=self._api_config.get_url(UniProtEndpoint.SEARCH.value),
-            method="GET",
-            params=params,
-            headers={"Accept": "application/json"},
-            max_retries=3,
-            rate_limit=True,
-        )
-
+    def _parse_search(self, response: Any, url: str, query: str) -> UniProtSearchResult:
         if response.status_code != 200:
-            raise_for_status(response, "UniProt", url=self._api_config.get_url(UniProtEndpoint.SEARCH.value))
+            raise_for_status(response, "UniProt", url=url)
 
         # Extract next cursor from headers
         next_cursor = self._extract_next_cursor(dict(response.headers))
 
         data = response.json()
-        return UniProtSearchResult(data, query=query, next_cursor=next_cursor)
+        return UniProtSearchResult(
+            data, query=query, next_cursor=next_cursor, trusted=self._trusted
+        )
 
     def search_all(
         self,
@@ -309,7 +439,7 @@ class UniProt_Fetcher(BaseDataFetcher):
         Returns:
             UniProtFetchedData with all matching entries.
         """
-        all_entries = []
+        combined = UniProtFetchedData([], query_ids=[query], trusted=self._trusted)
         cursor = None
         retrieved = 0
 
@@ -324,18 +454,49 @@ class UniProt_Fetcher(BaseDataFetcher):
                 cursor=cursor,
             )
 
-            all_entries.extend(result.entries)
-            retrieved += len(result.entries)
+            # Entries stay unparsed until the caller reads them
+            combined += result
+            retrieved += len(result)
 
-            if not result.has_next or len(result.entries) == 0:
+            if not result.has_next or len(result) == 0:
                 break
 
             cursor = result.next_cursor
 
-        # Create combined result
-        combined = UniProtFetchedData([], query_ids=[query])
-        combined.entries = all_entries
-        combined.total_count = len(all_entries)
+        return combined
+
+    async def asearch_all(
+        self,
+        query: str,
+        fields: Optional[str] = None,
+        sort: Optional[str] = None,
+        max_results: int = 10000,
+        include_isoform: bool = False,
+    ) -> UniProtFetchedData:
+        """Coroutine version of `search_all`.
+
+        UniProt paginates with cursors, so the pages of one query are
+        fetched in sequence; the event loop stays free to run other
+        queries while each page is awaited.
+        """
+        combined = UniProtFetchedData([], query_ids=[query], trusted=self._trusted)
+        cursor = None
+
+        while len(combined) < max_results:
+            result = await self.asearch(
+                query=query,
+                fields=fields,
+                sort=sort,
+                size=min(500, max_results - len(combined)),
+                include_isoform=include_isoform,
+                cursor=cursor,
+            )
+            combined += result
+
+            if not result.has_next or len(result) == 0:
+                break
+            cursor = result.next_cursor
+
         return combined
 
     # ----- Convenience Search Methods -----
@@ -491,14 +652,13 @@ class UniProt_Fetcher(BaseDataFetcher):
             raise ConnectionError("No job ID returned from ID mapping")
 
         # Poll for job completion and get redirect URL
-        import requests as req
         start_time = time.time()
         results_url = None
 
         while time.time() - start_time < max_wait:
             status_endpoint = UniProtEndpoint.IDMAPPING_STATUS.value.format(job_id=job_id)
-            # Use requests directly with allow_redirects=False to capture redirect
-            status_response = req.get(
+            # Bypass retry handling with allow_redirects=False to capture redirect
+            status_response = session_pool.get(
                 self._api_config.get_url(status_endpoint),
                 headers={"Accept": "application/json"},
                 allow_redirects=False,
@@ -589,9 +749,8 @@ class UniProt_Fetcher(BaseDataFetcher):
             results = self.search_by_gene(
                 gene, organism=organism, reviewed_only=reviewed_only, size=1
             )
-            if results.entries:
-                return (gene, results.entries[0].primaryAccession)
-            return (gene, None)
+            accessions = results.get_accessions()
+            return (gene, accessions[0] if accessions else None)
 
         # Use schedule_process for concurrent requests
         results = self.schedule_process(
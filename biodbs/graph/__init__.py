@@ -9,6 +9,8 @@ Core Classes:
     Node: Represents a node (entity) in the knowledge graph.
     Edge: Represents a directed edge (relationship) between nodes.
     KnowledgeGraph: Container for nodes and edges with graph operations.
+    CompactKnowledgeGraph: KnowledgeGraph stored as CSR/CSC arrays, for
+        graphs with millions of edges.
 
 Enums:
     NodeType: Types of biological entities (GENE, PROTEIN, DISEASE, etc.)
@@ -29,6 +31,9 @@ Export Functions:
     to_rdf: Export to RDF format (Turtle or XML).
     to_neo4j_csv: Export CSV files for Neo4j import.
     to_cypher: Generate Cypher queries for Neo4j.
+    write_json_ld: Stream JSON-LD to a file (optionally gzipped).
+    write_rdf: Stream N-Triples/N-Quads/Turtle to a file, without rdflib.
+    write_cypher: Stream Cypher queries to a file (optionally gzipped).
 
 Utility Functions:
     find_shortest_path: Find shortest path between two nodes.
@@ -60,49 +65,56 @@ Example:
     >>> centrality = nx.degree_centrality(nx_graph)
 
 Dependencies:
-    Required: None (core functionality is pure Python)
+    Required: None (core functionality is pure Python; CompactKnowledgeGraph
+        uses numpy, and scipy for to_scipy_sparse())
     Optional:
         - networkx: For to_networkx() export and advanced algorithms
         - rdflib: For to_rdf() export
 """
 
-from biodbs._funcs.graph.core import (
-    # Enums
-    NodeType,
-    EdgeType,
-    DataSource,
-    # Data classes
-    Node,
-    Edge,
-    # Container
-    KnowledgeGraph,
-)
+from biodbs._lazy import lazy_exports
 
-from biodbs._funcs.graph.builders import (
-    build_graph,
-    build_disease_graph,
-    build_go_graph,
-    build_reactome_graph,
-    build_kegg_graph,
-    merge_graphs,
-)
-
-from biodbs._funcs.graph.exporters import (
-    to_networkx,
-    to_json_ld,
-    to_rdf,
-    to_neo4j_csv,
-    to_cypher,
-)
-
-from biodbs._funcs.graph.utils import (
-    find_shortest_path,
-    find_all_paths,
-    get_neighborhood,
-    get_connected_component,
-    find_hub_nodes,
-    get_graph_statistics,
-)
+# Imported on first access (PEP 562) to keep package import cheap.
+_EXPORTS = {
+    "biodbs._funcs.graph.core": (
+        # Enums
+        "NodeType",
+        "EdgeType",
+        "DataSource",
+        # Data classes
+        "Node",
+        "Edge",
+        # Container
+        "KnowledgeGraph",
+    ),
+    "biodbs._funcs.graph.compact": ("CompactKnowledgeGraph",),
+    "biodbs._funcs.graph.builders": (
+        "build_graph",
+        "build_disease_graph",
+        "build_go_graph",
+        "build_reactome_graph",
+        "build_kegg_graph",
+        "merge_graphs",
+    ),
+    "biodbs._funcs.graph.exporters": (
+        "to_networkx",
+        "to_json_ld",
+        "to_rdf",
+        "to_neo4j_csv",
+        "to_cypher",
+        "write_json_ld",
+        "write_rdf",
+        "write_cypher",
+    ),
+    "biodbs._funcs.graph.utils": (
+        "find_shortest_path",
+        "find_all_paths",
+        "get_neighborhood",
+        "get_connected_component",
+        "find_hub_nodes",
+        "get_graph_statistics",
+    ),
+}
 
 __all__ = [
     # Enums
@@ -114,6 +126,7 @@ __all__ = [
     "Edge",
     # Container
     "KnowledgeGraph",
+    "CompactKnowledgeGraph",
     # Builders
     "build_graph",
     "build_disease_graph",
@@ -127,6 +140,9 @@ __all__ = [
     "to_rdf",
     "to_neo4j_csv",
     "to_cypher",
+    "write_json_ld",
+    "write_rdf",
+    "write_cypher",
     # Utilities
     "find_shortest_path",
     "find_all_paths",
@@ -135,3 +151,5 @@ __all__ = [
     "find_hub_nodes",
     "get_graph_statistics",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, exports=_EXPORTS)
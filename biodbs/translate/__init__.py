@@ -34,23 +34,28 @@ Usage:
     result = translate_chembl_to_pubchem(["CHEMBL25"])
 """
 
-from biodbs._funcs.translate import (
-    # Gene translation
-    translate_gene_ids,
-    translate_gene_ids_kegg,
-    # Chemical translation
-    translate_chemical_ids,
-    translate_chemical_ids_kegg,
-    translate_chembl_to_pubchem,
-    translate_pubchem_to_chembl,
-    # Protein translation
-    translate_protein_ids,
-    translate_gene_to_uniprot,
-    translate_uniprot_to_gene,
-    translate_uniprot_to_pdb,
-    translate_uniprot_to_ensembl,
-    translate_uniprot_to_refseq,
-)
+from biodbs._lazy import lazy_exports
+
+# Imported on first access (PEP 562) to keep package import cheap.
+_EXPORTS = {
+    "biodbs._funcs.translate": (
+        # Gene translation
+        "translate_gene_ids",
+        "translate_gene_ids_kegg",
+        # Chemical translation
+        "translate_chemical_ids",
+        "translate_chemical_ids_kegg",
+        "translate_chembl_to_pubchem",
+        "translate_pubchem_to_chembl",
+        # Protein translation
+        "translate_protein_ids",
+        "translate_gene_to_uniprot",
+        "translate_uniprot_to_gene",
+        "translate_uniprot_to_pdb",
+        "translate_uniprot_to_ensembl",
+        "translate_uniprot_to_refseq",
+    ),
+}
 
 __all__ = [
     # Gene translation
@@ -69,3 +74,5 @@ __all__ = [
     "translate_uniprot_to_ensembl",
     "translate_uniprot_to_refseq",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, exports=_EXPORTS)
@@ -7,7 +7,10 @@ from io import BytesIO
 
 
 def get_rsp(host_url, params=None, safe_check=True, method="get", **kwargs):
-    rsp = getattr(requests, method)(host_url, params=params, **kwargs)
+    # Imported lazily: biodbs.fetch imports this module while initializing
+    from biodbs.fetch._session import session_pool
+
+    rsp = getattr(session_pool, method)(host_url, params=params, **kwargs)
     if safe_check:
         assert rsp.status_code == 200, str(rsp.status_code) + str(params)
     return rsp
@@ -6,10 +6,16 @@ from pathlib import Path
 import pytest
 from biodbs._funcs.analysis._cache import (
     PathwayDBManager,
+    PathwayMemoryCache,
     StorageBackend,
     SQLiteDialect,
     MySQLDialect,
     PostgreSQLDialect,
+    cache_pathways,
+    clear_memory_cache,
+    get_cached_pathways,
+    get_memory_cache_info,
+    set_default_backend,
 )
 
 
@@ -212,6 +218,108 @@ class TestPathwayDBManagerCSV:
             csv_mgr.get_genes_for_pathway("p1")
 
 
+# =============================================================================
+# TestPathwayDBManagerColumnar
+# =============================================================================
+
+
+@pytest.fixture(params=["parquet", "arrow"])
+def columnar_mgr(request, tmp_path):
+    return PathwayDBManager(
+        storage_path=tmp_path,
+        db_name="test_pathways",
+        backend=request.param,
+        cache_expiry_days=7,
+    )
+
+
+class TestPathwayDBManagerColumnar:
+    def test_save_and_load(self, columnar_mgr, sample_pathways):
+        path = columnar_mgr.save_pathways(sample_pathways, cache_key="kegg_test", database="KEGG")
+        assert path.exists()
+        loaded = columnar_mgr.load_pathways("kegg_test")
+        assert loaded == {k: (name, frozenset(genes)) for k, (name, genes) in sample_pathways.items()}
+
+    def test_load_as_pathway_objects(self, columnar_mgr, sample_pathways):
+        columnar_mgr.save_pathways(
+            sample_pathways, cache_key="kegg_test", database="KEGG", species="Homo sapiens"
+        )
+        loaded = columnar_mgr.load_pathways("kegg_test", as_pathway_objects=True)
+        pathway = loaded["hsa04110"]
+        assert pathway.database == "KEGG"
+        assert pathway.species == "Homo sapiens"
+        assert pathway.genes == frozenset({"TP53", "BRCA1", "CDK1"})
+
+    def test_load_nonexistent(self, columnar_mgr):
+        assert columnar_mgr.load_pathways("nonexistent") is None
+
+    def test_expired(self, columnar_mgr, sample_pathways):
+        columnar_mgr.save_pathways(
+            sample_pathways, cache_key="expired",
+            database="KEGG", expiry_seconds=0.001,
+        )
+        time.sleep(0.01)
+        assert columnar_mgr.load_pathways("expired", use_cache=True) is None
+        assert columnar_mgr.load_pathways("expired", use_cache=False) is not None
+        assert columnar_mgr.clear_expired() == 2
+        assert columnar_mgr.load_pathways("expired", use_cache=False) is None
+
+    def test_query_pathways(self, columnar_mgr, sample_pathways):
+        columnar_mgr.save_pathways(sample_pathways, cache_key="k1", database="KEGG")
+        columnar_mgr.save_pathways(
+            {"R-HSA-1": ("Apoptosis", {"TP53", "BAX"})}, cache_key="k2", database="Reactome"
+        )
+        assert len(columnar_mgr.query_pathways(gene_id="TP53")) == 3
+        assert len(columnar_mgr.query_pathways(database="KEGG")) == 2
+        results = columnar_mgr.query_pathways(max_size=2)
+        assert results == [{
+            "id": "R-HSA-1", "name": "Apoptosis", "database": "Reactome",
+            "species": None, "url": None, "gene_count": 2, "cache_key": "k2",
+        }]
+
+    def test_get_genes_for_pathway(self, columnar_mgr, sample_pathways):
+        columnar_mgr.save_pathways(sample_pathways, cache_key="k1", database="KEGG")
+        assert columnar_mgr.get_genes_for_pathway("hsa04115") == {"TP53", "MDM2", "CDKN1A"}
+        assert columnar_mgr.get_genes_for_pathway("missing") == set()
+
+    def test_clear_cache(self, columnar_mgr, sample_pathways):
+        columnar_mgr.save_pathways(sample_pathways, cache_key="k1", database="KEGG")
+        columnar_mgr.clear_cache("k1")
+        assert columnar_mgr.load_pathways("k1") is None
+
+    def test_load_gene_set_index(self, columnar_mgr, sample_pathways):
+        columnar_mgr.save_pathways(sample_pathways, cache_key="k1", database="KEGG")
+        index = columnar_mgr.load_gene_set_index("k1")
+        assert index.database == "KEGG"
+        assert index.term_ids == ["hsa04110", "hsa04115"]
+        assert list(index.term_sizes()) == [3, 3]
+        assert list(index.overlap_counts(index.query_mask({"TP53", "MDM2"}))) == [1, 2]
+
+    def test_load_gene_set_index_fallback(self, sqlite_mgr, sample_pathways):
+        sqlite_mgr.save_pathways(sample_pathways, cache_key="k1", database="KEGG")
+        index = sqlite_mgr.load_gene_set_index("k1")
+        assert sorted(index.term_ids) == ["hsa04110", "hsa04115"]
+        assert index.database == "KEGG"
+
+
+class TestDefaultBackend:
+    @pytest.fixture(autouse=True)
+    def _restore(self):
+        yield
+        set_default_backend("sqlite")
+        clear_memory_cache()
+
+    def test_module_functions_use_default_backend(self, tmp_path, sample_pathways):
+        set_default_backend("parquet")
+        cache_pathways("kegg_test", sample_pathways, str(tmp_path))
+        assert (tmp_path / "pathways" / "kegg_test.parquet").exists()
+        assert len(get_cached_pathways("kegg_test", str(tmp_path))) == 2
+
+    def test_server_backends_rejected(self):
+        with pytest.raises(ValueError, match="db_config"):
+            set_default_backend("mysql")
+
+
 # =============================================================================
 # TestSQLDialects
 # =============================================================================
@@ -241,6 +349,8 @@ class TestStorageBackend:
         assert StorageBackend.CSV.value == "csv"
         assert StorageBackend.MYSQL.value == "mysql"
         assert StorageBackend.POSTGRESQL.value == "postgresql"
+        assert StorageBackend.PARQUET.value == "parquet"
+        assert StorageBackend.ARROW.value == "arrow"
 
     def test_missing_db_config_raises(self, tmp_path):
         with pytest.raises(ValueError, match="missing required keys"):
@@ -249,3 +359,126 @@ class TestStorageBackend:
                 backend="mysql",
                 db_config={"host": "localhost"},
             )
+
+
+# =============================================================================
+# TestPathwayMemoryCache
+# =============================================================================
+
+
+class TestPathwayMemoryCache:
+    def test_hit_and_miss_counters(self):
+        cache = PathwayMemoryCache()
+        key = ("store", "kegg_hsa", "pathways", ())
+        assert cache.get(key) is None
+        cache.put(key, {"a": 1})
+        assert cache.get(key) == {"a": 1}
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    def test_lru_eviction_by_entries(self):
+        cache = PathwayMemoryCache(max_entries=2, max_bytes=None)
+        keys = [("store", f"key{i}", "pathways", ()) for i in range(3)]
+        cache.put(keys[0], 0)
+        cache.put(keys[1], 1)
+        cache.get(keys[0])  # keys[1] is now least recently used
+        cache.put(keys[2], 2)
+        assert keys[1] not in cache
+        assert keys[0] in cache and keys[2] in cache
+        assert cache.stats()["evictions"] == 1
+
+    def test_eviction_by_bytes(self):
+        cache = PathwayMemoryCache(max_entries=None, max_bytes=100)
+        cache.put(("s", "a", "k", ()), "a", nbytes=60)
+        cache.put(("s", "b", "k", ()), "b", nbytes=60)
+        assert len(cache) == 1
+        cache.put(("s", "c", "k", ()), "c", nbytes=500)  # larger than budget
+        assert ("s", "c", "k", ()) not in cache
+
+    def test_expiry(self):
+        cache = PathwayMemoryCache()
+        key = ("store", "kegg_hsa", "pathways", ())
+        cache.put(key, 1, expires_at=time.time() - 1)
+        assert cache.get(key) is None
+        assert len(cache) == 0
+
+    def test_invalidate_by_cache_key(self):
+        cache = PathwayMemoryCache()
+        cache.put(("s", "kegg_hsa", "pathways", ()), 1)
+        cache.put(("s", "kegg_hsa", "index", ()), 2)
+        cache.put(("s", "go_9606", "index", ()), 3)
+        assert cache.invalidate("kegg_hsa", namespace="s") == 2
+        assert len(cache) == 1
+
+    def test_configure_shrinks(self):
+        cache = PathwayMemoryCache(max_entries=4)
+        for i in range(4):
+            cache.put(("s", f"k{i}", "pathways", ()), i)
+        cache.configure(max_entries=1)
+        assert len(cache) == 1
+        assert ("s", "k3", "pathways", ()) in cache
+
+
+class TestMemoryTier:
+    @pytest.fixture(autouse=True)
+    def _clear(self):
+        clear_memory_cache()
+        yield
+        clear_memory_cache()
+
+    def test_second_load_served_from_memory(self, tmp_path, sample_pathways, monkeypatch):
+        cache_pathways("kegg_test", sample_pathways, str(tmp_path))
+        first = get_cached_pathways("kegg_test", str(tmp_path))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("backing store should not be read")
+
+        monkeypatch.setattr(PathwayDBManager, "load_pathways", fail)
+        assert get_cached_pathways("kegg_test", str(tmp_path)) is first
+        assert get_memory_cache_info()["hits"] == 1
+
+    def test_build_result_is_memoized(self, tmp_path, sample_pathways):
+        cache_pathways("kegg_test", sample_pathways, str(tmp_path))
+        calls = []
+
+        def build(data):
+            calls.append(1)
+            return sorted(data)
+
+        for _ in range(3):
+            result = get_cached_pathways(
+                "kegg_test", str(tmp_path), build=build, kind="ids"
+            )
+        assert result == ["hsa04110", "hsa04115"]
+        assert len(calls) == 1
+
+    def test_save_invalidates(self, tmp_path, sample_pathways):
+        cache_pathways("kegg_test", sample_pathways, str(tmp_path))
+        assert len(get_cached_pathways("kegg_test", str(tmp_path))) == 2
+
+        cache_pathways("kegg_test", {"p": ("P", {"A"})}, str(tmp_path))
+        assert list(get_cached_pathways("kegg_test", str(tmp_path))) == ["p"]
+
+    def test_clear_cache_invalidates(self, tmp_path, sample_pathways):
+        mgr = PathwayDBManager(storage_path=tmp_path)
+        mgr.save_pathways(sample_pathways, cache_key="kegg_test")
+        assert get_cached_pathways("kegg_test", str(tmp_path)) is not None
+        mgr.clear_cache("kegg_test")
+        assert get_cached_pathways("kegg_test", str(tmp_path)) is None
+
+    def test_follows_store_expiry(self, tmp_path, sample_pathways, monkeypatch):
+        mgr = PathwayDBManager(storage_path=tmp_path)
+        mgr.save_pathways(sample_pathways, cache_key="kegg_test", expiry_seconds=60)
+        assert get_cached_pathways("kegg_test", str(tmp_path)) is not None
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 61)
+        assert get_cached_pathways("kegg_test", str(tmp_path)) is None
+
+    def test_get_expiry(self, sqlite_mgr, json_mgr, sample_pathways):
+        for mgr in (sqlite_mgr, json_mgr):
+            before = time.time()
+            mgr.save_pathways(sample_pathways, cache_key="kegg_test", expiry_seconds=60)
+            assert before + 59 < mgr.get_expiry("kegg_test") <= time.time() + 60
+            assert mgr.get_expiry("missing") is None
@@ -0,0 +1,153 @@
+"""Tests for biodbs._funcs.analysis._go — streamed GO annotation ingest."""
+
+import gzip
+import importlib
+
+import polars as pl
+import pytest
+
+from biodbs._funcs.analysis._cache import clear_memory_cache
+from biodbs._funcs.analysis._go import GOAnnotationAggregator, load_go_ancestors
+from biodbs.data._base import iter_line_blocks
+from biodbs.data.QuickGO.data import QuickGOFetchedData, iter_annotation_file
+
+
+GAF = (
+    "!gaf-version: 2.2\n"
+    "UniProtKB\tP1\tA\tinvolved_in\tGO:0000002\tref\tIDA\t\tP\n"
+    "UniProtKB\tP2\tB\tinvolved_in\tGO:0000002\tref\tIEA\t\tP\n"
+    "UniProtKB\tP3\tC\tNOT|involved_in\tGO:0000002\tref\tIDA\t\tP\n"
+    "UniProtKB\tP3\tC\tinvolved_in\tGO:0000003\tref\tIMP\t\tP\n"
+    "UniProtKB\tP4\tD\tenables\tGO:0000009\tref\tIDA\t\tF\n"
+)
+
+GPAD = (
+    "!gpad-version: 2.0\n"
+    "UniProtKB:P1\t\tRO:0002331\tGO:0000002\tref\tECO:0000314\n"
+    "UniProtKB:P2\tNOT\tRO:0002331\tGO:0000002\tref\tECO:0000314\n"
+    "UniProtKB:P3\t\tRO:0002331\tGO:0000002\tref\tECO:0000315\n"
+    "UniProtKB:P4\t\tRO:0002331\tGO:0000002\tref\tECO:0000501\n"
+)
+
+ora_module = importlib.import_module("biodbs._funcs.analysis.ora")
+
+
+class TestChunkedReading:
+    def test_line_blocks_end_on_newlines(self):
+        blocks = list(iter_line_blocks([b"ab\ncd", b"e\nf", b"g"], block_size=3))
+        assert blocks == [b"ab\n", b"cde\n", b"fg"]
+
+    def test_tsv_header_repeated_in_every_chunk(self):
+        stream = [b"GENE\tGO\n", b"P1\tGO:1\nP2\tGO:2\n", b"P3\tGO:3\n"]
+        chunks = list(QuickGOFetchedData.iter_chunks(stream, "tsv", block_size=8))
+        assert len(chunks) > 1
+        rows = [r for chunk in chunks for r in chunk.results]
+        assert [r["GENE"] for r in rows] == ["P1", "P2", "P3"]
+
+    def test_annotation_file_gzip_and_format_inference(self, tmp_path):
+        path = tmp_path / "goa_test.gaf.gz"
+        with gzip.open(path, "wt") as f:
+            f.write(GAF)
+        chunks = list(iter_annotation_file(path, block_size=64))
+        assert sum(len(chunk) for chunk in chunks) == 5
+        assert all(chunk.format == "gaf" for chunk in chunks)
+        with pytest.raises(ValueError, match="Cannot infer"):
+            list(iter_annotation_file(tmp_path / "annotations.txt"))
+
+
+class TestGOAnnotationAggregator:
+    def chunks(self, text, fmt):
+        return QuickGOFetchedData.iter_chunks([text.encode()], fmt, block_size=80)
+
+    def test_filters_negation_evidence_and_aspect(self):
+        aggregator = GOAnnotationAggregator("biological_process", ["IDA", "IMP"])
+        aggregator.update(self.chunks(GAF, "gaf"))
+        assert aggregator.annotation_count == 2
+        assert aggregator.gene_sets() == {
+            "GO:0000002": frozenset({"P1"}),
+            "GO:0000003": frozenset({"P3"}),
+        }
+
+    def test_gpad_strips_prefix_and_rejects_aspect(self):
+        aggregator = GOAnnotationAggregator().update(self.chunks(GPAD, "gpad"))
+        assert aggregator.gene_sets() == {"GO:0000002": frozenset({"P1", "P3", "P4"})}
+        with pytest.raises(ValueError, match="aspect"):
+            GOAnnotationAggregator("biological_process").update(self.chunks(GPAD, "gpad"))
+
+    def test_gpad_matches_go_evidence_codes_as_eco(self):
+        aggregator = GOAnnotationAggregator(evidence_codes=["IDA", "IMP"])
+        aggregator.update(self.chunks(GPAD, "gpad"))
+        assert aggregator.gene_sets() == {"GO:0000002": frozenset({"P1", "P3"})}
+        aggregator = GOAnnotationAggregator(evidence_codes=["ECO:0000501"])
+        aggregator.update(self.chunks(GPAD, "gpad"))
+        assert aggregator.gene_sets() == {"GO:0000002": frozenset({"P4"})}
+
+    def test_true_path_propagation_and_size_filter(self, tmp_path):
+        table = tmp_path / "ancestors.tsv"
+        table.write_text(
+            "# term\tancestor\n"
+            "GO:0000002\tGO:0000001\nGO:0000003\tGO:0000001\nGO:0000003\tGO:0000003\n"
+        )
+        ancestors = load_go_ancestors(table)
+        assert ancestors == {"GO:0000002": ("GO:0000001",), "GO:0000003": ("GO:0000001",)}
+
+        aggregator = GOAnnotationAggregator("biological_process")
+        aggregator.update(self.chunks(GAF, "gaf"))
+        gene_sets = aggregator.gene_sets(ancestors, min_term_size=2)
+        assert gene_sets == {
+            "GO:0000001": frozenset({"P1", "P2", "P3"}),
+            "GO:0000002": frozenset({"P1", "P2"}),
+        }
+        # Propagation does not change the aggregated direct annotations
+        assert "GO:0000001" not in aggregator.gene_sets()
+
+    def test_accepts_polars_frames(self):
+        frame = pl.DataFrame({
+            "db_object_id": ["P1"], "qualifier": ["enables"],
+            "go_id": ["GO:0000009"], "evidence_code": ["IDA"], "aspect": ["F"],
+        })
+        aggregator = GOAnnotationAggregator("molecular_function")
+        assert aggregator.add(frame) == 1
+        assert len(aggregator) == 1
+
+
+class TestOraGoAnnotationFile:
+    @pytest.fixture(autouse=True)
+    def _offline(self, monkeypatch):
+        monkeypatch.setattr(ora_module, "_go_term_names", lambda go_ids: ({}, True))
+        clear_memory_cache()
+        yield
+        clear_memory_cache()
+
+    def test_gpad_file(self, tmp_path):
+        path = tmp_path / "annotations.gpad"
+        path.write_text(GPAD)
+        with pytest.raises(ValueError, match="aspect='all'"):
+            ora_module.ora_go(["P1"], annotation_file=path, cache_dir=str(tmp_path))
+
+        result = ora_module.ora_go(
+            ["P1", "P3"], aspect="all", annotation_file=path,
+            background={"P1", "P2", "P3", "P4", "P5"},
+            min_overlap=1, min_term_size=1, cache_dir=str(tmp_path),
+        )
+        # Default evidence (no IEA) keeps the IDA and IMP annotations only
+        assert [(r.term_id, r.overlap_count, r.term_size) for r in result] == [
+            ("GO:0000002", 2, 2)
+        ]
+
+    def test_cache_key_covers_file_and_ancestors(self, tmp_path):
+        species = ora_module.Species.from_taxon_id(9606)
+        gaf, gpad = tmp_path / "annot.gaf", tmp_path / "annot.gpad"
+        gaf.write_text(GAF)
+        gpad.write_text(GPAD)
+        keys = {
+            ora_module._go_cache_key(species, "all", gaf),
+            ora_module._go_cache_key(species, "all", gpad),
+            ora_module._go_cache_key(species, "all", gpad, {"GO:0000002": ("GO:0000001",)}),
+            ora_module._go_cache_key(species, "all", gpad, {"GO:0000002": ("GO:0000008",)}),
+        }
+        assert len(keys) == 4
+
+        before = ora_module._go_cache_key(species, "all", gpad)
+        gpad.write_text(GPAD + GPAD)
+        assert ora_module._go_cache_key(species, "all", gpad) != before
@@ -0,0 +1,298 @@
+"""Tests for biodbs._funcs.analysis._index module."""
+
+import importlib
+import pickle
+
+import pytest
+
+from biodbs._funcs.analysis._cache import set_default_backend
+from biodbs._funcs.analysis._index import GeneSetIndex
+from biodbs._funcs.analysis.ora import Pathway, ora, ora_batch
+
+ora_module = importlib.import_module("biodbs._funcs.analysis.ora")
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def gene_sets():
+    return {
+        "p1": ("Pathway 1", {"A", "B", "C", "D", "E"}),
+        "p2": ("Pathway 2", {"C", "D", "E", "F", "G"}),
+        "p3": ("Pathway 3", {"H", "I", "J"}),
+    }
+
+
+@pytest.fixture
+def index(gene_sets):
+    return GeneSetIndex.from_gene_sets(gene_sets, database="test")
+
+
+# =============================================================================
+# TestGeneSetIndex
+# =============================================================================
+
+
+class TestGeneSetIndex:
+    def test_dimensions(self, index):
+        assert len(index) == 3
+        assert index.n_genes == 10
+        assert index.membership.shape == (3, 10)
+        assert index.term_ids == ["p1", "p2", "p3"]
+        assert index.term_names == ["Pathway 1", "Pathway 2", "Pathway 3"]
+
+    def test_repr(self, index):
+        assert repr(index) == "<GeneSetIndex database='test' terms=3 genes=10>"
+
+    def test_contains(self, index):
+        assert "A" in index
+        assert "Z" not in index
+
+    def test_from_pathway_objects(self):
+        pathways = {
+            "p1": Pathway(id="p1", name="One", genes=frozenset({"A", "B"}), database="KEGG"),
+        }
+        index = GeneSetIndex.from_gene_sets(pathways)
+        assert index.term_names == ["One"]
+        assert index.n_genes == 2
+
+    def test_empty(self):
+        index = GeneSetIndex.from_gene_sets({})
+        assert len(index) == 0
+        assert index.overlap_counts(index.query_mask(["A"])).size == 0
+
+    def test_overlap_counts(self, index):
+        mask = index.query_mask({"A", "C", "F", "Z"})
+        assert index.overlap_counts(mask).tolist() == [2, 2, 0]
+
+    def test_term_sizes_default(self, index):
+        assert index.term_sizes().tolist() == [5, 5, 3]
+
+    def test_term_sizes_background(self, index):
+        sizes = index.term_sizes({"A", "B", "F", "H"})
+        assert sizes.tolist() == [2, 1, 1]
+        assert index.term_sizes({"A", "B", "F", "H"}) is sizes
+
+    def test_term_sizes_cache_bounded(self, index):
+        for i in range(GeneSetIndex.MAX_CACHED_BACKGROUNDS + 3):
+            index.term_sizes({"A", f"extra{i}"})
+        assert len(index._term_sizes) == GeneSetIndex.MAX_CACHED_BACKGROUNDS
+
+    def test_overlap_genes_selected_rows(self, index):
+        mask = index.query_mask({"A", "C", "F"})
+        overlaps = index.overlap_genes([1], mask)
+        assert len(overlaps) == 1
+        assert sorted(overlaps[0]) == ["C", "F"]
+
+
+# =============================================================================
+# TestORAWithIndex
+# =============================================================================
+
+
+class TestORAWithIndex:
+    @pytest.mark.parametrize("background", [None, {"A", "B", "C", "D", "F", "H", "Q"}])
+    def test_matches_dict_input(self, gene_sets, index, background):
+        query = ["A", "B", "C", "D", "X"]
+        from_dict = ora(query, gene_sets, background=background, min_overlap=1)
+        from_index = ora(query, index, background=background, min_overlap=1)
+
+        assert from_dict.background_size == from_index.background_size
+        assert [r.term_id for r in from_dict] == [r.term_id for r in from_index]
+        for a, b in zip(from_dict, from_index):
+            assert a.p_value == b.p_value
+            assert a.term_size == b.term_size
+            assert sorted(a.overlap_genes) == sorted(b.overlap_genes)
+
+    def test_query_genes_outside_background_count(self, index):
+        # Query genes are always added to the background
+        result = ora(["A", "B", "Z"], index, background={"A", "C"}, min_overlap=1)
+        assert result.background_size == 4
+        p1 = next(r for r in result if r.term_id == "p1")
+        assert p1.term_size == 3
+
+
+# =============================================================================
+# TestORABatch
+# =============================================================================
+
+
+class TestORABatch:
+    @pytest.fixture
+    def gene_lists(self):
+        return {
+            "q1": ["A", "B", "C", "D", "X"],
+            "q2": ["F", "G", "H", "I"],
+            "q3": ["Z"],
+            "q4": [],
+        }
+
+    @pytest.mark.parametrize("background", [None, {"A", "B", "C", "D", "F", "H", "Q"}])
+    @pytest.mark.parametrize("method", ["bonferroni", "holm", "bh", "by"])
+    def test_matches_per_list_ora(self, gene_sets, gene_lists, background, method):
+        df = ora_batch(
+            gene_lists, gene_sets, background=background,
+            min_overlap=1, correction_method=method,
+        )
+        for name, genes in gene_lists.items():
+            rows = df[df["query"] == name]
+            if not genes:
+                assert rows.empty
+                continue
+            expected = ora(
+                genes, gene_sets, background=background,
+                min_overlap=1, correction_method=method,
+            )
+            assert list(rows["term_id"]) == [r.term_id for r in expected]
+            for (_, row), r in zip(rows.iterrows(), expected):
+                assert row["p_value"] == pytest.approx(r.p_value)
+                assert row["adjusted_p_value"] == pytest.approx(r.adjusted_p_value)
+                assert row["overlap_count"] == r.overlap_count
+                assert row["term_size"] == r.term_size
+                assert row["background_size"] == r.background_size
+                assert row["odds_ratio"] == pytest.approx(r.odds_ratio)
+                assert set(row["overlap_genes"].split(",")) == set(r.overlap_genes)
+
+    def test_columns_and_query_order(self, index, gene_lists):
+        df = ora_batch(gene_lists, index, min_overlap=1)
+        assert list(df.columns)[:3] == ["query", "term_id", "term_name"]
+        assert list(dict.fromkeys(df["query"])) == ["q1", "q2"]
+        assert set(df["database"]) == {"custom"}
+
+    def test_min_overlap_zero_tests_every_term(self, index):
+        df = ora_batch({"q": ["A"]}, index, min_overlap=0)
+        assert sorted(df["term_id"]) == ["p1", "p2", "p3"]
+
+    def test_polars_engine(self, index, gene_lists):
+        pl = pytest.importorskip("polars")
+        df = ora_batch(gene_lists, index, min_overlap=1, engine="polars")
+        assert isinstance(df, pl.DataFrame)
+        assert df.columns == list(ora_batch(gene_lists, index, min_overlap=1).columns)
+
+    def test_invalid_engine(self, index, gene_lists):
+        with pytest.raises(ValueError, match="Unsupported engine"):
+            ora_batch(gene_lists, index, engine="arrow")
+
+    def test_n_jobs_matches_serial(self, index, gene_lists):
+        serial = ora_batch(gene_lists, index, min_overlap=1)
+        parallel = ora_batch(gene_lists, index, min_overlap=1, n_jobs=2)
+        assert serial.equals(parallel)
+
+    def test_index_pickle_roundtrip(self, index):
+        index.term_sizes({"A", "B"})
+        restored = pickle.loads(pickle.dumps(index))
+        assert restored.term_ids == index.term_ids
+        assert (restored.membership != index.membership).nnz == 0
+        assert list(restored.term_sizes({"A", "B"})) == [2, 0, 0]
+
+
+# =============================================================================
+# TestGeneSetIndexMemo
+# =============================================================================
+
+
+class TestGeneSetIndexMemo:
+    @pytest.fixture(autouse=True)
+    def _clear(self):
+        ora_module.clear_gene_set_indexes()
+        yield
+        ora_module.clear_gene_set_indexes()
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path):
+        return str(tmp_path)
+
+    def test_builds_once(self, gene_sets, cache_dir):
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return gene_sets
+
+        first = ora_module._get_gene_set_index("kegg_hsa", loader, "KEGG", cache_dir=cache_dir)
+        second = ora_module._get_gene_set_index("kegg_hsa", loader, "KEGG", cache_dir=cache_dir)
+
+        assert first is second
+        assert len(calls) == 1
+
+    def test_use_cache_false_rebuilds(self, gene_sets, cache_dir):
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return gene_sets
+
+        first = ora_module._get_gene_set_index("kegg_hsa", loader, "KEGG", cache_dir=cache_dir)
+        second = ora_module._get_gene_set_index(
+            "kegg_hsa", loader, "KEGG", cache_dir=cache_dir, use_cache=False
+        )
+
+        assert first is not second
+        assert len(calls) == 2
+
+    def test_empty_library_not_stored(self, cache_dir):
+        ora_module._get_gene_set_index("go_9606_biological_process", dict, "GO", cache_dir=cache_dir)
+        assert ora_module.get_memoized(
+            "go_9606_biological_process", "index", cache_dir=cache_dir
+        ) is None
+
+    def test_options_are_part_of_key(self, gene_sets, cache_dir):
+        small = ora_module._get_gene_set_index(
+            "go_9606_biological_process", lambda: gene_sets, "GO",
+            options=(None, 5, 500), cache_dir=cache_dir,
+        )
+        large = ora_module._get_gene_set_index(
+            "go_9606_biological_process", lambda: gene_sets, "GO",
+            options=(None, 10, 500), cache_dir=cache_dir,
+        )
+        assert small is not large
+
+    def test_invalidated_when_library_saved(self, gene_sets, cache_dir):
+        first = ora_module._get_gene_set_index(
+            "kegg_hsa", lambda: gene_sets, "KEGG", cache_dir=cache_dir
+        )
+        ora_module.cache_pathways("kegg_hsa", gene_sets, cache_dir)
+        second = ora_module._get_gene_set_index(
+            "kegg_hsa", lambda: gene_sets, "KEGG", cache_dir=cache_dir
+        )
+        assert first is not second
+
+    def test_columnar_store_skips_loader(self, gene_sets, cache_dir):
+        def loader():
+            raise AssertionError("loader should not be called")
+
+        set_default_backend("parquet")
+        try:
+            ora_module.cache_pathways("reactome_hsa", gene_sets, cache_dir)
+            index = ora_module._get_gene_set_index(
+                "reactome_hsa", loader, "Reactome", options=(4, 500),
+                cache_dir=cache_dir, min_term_size=4, max_term_size=500,
+            )
+        finally:
+            set_default_backend("sqlite")
+
+        assert index.database == "Reactome"
+        assert index.term_ids == ["p1", "p2"]
+        assert list(index.term_sizes()) == [5, 5]
+
+    def test_ora_kegg_reuses_index(self, gene_sets, monkeypatch, cache_dir):
+        calls = []
+
+        def fake_kegg(species, use_cache=True, cache_dir=None):
+            calls.append(species)
+            return gene_sets
+
+        monkeypatch.setattr(ora_module, "_get_kegg_pathways", fake_kegg)
+        ora_module.ora_kegg(
+            ["A", "B", "C"], organism="hsa", min_overlap=1, cache_dir=cache_dir
+        )
+        result = ora_module.ora_kegg(
+            ["C", "D", "E"], organism="hsa", min_overlap=1, cache_dir=cache_dir
+        )
+
+        assert len(calls) == 1
+        assert result.database == "KEGG"
+        assert {r.term_id for r in result} == {"p1", "p2"}
@@ -3,8 +3,10 @@
 All tests are pure unit tests with no API calls or network access.
 """
 
+import importlib
 import math
 
+import numpy as np
 import pytest
 
 from biodbs._funcs.analysis.ora import (
@@ -17,11 +19,18 @@ from biodbs._funcs.analysis.ora import (
     Species,
     TranslationDatabase,
     hypergeometric_test,
+    hypergeometric_test_batch,
     multiple_test_correction,
+    multiple_test_correction_array,
     ora,
+    _get_go_terms,
+    _get_kegg_pathways,
+    _hypergeom_sf_numpy,
     _normalize_id_type,
 )
 
+ora_module = importlib.import_module("biodbs._funcs.analysis.ora")
+
 
 # =============================================================================
 # Species enum
@@ -349,6 +358,90 @@ class TestMultipleTestCorrection:
         assert all(v == 1.0 for v in adj)
 
 
+# =============================================================================
+# Batch statistics
+# =============================================================================
+
+
+class TestHypergeometricTestBatch:
+    CASES = [(5, 50, 20, 1000), (0, 50, 20, 1000), (10, 100, 10, 10000),
+             (5, 5, 5, 5), (3, 7, 5, 20), (0, 0, 10, 20)]
+
+    def test_matches_scalar(self):
+        k, K, n, N = (list(col) for col in zip(*self.CASES))
+        batch = hypergeometric_test_batch(k, K, n, N)
+        for p, case in zip(batch, self.CASES):
+            assert p == pytest.approx(hypergeometric_test(*case), rel=1e-12)
+
+    def test_broadcast_scalars(self):
+        batch = hypergeometric_test_batch([1, 2, 3], [10, 20, 30], 15, 500)
+        assert batch.shape == (3,)
+        assert batch[0] == pytest.approx(hypergeometric_test(1, 10, 15, 500))
+
+    def test_numpy_kernel_matches_scipy(self):
+        k = np.array([c[0] for c in self.CASES])
+        K = np.array([c[1] for c in self.CASES])
+        n = np.array([c[2] for c in self.CASES])
+        N = np.array([c[3] for c in self.CASES])
+        expected = hypergeometric_test_batch(k, K, n, N)
+        assert np.allclose(_hypergeom_sf_numpy(k, K, n, N), expected, rtol=1e-9)
+
+    def test_empty(self):
+        assert hypergeometric_test_batch([], [], 10, 100).size == 0
+
+    def test_invalid_raises(self):
+        with pytest.raises(ValueError, match="non-negative"):
+            hypergeometric_test_batch([-1], [10], 10, 100)
+        with pytest.raises(ValueError, match="k cannot exceed"):
+            hypergeometric_test_batch([1, 15], [10, 10], 20, 100)
+        with pytest.raises(ValueError, match="cannot exceed N"):
+            hypergeometric_test_batch([5], [200], 10, 100)
+
+
+class TestMultipleTestCorrectionArray:
+    @pytest.fixture
+    def p_values(self):
+        return [0.04, 0.001, 0.5, 0.01, 0.04, 0.1]
+
+    @pytest.mark.parametrize("method", ["bh", "by", "holm", "bonferroni", "none"])
+    def test_matches_reference_loop(self, p_values, method):
+        n = len(p_values)
+        indexed = sorted(enumerate(p_values), key=lambda x: x[1])
+        expected = [0.0] * n
+        if method in ("bh", "by"):
+            c_n = sum(1.0 / i for i in range(1, n + 1)) if method == "by" else 1.0
+            cummin = 1.0
+            for rank in range(n - 1, -1, -1):
+                idx, p = indexed[rank]
+                cummin = min(cummin, p * n * c_n / (rank + 1))
+                expected[idx] = min(1.0, cummin)
+        elif method == "holm":
+            cummax = 0.0
+            for rank, (idx, p) in enumerate(indexed):
+                cummax = max(cummax, p * (n - rank))
+                expected[idx] = min(1.0, cummax)
+        elif method == "bonferroni":
+            expected = [min(1.0, p * n) for p in p_values]
+        else:
+            expected = list(p_values)
+
+        adj = multiple_test_correction_array(p_values, method)
+        assert isinstance(adj, np.ndarray)
+        assert np.allclose(adj, expected, rtol=1e-12, atol=0)
+
+    def test_empty(self):
+        assert multiple_test_correction_array([], "bh").size == 0
+
+    @pytest.mark.parametrize("method", ["bh", "by", "holm", "bonferroni"])
+    def test_rows_with_nan_padding(self, p_values, method):
+        short = [0.2, 0.003, 0.03]
+        padded = np.array([p_values, short + [np.nan] * (len(p_values) - len(short))])
+        adj = multiple_test_correction_array(padded, method)
+        assert np.allclose(adj[0], multiple_test_correction_array(p_values, method))
+        assert np.allclose(adj[1, :3], multiple_test_correction_array(short, method))
+        assert np.isnan(adj[1, 3:]).all()
+
+
 # =============================================================================
 # _normalize_id_type
 # =============================================================================
@@ -454,6 +547,117 @@ class TestORA:
         assert "B" in result.mapped_genes
 
 
+# =============================================================================
+# Gene-set builders (fetchers replaced with canned responses)
+# =============================================================================
+
+
+class TestGeneSetBuilders:
+    def test_kegg_pathways_grouped_from_link_table(self, monkeypatch):
+        from biodbs.data.KEGG.data import KEGGFetchedData
+
+        listing = (
+            "path:hsa00010\tGlycolysis - Homo sapiens (human)\n"
+            "path:hsa00020\tCitrate cycle (TCA cycle) - Homo sapiens (human)\n"
+        )
+        links = (
+            "hsa:1\tpath:hsa00010\nhsa:2\tpath:hsa00010\n"
+            "hsa:2\tpath:hsa00020\nhsa:3\tpath:hsa00099\n"
+        )
+        monkeypatch.setattr(ora_module, "kegg_list",
+                            lambda *a, **kw: KEGGFetchedData(listing, "list"))
+        monkeypatch.setattr(ora_module, "kegg_link",
+                            lambda *a, **kw: KEGGFetchedData(links, "link"))
+
+        pathways = _get_kegg_pathways(Species.HUMAN, use_cache=False)
+
+        assert pathways["hsa00010"].genes == frozenset({"1", "2"})
+        assert pathways["hsa00010"].name == "Glycolysis"
+        assert pathways["hsa00020"].name == "Citrate cycle (TCA cycle)"
+        assert pathways["hsa00099"].name == "hsa00099"
+
+    def test_go_terms_streamed_from_gaf_download(self, monkeypatch):
+        from types import SimpleNamespace
+
+        from biodbs.data.QuickGO.data import QuickGOFetchedData
+
+        gaf = (
+            b"!gaf-version: 2.2\n"
+            b"UniProtKB\tP1\tA\tinvolved_in\tGO:1\tref\tIDA\t\tP\n"
+            b"UniProtKB\tP2\tB\tinvolved_in\tGO:1\tref\tIMP\t\tP\n"
+            b"UniProtKB\tP3\tC\tNOT|involved_in\tGO:1\tref\tIDA\t\tP\n"
+            b"UniProtKB\tP3\tC\tinvolved_in\tGO:2\tref\tIEA\t\tP\n"
+            b"UniProtKB\tP3\tC\tenables\tGO:3\tref\tIDA\t\tF\n"
+        )
+        requests = []
+
+        def fake_download(**kwargs):
+            requests.append(kwargs)
+            return QuickGOFetchedData.iter_chunks([gaf], "gaf", block_size=64)
+
+        monkeypatch.setattr(ora_module, "quickgo_iter_annotations", fake_download)
+        monkeypatch.setattr(
+            ora_module, "quickgo_get_terms",
+            lambda ids: SimpleNamespace(results=[{"id": "GO:1", "name": "one"}]),
+        )
+
+        terms = _get_go_terms(Species.HUMAN, use_cache=False,
+                              min_term_size=1, max_term_size=10)
+
+        assert set(terms) == {"GO:1"}
+        assert terms["GO:1"].genes == frozenset({"P1", "P2"})
+        assert terms["GO:1"].name == "one"
+        assert requests[0]["taxonId"] == 9606
+        assert requests[0]["aspect"] == "biological_process"
+        assert "IEA" not in requests[0]["goEvidence"]
+
+    def test_go_term_names_fetched_in_batches(self, monkeypatch):
+        from types import SimpleNamespace
+
+        from biodbs._funcs.analysis.ora import _go_term_names
+
+        batches = []
+
+        def fake_terms(ids):
+            batches.append(list(ids))
+            return SimpleNamespace(results=[{"id": i, "name": i.lower()} for i in ids])
+
+        monkeypatch.setattr(ora_module, "quickgo_get_terms", fake_terms)
+        ids = [f"GO:{i}" for i in range(5)]
+        names, complete = _go_term_names(ids, batch_size=2)
+
+        assert complete
+        assert names == {i: i.lower() for i in ids}
+        assert sorted(map(len, batches)) == [1, 2, 2]
+
+    def test_go_terms_not_cached_after_failed_name_lookup(self, monkeypatch, tmp_path):
+        from biodbs._funcs.analysis._cache import clear_memory_cache
+        from biodbs.data.QuickGO.data import QuickGOFetchedData
+
+        clear_memory_cache()
+
+        gaf = b"UniProtKB\tP1\tA\tinvolved_in\tGO:1\tref\tIDA\t\tP\n"
+        monkeypatch.setattr(
+            ora_module, "quickgo_iter_annotations",
+            lambda **kwargs: QuickGOFetchedData.iter_chunks([gaf], "gaf"),
+        )
+
+        def failing_terms(ids):
+            raise ConnectionError("QuickGO unavailable")
+
+        monkeypatch.setattr(ora_module, "quickgo_get_terms", failing_terms)
+        cached = []
+        monkeypatch.setattr(ora_module, "cache_pathways", lambda *args: cached.append(args))
+
+        with pytest.warns(UserWarning, match="GO term names"):
+            terms = _get_go_terms(Species.HUMAN, cache_dir=str(tmp_path),
+                                  min_term_size=1, max_term_size=10)
+
+        assert terms["GO:1"].name == "GO:1"
+        assert cached == []
+        clear_memory_cache()
+
+
 # =============================================================================
 # Enum values
 # =============================================================================
@@ -6,7 +6,16 @@ from datetime import datetime, timedelta
 
 import pytest
 
-from biodbs.data._base import BaseFetchedData, BaseDBManager, _sanitize_identifier
+from biodbs.data._base import (
+    BaseFetchedData,
+    BaseDBManager,
+    FrameRecords,
+    LazyRecords,
+    _sanitize_identifier,
+    concat_records,
+    construct_model,
+    read_tsv,
+)
 
 
 # =============================================================================
@@ -64,6 +73,117 @@ class TestBaseFetchedData:
 # =============================================================================
 
 
+class TestLazyRecords:
+    def test_parses_only_on_access(self):
+        calls = []
+
+        def parse(raw):
+            calls.append(raw["id"])
+            return raw["id"] * 10 if raw["id"] != 2 else None
+
+        records = LazyRecords([{"id": 1}, {"id": 2}, {"id": 3}], parse)
+        assert records.raw_count == 3
+        assert list(records.project(lambda d: d["id"], lambda r: r)) == [1, 2, 3]
+        assert calls == []
+        assert records.parse_at(0) == 10
+        assert list(records.project(lambda d: d["id"], lambda r: r)) == [10, 2, 3]
+        assert records == [10, 30]
+        assert calls == [1, 2, 3]
+
+    def test_indexing_parses_only_requested_records(self):
+        calls = []
+
+        def parse(raw):
+            calls.append(raw)
+            return raw * 10
+
+        records = LazyRecords(range(1000), parse)
+        assert len(records) == 1000
+        assert records[0] == 0
+        assert records[-1] == 9990
+        assert records[10:12] == [100, 110]
+        assert records[0] == 0
+        assert calls == [0, 999, 10, 11]
+        assert not records.is_parsed
+
+    def test_rejected_record_falls_back_to_parsed_list(self):
+        records = LazyRecords([1, 2, 3], lambda raw: raw if raw != 2 else None)
+        assert records[0] == 1
+        assert records[1] == 3
+        assert len(records) == 2
+        assert records.is_parsed
+
+    def test_truthiness_skips_rejected_records(self):
+        records = LazyRecords([1, 2, 3], lambda raw: raw if raw == 2 else None)
+        assert records and records.parse_at(1) == 2
+        assert not LazyRecords([1, 2], lambda raw: None)
+        assert not LazyRecords()
+
+    def test_extend_keeps_other_unparsed(self):
+        records = LazyRecords([{"id": 1}], lambda d: d["id"])
+        assert list(records) == [1]
+        other = LazyRecords([{"id": 2}], lambda d: d["id"])
+        records.extend(other)
+        assert not records.is_parsed
+        records.append(3)
+        assert records == [1, 2, 3]
+        assert records.select(lambda r: r > 1).raw == [{"id": 2}, None]
+
+    def test_construct_model_builds_nested_models(self):
+        from typing import List, Optional
+
+        from pydantic import BaseModel, Field
+
+        class Child(BaseModel):
+            value: int
+
+        class Parent(BaseModel):
+            name: str = Field(alias="label")
+            child: Optional[Child] = None
+            children: Optional[List[Child]] = None
+
+        parent = construct_model(
+            Parent, {"label": "p", "child": {"value": 1}, "children": [{"value": 2}]}
+        )
+        assert parent.name == "p"
+        assert parent.child.value == 1
+        assert parent.children[0].value == 2
+
+
+class TestFrameRecords:
+    def test_read_tsv_ragged_rows_comments_and_header(self):
+        frame = read_tsv("!c\nk\tv\na\t1\textra\n\nb\n", has_header=True,
+                         comment_prefix="!")
+        assert frame.columns == ["k", "v", "col_2"]
+        assert frame.rows() == [("a", "1", "extra"), ("b", None, None)]
+        trimmed = read_tsv("a\t1\textra\nb\n", ["k", "v"], fill="", drop_extra=True)
+        assert trimmed.rows() == [("a", "1"), ("b", "")]
+        assert read_tsv("  \n", ["k"]).columns == ["k"]
+
+    def test_read_tsv_separator_bytes_in_text(self):
+        frame = read_tsv("a\x1fb\t1\nc\t2\n", ["k", "v"])
+        assert frame.rows() == [("a\x1fb", "1"), ("c", "2")]
+        every = "".join(["\x1f", "\x1e", "\x1d", "\x1c", "\x00"])
+        frame = read_tsv(f"!c\n{every}\t1\n", ["k", "v"], comment_prefix="!")
+        assert frame.rows() == [(every, "1")]
+
+    def test_rows_built_only_when_iterated(self):
+        records = FrameRecords(read_tsv("a\t1\nb\t2\n", ["k", "v"]))
+        assert len(records) == 2 and records[1] == {"k": "b", "v": "2"}
+        assert len(records[:1]) == 1 and not records.is_materialized
+        assert list(records) == [{"k": "a", "v": "1"}, {"k": "b", "v": "2"}]
+        assert records.is_materialized
+        records.append({"k": "c", "v": "3"})
+        assert records.frame.height == 3
+
+    def test_concat_records_stays_columnar(self):
+        parts = [FrameRecords(read_tsv(f"{k}\t1\n", ["k", "v"])) for k in "ab"]
+        combined = concat_records(parts)
+        assert isinstance(combined, FrameRecords) and not combined.is_materialized
+        assert combined == [{"k": "a", "v": "1"}, {"k": "b", "v": "1"}]
+        assert concat_records([[{"k": "x"}], parts[0]]) == [{"k": "x"}, {"k": "a", "v": "1"}]
+
+
 class TestSanitizeIdentifier:
     def test_valid_name(self):
         assert _sanitize_identifier("my_table") == '"my_table"'
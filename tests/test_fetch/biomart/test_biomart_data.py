@@ -377,6 +377,16 @@ ENSG00000012048\tBRCA1\tBRCA1 DNA repair associated
         data1 += data2
         assert len(data1) == 4
 
+    def test_concat(self, sample_query_result):
+        """Test concat combines many results in one pass."""
+        parts = [BioMartQueryData(sample_query_result) for _ in range(3)]
+        combined = BioMartQueryData.concat([None] + parts)
+        assert combined is parts[0]
+        assert len(combined) == 6
+        assert list(combined.as_dataframe().index) == list(range(6))
+        with pytest.raises(ValueError):
+            BioMartQueryData.concat([])
+
     def test_has_error_false(self, sample_query_result):
         """Test has_error returns False for valid data."""
         data = BioMartQueryData(sample_query_result)
@@ -200,6 +200,14 @@ class TestDOFetchedData:
         assert term is not None
         assert term.name == "cancer"
 
+    def test_get_term_index_follows_iadd(self):
+        """Test get_term sees terms added with +=."""
+        data = DOFetchedData([{"id": "DOID:162", "name": "cancer"}])
+        assert data.get_term("DOID:1612") is None
+        data += DOFetchedData({"obo_id": "DOID:1612", "label": "breast cancer"})
+        assert data.get_term("1612").name == "breast cancer"
+        assert data.get_term("162").name == "cancer"
+
     def test_get_term_by_name(self):
         """Test get_term_by_name method."""
         content = [
@@ -119,6 +119,21 @@ class TestHPAFetchedData:
         assert len(filtered.results) == 1
         assert filtered.results[0]["Gene"] == "TP53"
 
+    def test_filter_uses_index_and_follows_iadd(self):
+        """Test equality filters combined with callables and +=."""
+        content = [
+            {"Gene": "TP53", "Ensembl": "ENSG00000141510", "Score": 10},
+            {"Gene": "TP53", "Ensembl": "ENSG00000141510", "Score": 1},
+            {"Gene": "BRCA1", "Ensembl": "ENSG00000012048", "Score": 5},
+        ]
+        data = HPAFetchedData(content)
+        filtered = data.filter(Ensembl="ENSG00000141510", Score=lambda x: x > 5)
+        assert [r["Score"] for r in filtered.results] == [10]
+        assert len(data.filter(Ensembl="ENSG00000146648").results) == 0
+
+        data += HPAFetchedData([{"Gene": "EGFR", "Ensembl": "ENSG00000146648"}])
+        assert data.filter(Ensembl="ENSG00000146648").results[0]["Gene"] == "EGFR"
+
     def test_filter_with_callable(self):
         """Test filtering with callable."""
         content = [
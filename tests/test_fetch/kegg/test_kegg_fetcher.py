@@ -492,6 +492,55 @@ class TestErrorHandling:
 class TestKEGGFetchedData:
     """Tests for KEGGFetchedData methods."""
 
+    def test_get_entry_index(self):
+        """Test get_entry by entry ID and ENTRY prefix without network."""
+        from biodbs.data.KEGG.data import KEGGFetchedData
+
+        text = (
+            "ENTRY       10458             CDS       T01001\nNAME        BAIAP2\n///\n"
+            "ENTRY       7157              CDS       T01001\nNAME        TP53\n///\n"
+        )
+        data = KEGGFetchedData(text, operation="get")
+        assert data.get_entry("7157")["NAME"] == "TP53"
+        assert data.get_entry("1045")["NAME"] == "BAIAP2"
+        assert data.get_entry("672") is None
+
+        listing = KEGGFetchedData("hsa:672\tBRCA1\n", operation="list")
+        data = KEGGFetchedData("hsa:7157\tTP53\n", operation="list")
+        assert data.get_entry("hsa:672") is None
+        data += listing
+        assert data.get_entry("hsa:672")["description"] == "BRCA1"
+
+    def test_tabular_records_keep_baseline_shape(self):
+        """Test only rows with extra fields get an ``extra`` key."""
+        from biodbs.data.KEGG.data import KEGGFetchedData
+
+        data = KEGGFetchedData("a\tb\tc\te\nx\ty\n", operation="ddi")
+        assert data.records[1] == {"drug1": "x", "drug2": "y", "interaction_type": None}
+        assert list(data.records) == [
+            {"drug1": "a", "drug2": "b", "interaction_type": "c", "extra": ["e"]},
+            {"drug1": "x", "drug2": "y", "interaction_type": None},
+        ]
+        plain = KEGGFetchedData("hsa:1\tG1\n", operation="list")
+        assert list(KEGGFetchedData.concat([data, plain]).records)[2] == {
+            "entry_id": "hsa:1", "description": "G1",
+        }
+
+    def test_concat(self):
+        """Test concat joins records once and refreshes the index."""
+        from biodbs.data.KEGG.data import KEGGFetchedData
+
+        parts = [
+            KEGGFetchedData(f"hsa:{gene_id}\tG{gene_id}\n", operation="list")
+            for gene_id in (1, 2, 3)
+        ]
+        parts[0].get_entry("hsa:1")
+        combined = KEGGFetchedData.concat(parts)
+        assert [r["entry_id"] for r in combined.records] == ["hsa:1", "hsa:2", "hsa:3"]
+        assert combined.get_entry("hsa:3")["description"] == "G3"
+        with pytest.raises(ValueError):
+            KEGGFetchedData.concat([combined, KEGGFetchedData({"a": 1}, operation="get", get_option="json")])
+
     def test_filter_by_exact_match(self, fetcher):
         """Test filtering records by exact match."""
         data = fetcher.get(
@@ -0,0 +1,342 @@
+"""Tests for the native asyncio fetcher API (aget / aget_all)."""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from biodbs.exceptions import APIRateLimitError, APIServerError
+from biodbs.fetch._base import BaseDataFetcher
+from biodbs.fetch._rate_limit import RateLimiter, async_request_with_retry
+from biodbs.fetch._session import AsyncResponse, SessionPool, session_pool
+
+
+def _async_response(status_code=200, json_data=None, text="", headers=None, url=""):
+    """Create a buffered async response."""
+    if json_data is not None:
+        content = json.dumps(json_data).encode()
+        headers = {"Content-Type": "application/json", **(headers or {})}
+    else:
+        content = text.encode()
+    return AsyncResponse(status_code, headers or {}, url, content)
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limiter():
+    """Give every test a fresh limiter schedule and fast rates."""
+    limiter = RateLimiter()
+    saved_rates = dict(limiter._rates)
+    limiter.reset()
+    limiter._rates.clear()
+    limiter.DEFAULT_RATE = 1000
+    yield limiter
+    del limiter.DEFAULT_RATE
+    limiter.reset()
+    limiter._rates.clear()
+    limiter._rates.update(saved_rates)
+
+
+@pytest.fixture
+def mock_arequest():
+    with patch.object(session_pool, "arequest", new_callable=AsyncMock) as mocked:
+        yield mocked
+
+
+# =============================================================================
+# Session layer
+# =============================================================================
+
+
+class TestAsyncResponse:
+    def test_text_and_json(self):
+        resp = AsyncResponse(200, {}, "http://x", b'{"a": 1}')
+        assert resp.ok
+        assert resp.text == '{"a": 1}'
+        assert resp.json() == {"a": 1}
+
+    def test_not_ok(self):
+        assert not AsyncResponse(404, {}, "", b"").ok
+
+
+class TestAiohttpSession:
+    def test_session_shared_within_loop(self):
+        pool = SessionPool()
+
+        async def main():
+            a = pool.aiohttp_session()
+            b = pool.aiohttp_session()
+            await pool.aclose()
+            return a, b
+
+        a, b = asyncio.run(main())
+        assert a is b
+        assert a.closed
+
+    def test_arequest_encodes_params_like_requests(self):
+        from aiohttp import web
+
+        pool = SessionPool()
+
+        async def handler(request):
+            return web.json_response({"query": request.rel_url.raw_query_string})
+
+        async def main():
+            app = web.Application()
+            app.router.add_get("/echo", handler)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            try:
+                return await pool.arequest(
+                    "GET",
+                    f"http://127.0.0.1:{port}/echo",
+                    params={"ids": ["GO:1", "GO:2"], "skip": None, "limit": 5},
+                    timeout=5,
+                )
+            finally:
+                await pool.aclose()
+                await runner.cleanup()
+
+        resp = asyncio.run(main())
+        assert resp.status_code == 200
+        assert resp.json() == {"query": "ids=GO%3A1&ids=GO%3A2&limit=5"}
+
+
+# =============================================================================
+# Rate limiting and retry
+# =============================================================================
+
+
+class TestAsyncRateLimiting:
+    def test_acquire_async_spaces_requests(self, reset_rate_limiter):
+        limiter = reset_rate_limiter
+        limiter.set_rate("slow.host", 20)
+
+        async def main():
+            start = time.perf_counter()
+            await asyncio.gather(*(limiter.acquire_async("slow.host") for _ in range(5)))
+            return time.perf_counter() - start
+
+        # Five slots at 20/s: the last one is 4 intervals after the first
+        assert asyncio.run(main()) >= 0.18
+
+    def test_setdefault_rate_keeps_explicit_rate(self, reset_rate_limiter):
+        limiter = reset_rate_limiter
+        limiter.set_rate("api.example.org", 2)
+        assert limiter.setdefault_rate("api.example.org", 10) == 2
+        assert limiter.setdefault_rate("other.example.org", 10) == 10
+
+    def test_retries_429_then_succeeds(self, mock_arequest):
+        mock_arequest.side_effect = [
+            _async_response(429, headers={"Retry-After": "0"}),
+            _async_response(200, json_data={"ok": True}),
+        ]
+        resp = asyncio.run(async_request_with_retry("https://api.example.org/x"))
+        assert resp.json() == {"ok": True}
+        assert mock_arequest.await_count == 2
+
+    def test_429_exhausted_raises(self, mock_arequest):
+        mock_arequest.return_value = _async_response(429, headers={"Retry-After": "0"})
+        with pytest.raises(APIRateLimitError):
+            asyncio.run(async_request_with_retry("https://api.example.org/x", max_retries=1))
+
+    def test_5xx_exhausted_raises(self, mock_arequest):
+        mock_arequest.return_value = _async_response(503, text="down")
+        with pytest.raises(APIServerError):
+            asyncio.run(async_request_with_retry(
+                "https://api.example.org/x", max_retries=1, initial_delay=0.0,
+            ))
+
+    def test_client_errors_are_returned(self, mock_arequest):
+        mock_arequest.return_value = _async_response(404, text="missing")
+        resp = asyncio.run(async_request_with_retry("https://api.example.org/x"))
+        assert resp.status_code == 404
+
+
+# =============================================================================
+# Base fetcher scheduling
+# =============================================================================
+
+
+class TestAsyncScheduling:
+    def _fetcher(self):
+        return BaseDataFetcher(None, None, {})
+
+    def test_aschedule_process_preserves_order_and_bounds_concurrency(self):
+        fetcher = self._fetcher()
+        in_flight = 0
+        peak = 0
+
+        async def work(i):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01 * (5 - i % 5))
+            in_flight -= 1
+            return i
+
+        results = asyncio.run(fetcher.aschedule_process(
+            work, args_list=[(i,) for i in range(12)], max_concurrency=3,
+        ))
+        assert results == list(range(12))
+        assert peak == 3
+
+    def test_schedule_process_inside_running_loop(self):
+        fetcher = self._fetcher()
+
+        async def main():
+            return fetcher.schedule_process(
+                lambda x: x * 2, args_list=[(1,), (2,)], rate_limit_per_second=10,
+            )
+
+        assert asyncio.run(main()) == [2, 4]
+
+
+# =============================================================================
+# Fetchers
+# =============================================================================
+
+
+class TestFDAAsync:
+    SEARCH = {"patient.drug.medicinalproduct": "aspirin"}
+
+    def test_aget(self, mock_arequest, tmp_path):
+        from biodbs.fetch.FDA.fda_fetcher import FDA_Fetcher
+
+        mock_arequest.return_value = _async_response(200, json_data={
+            "meta": {"results": {"total": 1}},
+            "results": [{"receivedate": "20200101"}],
+        })
+        fetcher = FDA_Fetcher(storage_path=str(tmp_path))
+        data = asyncio.run(fetcher.aget("drug", "event", search=self.SEARCH, limit=1))
+        assert data.results == [{"receivedate": "20200101"}]
+        args, kwargs = mock_arequest.call_args
+        assert args == ("GET", "https://api.fda.gov/drug/event.json")
+        assert kwargs["params"]["limit"] == 1
+
+    def test_aget_all_pages(self, mock_arequest, tmp_path):
+        from biodbs.fetch.FDA.fda_fetcher import FDA_Fetcher
+
+        async def fake(method, url, params=None, **kwargs):
+            skip, limit = params["skip"], params["limit"]
+            return _async_response(200, json_data={
+                "meta": {"results": {"total": 25}},
+                "results": [
+                    {"receivedate": str(i)} for i in range(skip, min(skip + limit, 25))
+                ],
+            })
+
+        mock_arequest.side_effect = fake
+        fetcher = FDA_Fetcher(storage_path=str(tmp_path))
+        data = asyncio.run(fetcher.aget_all("drug", "event", search=self.SEARCH, batch_size=10))
+        assert [r["receivedate"] for r in data.results] == [str(i) for i in range(25)]
+        assert mock_arequest.await_count == 3
+
+
+class TestChEMBLAsync:
+    def test_aget_404_returns_empty(self, mock_arequest):
+        from biodbs.fetch.ChEMBL.chembl_fetcher import ChEMBL_Fetcher
+
+        mock_arequest.return_value = _async_response(404, text="not found")
+        data = asyncio.run(ChEMBL_Fetcher().aget(resource="molecule", chembl_id="CHEMBL0"))
+        assert len(data.results) == 0
+
+    def test_aget_all_pages(self, mock_arequest):
+        from biodbs.fetch.ChEMBL.chembl_fetcher import ChEMBL_Fetcher
+
+        async def fake(method, url, params=None, **kwargs):
+            offset, limit = params["offset"], params["limit"]
+            return _async_response(200, json_data={
+                "page_meta": {"total_count": 7},
+                "molecules": [
+                    {"molecule_chembl_id": f"CHEMBL{i}"}
+                    for i in range(offset, min(offset + limit, 7))
+                ],
+            })
+
+        mock_arequest.side_effect = fake
+        data = asyncio.run(ChEMBL_Fetcher().aget_all(resource="molecule", limit_per_page=3))
+        assert [r["molecule_chembl_id"] for r in data.results] == [f"CHEMBL{i}" for i in range(7)]
+
+
+class TestQuickGOAsync:
+    def test_aget_all_pages(self, mock_arequest):
+        from biodbs.fetch.QuickGO.quickgo_fetcher import QuickGO_Fetcher
+
+        async def fake(method, url, params=None, **kwargs):
+            page = params["page"]
+            start = (page - 1) * 2
+            return _async_response(200, json_data={
+                "numberOfHits": 5,
+                "results": [{"id": f"GO:{i}"} for i in range(start, min(start + 2, 5))],
+            })
+
+        mock_arequest.side_effect = fake
+        data = asyncio.run(QuickGO_Fetcher().aget_all(
+            category="ontology", endpoint="search", query="apoptosis", limit_per_page=2,
+        ))
+        assert [r["id"] for r in data.results] == [f"GO:{i}" for i in range(5)]
+
+
+class TestKEGGAsync:
+    def test_aget_text(self, mock_arequest):
+        from biodbs.fetch.KEGG.kegg_fetcher import KEGG_Fetcher
+
+        mock_arequest.return_value = _async_response(200, text="pathway info")
+        data = asyncio.run(KEGG_Fetcher().aget("info", database="pathway"))
+        assert data.text == "pathway info"
+        assert mock_arequest.call_args.args[1] == "https://rest.kegg.jp/info/pathway"
+
+    def test_aget_all_batches(self, mock_arequest):
+        from biodbs.fetch.KEGG.kegg_fetcher import KEGG_Fetcher
+
+        async def fake(method, url, **kwargs):
+            entries = url.rsplit("/", 1)[-1].split("+")
+            return _async_response(200, text="\n".join(f"{e}\tncbi-geneid:{e[4:]}" for e in entries))
+
+        mock_arequest.side_effect = fake
+        genes = [f"hsa:{i}" for i in range(25)]
+        data = asyncio.run(KEGG_Fetcher().aget_all("conv", genes, target_db="ncbi-geneid"))
+        assert mock_arequest.await_count == 3
+        assert [r["source_id"] for r in data.records] == genes
+
+
+class TestPubChemAsync:
+    def test_aget_all_batches(self, mock_arequest):
+        from biodbs.fetch.pubchem.pubchem_fetcher import PubChem_Fetcher
+
+        async def fake(method, url, **kwargs):
+            cids = url.split("/cid/")[1].split("/")[0].split(",")
+            return _async_response(200, json_data={
+                "PropertyTable": {"Properties": [{"CID": int(c)} for c in cids]}
+            })
+
+        mock_arequest.side_effect = fake
+        data = asyncio.run(PubChem_Fetcher().aget_all(
+            domain="compound", namespace="cid", identifiers=list(range(1, 6)),
+            operation="property", properties=["MolecularWeight"], batch_size=2,
+        ))
+        assert [r["CID"] for r in data.results] == [1, 2, 3, 4, 5]
+
+
+class TestUniProtAsync:
+    def test_asearch_all_follows_cursor(self, mock_arequest):
+        from biodbs.fetch.uniprot.uniprot_fetcher import UniProt_Fetcher
+
+        pages = [
+            _async_response(
+                200,
+                json_data={"results": [{"primaryAccession": "P1"}]},
+                headers={"Link": '<https://rest.uniprot.org/uniprotkb/search?cursor=abc>; rel="next"'},
+            ),
+            _async_response(200, json_data={"results": [{"primaryAccession": "P2"}]}),
+        ]
+        mock_arequest.side_effect = pages
+        data = asyncio.run(UniProt_Fetcher().asearch_all("gene:TP53", max_results=10))
+        assert [e.primaryAccession for e in data.entries] == ["P1", "P2"]
+        assert mock_arequest.call_args.kwargs["params"]["cursor"] == "abc"
+
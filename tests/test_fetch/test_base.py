@@ -1,8 +1,10 @@
 """Tests for biodbs.fetch._base module."""
 
+import time
+
 import pytest
 from pydantic import BaseModel
-from biodbs.fetch._base import BaseAPIConfig, NameSpace, BaseDataFetcher
+from biodbs.fetch._base import BaseAPIConfig, NameSpace, BaseDataFetcher, RequestPlan
 
 
 # =============================================================================
@@ -55,6 +57,12 @@ class TestBaseAPIConfig:
         assert copied.api_url == config.api_url
         assert copied is not config
 
+    def test_build_url_leaves_config_untouched(self):
+        config = BaseAPIConfig(url_format="https://api.example.com/{x}")
+        config.update_params(x="old")
+        assert config.build_url({"x": "new"}) == "https://api.example.com/new"
+        assert config.api_url == "https://api.example.com/old"
+
     def test_no_format_raises(self):
         config = BaseAPIConfig()
         with pytest.raises(NotImplementedError):
@@ -82,13 +90,27 @@ class TestNameSpace:
         ns = NameSpace(_TestModel)
         ok, msg = ns.validate(name="test", value=5)
         assert ok is True
-        assert ns.valid_params == {"name": "test", "value": 5}
+        assert not hasattr(ns, "valid_params")
 
-    def test_validate_with_defaults(self):
+    def test_parse_with_defaults(self):
         ns = NameSpace(_TestModel)
-        ok, msg = ns.validate(name="test")
-        assert ok is True
-        assert ns.valid_params["value"] == 10
+        assert ns.parse(name="test") == {"name": "test", "value": 10}
+
+    def test_parse_invalid_raises(self):
+        ns = NameSpace(_TestModel)
+        with pytest.raises(ValueError, match="name"):
+            ns.parse(value=5)
+
+    def test_request_params_hook(self):
+        class _PathNameSpace(NameSpace):
+            def request_params(self, model):
+                params = super().request_params(model)
+                params["_path"] = f"items/{model.name}"
+                return params
+
+        ns = _PathNameSpace(_TestModel)
+        assert ns.parse(name="a")["_path"] == "items/a"
+        assert ns.parse(name="b")["_path"] == "items/b"
 
     def test_validate_invalid(self):
         ns = NameSpace(_TestModel)
@@ -102,6 +124,32 @@ class TestNameSpace:
         assert ok is False
 
 
+# =============================================================================
+# TestRequestPlan
+# =============================================================================
+
+
+class TestRequestPlan:
+    def test_copies_inputs(self):
+        params = {"q": "a"}
+        plan = RequestPlan("https://api.example.com", params)
+        params["q"] = "b"
+        assert plan.params == {"q": "a"}
+        assert plan.method == "GET"
+
+    def test_frozen(self):
+        plan = RequestPlan("https://api.example.com")
+        with pytest.raises(AttributeError):
+            plan.url = "https://other.example.com"
+
+    def test_with_params(self):
+        plan = RequestPlan("https://api.example.com", {"q": "a", "page": 1})
+        page2 = plan.with_params(page=2)
+        assert page2.params == {"q": "a", "page": 2}
+        assert plan.params == {"q": "a", "page": 1}
+        assert page2.url == plan.url
+
+
 # =============================================================================
 # TestBaseDataFetcher
 # =============================================================================
@@ -132,3 +180,119 @@ class TestBaseDataFetcher:
                 args_list=[(1,), (2,)],
                 kwargs_list=[{}],
             )
+
+    def test_schedule_process_paces_with_token_bucket(self):
+        fetcher = BaseDataFetcher(None, None, {})
+        start = time.perf_counter()
+        result = fetcher.schedule_process(
+            lambda x: x, args_list=[(i,) for i in range(5)], rate_limit_per_second=20,
+        )
+        assert result == list(range(5))
+        # Five calls at 20/s with no burst: four intervals of 50 ms
+        assert time.perf_counter() - start >= 0.18
+
+    def test_schedule_process_shares_host_bucket(self):
+        from biodbs.fetch._rate_limit import get_rate_limiter
+
+        limiter = get_rate_limiter()
+        limiter.set_rate("shared.example.org", 1000.0)
+        try:
+            fetcher = BaseDataFetcher(None, None, {})
+            fetcher.schedule_process(
+                lambda x: x, args_list=[(1,), (2,)], host="shared.example.org",
+            )
+            bucket = limiter.bucket("shared.example.org")
+            assert bucket.rate == 1000.0
+            assert bucket.tokens < bucket.capacity
+        finally:
+            limiter._rates.pop("shared.example.org", None)
+            limiter.reset()
+
+    def test_iter_process_yields_in_order(self):
+        fetcher = BaseDataFetcher(None, None, {})
+
+        def slow_first(x):
+            time.sleep(0.05 if x == 0 else 0)
+            return x * 2
+
+        results = list(fetcher.iter_process(
+            slow_first, args_list=[(i,) for i in range(5)], rate_limit_per_second=1000,
+            max_in_flight=3,
+        ))
+        assert results == [(i, i * 2) for i in range(5)]
+
+    def test_iter_process_unordered_yields_completed_first(self):
+        fetcher = BaseDataFetcher(None, None, {})
+
+        def slow_first(x):
+            time.sleep(0.2 if x == 0 else 0)
+            return x
+
+        results = list(fetcher.iter_process(
+            slow_first, args_list=[(i,) for i in range(3)], rate_limit_per_second=1000,
+            max_in_flight=3, ordered=False,
+        ))
+        assert results[-1] == (0, 0)
+        assert sorted(results) == [(0, 0), (1, 1), (2, 2)]
+
+    def test_iter_process_bounds_in_flight(self):
+        import threading
+
+        fetcher = BaseDataFetcher(None, None, {})
+        started = []
+        lock = threading.Lock()
+
+        def record(x):
+            with lock:
+                started.append(x)
+            return x
+
+        stream = fetcher.iter_process(
+            record, args_list=[(i,) for i in range(10)], rate_limit_per_second=1000,
+            max_in_flight=2,
+        )
+        assert next(stream) == (0, 0)
+        time.sleep(0.05)
+        # One result consumed, so at most 2 more calls may have started
+        assert len(started) <= 3
+        stream.close()
+        time.sleep(0.05)
+        assert len(started) <= 3
+
+    def test_iter_process_exceptions(self):
+        fetcher = BaseDataFetcher(None, None, {})
+
+        def fail_odd(x):
+            if x % 2:
+                raise RuntimeError(x)
+            return x
+
+        results = dict(fetcher.iter_process(
+            fail_odd, args_list=[(i,) for i in range(4)], rate_limit_per_second=1000,
+            return_exceptions=True,
+        ))
+        assert results[0] == 0 and isinstance(results[1], RuntimeError)
+        with pytest.raises(RuntimeError):
+            list(fetcher.iter_process(
+                fail_odd, args_list=[(i,) for i in range(4)], rate_limit_per_second=1000,
+            ))
+
+    def test_aiter_process_ordered_and_unordered(self):
+        import asyncio
+
+        fetcher = BaseDataFetcher(None, None, {})
+
+        async def delayed(x):
+            await asyncio.sleep(0.1 if x == 0 else 0)
+            return x
+
+        async def collect(ordered):
+            return [
+                item async for item in fetcher.aiter_process(
+                    delayed, args_list=[(i,) for i in range(3)], max_in_flight=3,
+                    ordered=ordered,
+                )
+            ]
+
+        assert asyncio.run(collect(True)) == [(0, 0), (1, 1), (2, 2)]
+        assert asyncio.run(collect(False))[-1] == (0, 0)
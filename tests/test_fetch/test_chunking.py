@@ -0,0 +1,166 @@
+"""Tests for biodbs.fetch._chunking module."""
+
+import threading
+import time
+
+import pytest
+import requests
+
+from biodbs.exceptions import APIError, APIValidationError
+from biodbs.fetch._base import BaseDataFetcher
+from biodbs.fetch._chunking import (
+    ChunkLimits,
+    ChunkPlanner,
+    get_chunk_planner,
+    register_chunk_limits,
+)
+
+
+@pytest.fixture
+def fetcher():
+    return BaseDataFetcher(None, None, {})
+
+
+def _too_large(status=413):
+    return APIError("too large", service="test", status_code=status)
+
+
+class TestChunkPlanner:
+    def test_split_respects_max_items(self):
+        planner = ChunkPlanner(ChunkLimits(max_items=3))
+        assert planner.split(list(range(7))) == [[0, 1, 2], [3, 4, 5], [6]]
+        assert planner.split(list(range(7)), max_items=2)[0] == [0, 1]
+
+    def test_split_respects_max_bytes(self):
+        planner = ChunkPlanner(ChunkLimits(max_items=100, max_bytes=11))
+        # "aaaa,bbbb" is 9 bytes; adding ",cccc" would make 14
+        assert planner.split(["aaaa", "bbbb", "cccc"]) == [["aaaa", "bbbb"], ["cccc"]]
+
+    def test_oversized_single_item_still_gets_a_chunk(self):
+        planner = ChunkPlanner(ChunkLimits(max_items=10, max_bytes=2))
+        assert planner.split(["long-id", "x"]) == [["long-id"], ["x"]]
+
+    def test_slow_responses_shrink_fast_ones_grow_back(self):
+        planner = ChunkPlanner(ChunkLimits(max_items=100, target_seconds=1.0))
+        planner.record_success(100, 3.0)
+        assert planner.chunk_size == 50
+        planner.record_success(50, 0.1)
+        assert planner.chunk_size == 100
+        planner.record_success(100, 0.1)
+        assert planner.chunk_size == 100
+
+    def test_oversize_caps_growth(self):
+        planner = ChunkPlanner(ChunkLimits(max_items=100))
+        planner.record_failure(100, oversize=True)
+        planner.record_success(50, 0.0)
+        assert planner.chunk_size == 50
+        planner.record_failure(50, oversize=False)
+        planner.record_success(25, 0.0)
+        assert planner.chunk_size == 50
+
+    def test_cleared_rejection_caps_growth(self):
+        planner = ChunkPlanner(ChunkLimits(max_items=100))
+        planner.record_failure(100, oversize=False)
+        planner.record_rejection_cleared(50)
+        planner.record_success(50, 0.0)
+        assert planner.chunk_size == 50
+
+    def test_failure_kind(self):
+        assert ChunkPlanner.failure_kind(_too_large(414)) == "oversize"
+        assert ChunkPlanner.failure_kind(APIValidationError("x")) == "rejected"
+        assert ChunkPlanner.failure_kind(requests.exceptions.ReadTimeout()) == "timeout"
+        assert ChunkPlanner.failure_kind(APIError("down", status_code=503)) is None
+
+    def test_registry(self):
+        assert get_chunk_planner("ensembl.sequence_id").limits.max_items == 50
+        with pytest.raises(ValueError, match="No chunk limits"):
+            get_chunk_planner("nope.endpoint")
+        planner = register_chunk_limits("test.endpoint", max_items=7)
+        assert get_chunk_planner("test.endpoint") is planner
+
+
+class TestChunkedProcess:
+    def test_results_in_input_order(self, fetcher):
+        planner = ChunkPlanner(ChunkLimits(max_items=10))
+
+        def get(chunk):
+            time.sleep(0.01 * (chunk[0] % 3))
+            return list(chunk)
+
+        parts = fetcher.chunked_process(get, list(range(95)), planner, max_workers=4)
+        assert [x for part in parts for x in part] == list(range(95))
+        assert len(parts) == 10
+
+    def test_runs_chunks_concurrently(self, fetcher):
+        planner = ChunkPlanner(ChunkLimits(max_items=1))
+        active = peak = 0
+        lock = threading.Lock()
+
+        def get(chunk):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return chunk
+
+        fetcher.chunked_process(get, list(range(8)), planner, max_workers=4)
+        assert peak > 1
+
+    def test_too_large_chunks_are_split(self, fetcher):
+        planner = ChunkPlanner(ChunkLimits(max_items=100))
+        sizes = []
+
+        def get(chunk):
+            sizes.append(len(chunk))
+            if len(chunk) > 30:
+                raise _too_large()
+            return list(chunk)
+
+        parts = fetcher.chunked_process(get, list(range(100)), planner, max_workers=1)
+        assert [x for part in parts for x in part] == list(range(100))
+        assert sizes[:3] == [100, 50, 25]
+        assert planner.chunk_size <= 25
+
+    def test_bad_request_cleared_by_split_caps_growth(self, fetcher):
+        planner = ChunkPlanner(ChunkLimits(max_items=100))
+        sizes = []
+
+        def get(chunk):
+            sizes.append(len(chunk))
+            if len(chunk) > 50:
+                raise APIValidationError("test", detail="too many IDs")
+            return list(chunk)
+
+        parts = fetcher.chunked_process(get, list(range(200)), planner, max_workers=1)
+        assert [x for part in parts for x in part] == list(range(200))
+        assert max(sizes[1:]) == 50
+        assert planner.chunk_size == 50
+
+    def test_genuine_bad_request_is_raised(self, fetcher):
+        planner = ChunkPlanner(ChunkLimits(max_items=100))
+        calls = []
+
+        def get(chunk):
+            calls.append(len(chunk))
+            raise APIValidationError("test", detail="unknown species")
+
+        with pytest.raises(APIValidationError):
+            fetcher.chunked_process(get, list(range(100)), planner, max_workers=1)
+        assert calls == [100, 50]
+
+    def test_other_errors_propagate(self, fetcher):
+        planner = ChunkPlanner(ChunkLimits(max_items=10))
+
+        def get(chunk):
+            raise APIError("down", status_code=503)
+
+        with pytest.raises(APIError, match="down"):
+            fetcher.chunked_process(get, list(range(30)), planner)
+        assert planner.chunk_size == 10
+
+    def test_empty_input(self, fetcher):
+        planner = ChunkPlanner(ChunkLimits(max_items=10))
+        assert fetcher.chunked_process(lambda chunk: chunk, [], planner) == []
@@ -0,0 +1,219 @@
+"""Tests for biodbs.fetch._coalesce module."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from biodbs.fetch._coalesce import (
+    RequestCoalescer,
+    disable_request_coalescing,
+    enable_request_coalescing,
+    get_request_coalescer,
+)
+from biodbs.fetch._rate_limit import get_rate_limiter, request_with_retry
+from biodbs.fetch._session import SessionPool
+
+
+def _response(content=b'{"a": 1}', url="https://example.org/x"):
+    resp = requests.Response()
+    resp.status_code = 200
+    resp._content = content
+    resp.headers = requests.structures.CaseInsensitiveDict({"Content-Type": "application/json"})
+    resp.url = url
+    return resp
+
+
+def _slow_session(delay=0.2, content=b'{"a": 1}'):
+    session = MagicMock()
+
+    def request(method, url, **kwargs):
+        time.sleep(delay)
+        return _response(content, url)
+
+    session.request.side_effect = request
+    return session
+
+
+def _in_threads(n, target):
+    results = [None] * n
+
+    def run(i):
+        results[i] = target()
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+@pytest.fixture
+def pool():
+    p = SessionPool()
+    yield p
+    p.close()
+
+
+@pytest.fixture(autouse=True)
+def coalescer():
+    c = enable_request_coalescing()
+    c.reset_stats()
+    yield c
+    enable_request_coalescing(RequestCoalescer.DEFAULT_METHODS)
+    c.reset_stats()
+
+
+class TestRequestCoalescer:
+    def test_key_ignores_method_and_header_case(self):
+        c = RequestCoalescer()
+        a = c.key("GET", "https://x.org/a", params={"p": 1, "q": 2}, headers={"Accept": "json"})
+        b = c.key("get", "https://x.org/a?p=1&q=2", headers={"accept": "json"})
+        assert a == b
+        assert a != c.key("GET", "https://x.org/a", params={"p": 1, "q": 3})
+        assert a != c.key("GET", "https://x.org/a", params={"p": 1, "q": 2})
+
+    def test_post_body_is_part_of_key(self):
+        c = RequestCoalescer()
+        assert c.key("POST", "https://x.org", json={"ids": [1]}) != c.key(
+            "POST", "https://x.org", json={"ids": [2]}
+        )
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"stream": True}, {"files": {"f": b"1"}}, {"auth": ("u", "p")}, {"data": iter([b"x"])}],
+    )
+    def test_uncoalescable_requests(self, kwargs):
+        assert RequestCoalescer().key("POST", "https://x.org", **kwargs) is None
+
+    def test_disabled_and_method_filter(self):
+        assert RequestCoalescer(enabled=False).key("GET", "https://x.org") is None
+        assert RequestCoalescer(methods=["GET"]).key("POST", "https://x.org") is None
+        assert RequestCoalescer().key("DELETE", "https://x.org") is None
+
+    def test_run_shares_result_and_error(self):
+        c = RequestCoalescer()
+        gate = threading.Event()
+        calls = []
+
+        def send():
+            calls.append(1)
+            gate.wait(2)
+            raise ValueError("boom")
+
+        def call():
+            try:
+                c.run("k", send)
+            except ValueError as e:
+                return str(e)
+
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        for t in threads:
+            t.start()
+        time.sleep(0.1)
+        gate.set()
+        for t in threads:
+            t.join()
+        assert len(calls) == 1
+        assert c.stats() == {"requests": 4, "executed": 1, "coalesced": 3, "in_flight": 0}
+
+    def test_sequential_calls_are_not_coalesced(self):
+        c = RequestCoalescer()
+        assert c.run("k", lambda: 1) == (1, False)
+        assert c.run("k", lambda: 2) == (2, False)
+        assert c.stats()["coalesced"] == 0
+
+    def test_global_toggle(self):
+        disable_request_coalescing()
+        assert get_request_coalescer().enabled is False
+        assert enable_request_coalescing(["GET"]).methods == {"GET"}
+
+
+class TestSessionPoolCoalescing:
+    def test_concurrent_identical_gets_share_one_call(self, pool, coalescer):
+        session = _slow_session()
+        with patch.object(pool, "session", return_value=session):
+            results = _in_threads(8, lambda: pool.get("https://example.org/x", params={"q": 1}))
+        assert session.request.call_count == 1
+        assert all(r.json() == {"a": 1} for r in results)
+        assert len({id(r) for r in results}) == 8
+        assert coalescer.stats()["coalesced"] == 7
+
+    def test_different_requests_are_sent_separately(self, pool):
+        session = _slow_session(0.05)
+        with patch.object(pool, "session", return_value=session):
+            _in_threads(4, lambda: pool.get("https://example.org/x", params={"q": time.monotonic_ns()}))
+        assert session.request.call_count == 4
+
+    def test_streams_are_not_coalesced(self, pool):
+        session = _slow_session(0.05)
+        with patch.object(pool, "session", return_value=session):
+            _in_threads(3, lambda: pool.get("https://example.org/x", stream=True))
+        assert session.request.call_count == 3
+
+    def test_disabled_sends_every_request(self, pool):
+        disable_request_coalescing()
+        session = _slow_session(0.05)
+        with patch.object(pool, "session", return_value=session):
+            _in_threads(3, lambda: pool.get("https://example.org/x"))
+        assert session.request.call_count == 3
+
+    def test_async_gather_shares_one_call(self, pool, coalescer):
+        calls = []
+
+        class _Resp:
+            status = 200
+            headers = {"Content-Type": "application/json"}
+            url = "https://example.org/x?q=1"
+
+            async def read(self):
+                await asyncio.sleep(0.05)
+                return b'{"a": 1}'
+
+            def get_encoding(self):
+                return "utf-8"
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+        session = MagicMock()
+        session.request.side_effect = lambda *a, **k: calls.append(1) or _Resp()
+
+        async def run():
+            with patch.object(pool, "aiohttp_session", return_value=session):
+                return await asyncio.gather(
+                    *(pool.arequest("GET", "https://example.org/x", params={"q": 1}) for _ in range(5))
+                )
+
+        results = asyncio.run(run())
+        assert len(calls) == 1
+        assert [r.json() for r in results] == [{"a": 1}] * 5
+        assert coalescer.stats() == {"requests": 5, "executed": 1, "coalesced": 4, "in_flight": 0}
+
+
+class TestCoalescedRequestsSkipRateLimiter:
+    @pytest.fixture(autouse=True)
+    def slow_host(self):
+        limiter = get_rate_limiter()
+        limiter.set_rate("coalesce.test", 0.5)
+        yield
+        limiter._rates.pop("coalesce.test", None)
+        limiter.reset()
+
+    def test_followers_do_not_take_tokens(self):
+        url = "https://coalesce.test/x"
+        session = _slow_session(0.2)
+        with patch("biodbs.fetch._session.session_pool.session", return_value=session):
+            start = time.monotonic()
+            results = _in_threads(4, lambda: request_with_retry(url, max_retries=0))
+            elapsed = time.monotonic() - start
+        assert session.request.call_count == 1
+        assert all(r.status_code == 200 for r in results)
+        assert elapsed < 1.0
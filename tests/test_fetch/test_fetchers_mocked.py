@@ -8,6 +8,8 @@ Tests cover:
 """
 
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 from unittest.mock import Mock, patch
@@ -47,7 +49,7 @@ def _mock_response(
 class TestKEGGFetcherMocked:
     """Test KEGG fetcher with mocked HTTP."""
 
-    @patch("biodbs.utils.fetch.requests")
+    @patch("biodbs.fetch._session.session_pool")
     def test_get_info_success(self, mock_requests):
         """Test successful info operation returns KEGGFetchedData."""
         mock_requests.get.return_value = _mock_response(
@@ -62,7 +64,7 @@ class TestKEGGFetcherMocked:
         assert result is not None
         assert result.text == "kegg db info for pathway..."
 
-    @patch("biodbs.utils.fetch.requests")
+    @patch("biodbs.fetch._session.session_pool")
     def test_get_server_error_503(self, mock_requests):
         """Test 503 raises APIServerError."""
         mock_requests.get.return_value = _mock_response(
@@ -75,7 +77,7 @@ class TestKEGGFetcherMocked:
         with pytest.raises(APIServerError):
             fetcher.get("info", database="pathway")
 
-    @patch("biodbs.utils.fetch.requests")
+    @patch("biodbs.fetch._session.session_pool")
     def test_get_server_error_500(self, mock_requests):
         """Test 500 raises APIServerError."""
         mock_requests.get.return_value = _mock_response(
@@ -88,7 +90,7 @@ class TestKEGGFetcherMocked:
         with pytest.raises(APIServerError):
             fetcher.get("info", database="pathway")
 
-    @patch("biodbs.utils.fetch.requests")
+    @patch("biodbs.fetch._session.session_pool")
     def test_get_rate_limit_error(self, mock_requests):
         """Test 429 raises APIRateLimitError."""
         mock_requests.get.return_value = _mock_response(
@@ -101,7 +103,7 @@ class TestKEGGFetcherMocked:
         with pytest.raises(APIRateLimitError):
             fetcher.get("info", database="pathway")
 
-    @patch("biodbs.utils.fetch.requests")
+    @patch("biodbs.fetch._session.session_pool")
     def test_get_not_found_error(self, mock_requests):
         """Test 404 raises APINotFoundError."""
         mock_requests.get.return_value = _mock_response(404, text="Not Found")
@@ -112,7 +114,7 @@ class TestKEGGFetcherMocked:
         with pytest.raises(APINotFoundError):
             fetcher.get("info", database="pathway")
 
-    @patch("biodbs.utils.fetch.requests")
+    @patch("biodbs.fetch._session.session_pool")
     def test_get_json_option(self, mock_requests):
         """Test get with json option parses JSON."""
         mock_requests.get.return_value = _mock_response(
@@ -125,7 +127,7 @@ class TestKEGGFetcherMocked:
         result = fetcher.get("get", dbentries=["hsa:7157"], get_option="json")
         assert result is not None
 
-    @patch("biodbs.utils.fetch.requests")
+    @patch("biodbs.fetch._session.session_pool")
     def test_get_image_option(self, mock_requests):
         """Test get with image option uses response.content (binary)."""
         mock_requests.get.return_value = _mock_response(
@@ -140,7 +142,7 @@ class TestKEGGFetcherMocked:
         )
         assert result is not None
 
-    @patch("biodbs.utils.fetch.requests")
+    @patch("biodbs.fetch._session.session_pool")
     def test_get_text_default(self, mock_requests):
         """Test get without option uses response.text."""
         mock_requests.get.return_value = _mock_response(
@@ -155,7 +157,7 @@ class TestKEGGFetcherMocked:
         assert result is not None
         assert "TP53" in result.text
 
-    @patch("biodbs.utils.fetch.requests")
+    @patch("biodbs.fetch._session.session_pool")
     def test_get_list_operation(self, mock_requests):
         """Test list operation."""
         mock_requests.get.return_value = _mock_response(
@@ -172,7 +174,7 @@ class TestKEGGFetcherMocked:
         result = fetcher.get("list", database="pathway", organism="hsa")
         assert result is not None
 
-    @patch("biodbs.utils.fetch.requests")
+    @patch("biodbs.fetch._session.session_pool")
     def test_get_find_operation(self, mock_requests):
         """Test find operation."""
         mock_requests.get.return_value = _mock_response(
@@ -186,7 +188,7 @@ class TestKEGGFetcherMocked:
         result = fetcher.get("find", database="genes", query="tp53")
         assert result is not None
 
-    @patch("biodbs.utils.fetch.requests")
+    @patch("biodbs.fetch._session.session_pool")
     def test_get_client_error_raises_api_error(self, mock_requests):
         """Test non-standard HTTP error (e.g. 403) raises APIError."""
         mock_requests.get.return_value = _mock_response(
@@ -256,7 +258,7 @@ class TestKEGGFetcherValidation:
 class TestChEMBLFetcherMocked:
     """Test ChEMBL fetcher with mocked HTTP."""
 
-    @patch("biodbs.fetch.ChEMBL.chembl_fetcher.requests")
+    @patch("biodbs.fetch.ChEMBL.chembl_fetcher.session_pool")
     def test_get_molecule_success(self, mock_requests):
         """Test successful molecule lookup."""
         mock_requests.get.return_value = _mock_response(
@@ -274,7 +276,7 @@ class TestChEMBLFetcherMocked:
         result = fetcher.get(resource="molecule", chembl_id="CHEMBL25")
         assert result is not None
 
-    @patch("biodbs.fetch.ChEMBL.chembl_fetcher.requests")
+    @patch("biodbs.fetch.ChEMBL.chembl_fetcher.session_pool")
     def test_get_404_returns_empty(self, mock_requests):
         """Test 404 returns empty result, not exception."""
         mock_requests.get.return_value = _mock_response(404, text="Not Found")
@@ -285,7 +287,7 @@ class TestChEMBLFetcherMocked:
         result = fetcher.get(resource="molecule", chembl_id="CHEMBL99999999")
         assert len(result.results) == 0
 
-    @patch("biodbs.fetch.ChEMBL.chembl_fetcher.requests")
+    @patch("biodbs.fetch.ChEMBL.chembl_fetcher.session_pool")
     def test_get_server_error_500(self, mock_requests):
         """Test 500 raises APIServerError."""
         mock_requests.get.return_value = _mock_response(
@@ -298,7 +300,7 @@ class TestChEMBLFetcherMocked:
         with pytest.raises(APIServerError):
             fetcher.get(resource="molecule", chembl_id="CHEMBL25")
 
-    @patch("biodbs.fetch.ChEMBL.chembl_fetcher.requests")
+    @patch("biodbs.fetch.ChEMBL.chembl_fetcher.session_pool")
     def test_get_server_error_502(self, mock_requests):
         """Test 502 raises APIServerError."""
         mock_requests.get.return_value = _mock_response(
@@ -311,7 +313,7 @@ class TestChEMBLFetcherMocked:
         with pytest.raises(APIServerError):
             fetcher.get(resource="molecule", chembl_id="CHEMBL25")
 
-    @patch("biodbs.fetch.ChEMBL.chembl_fetcher.requests")
+    @patch("biodbs.fetch.ChEMBL.chembl_fetcher.session_pool")
     def test_get_rate_limit_error(self, mock_requests):
         """Test 429 raises APIRateLimitError."""
         mock_requests.get.return_value = _mock_response(
@@ -324,7 +326,7 @@ class TestChEMBLFetcherMocked:
         with pytest.raises(APIRateLimitError):
             fetcher.get(resource="molecule", chembl_id="CHEMBL25")
 
-    @patch("biodbs.fetch.ChEMBL.chembl_fetcher.requests")
+    @patch("biodbs.fetch.ChEMBL.chembl_fetcher.session_pool")
     def test_get_search(self, mock_requests):
         """Test search returns results."""
         mock_requests.get.return_value = _mock_response(
@@ -344,7 +346,7 @@ class TestChEMBLFetcherMocked:
         )
         assert result is not None
 
-    @patch("biodbs.fetch.ChEMBL.chembl_fetcher.requests")
+    @patch("biodbs.fetch.ChEMBL.chembl_fetcher.session_pool")
     def test_get_with_filters(self, mock_requests):
         """Test filtered query."""
         mock_requests.get.return_value = _mock_response(
@@ -361,7 +363,7 @@ class TestChEMBLFetcherMocked:
         )
         assert result is not None
 
-    @patch("biodbs.fetch.ChEMBL.chembl_fetcher.requests")
+    @patch("biodbs.fetch.ChEMBL.chembl_fetcher.session_pool")
     def test_fetch_page_success(self, mock_requests):
         """Test _fetch_page returns ChEMBLFetchedData on 200."""
         mock_requests.get.return_value = _mock_response(
@@ -383,7 +385,7 @@ class TestChEMBLFetcherMocked:
         )
         assert result is not None
 
-    @patch("biodbs.fetch.ChEMBL.chembl_fetcher.requests")
+    @patch("biodbs.fetch.ChEMBL.chembl_fetcher.session_pool")
     def test_fetch_page_error(self, mock_requests):
         """Test _fetch_page raises on non-200."""
         mock_requests.get.return_value = _mock_response(
@@ -400,7 +402,7 @@ class TestChEMBLFetcherMocked:
                 "molecule",
             )
 
-    @patch("biodbs.fetch.ChEMBL.chembl_fetcher.requests")
+    @patch("biodbs.fetch.ChEMBL.chembl_fetcher.session_pool")
     def test_get_validation_error(self, mock_requests):
         """Test 400 raises APIValidationError."""
         mock_requests.get.return_value = _mock_response(
@@ -418,6 +420,31 @@ class TestChEMBLFetcherMocked:
             )
 
 
+    @patch("biodbs.fetch.ChEMBL.chembl_fetcher.session_pool")
+    def test_shared_fetcher_across_threads(self, mock_requests):
+        """Concurrent get() calls on one fetcher never see each other's URL."""
+        def echo(url, params=None, **kwargs):
+            time.sleep(0.001)
+            return _mock_response(
+                200, json_data={"molecule_chembl_id": url.rsplit("/", 1)[-1]}
+            )
+
+        mock_requests.get.side_effect = echo
+
+        from biodbs.fetch.ChEMBL.chembl_fetcher import ChEMBL_Fetcher
+
+        fetcher = ChEMBL_Fetcher()
+        ids = [f"CHEMBL{i}" for i in range(200)]
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(pool.map(
+                lambda chembl_id: fetcher.get(resource="molecule", chembl_id=chembl_id),
+                ids,
+            ))
+        assert [r.results[0]["molecule_chembl_id"] for r in results] == [
+            f"{chembl_id}.json" for chembl_id in ids
+        ]
+
+
 class TestChEMBLFetcherValidation:
     """Test ChEMBL fetcher input validation."""
 
@@ -469,7 +496,7 @@ class TestFDAFetcherMocked:
     def _tmp_storage(self, tmp_path):
         self._storage_path = str(tmp_path)
 
-    @patch("biodbs.fetch.FDA.fda_fetcher.requests")
+    @patch("biodbs.fetch.FDA.fda_fetcher.session_pool")
     def test_get_success(self, mock_requests):
         """Test successful drug event query."""
         mock_requests.get.return_value = _mock_response(
@@ -492,7 +519,7 @@ class TestFDAFetcherMocked:
         assert result is not None
         assert len(result.results) == 1
 
-    @patch("biodbs.fetch.FDA.fda_fetcher.requests")
+    @patch("biodbs.fetch.FDA.fda_fetcher.session_pool")
     def test_get_server_error_503(self, mock_requests):
         """Test 503 raises APIServerError."""
         mock_requests.get.return_value = _mock_response(
@@ -510,7 +537,7 @@ class TestFDAFetcherMocked:
                 limit=1,
             )
 
-    @patch("biodbs.fetch.FDA.fda_fetcher.requests")
+    @patch("biodbs.fetch.FDA.fda_fetcher.session_pool")
     def test_get_server_error_500(self, mock_requests):
         """Test 500 raises APIServerError."""
         mock_requests.get.return_value = _mock_response(
@@ -528,7 +555,7 @@ class TestFDAFetcherMocked:
                 limit=1,
             )
 
-    @patch("biodbs.fetch.FDA.fda_fetcher.requests")
+    @patch("biodbs.fetch.FDA.fda_fetcher.session_pool")
     def test_get_rate_limit(self, mock_requests):
         """Test 429 raises APIRateLimitError with retry_after."""
         mock_requests.get.return_value = _mock_response(
@@ -549,7 +576,7 @@ class TestFDAFetcherMocked:
             )
         assert exc_info.value.retry_after == 60.0
 
-    @patch("biodbs.fetch.FDA.fda_fetcher.requests")
+    @patch("biodbs.fetch.FDA.fda_fetcher.session_pool")
     def test_get_not_found(self, mock_requests):
         """Test 404 raises APINotFoundError."""
         mock_requests.get.return_value = _mock_response(
@@ -567,7 +594,7 @@ class TestFDAFetcherMocked:
                 limit=1,
             )
 
-    @patch("biodbs.fetch.FDA.fda_fetcher.requests")
+    @patch("biodbs.fetch.FDA.fda_fetcher.session_pool")
     def test_fetch_page_success(self, mock_requests):
         """Test _fetch_page returns FDAFetchedData on 200."""
         mock_requests.get.return_value = _mock_response(
@@ -586,7 +613,7 @@ class TestFDAFetcherMocked:
         )
         assert result is not None
 
-    @patch("biodbs.fetch.FDA.fda_fetcher.requests")
+    @patch("biodbs.fetch.FDA.fda_fetcher.session_pool")
     def test_fetch_page_error(self, mock_requests):
         """Test _fetch_page raises on non-200."""
         mock_requests.get.return_value = _mock_response(500, text="Error")
@@ -599,7 +626,7 @@ class TestFDAFetcherMocked:
                 "https://api.fda.gov/drug/event.json", limit=1
             )
 
-    @patch("biodbs.fetch.FDA.fda_fetcher.requests")
+    @patch("biodbs.fetch.FDA.fda_fetcher.session_pool")
     def test_get_multiple_results(self, mock_requests):
         """Test response with multiple results."""
         mock_requests.get.return_value = _mock_response(
@@ -625,7 +652,7 @@ class TestFDAFetcherMocked:
         )
         assert len(result.results) == 3
 
-    @patch("biodbs.fetch.FDA.fda_fetcher.requests")
+    @patch("biodbs.fetch.FDA.fda_fetcher.session_pool")
     def test_get_client_error_raises_api_error(self, mock_requests):
         """Test non-standard client error raises APIError."""
         mock_requests.get.return_value = _mock_response(
@@ -703,7 +730,7 @@ class TestFDAFetcherValidation:
 class TestEnsemblFetcherMocked:
     """Test Ensembl fetcher with mocked HTTP."""
 
-    @patch("biodbs.fetch.ensembl.ensembl_fetcher.requests")
+    @patch("biodbs.fetch.ensembl.ensembl_fetcher.session_pool")
     def test_get_lookup_success(self, mock_requests):
         """Test successful gene lookup."""
         mock_resp = _mock_response(
@@ -725,7 +752,7 @@ class TestEnsemblFetcherMocked:
         )
         assert result is not None
 
-    @patch("biodbs.fetch.ensembl.ensembl_fetcher.requests")
+    @patch("biodbs.fetch.ensembl.ensembl_fetcher.session_pool")
     def test_get_404_returns_empty(self, mock_requests):
         """Test 404 returns empty result for Ensembl."""
         mock_resp = _mock_response(404, text="Not Found")
@@ -742,7 +769,7 @@ class TestEnsemblFetcherMocked:
         # 404 returns EnsemblFetchedData({}) which wraps empty dict as single result
         assert result.results == [{}]
 
-    @patch("biodbs.fetch.ensembl.ensembl_fetcher.requests")
+    @patch("biodbs.fetch.ensembl.ensembl_fetcher.session_pool")
     def test_get_400_raises_validation_error(self, mock_requests):
         """Test 400 raises APIValidationError for Ensembl."""
         mock_resp = _mock_response(
@@ -757,7 +784,7 @@ class TestEnsemblFetcherMocked:
         with pytest.raises(APIValidationError):
             fetcher.get(endpoint="lookup/id", id="ENSG00000141510")
 
-    @patch("biodbs.fetch.ensembl.ensembl_fetcher.requests")
+    @patch("biodbs.fetch.ensembl.ensembl_fetcher.session_pool")
     def test_get_server_error(self, mock_requests):
         """Test 500 raises APIServerError."""
         mock_resp = _mock_response(500, text="Internal Server Error")
@@ -770,7 +797,7 @@ class TestEnsemblFetcherMocked:
         with pytest.raises(APIServerError):
             fetcher.get(endpoint="lookup/id", id="ENSG00000141510")
 
-    @patch("biodbs.fetch.ensembl.ensembl_fetcher.requests")
+    @patch("biodbs.fetch.ensembl.ensembl_fetcher.session_pool")
     def test_get_rate_limit_error(self, mock_requests):
         """Test 429 raises APIRateLimitError."""
         mock_resp = _mock_response(429, text="Too Many Requests")
@@ -783,7 +810,7 @@ class TestEnsemblFetcherMocked:
         with pytest.raises(APIRateLimitError):
             fetcher.get(endpoint="lookup/id", id="ENSG00000141510")
 
-    @patch("biodbs.fetch.ensembl.ensembl_fetcher.requests")
+    @patch("biodbs.fetch.ensembl.ensembl_fetcher.session_pool")
     def test_get_fasta_content_type(self, mock_requests):
         """Test fasta content type returns text-based result."""
         mock_resp = _mock_response(
@@ -804,6 +831,64 @@ class TestEnsemblFetcherMocked:
         assert result is not None
 
 
+    @patch("biodbs.fetch.ensembl.ensembl_fetcher.session_pool")
+    def test_lookup_batch_splits_long_lists(self, mock_requests):
+        """Test lookup_batch sends at most 1000 IDs per request and merges in order."""
+        ids = [f"ENSG{i:011d}" for i in range(2500)]
+
+        def post(url, json=None, **kwargs):
+            return _mock_response(200, json_data={i: {"id": i} for i in json["ids"]})
+
+        mock_requests.post.side_effect = post
+
+        from biodbs.fetch.ensembl.ensembl_fetcher import Ensembl_Fetcher
+
+        result = Ensembl_Fetcher().lookup_batch(ids)
+        sizes = [len(c.kwargs["json"]["ids"]) for c in mock_requests.post.call_args_list]
+        assert sorted(sizes) == [500, 1000, 1000]
+        assert list(result.raw_response) == ids
+
+    @patch("biodbs.fetch.ensembl.ensembl_fetcher.session_pool")
+    def test_sequence_batch_splits_and_joins_fasta(self, mock_requests):
+        """Test get_sequence_batch chunks at 50 IDs and joins FASTA text in order."""
+        ids = [f"ENST{i:011d}" for i in range(120)]
+
+        def post(url, json=None, **kwargs):
+            return _mock_response(200, text="".join(f">{i}\nACGT\n" for i in json["ids"]))
+
+        mock_requests.post.side_effect = post
+
+        from biodbs.fetch.ensembl.ensembl_fetcher import Ensembl_Fetcher
+
+        result = Ensembl_Fetcher().get_sequence_batch(ids)
+        assert mock_requests.post.call_count == 3
+        assert [seq["id"] for seq in result.sequence] == ids
+
+
+class TestNCBIFetcherMocked:
+    """Test NCBI fetcher with mocked HTTP."""
+
+    @patch("biodbs.fetch.NCBI.ncbi_fetcher.request_with_retry")
+    def test_get_genes_by_id_chunks_to_page_size(self, mock_request):
+        """Test long ID lists are split so every chunk fits in one page."""
+
+        def request(url, **kwargs):
+            ids = url.split("/")[-2].split(",")
+            reports = [{"gene": {"geneId": gid, "symbol": f"G{gid}"}} for gid in ids]
+            return _mock_response(200, json_data={"reports": reports, "total_count": len(ids)})
+
+        mock_request.side_effect = request
+
+        from biodbs.fetch.NCBI.ncbi_fetcher import NCBI_Fetcher
+
+        gene_ids = list(range(1, 251))
+        genes = NCBI_Fetcher().get_genes_by_id(gene_ids, page_size=100)
+        assert mock_request.call_count == 3
+        assert genes.get_gene_ids() == gene_ids
+        assert genes.total_count == 250
+        assert genes.query_ids == gene_ids
+
+
 class TestEnsemblFetcherValidation:
     """Test Ensembl fetcher input validation."""
 
@@ -823,7 +908,7 @@ class TestEnsemblFetcherValidation:
 class TestEnrichRFetcherMocked:
     """Test EnrichR fetcher with mocked HTTP."""
 
-    @patch("biodbs.fetch.EnrichR.enrichr_fetcher.requests")
+    @patch("biodbs.fetch.EnrichR.enrichr_fetcher.session_pool")
     def test_enrich_success(self, mock_requests):
         """Test successful enrichment analysis (two-step: addList + enrich)."""
         # First call: addList POST
@@ -853,7 +938,7 @@ class TestEnrichRFetcherMocked:
         )
         assert result is not None
 
-    @patch("biodbs.fetch.EnrichR.enrichr_fetcher.requests")
+    @patch("biodbs.fetch.EnrichR.enrichr_fetcher.session_pool")
     def test_add_list_failure(self, mock_requests):
         """Test addList POST failure raises error."""
         mock_requests.post.return_value = _mock_response(
@@ -869,7 +954,7 @@ class TestEnrichRFetcherMocked:
                 library="KEGG_2021_Human",
             )
 
-    @patch("biodbs.fetch.EnrichR.enrichr_fetcher.requests")
+    @patch("biodbs.fetch.EnrichR.enrichr_fetcher.session_pool")
     def test_enrich_rate_limit(self, mock_requests):
         """Test rate limit during addList."""
         mock_requests.post.return_value = _mock_response(
@@ -885,7 +970,7 @@ class TestEnrichRFetcherMocked:
                 library="KEGG_2021_Human",
             )
 
-    @patch("biodbs.fetch.EnrichR.enrichr_fetcher.requests")
+    @patch("biodbs.fetch.EnrichR.enrichr_fetcher.session_pool")
     def test_get_libraries_success(self, mock_requests):
         """Test getting available libraries."""
         mock_requests.get.return_value = _mock_response(
@@ -904,7 +989,7 @@ class TestEnrichRFetcherMocked:
         result = fetcher.get_libraries()
         assert result is not None
 
-    @patch("biodbs.fetch.EnrichR.enrichr_fetcher.requests")
+    @patch("biodbs.fetch.EnrichR.enrichr_fetcher.session_pool")
     def test_get_libraries_server_error(self, mock_requests):
         """Test libraries endpoint server error."""
         mock_requests.get.return_value = _mock_response(
@@ -917,7 +1002,7 @@ class TestEnrichRFetcherMocked:
         with pytest.raises(APIServerError):
             fetcher.get_libraries()
 
-    @patch("biodbs.fetch.EnrichR.enrichr_fetcher.requests")
+    @patch("biodbs.fetch.EnrichR.enrichr_fetcher.session_pool")
     def test_enrich_step2_failure(self, mock_requests):
         """Test enrich GET failure after successful addList."""
         # addList succeeds
@@ -939,7 +1024,7 @@ class TestEnrichRFetcherMocked:
                 library="KEGG_2021_Human",
             )
 
-    @patch("biodbs.fetch.EnrichR.enrichr_fetcher.requests")
+    @patch("biodbs.fetch.EnrichR.enrichr_fetcher.session_pool")
     def test_view_gene_list_success(self, mock_requests):
         """Test viewing a previously submitted gene list."""
         mock_requests.get.return_value = _mock_response(
@@ -953,7 +1038,7 @@ class TestEnrichRFetcherMocked:
         result = fetcher.view_gene_list(user_list_id=12345)
         assert result == ["TP53", "BRCA1", "EGFR"]
 
-    @patch("biodbs.fetch.EnrichR.enrichr_fetcher.requests")
+    @patch("biodbs.fetch.EnrichR.enrichr_fetcher.session_pool")
     def test_view_gene_list_error(self, mock_requests):
         """Test view gene list error."""
         mock_requests.get.return_value = _mock_response(
@@ -966,7 +1051,7 @@ class TestEnrichRFetcherMocked:
         with pytest.raises(APINotFoundError):
             fetcher.view_gene_list(user_list_id=99999)
 
-    @patch("biodbs.fetch.EnrichR.enrichr_fetcher.requests")
+    @patch("biodbs.fetch.EnrichR.enrichr_fetcher.session_pool")
     def test_enrich_multiple_libraries(self, mock_requests):
         """Test enrichment against multiple libraries."""
         # addList POST
@@ -999,6 +1084,55 @@ class TestEnrichRFetcherMocked:
         assert fetcher._organism == "fly"
 
 
+# =============================================================================
+# QuickGO Fetcher Tests
+# =============================================================================
+
+
+class TestQuickGOFetcherMocked:
+    """Test QuickGO streaming download with mocked HTTP."""
+
+    @patch("biodbs.fetch.QuickGO.quickgo_fetcher.session_pool")
+    def test_iter_download_streams_chunks(self, mock_requests):
+        """Body is read in pieces and parsed chunk by chunk."""
+        body = b"".join(
+            f"UniProtKB\tP{i}\tG{i}\tenables\tGO:0005515\tref\tIPI\t\tF\n".encode()
+            for i in range(50)
+        )
+        resp = _mock_response(200)
+        resp.iter_content.return_value = iter(
+            [body[i:i + 100] for i in range(0, len(body), 100)]
+        )
+        mock_requests.get.return_value = resp
+
+        from biodbs.fetch.QuickGO.quickgo_fetcher import QuickGO_Fetcher
+
+        fetcher = QuickGO_Fetcher()
+        chunks = list(fetcher.iter_download(
+            "gaf", block_size=500, taxonId=9606, downloadLimit=50
+        ))
+
+        assert len(chunks) > 1
+        assert sum(len(chunk) for chunk in chunks) == 50
+        assert chunks[-1].results[-1]["db_object_id"] == "P49"
+        _, kwargs = mock_requests.get.call_args
+        assert kwargs["stream"] is True
+        assert kwargs["headers"]["Accept"] == "text/gaf"
+        assert kwargs["params"]["downloadLimit"] == 50
+        resp.close.assert_called_once()
+
+    @patch("biodbs.fetch.QuickGO.quickgo_fetcher.session_pool")
+    def test_iter_download_error_closes_response(self, mock_requests):
+        resp = _mock_response(500, text="boom")
+        mock_requests.get.return_value = resp
+
+        from biodbs.fetch.QuickGO.quickgo_fetcher import QuickGO_Fetcher
+
+        with pytest.raises(APIError):
+            list(QuickGO_Fetcher().iter_download("gaf", taxonId=9606))
+        resp.close.assert_called_once()
+
+
 # =============================================================================
 # Cross-cutting error handling tests
 # =============================================================================
@@ -1074,3 +1208,116 @@ class TestRaiseForStatus:
         resp = _mock_response(500, text=long_text)
         with pytest.raises(APIServerError):
             raise_for_status(resp, "TestService")
+
+
+# =============================================================================
+# Reactome gene-set builder
+# =============================================================================
+
+
+class TestReactomeGeneSetBuilderMocked:
+    """Tests for Reactome_Fetcher.build_pathway_gene_sets with mocked calls."""
+
+    HIERARCHY = [
+        {"stId": "R-MMU-1", "name": "One", "children": [
+            {"stId": "R-MMU-2", "name": "Two"},
+            {"stId": "R-MMU-3", "name": "Three"},
+        ]},
+    ]
+    GENES = {"R-MMU-1": ["A", "B"], "R-MMU-2": ["B"], "R-MMU-3": []}
+
+    @pytest.fixture
+    def fetcher(self):
+        from biodbs.fetch.Reactome import Reactome_Fetcher
+
+        fetcher = Reactome_Fetcher(species="Mus musculus")
+        with patch.object(fetcher, "get_events_hierarchy", return_value=self.HIERARCHY):
+            yield fetcher
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        from biodbs._funcs.analysis._cache import PathwayDBManager
+
+        return PathwayDBManager(tmp_path)
+
+    def test_fans_out_and_drops_empty_pathways(self, fetcher):
+        with patch.object(
+            fetcher, "get_pathway_genes", side_effect=lambda pid, id_type: self.GENES[pid]
+        ) as mock_genes:
+            result = fetcher.build_pathway_gene_sets(id_type="uniprot")
+        assert mock_genes.call_count == 3
+        assert result == {"R-MMU-1": ("One", {"A", "B"}), "R-MMU-2": ("Two", {"B"})}
+
+    def test_transient_failures_are_retried(self, fetcher):
+        calls = {"R-MMU-2": 0}
+
+        def flaky(pid, id_type):
+            if pid == "R-MMU-2":
+                calls[pid] += 1
+                if calls[pid] == 1:
+                    raise APIServerError("Reactome", 503)
+            if pid == "R-MMU-3":
+                raise APINotFoundError("Reactome")
+            return self.GENES[pid]
+
+        with patch.object(fetcher, "get_pathway_genes", side_effect=flaky):
+            result = fetcher.build_pathway_gene_sets(retry_delay=0)
+        assert calls["R-MMU-2"] == 2
+        assert set(result) == {"R-MMU-1", "R-MMU-2"}
+
+    def test_interrupted_build_resumes_from_checkpoint(self, fetcher, manager):
+        def interrupted(pid, id_type):
+            if pid == "R-MMU-3":
+                raise KeyboardInterrupt
+            return self.GENES[pid]
+
+        with patch.object(fetcher, "get_pathway_genes", side_effect=interrupted):
+            with pytest.raises(KeyboardInterrupt):
+                fetcher.build_pathway_gene_sets(
+                    checkpoint=manager, checkpoint_key="partial", max_in_flight=1
+                )
+        saved = manager.load_pathways("partial", use_cache=False)
+        assert set(saved) == {"R-MMU-1", "R-MMU-2"}
+
+        with patch.object(
+            fetcher, "get_pathway_genes", side_effect=lambda pid, id_type: self.GENES[pid]
+        ) as mock_genes:
+            result = fetcher.build_pathway_gene_sets(
+                checkpoint=manager, checkpoint_key="partial"
+            )
+        assert [c.args[0] for c in mock_genes.call_args_list] == ["R-MMU-3"]
+        assert set(result) == {"R-MMU-1", "R-MMU-2"}
+        assert manager.load_pathways("partial", use_cache=False) is None
+
+    def test_bulk_download_is_single_request(self):
+        import io
+        import zipfile
+
+        from biodbs.fetch.Reactome import Reactome_Fetcher
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            archive.writestr(
+                "ReactomePathways.gmt",
+                "Cell Cycle\tR-HSA-1640170\tTP53\tCDK1\n"
+                "Empty\tR-HSA-0\t\n",
+            )
+        fetcher = Reactome_Fetcher()
+        with patch("biodbs.fetch.Reactome.reactome_fetcher.session_pool.get") as mock_get:
+            mock_get.return_value = _mock_response(content=buffer.getvalue())
+            with patch.object(fetcher, "get_pathway_genes") as mock_genes:
+                result = fetcher.build_pathway_gene_sets()
+        mock_get.assert_called_once()
+        mock_genes.assert_not_called()
+        assert result == {"R-HSA-1640170": ("Cell Cycle", {"TP53", "CDK1"})}
+
+    def test_bulk_failure_falls_back_to_fan_out(self, fetcher):
+        fetcher.set_species("Homo sapiens")
+        with patch("biodbs.fetch.Reactome.reactome_fetcher.session_pool.get") as mock_get:
+            mock_get.return_value = _mock_response(status_code=503)
+            with patch.object(
+                fetcher, "get_pathway_genes",
+                side_effect=lambda pid, id_type: self.GENES[pid],
+            ):
+                result = fetcher.build_pathway_gene_sets()
+        assert set(result) == {"R-MMU-1", "R-MMU-2"}
@@ -0,0 +1,293 @@
+"""Tests for biodbs.fetch._http_cache module."""
+
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from biodbs.data._base import BaseDBManager
+from biodbs.fetch._http_cache import (
+    ResponseCache,
+    disable_response_cache,
+    enable_response_cache,
+    get_response_cache,
+)
+from biodbs.fetch._rate_limit import (
+    async_request_with_retry,
+    get_rate_limiter,
+    request_with_retry,
+)
+from biodbs.fetch._session import AsyncResponse, SessionPool
+
+
+def _response(status=200, content=b'{"a": 1}', headers=None, url="https://example.org/x?q=1"):
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = content
+    resp.headers = requests.structures.CaseInsensitiveDict(headers or {})
+    resp.url = url
+    return resp
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = enable_response_cache(tmp_path, default_ttl=60)
+    yield c
+    disable_response_cache()
+    c.close()
+
+
+@pytest.fixture
+def pool():
+    p = SessionPool()
+    yield p
+    p.close()
+
+
+class TestResponseCache:
+    def test_disabled_by_default(self):
+        assert get_response_cache() is None
+
+    def test_enable_from_manager_reuses_storage_path(self, tmp_path):
+        manager = BaseDBManager(tmp_path / "kegg", db_name="kegg")
+        cache = enable_response_cache(manager)
+        try:
+            assert get_response_cache() is cache
+            assert cache.db_path == tmp_path / "kegg" / "http_cache.db"
+        finally:
+            disable_response_cache()
+            cache.close()
+
+    def test_key_covers_method_url_params_and_body(self):
+        key, url = ResponseCache.make_key("GET", "https://example.org/x", {"q": 1})
+        assert url == "https://example.org/x?q=1"
+        assert ResponseCache.make_key("get", "https://example.org/x?q=1")[0] == key
+        assert ResponseCache.make_key("GET", "https://example.org/x", {"q": 2})[0] != key
+        assert ResponseCache.make_key("POST", "https://example.org/x", {"q": 1})[0] != key
+        assert (
+            ResponseCache.make_key("POST", "https://example.org/x", json_body={"a": 1, "b": 2})[0]
+            == ResponseCache.make_key("POST", "https://example.org/x", json_body={"b": 2, "a": 1})[0]
+        )
+        assert (
+            ResponseCache.make_key("POST", "https://example.org/x", data="a")[0]
+            != ResponseCache.make_key("POST", "https://example.org/x", data="b")[0]
+        )
+
+    def test_key_covers_negotiation_headers(self):
+        url = "https://rest.ensembl.org/sequence/id/X"
+        plain = ResponseCache.make_key("GET", url)[0]
+        fasta = ResponseCache.make_key("GET", url, headers={"Accept": "text/x-fasta"})[0]
+        json_ = ResponseCache.make_key("GET", url, headers={"accept": "application/json"})[0]
+        assert len({plain, fasta, json_}) == 3
+        assert ResponseCache.make_key("GET", url, headers={"ACCEPT": "text/x-fasta"})[0] == fasta
+        assert ResponseCache.make_key("GET", url, headers={"User-Agent": "biodbs"})[0] == plain
+
+    def test_store_and_lookup_round_trip(self, cache):
+        key, _ = cache.make_key("GET", "https://example.org/x")
+        assert cache.store(key, "GET", "https://example.org/x", 200, {"ETag": '"v1"'}, b"body")
+        entry = cache.lookup(key)
+        assert entry.is_fresh
+        assert entry.content == b"body"
+        assert entry.conditional_headers() == {"If-None-Match": '"v1"'}
+        assert cache.stats()["hits"] == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        first = ResponseCache(tmp_path)
+        key, _ = first.make_key("GET", "https://example.org/x")
+        first.store(key, "GET", "https://example.org/x", 200, {}, b"body")
+        first.close()
+        second = ResponseCache(tmp_path)
+        assert second.lookup(key).content == b"body"
+        assert second.stats()["total_bytes"] == 4
+        second.close()
+
+    def test_per_host_ttl_matches_subdomains(self, cache):
+        cache.set_ttl("ebi.ac.uk", 5)
+        cache.set_ttl("rest.kegg.jp", 0)
+        assert cache.ttl_for("www.ebi.ac.uk") == 5
+        assert cache.ttl_for("example.org") == 60
+        assert not cache.store("k", "GET", "https://rest.kegg.jp/info/kegg", 200, {}, b"x")
+
+    def test_does_not_store_errors_or_no_store(self, cache):
+        assert not cache.store("k1", "GET", "https://example.org/", 500, {}, b"x")
+        assert not cache.store(
+            "k2", "GET", "https://example.org/", 200, {"Cache-Control": "no-store"}, b"x"
+        )
+        assert len(cache) == 0
+
+    def test_lru_eviction_bounds_size(self, tmp_path):
+        cache = ResponseCache(tmp_path, max_bytes=100)
+        for i in range(5):
+            cache.store(f"k{i}", "GET", f"https://example.org/{i}", 200, {}, b"x" * 30)
+            time.sleep(0.001)
+        assert cache.stats()["total_bytes"] <= 100
+        assert cache.lookup("k4") is not None
+        assert cache.lookup("k0") is None
+        cache.close()
+
+    def test_clear_cache_by_host(self, cache):
+        cache.store("k1", "GET", "https://a.org/", 200, {}, b"x")
+        cache.store("k2", "GET", "https://b.org/", 200, {}, b"y")
+        cache.clear_cache("a.org")
+        assert cache.lookup("k1") is None
+        assert cache.lookup("k2") is not None
+        cache.clear_cache()
+        assert len(cache) == 0 and cache.stats()["total_bytes"] == 0
+
+
+class TestSessionPoolCaching:
+    def test_fresh_hit_skips_network(self, cache, pool):
+        session = MagicMock()
+        session.request.return_value = _response()
+        with patch.object(pool, "session", return_value=session):
+            first = pool.get("https://example.org/x", params={"q": 1})
+            second = pool.get("https://example.org/x", params={"q": 1})
+        assert session.request.call_count == 1
+        assert not getattr(first, "from_cache", False)
+        assert second.from_cache is True
+        assert second.json() == {"a": 1}
+
+    def test_stale_entry_is_revalidated(self, cache, pool):
+        session = MagicMock()
+        session.request.side_effect = [
+            _response(headers={"ETag": '"v1"'}),
+            _response(status=304, content=b"", headers={"ETag": '"v1"'}),
+        ]
+        with patch.object(pool, "session", return_value=session):
+            pool.get("https://example.org/x", params={"q": 1})
+            cache._conn.execute("UPDATE responses SET expires_at = 0")
+            revalidated = pool.get("https://example.org/x", params={"q": 1})
+        sent_headers = session.request.call_args.kwargs["headers"]
+        assert sent_headers["If-None-Match"] == '"v1"'
+        assert revalidated.status_code == 200
+        assert revalidated.json() == {"a": 1}
+        assert cache.stats()["revalidated"] == 1
+        assert cache.lookup(cache.make_key("GET", "https://example.org/x", {"q": 1})[0]).is_fresh
+
+    def test_accept_header_selects_entry(self, cache, pool):
+        session = MagicMock()
+        session.request.side_effect = [
+            _response(content=b">seq\nACGT", headers={"Content-Type": "text/x-fasta"}),
+            _response(content=b'{"seq": "ACGT"}', headers={"Content-Type": "application/json"}),
+        ]
+        url = "https://rest.ensembl.org/sequence/id/X"
+        with patch.object(pool, "session", return_value=session):
+            fasta = pool.get(url, headers={"Accept": "text/x-fasta"})
+            as_json = pool.get(url, headers={"Accept": "application/json"})
+            again = pool.get(url, headers={"Accept": "application/json"})
+        assert session.request.call_count == 2
+        assert fasta.text == ">seq\nACGT"
+        assert as_json.json() == {"seq": "ACGT"}
+        assert again.from_cache is True
+        assert again.json() == {"seq": "ACGT"}
+
+    def test_async_accept_header_selects_entry(self, cache, pool):
+        url = "https://rest.ensembl.org/sequence/id/X"
+        bodies = {"text/x-fasta": b">seq\nACGT", "application/json": b'{"seq": "ACGT"}'}
+        for accept, body in bodies.items():
+            cache.store(
+                cache.make_key("GET", url, headers={"Accept": accept})[0],
+                "GET", url, 200, {"Content-Type": accept}, body,
+            )
+
+        async def run():
+            with patch.object(pool, "aiohttp_session") as mock_session:
+                response = await pool.arequest("GET", url, headers={"Accept": "application/json"})
+            mock_session.assert_not_called()
+            return response
+
+        response = asyncio.run(run())
+        assert response.from_cache is True
+        assert response.json() == {"seq": "ACGT"}
+
+    def test_streams_and_uploads_bypass_cache(self, cache, pool):
+        session = MagicMock()
+        session.request.return_value = _response()
+        with patch.object(pool, "session", return_value=session):
+            pool.get("https://example.org/x", stream=True)
+            pool.post("https://example.org/x", files={"f": b"1"})
+        assert len(cache) == 0
+
+    def test_async_hit_skips_network(self, cache, pool):
+        async def run():
+            cache.store(
+                cache.make_key("GET", "https://example.org/x", {"q": 1})[0],
+                "GET", "https://example.org/x?q=1", 200,
+                {"Content-Type": "application/json"}, b'{"a": 1}',
+            )
+            with patch.object(pool, "aiohttp_session") as mock_session:
+                response = await pool.arequest("GET", "https://example.org/x", params={"q": 1})
+            mock_session.assert_not_called()
+            return response
+
+        response = asyncio.run(run())
+        assert isinstance(response, AsyncResponse)
+        assert response.from_cache is True
+        assert response.json() == {"a": 1}
+
+
+class TestCachedReadsSkipRateLimiter:
+    @pytest.fixture(autouse=True)
+    def slow_host(self):
+        limiter = get_rate_limiter()
+        limiter.set_rate("cache.test", 0.5)
+        yield
+        limiter._rates.pop("cache.test", None)
+        limiter.reset()
+
+    def test_request_with_retry_hit_does_not_take_token(self, cache):
+        url = "https://cache.test/x"
+        cache.store(cache.make_key("GET", url)[0], "GET", url, 200, {}, b"ok")
+        with patch("biodbs.fetch._session.session_pool.session") as mock_session:
+            start = time.monotonic()
+            for _ in range(3):
+                assert request_with_retry(url, max_retries=0).text == "ok"
+            elapsed = time.monotonic() - start
+        mock_session.assert_not_called()
+        assert elapsed < 1.0
+        assert get_rate_limiter().bucket("cache.test").try_take()
+
+    def test_miss_still_takes_token(self, cache):
+        url = "https://cache.test/y"
+        session = MagicMock()
+        session.request.return_value = _response(url=url)
+        with patch("biodbs.fetch._session.session_pool.session", return_value=session):
+            request_with_retry(url, max_retries=0)
+        assert not get_rate_limiter().bucket("cache.test").try_take()
+
+    def test_async_hit_does_not_take_token(self, cache):
+        url = "https://cache.test/z"
+        cache.store(cache.make_key("GET", url)[0], "GET", url, 200, {}, b"ok")
+
+        async def run():
+            with patch("biodbs.fetch._session.session_pool.aiohttp_session") as mock_session:
+                for _ in range(3):
+                    response = await async_request_with_retry(url, max_retries=0)
+                mock_session.assert_not_called()
+                return response
+
+        start = time.monotonic()
+        assert asyncio.run(run()).text == "ok"
+        assert time.monotonic() - start < 1.0
+        assert get_rate_limiter().bucket("cache.test").try_take()
+
+    def test_schedule_process_charges_only_misses(self, cache):
+        from biodbs.fetch._base import BaseDataFetcher
+        from biodbs.fetch._session import session_pool
+
+        for i in range(4):
+            url = f"https://cache.test/{i}"
+            cache.store(cache.make_key("GET", url)[0], "GET", url, 200, {}, b"ok")
+
+        fetcher = BaseDataFetcher.__new__(BaseDataFetcher)
+        start = time.monotonic()
+        results = fetcher.schedule_process(
+            lambda i: session_pool.get(f"https://cache.test/{i}").text,
+            args_list=[(i,) for i in range(4)],
+            rate_limit_per_second=0.5,
+            host="cache.test",
+        )
+        assert results == ["ok"] * 4
+        assert time.monotonic() - start < 1.0
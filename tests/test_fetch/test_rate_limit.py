@@ -71,26 +71,27 @@ class TestRateLimiter:
     def test_acquire_sleeps_when_too_fast(self, mock_sleep):
         limiter = RateLimiter()
         limiter.set_rate("slow.host", 1.0)  # 1 req/sec
-        limiter._last_request["slow.host"] = time.time()
         limiter.acquire("slow.host")
-        # Should have been called with some sleep time
-        # (may or may not be called depending on timing)
-        # At minimum no exception raised
+        limiter.acquire("slow.host")
+        mock_sleep.assert_called_once()
+        assert 0.9 < mock_sleep.call_args.args[0] <= 1.0
 
     def test_reset_specific_host(self):
         limiter = RateLimiter()
-        limiter._last_request["host1"] = time.time()
-        limiter._last_request["host2"] = time.time()
+        limiter.set_rate("host1", 1.0)
+        limiter.set_rate("host2", 1.0)
+        limiter.acquire("host1")
+        limiter.acquire("host2")
         limiter.reset("host1")
-        assert limiter._last_request["host1"] == 0
-        assert limiter._last_request["host2"] != 0
+        assert limiter.try_acquire("host1")
+        assert not limiter.try_acquire("host2")
 
     def test_reset_all(self):
         limiter = RateLimiter()
-        limiter._last_request["host1"] = time.time()
-        limiter._last_request["host2"] = time.time()
+        limiter.acquire("host1")
+        limiter.acquire("host2")
         limiter.reset()
-        assert len(limiter._last_request) == 0
+        assert len(limiter._buckets) == 0
 
     def test_get_rate_limiter_returns_instance(self):
         limiter = get_rate_limiter()
@@ -116,6 +117,68 @@ class TestRateLimiter:
         assert errors == []
 
 
+    def test_burst_allows_back_to_back_requests(self):
+        limiter = RateLimiter()
+        limiter.set_rate("burst.host", 1.0, burst=3)
+        assert limiter.get_burst("burst.host") == 3
+        assert [limiter.try_acquire("burst.host") for _ in range(4)] == [
+            True, True, True, False,
+        ]
+
+    def test_try_acquire_does_not_queue(self):
+        limiter = RateLimiter()
+        limiter.set_rate("busy.host", 1.0)
+        assert limiter.try_acquire("busy.host")
+        assert not limiter.try_acquire("busy.host")
+        # A failed attempt must not consume a future slot
+        assert limiter.bucket("busy.host").tokens >= 0
+
+    def test_resolution_is_cached(self):
+        limiter = RateLimiter()
+        limiter.set_rate("api.ncbi", 3.0)
+        limiter.get_rate("eutils.api.ncbi.nlm.nih.gov")
+        assert limiter._resolved["eutils.api.ncbi.nlm.nih.gov"] == "api.ncbi"
+        # Registering a new host invalidates cached resolutions
+        limiter.set_rate("eutils.api.ncbi.nlm.nih.gov", 7.0)
+        assert limiter.get_rate("eutils.api.ncbi.nlm.nih.gov") == 7.0
+
+    def test_set_rate_updates_existing_bucket(self):
+        limiter = RateLimiter()
+        limiter.set_rate("live.host", 1.0)
+        bucket = limiter.bucket("live.host")
+        limiter.set_rate("live.host", 50.0, burst=5)
+        assert bucket.rate == 50.0
+        assert bucket.capacity == 5
+
+    def test_report_rate_limited_halves_rate_and_honours_retry_after(self):
+        limiter = RateLimiter()
+        limiter.set_rate("throttled.host", 10.0)
+        limiter.report_rate_limited("throttled.host", retry_after=2.0)
+        bucket = limiter.bucket("throttled.host")
+        assert bucket.effective_rate == 5.0
+        assert not limiter.try_acquire("throttled.host")
+        assert 1.9 < bucket.reserve() <= 2.0
+
+    def test_back_off_has_floor_and_recovers(self):
+        limiter = RateLimiter()
+        limiter.set_rate("flaky.host", 10.0)
+        for _ in range(10):
+            limiter.report_rate_limited("flaky.host")
+        bucket = limiter.bucket("flaky.host")
+        assert bucket.effective_rate == pytest.approx(1.0)
+        for _ in range(20):
+            limiter.report_success("flaky.host")
+        assert bucket.effective_rate == 10.0
+
+    def test_reservations_space_concurrent_callers(self):
+        limiter = RateLimiter()
+        limiter.set_rate("queued.host", 10.0)
+        bucket = limiter.bucket("queued.host")
+        delays = [bucket.reserve() for _ in range(4)]
+        assert delays[0] == 0.0
+        assert delays[1:] == pytest.approx([0.1, 0.2, 0.3], abs=0.01)
+
+
 # =============================================================================
 # TestRetryWithBackoff
 # =============================================================================
@@ -192,7 +255,7 @@ class TestRetryWithBackoff:
 
 
 class TestRequestWithRetry:
-    @patch("biodbs.fetch._rate_limit.requests.get")
+    @patch("biodbs.fetch._rate_limit.session_pool.request")
     @patch("biodbs.fetch._rate_limit.time.sleep")
     def test_successful_get(self, mock_sleep, mock_get):
         mock_resp = MagicMock()
@@ -201,7 +264,7 @@ class TestRequestWithRetry:
         resp = request_with_retry("https://example.com/api", rate_limit=False)
         assert resp.status_code == 200
 
-    @patch("biodbs.fetch._rate_limit.requests.get")
+    @patch("biodbs.fetch._rate_limit.session_pool.request")
     @patch("biodbs.fetch._rate_limit.time.sleep")
     def test_rate_limit_retry(self, mock_sleep, mock_get):
         mock_429 = MagicMock()
@@ -214,7 +277,22 @@ class TestRequestWithRetry:
         resp = request_with_retry("https://example.com/api", rate_limit=False)
         assert resp.status_code == 200
 
-    @patch("biodbs.fetch._rate_limit.requests.get")
+    @patch("biodbs.fetch._rate_limit.session_pool.request")
+    @patch("biodbs.fetch._rate_limit.time.sleep")
+    def test_rate_limit_backs_off_shared_limiter(self, mock_sleep, mock_get):
+        mock_429 = MagicMock()
+        mock_429.status_code = 429
+        mock_429.headers = {"Retry-After": "0"}
+        mock_200 = MagicMock()
+        mock_200.status_code = 200
+        mock_get.side_effect = [mock_429, mock_200]
+        limiter = get_rate_limiter()
+        limiter.set_rate("example.com", 8.0)
+        request_with_retry("https://example.com/api")
+        # One halving from the 429, one recovery step from the success
+        assert limiter.bucket("example.com").effective_rate == pytest.approx(4.8)
+
+    @patch("biodbs.fetch._rate_limit.session_pool.request")
     @patch("biodbs.fetch._rate_limit.time.sleep")
     def test_timeout_retry(self, mock_sleep, mock_get):
         mock_200 = MagicMock()
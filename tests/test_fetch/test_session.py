@@ -0,0 +1,101 @@
+"""Tests for biodbs.fetch._session module."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from biodbs.fetch._session import (
+    SessionPool,
+    configure_session_pool,
+    get_session_pool,
+    session_pool,
+)
+
+
+@pytest.fixture
+def pool():
+    p = SessionPool(pool_connections=2, pool_maxsize=4)
+    yield p
+    p.close()
+
+
+class TestSessionPool:
+    def test_same_host_shares_session(self, pool):
+        a = pool.session("https://rest.kegg.jp/info/pathway")
+        b = pool.session("https://rest.kegg.jp/list/pathway/hsa")
+        assert a is b
+        assert len(pool._sessions) == 1
+
+    def test_different_hosts_get_different_sessions(self, pool):
+        a = pool.session("https://rest.kegg.jp/info")
+        b = pool.session("https://www.ebi.ac.uk/QuickGO")
+        c = pool.session("http://rest.kegg.jp/info")
+        assert a is not b
+        assert a is not c
+        assert len(pool._sessions) == 3
+
+    def test_adapter_uses_pool_settings(self, pool):
+        adapter = pool.session("https://example.org").get_adapter("https://example.org")
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 4
+        assert adapter.max_retries.total == 0
+
+    def test_configure_resets_sessions(self, pool):
+        old = pool.session("https://example.org")
+        pool.configure(pool_maxsize=8)
+        new = pool.session("https://example.org")
+        assert new is not old
+        assert pool.pool_maxsize == 8
+        assert pool.pool_connections == 2
+
+    def test_get_routes_through_host_session(self, pool):
+        session = MagicMock()
+        with patch.object(pool, "session", return_value=session) as mock_session:
+            pool.get("https://example.org/a", params={"q": 1}, timeout=5)
+        mock_session.assert_called_once_with("https://example.org/a")
+        session.request.assert_called_once_with(
+            "GET", "https://example.org/a", params={"q": 1}, timeout=5
+        )
+
+    def test_post_routes_through_host_session(self, pool):
+        session = MagicMock()
+        with patch.object(pool, "session", return_value=session):
+            pool.post("https://example.org/b", json={"x": 1})
+        session.request.assert_called_once_with(
+            "POST", "https://example.org/b", data=None, json={"x": 1}
+        )
+
+    def test_concurrent_access_creates_one_session(self, pool):
+        results = []
+        barrier = threading.Barrier(16)
+
+        def worker():
+            barrier.wait()
+            results.append(pool.session("https://example.org/x"))
+
+        threads = [threading.Thread(target=worker) for _ in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len({id(s) for s in results}) == 1
+
+    def test_close_clears_sessions(self, pool):
+        pool.session("https://example.org")
+        pool.close()
+        assert len(pool._sessions) == 0
+
+
+class TestGlobalPool:
+    def test_get_session_pool_returns_global(self):
+        assert get_session_pool() is session_pool
+
+    def test_configure_session_pool(self):
+        saved = session_pool.pool_maxsize
+        try:
+            configure_session_pool(pool_maxsize=saved + 1)
+            assert session_pool.pool_maxsize == saved + 1
+        finally:
+            configure_session_pool(pool_maxsize=saved)
@@ -0,0 +1,190 @@
+"""Tests for streaming page iteration (iter_all / aiter_all) and page sinks."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from biodbs.data._base import BaseDBManager
+from biodbs.fetch._base import ConcatSink, JsonLinesSink
+from biodbs.fetch._rate_limit import RateLimiter
+from biodbs.fetch._session import AsyncResponse, session_pool
+
+SEARCH = {"patient.drug.medicinalproduct": "aspirin"}
+TOTAL = 25
+
+
+@pytest.fixture(autouse=True)
+def fast_rate_limiter():
+    limiter = RateLimiter()
+    saved_rates = dict(limiter._rates)
+    limiter.reset()
+    limiter._rates.clear()
+    limiter.DEFAULT_RATE = 1000
+    yield
+    del limiter.DEFAULT_RATE
+    limiter.reset()
+    limiter._rates.clear()
+    limiter._rates.update(saved_rates)
+
+
+def _fda_page(skip, limit):
+    from biodbs.data.FDA.data import FDAFetchedData
+
+    return FDAFetchedData({
+        "meta": {"results": {"total": TOTAL}},
+        "results": [{"receivedate": str(i)} for i in range(skip, min(skip + limit, TOTAL))],
+    })
+
+
+@pytest.fixture
+def fda(tmp_path):
+    from biodbs.fetch.FDA.fda_fetcher import FDA_Fetcher
+
+    fetcher = FDA_Fetcher(storage_path=str(tmp_path))
+    with patch.object(
+        fetcher, "_fetch_page",
+        side_effect=lambda url, **params: _fda_page(params["skip"], params["limit"]),
+    ) as mocked:
+        fetcher.mock_fetch = mocked
+        yield fetcher
+
+
+class TestSinks:
+    def test_concat_sink_empty_and_truncate(self):
+        from biodbs.data.FDA.data import FDAFetchedData
+
+        sink = ConcatSink(lambda: FDAFetchedData({"meta": {}, "results": []}))
+        assert sink.finish().results == []
+
+        sink = ConcatSink(lambda: None, max_records=12)
+        sink.add(_fda_page(0, 10))
+        sink.add(_fda_page(10, 10))
+        assert len(sink.finish().results) == 12
+
+    def test_concat_sink_combines_once(self):
+        from biodbs.data.FDA.data import FDAFetchedData
+
+        sink = ConcatSink(lambda: None)
+        pages = [_fda_page(skip, 10) for skip in (0, 10, 20)]
+        for page in pages:
+            sink.add(page)
+        with patch.object(FDAFetchedData, "concat", wraps=FDAFetchedData.concat) as concat:
+            result = sink.finish()
+        concat.assert_called_once_with(pages)
+        assert result is pages[0]
+        assert [r["receivedate"] for r in result.results] == [str(i) for i in range(TOTAL)]
+
+    def test_json_lines_sink_writes_incrementally(self, tmp_path):
+        manager = BaseDBManager(tmp_path)
+        sink = JsonLinesSink(manager, "events", max_records=15)
+        sink.add(_fda_page(0, 10))
+        path = tmp_path / "events.jsonl"
+        assert path.exists()
+        sink.add(_fda_page(10, 10))
+        assert sink.finish() == path
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)["receivedate"] for line in lines] == [str(i) for i in range(15)]
+        assert manager._metadata["events"]["item_count"] == 15
+
+
+class TestFDAStreaming:
+    def test_iter_all_yields_pages(self, fda):
+        pages = list(fda.iter_all("drug", "event", search=SEARCH, batch_size=10))
+        assert [len(p.results) for p in pages] == [10, 10, 5]
+        assert fda.mock_fetch.call_count == 3
+
+    def test_iter_all_is_lazy(self, fda):
+        pages = fda.iter_all("drug", "event", search=SEARCH, batch_size=1, max_in_flight=2)
+        first = next(pages)
+        assert first.results == [{"receivedate": "0"}]
+        pages.close()
+        # First page plus at most two look-ahead pages
+        assert fda.mock_fetch.call_count <= 3
+
+    def test_iter_all_validates_eagerly(self, fda):
+        with pytest.raises(ValueError, match="Upper limit"):
+            fda.iter_all("drug", "event", search=SEARCH, batch_size=5000)
+
+    def test_get_all_concat(self, fda):
+        data = fda.get_all("drug", "event", search=SEARCH, batch_size=10, max_records=22)
+        assert [r["receivedate"] for r in data.results] == [str(i) for i in range(22)]
+
+    def test_stream_to_storage_keeps_every_page(self, fda, tmp_path):
+        path = fda.get_all(
+            "drug", "event", method="stream_to_storage", search=SEARCH, batch_size=10,
+            ordered=False,
+        )
+        assert path == tmp_path / "drug_event.jsonl"
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert sorted(int(r["receivedate"]) for r in records) == list(range(TOTAL))
+
+    def test_failed_page_is_skipped(self, fda):
+        def flaky(url, **params):
+            if params["skip"] == 10:
+                raise RuntimeError("boom")
+            return _fda_page(params["skip"], params["limit"])
+
+        fda.mock_fetch.side_effect = flaky
+        data = fda.get_all("drug", "event", search=SEARCH, batch_size=10)
+        assert len(data.results) == 15
+
+
+class TestAsyncStreaming:
+    @pytest.fixture
+    def mock_arequest(self):
+        async def fake(method, url, params=None, **kwargs):
+            skip, limit = params["skip"], params["limit"]
+            body = {
+                "meta": {"results": {"total": TOTAL}},
+                "results": [{"receivedate": str(i)} for i in range(skip, min(skip + limit, TOTAL))],
+            }
+            return AsyncResponse(200, {"Content-Type": "application/json"}, url, json.dumps(body).encode())
+
+        with patch.object(session_pool, "arequest", new_callable=AsyncMock) as mocked:
+            mocked.side_effect = fake
+            yield mocked
+
+    def test_aiter_all_yields_pages(self, mock_arequest, tmp_path):
+        from biodbs.fetch.FDA.fda_fetcher import FDA_Fetcher
+
+        fetcher = FDA_Fetcher(storage_path=str(tmp_path))
+
+        async def collect():
+            return [
+                len(page.results)
+                async for page in fetcher.aiter_all("drug", "event", search=SEARCH, batch_size=10)
+            ]
+
+        assert asyncio.run(collect()) == [10, 10, 5]
+
+    def test_aget_all_stream_to_storage(self, mock_arequest, tmp_path):
+        from biodbs.fetch.FDA.fda_fetcher import FDA_Fetcher
+
+        fetcher = FDA_Fetcher(storage_path=str(tmp_path))
+        path = asyncio.run(fetcher.aget_all(
+            "drug", "event", method="stream_to_storage", search=SEARCH, batch_size=10,
+        ))
+        assert len(path.read_text().splitlines()) == TOTAL
+
+
+class TestKEGGStreaming:
+    def test_stream_text_batches(self, tmp_path):
+        from biodbs.data.KEGG.data import KEGGFetchedData
+        from biodbs.fetch.KEGG.kegg_fetcher import KEGG_Fetcher
+
+        fetcher = KEGG_Fetcher(storage_path=str(tmp_path))
+        with patch.object(
+            fetcher, "_fetch_batch",
+            side_effect=lambda op, batch, **kw: KEGGFetchedData(
+                "\n".join(f"<pathway name='{e}'/>" for e in batch),
+                operation="get", get_option="kgml",
+            ),
+        ):
+            path = fetcher.get_all(
+                "get", [f"path:hsa0{i}" for i in range(25)],
+                method="stream_to_storage", get_option="kgml",
+            )
+        assert path.suffix == ".txt"
+        assert path.read_text().count("///") == 3
@@ -209,6 +209,79 @@ class TestUniProtFetchedData:
         assert data.entries[0].primaryAccession == "P05067"
 
 
+    def test_fast_accessors_skip_validation(self, sample_search_response, monkeypatch):
+        """Accessions and gene names are read from raw dicts."""
+        def fail(*args, **kwargs):
+            raise AssertionError("entry was validated")
+
+        monkeypatch.setattr(UniProtEntry, "model_validate", fail)
+        data = UniProtFetchedData(sample_search_response)
+        assert data.get_accessions() == ["P05067", "P04637"]
+        assert data.get_gene_names() == ["APP", "TP53"]
+        assert data.to_accession_mapping() == {"APP": "P05067", "TP53": "P04637"}
+        assert len(data) == 2
+
+    def test_entries_are_validated_on_access(self, sample_search_response):
+        data = UniProtFetchedData(sample_search_response)
+        assert not data.entries.is_parsed
+        assert isinstance(data.entries[1], UniProtEntry)
+        assert not data.entries.is_parsed
+        assert all(isinstance(entry, UniProtEntry) for entry in data.entries)
+        assert data.entries.is_parsed
+
+    def test_invalid_entry_counts_follow_parsing(self, sample_search_response):
+        sample_search_response["results"][1]["sequence"] = "not a sequence object"
+        data = UniProtFetchedData(sample_search_response)
+        # Raw accessors skip validation until the entries are parsed
+        assert data.get_accessions() == ["P05067", "P04637"]
+        assert len(data) == 2
+        assert [entry.primaryAccession for entry in data.entries] == ["P05067"]
+        assert len(data) == 1
+        assert data.get_accessions() == ["P05067"]
+        assert data.to_gene_mapping() == {"P05067": "APP"}
+
+    def test_only_invalid_entries_are_falsy(self, sample_search_response):
+        sample_search_response["results"] = [{"primaryAccession": "P1", "sequence": "bad"}]
+        data = UniProtFetchedData(sample_search_response)
+        assert not data.entries
+        assert len(data) == 0
+        assert "0 entries" in repr(data)
+
+    def test_trusted_entries_keep_nested_models(self, sample_search_response):
+        data = UniProtFetchedData(sample_search_response, trusted=True)
+        entry = data.entries[0]
+        assert entry.gene_name == "APP"
+        assert entry.tax_id == 9606
+        assert entry.protein_name == "Amyloid-beta precursor protein"
+
+    def test_iadd_keeps_entries_lazy(self, sample_search_response):
+        data = UniProtFetchedData(sample_search_response)
+        data += UniProtFetchedData(sample_search_response)
+        assert len(data) == 4
+        assert not data.entries.is_parsed
+        assert data.get_accessions()[2:] == ["P05067", "P04637"]
+
+
+    def test_lookup_indexes(self, sample_search_response):
+        sample_search_response["results"][1]["secondaryAccessions"] = ["Q15086"]
+        sample_search_response["results"][1]["genes"][0]["synonyms"] = [{"value": "P53"}]
+        data = UniProtFetchedData(sample_search_response)
+        assert data.get_entry("Q15086").primaryAccession == "P04637"
+        assert data.get_entry_by_gene("p53").primaryAccession == "P04637"
+        assert data.get_entry_by_gene("app").primaryAccession == "P05067"
+        assert data.get_entry("P99999") is None
+
+    def test_iadd_invalidates_indexes(self, sample_search_response):
+        data = UniProtFetchedData(sample_search_response)
+        assert data.get_entry("Q9Y6K9") is None
+        data += UniProtFetchedData({
+            "primaryAccession": "Q9Y6K9",
+            "genes": [{"geneName": {"value": "IKBKG"}}],
+        })
+        assert data.get_entry("Q9Y6K9").gene_name == "IKBKG"
+        assert data.get_entry_by_gene("ikbkg") is not None
+
+
 class TestUniProtSearchResult:
     """Tests for UniProtSearchResult."""
 
@@ -8,6 +8,7 @@ from biodbs.graph import (
     Node,
     Edge,
     KnowledgeGraph,
+    CompactKnowledgeGraph,
     NodeType,
     EdgeType,
     DataSource,
@@ -126,6 +127,22 @@ class TestMergeGraphs:
         assert merged.edge_count == 3
         assert merged.has_edge("B", "C")
 
+    def test_merge_keeps_edges_between_graphs(self, graph1, graph2):
+        bridge = KnowledgeGraph(name="Bridge")
+        bridge.add_nodes([graph1.get_node("B"), graph2.get_node("C")])
+        bridge.add_edge(Edge(source="B", target="C", relation=EdgeType.ASSOCIATED_WITH))
+        merged = merge_graphs(graph1, graph2, bridge)
+        assert merged.edge_count == 3
+        assert merged.has_edge("B", "C")
+
+    def test_merge_compact_graphs(self, graph1, graph2):
+        merged = merge_graphs(
+            CompactKnowledgeGraph.from_graph(graph1), CompactKnowledgeGraph.from_graph(graph2)
+        )
+        assert isinstance(merged, CompactKnowledgeGraph)
+        assert merged.edge_count == 2
+        assert merged.has_edge("C", "D")
+
 
 # =============================================================================
 # Helpers for mocking fetched data objects
@@ -497,6 +514,20 @@ class TestBuildKEGGLinkGraph:
         assert graph.node_count == 0
         assert graph.edge_count == 0
 
+    def test_node_types_and_labels(self):
+        records = [
+            {"source_id": "hsa:1234", "target_id": "path:hsa04110"},
+            {"source_id": "hsa:1234", "target_id": "path:hsa04110"},
+            {"source_id": "path:hsa04110", "target_id": None},
+        ]
+        data = _make_kegg_data(records, operation="link")
+        graph = build_kegg_link_graph(data)
+        assert graph.edge_count == 1
+        assert graph.get_node("hsa:1234").label == "1234"
+        assert graph.get_node("hsa:1234").node_type == NodeType.GENE
+        assert graph.get_node("path:hsa04110").node_type == NodeType.PATHWAY
+        assert graph.get_edge("hsa:1234", "path:hsa04110").relation == EdgeType.PARTICIPATES_IN
+
 
 class TestInferKeggNodeType:
     def test_pathway(self):
@@ -0,0 +1,168 @@
+"""Tests for biodbs.graph.compact module."""
+
+import numpy as np
+import pytest
+
+from biodbs.graph import (
+    CompactKnowledgeGraph,
+    Edge,
+    EdgeType,
+    KnowledgeGraph,
+    Node,
+    NodeType,
+    find_shortest_path,
+    get_connected_component,
+    get_graph_statistics,
+)
+
+
+def _populate(graph):
+    for nid in "ABCDE":
+        graph.add_node(Node(id=nid, label=nid, node_type=NodeType.GENE))
+    graph.add_edges(
+        [
+            Edge("A", "B", EdgeType.IS_A, weight=0.5),
+            Edge("A", "B", EdgeType.PART_OF),
+            Edge("B", "C", EdgeType.IS_A, evidence=frozenset(["IEA"])),
+            Edge("C", "A", EdgeType.REGULATES, properties=frozenset([("score", 3)])),
+            Edge("D", "D", EdgeType.RELATED_TO),
+        ]
+    )
+    return graph
+
+
+def _edge_dicts(graph):
+    return sorted(
+        (e["source"], e["target"], e["relation"], e["weight"], tuple(e["evidence"]), tuple(e["properties"].items()))
+        for e in graph.to_dict()["edges"]
+    )
+
+
+@pytest.fixture
+def graphs():
+    return _populate(KnowledgeGraph(name="G")), _populate(CompactKnowledgeGraph(name="G"))
+
+
+class TestCompactKnowledgeGraph:
+    def test_matches_set_backed_graph(self, graphs):
+        plain, compact = graphs
+        assert compact.edge_count == plain.edge_count == 5
+        assert _edge_dicts(compact) == _edge_dicts(plain)
+        for nid in "ABCDE":
+            assert set(compact.get_outgoing_edges(nid)) == set(plain.get_outgoing_edges(nid))
+            assert set(compact.get_incoming_edges(nid)) == set(plain.get_incoming_edges(nid))
+            assert sorted(compact.get_neighbors(nid)) == sorted(plain.get_neighbors(nid))
+            assert compact.get_degree(nid) == plain.get_degree(nid)
+        assert compact.get_edge_type_counts() == plain.get_edge_type_counts()
+        assert repr(compact) == "CompactKnowledgeGraph(name='G', nodes=5, edges=5)"
+
+    def test_duplicates_and_dangling_edges_rejected(self, graphs):
+        _, compact = graphs
+        assert not compact.add_edge(Edge("A", "B", EdgeType.IS_A))  # still buffered
+        compact.compact()
+        assert not compact.add_edge(Edge("A", "B", EdgeType.IS_A))
+        assert not compact.add_edge(Edge("A", "Z"))
+        assert compact.add_edge(Edge("A", "B", EdgeType.HAS_PART))
+        assert compact.edge_count == 6
+
+    def test_edge_attributes_survive_compaction(self, graphs):
+        _, compact = graphs
+        edge = compact.get_edge("B", "C")
+        assert edge.evidence == frozenset(["IEA"])
+        assert compact.get_edge("C", "A").get_property("score") == 3
+        assert compact.get_edge("A", "B", EdgeType.IS_A).weight == 0.5
+        assert compact.get_edge("A", "C") is None
+
+    def test_remove_node_renumbers(self, graphs):
+        plain, compact = graphs
+        for graph in graphs:
+            assert graph.remove_node("B")
+            assert not graph.remove_node("B")
+        assert compact.edge_count == plain.edge_count == 2
+        assert compact.node_ids == ["A", "C", "D", "E"]
+        assert compact.node_index("C") == 1
+        assert _edge_dicts(compact) == _edge_dicts(plain)
+
+    def test_remove_buffered_and_compacted_edges(self, graphs):
+        _, compact = graphs
+        compact.compact()
+        compact.add_edge(Edge("E", "A"))
+        assert compact.remove_edge(Edge("E", "A"))
+        assert compact.remove_edge(Edge("A", "B", EdgeType.IS_A))
+        assert not compact.remove_edge(Edge("A", "B", EdgeType.IS_A))
+        assert compact.edge_count == 4
+        assert [e.relation for e in compact.get_outgoing_edges("A")] == [EdgeType.PART_OF]
+
+    def test_neighbor_indices_are_views(self, graphs):
+        _, compact = graphs
+        a = compact.node_index("A")
+        view = compact.neighbor_indices(a)
+        assert view.base is not None
+        assert not view.flags.writeable
+        assert [compact.node_id(i) for i in view] == ["B", "B"]
+        assert [compact.node_id(i) for i in compact.neighbor_indices(a, "incoming")] == ["C"]
+        with pytest.raises(ValueError):
+            compact.neighbor_indices(a, "both")
+
+    def test_to_scipy_sparse_is_zero_copy(self, graphs):
+        _, compact = graphs
+        compact.add_node(Node(id="F", label="F"))
+        csr = compact.to_scipy_sparse()
+        assert csr.shape == (6, 6)
+        assert np.shares_memory(csr.indices, compact._targets)
+        assert np.shares_memory(csr.indptr, compact._indptr)
+        assert np.shares_memory(csr.data, compact._weights)
+        a, b = compact.node_index("A"), compact.node_index("B")
+        assert csr[a, b] == 1.5  # IS_A (0.5) + PART_OF (1.0)
+        csc = compact.to_scipy_sparse("csc", weighted=False)
+        assert csc[a, b] == 2
+        assert (csr.toarray() > 0).sum() == (csc.toarray() > 0).sum()
+
+    def test_filter_edges(self, graphs):
+        plain, compact = graphs
+        assert set(compact.filter_edges(relation=EdgeType.IS_A)) == set(plain.filter_edges(relation=EdgeType.IS_A))
+        assert len(compact.filter_edges(min_weight=0.9, predicate=lambda e: e.source == "A")) == 1
+
+    def test_from_graph_subgraph_and_utils(self, graphs):
+        plain, _ = graphs
+        compact = CompactKnowledgeGraph.from_graph(plain)
+        assert _edge_dicts(compact) == _edge_dicts(plain)
+        sub = compact.subgraph({"A", "B"})
+        assert isinstance(sub, CompactKnowledgeGraph)
+        assert sub.edge_count == 2
+        assert find_shortest_path(compact, "B", "A") == ["B", "C", "A"]
+        assert get_connected_component(compact, "A") == {"A", "B", "C"}
+        stats = get_graph_statistics(compact)
+        assert stats["num_self_loops"] == 1
+
+    def test_nodes_added_after_compaction(self, graphs):
+        _, compact = graphs
+        compact.compact()
+        compact.add_node(Node(id="F", label="F"))
+        assert compact.get_outgoing_edges("F") == []
+        assert compact.get_degree("F") == 0
+        compact.add_edge(Edge("F", "A"))
+        assert set(compact.get_neighbors("A", "incoming")) == {"C", "F"}
+
+    def test_add_edges_bulk(self, graphs):
+        plain, compact = graphs
+        compact.add_edge(Edge("E", "A"))  # left in the append buffer
+        table = {
+            "source": ["A", "E", "B", "X"],
+            "target": ["B", "A", "E", "A"],
+            "relation": ["is_a", "related_to", "part_of", "is_a"],
+            "evidence": [None, None, ["TAS"], None],
+        }
+        assert compact.add_edges_bulk(table) == 1
+        assert compact.get_edge("B", "E").evidence == frozenset(["TAS"])
+        assert compact.get_edge("A", "B", EdgeType.IS_A).weight == 0.5
+
+        other = CompactKnowledgeGraph.from_graph(plain)
+        other.add_edge(Edge("E", "C", EdgeType.PART_OF, weight=2.0))
+        for source in (other, plain):
+            copy = CompactKnowledgeGraph(name="copy")
+            copy.add_nodes(plain.nodes)
+            copy.add_edges_bulk(source)
+            assert _edge_dicts(copy) == _edge_dicts(source)
+        assert compact.add_edges_bulk(other) == 1
+        assert compact.edge_count == 8
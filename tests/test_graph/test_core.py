@@ -1,5 +1,7 @@
 """Tests for biodbs.graph.core module."""
 
+from operator import itemgetter
+
 import pytest
 from biodbs.graph import (
     Node,
@@ -401,6 +403,101 @@ class TestKnowledgeGraph:
         assert "Edges: 3" in summary
 
 
+# =============================================================================
+# Bulk Loading Tests
+# =============================================================================
+
+
+class TestBulkLoading:
+    """Tests for the DataFrame/Arrow bulk-loading constructors."""
+
+    @pytest.fixture
+    def source_graph(self):
+        graph = KnowledgeGraph(name="Source")
+        graph.add_nodes(
+            [
+                Node(id="A", label="Node A", node_type=NodeType.GENE, xrefs=frozenset(["HGNC:1"])),
+                Node(id="B", label="Node B", node_type=NodeType.DISEASE,
+                     properties=frozenset([("score", 2)])),
+                Node(id="C", label="Node C", source=DataSource.KEGG),
+            ]
+        )
+        graph.add_edges(
+            [
+                Edge(source="A", target="B", relation=EdgeType.ASSOCIATED_WITH, weight=0.5),
+                Edge(source="B", target="C", relation=EdgeType.IS_A, evidence=frozenset(["IEA"])),
+                Edge(source="C", target="A", properties=frozenset([("pmid", "123")])),
+            ]
+        )
+        return graph
+
+    def test_round_trip_through_dataframes(self, source_graph):
+        restored = KnowledgeGraph.from_frames(
+            source_graph.nodes_as_dataframe(),
+            source_graph.edges_as_dataframe(),
+            name="Source",
+        )
+        restored_dict, source_dict = restored.to_dict(), source_graph.to_dict()
+        edge_key = itemgetter("source", "target", "relation")
+        restored_dict["edges"].sort(key=edge_key)
+        source_dict["edges"].sort(key=edge_key)
+        assert restored_dict == source_dict
+
+    def test_polars_arrow_and_mapping_inputs(self):
+        pl = pytest.importorskip("polars")
+        pa = pytest.importorskip("pyarrow")
+        nodes = {"id": ["A", "B", "C"], "node_type": ["gene", "gene", "disease"]}
+        edges = {"source": ["A", "B"], "target": ["B", "C"], "weight": [0.5, 2.0]}
+
+        for make_table in (dict, pl.DataFrame, pa.table):
+            graph = KnowledgeGraph.from_frames(make_table(nodes), make_table(edges))
+            assert graph.node_count == 3
+            assert graph.get_node("A").label == "A"
+            assert graph.get_node("C").node_type == NodeType.DISEASE
+            assert graph.get_edge("A", "B").relation == EdgeType.RELATED_TO
+            assert graph.get_edge("B", "C").weight == 2.0
+
+    def test_duplicates_keep_first_row(self):
+        graph = KnowledgeGraph.from_frames(
+            {"id": ["A", "B", "A"], "label": ["first", "B", "second"]},
+            {
+                "source": ["A", "A", "A"],
+                "target": ["B", "B", "B"],
+                "relation": ["is_a", "is_a", "part_of"],
+                "weight": [1.0, 9.0, 1.0],
+            },
+        )
+        assert graph.node_count == 2
+        assert graph.get_node("A").label == "first"
+        assert graph.edge_count == 2
+        assert graph.get_edge("A", "B", EdgeType.IS_A).weight == 1.0
+
+    def test_existing_nodes_and_edges_are_kept(self, source_graph):
+        added = source_graph.add_nodes_bulk({"id": ["A", "D"], "label": ["Other A", "Node D"]})
+        assert added == 1
+        assert source_graph.get_node("A").label == "Node A"
+
+        added = source_graph.add_edges_bulk(
+            {"source": ["A", "A"], "target": ["B", "D"], "relation": ["associated_with", "is_a"]}
+        )
+        assert added == 1
+        assert source_graph.get_edge("A", "B").weight == 0.5
+
+    def test_dangling_edges_are_dropped(self):
+        graph = KnowledgeGraph.from_frames(
+            {"id": ["A", "B", None]},
+            {"source": ["A", "A", "X", None], "target": ["B", "Y", "B", "B"]},
+        )
+        assert graph.node_count == 2
+        assert graph.edge_count == 1
+
+    def test_missing_required_column(self):
+        with pytest.raises(ValueError, match="source"):
+            KnowledgeGraph.from_frames({"id": ["A"]}, {"target": ["A"]})
+        with pytest.raises(TypeError):
+            KnowledgeGraph.from_frames([("A",)])
+
+
 # =============================================================================
 # Enum Tests
 # =============================================================================
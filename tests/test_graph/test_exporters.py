@@ -1,5 +1,7 @@
 """Tests for biodbs.graph.exporters module."""
 
+import gzip
+import io
 import json
 import os
 import tempfile
@@ -16,6 +18,9 @@ from biodbs.graph import (
     to_json_ld,
     to_neo4j_csv,
     to_cypher,
+    write_json_ld,
+    write_rdf,
+    write_cypher,
 )
 from biodbs._funcs.graph.exporters import _make_uri, _cypher_value
 
@@ -568,3 +573,104 @@ class TestToRdf:
         assert "cancer" in turtle
         # Should contain description from definition property
         assert "A disease of cellular proliferation" in turtle
+
+
+class TestWriteJsonLD:
+    """Tests for the streaming write_json_ld exporter."""
+
+    def test_matches_to_json_ld(self, sample_graph):
+        """Test the streamed document equals to_json_ld."""
+        buffer = io.StringIO()
+        write_json_ld(sample_graph, buffer, compact=True)
+
+        assert json.loads(buffer.getvalue()) == to_json_ld(sample_graph, compact=True)
+
+    def test_gzip_path(self, sample_graph, tmp_path):
+        """Test paths ending in .gz are compressed."""
+        path = tmp_path / "graph.jsonld.gz"
+        write_json_ld(sample_graph, path)
+
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            assert json.load(f) == to_json_ld(sample_graph)
+
+    def test_empty_graph(self):
+        """Test an empty graph gives an empty @graph."""
+        buffer = io.StringIO()
+        write_json_ld(KnowledgeGraph(name="Empty"), buffer, include_context=False)
+
+        assert json.loads(buffer.getvalue())["@graph"] == []
+
+
+class TestWriteRdf:
+    """Tests for the streaming write_rdf exporter."""
+
+    def test_ntriples(self, sample_graph):
+        """Test N-Triples output has one statement per line."""
+        buffer = io.StringIO()
+        write_rdf(sample_graph, buffer, format="nt")
+        lines = buffer.getvalue().splitlines()
+
+        assert all(line.endswith(" .") for line in lines)
+        assert (
+            "<http://example.org/biokg/DOID_1612> "
+            "<http://www.w3.org/2000/01/rdf-schema#subClassOf> "
+            "<http://example.org/biokg/DOID_162> ."
+        ) in lines
+        assert '"A disease of cellular proliferation"' in buffer.getvalue()
+
+    def test_nquads_graph_name(self, sample_graph):
+        """Test N-Quads output names the graph."""
+        buffer = io.StringIO()
+        write_rdf(sample_graph, buffer, format="nq", graph_uri="http://mykg/g1")
+
+        assert all(line.endswith(" <http://mykg/g1> .") for line in buffer.getvalue().splitlines())
+
+    def test_unsafe_iri_characters_are_escaped(self):
+        """Test IDs with spaces or angle brackets give valid IRIs."""
+        graph = KnowledgeGraph()
+        graph.add_node(Node(id="odd id<1>", label='say "hi"\n'))
+        buffer = io.StringIO()
+        write_rdf(graph, buffer)
+
+        assert "<http://example.org/biokg/odd%20id%3C1%3E>" in buffer.getvalue()
+        assert '"say \\"hi\\"\\n"' in buffer.getvalue()
+
+    def test_invalid_format(self, sample_graph):
+        """Test unsupported formats raise ValueError."""
+        with pytest.raises(ValueError):
+            write_rdf(sample_graph, io.StringIO(), format="xml")
+
+    @pytest.mark.skipif(
+        not _check_rdflib_available(),
+        reason="rdflib not installed"
+    )
+    @pytest.mark.parametrize("format", ["nt", "turtle"])
+    def test_same_triples_as_to_rdf(self, sample_graph, format):
+        """Test the streamed triples are isomorphic to to_rdf output."""
+        from rdflib import Graph
+        from rdflib.compare import isomorphic
+        from biodbs.graph import to_rdf
+
+        buffer = io.StringIO()
+        write_rdf(sample_graph, buffer, format=format)
+
+        expected = Graph().parse(data=to_rdf(sample_graph, format="nt"), format="nt")
+        assert isomorphic(Graph().parse(data=buffer.getvalue(), format=format), expected)
+
+
+class TestWriteCypher:
+    """Tests for the streaming write_cypher exporter."""
+
+    def test_matches_to_cypher(self, sample_graph):
+        """Test the written script equals to_cypher."""
+        buffer = io.StringIO()
+        write_cypher(sample_graph, buffer, batch_size=1, use_merge=False)
+
+        assert buffer.getvalue() == to_cypher(sample_graph, batch_size=1, use_merge=False) + "\n"
+
+    def test_gzip_stream(self, sample_graph):
+        """Test compress=True gzips a binary stream."""
+        buffer = io.BytesIO()
+        write_cypher(sample_graph, buffer, compress=True)
+
+        assert gzip.decompress(buffer.getvalue()).decode("utf-8") == to_cypher(sample_graph) + "\n"
@@ -0,0 +1,125 @@
+"""Tests for biodbs.graph snapshots (KnowledgeGraph.save / load)."""
+
+import json
+
+import numpy as np
+import pytest
+
+from biodbs.graph import (
+    CompactKnowledgeGraph,
+    DataSource,
+    Edge,
+    EdgeType,
+    KnowledgeGraph,
+    Node,
+    NodeType,
+    find_shortest_path,
+    get_connected_component,
+)
+
+
+def _sorted_dict(graph):
+    data = graph.to_dict()
+    data["edges"].sort(key=lambda e: (e["source"], e["target"], e["relation"]))
+    return data
+
+
+@pytest.fixture
+def graph():
+    graph = KnowledgeGraph(name="Snapshot", description="test graph", source=DataSource.KEGG)
+    graph.add_nodes(
+        [
+            Node(id="A", label="Gene A", node_type=NodeType.GENE,
+                 properties=frozenset([("aliases", ("A1", "A2")), ("score", 2.5)]),
+                 xrefs=frozenset(["HGNC:1"])),
+            Node(id="B", label="Ünïcode B", node_type=NodeType.DISEASE),
+            Node(id="C", label="Pathway C", node_type=NodeType.PATHWAY, source=DataSource.KEGG),
+            Node(id="D", label="D"),
+        ]
+    )
+    graph.add_edges(
+        [
+            Edge("A", "B", EdgeType.ASSOCIATED_WITH, weight=0.5, evidence=frozenset(["IEA"])),
+            Edge("A", "B", EdgeType.IS_A),
+            Edge("A", "C", EdgeType.PARTICIPATES_IN, evidence=frozenset(["IEA"])),
+            Edge("C", "A", properties=frozenset([("pmid", "123")])),
+            Edge("D", "D", EdgeType.PART_OF),
+        ]
+    )
+    return graph
+
+
+class TestSnapshot:
+    def test_round_trip_matches_to_dict(self, graph, tmp_path):
+        graph.save(tmp_path / "g")
+        loaded = KnowledgeGraph.load(tmp_path / "g")
+        assert isinstance(loaded, CompactKnowledgeGraph)
+        assert _sorted_dict(loaded) == _sorted_dict(graph)
+
+        compact = CompactKnowledgeGraph.from_graph(graph)
+        compact.save(tmp_path / "c")
+        for mmap in (True, False):
+            assert CompactKnowledgeGraph.load(tmp_path / "c", mmap=mmap).to_dict() == compact.to_dict()
+
+    def test_arrays_are_memory_mapped(self, graph, tmp_path):
+        graph.save(tmp_path)
+        loaded = KnowledgeGraph.load(tmp_path)
+        assert isinstance(loaded._targets, np.memmap)
+        assert not loaded._targets.flags.writeable
+        matrix = loaded.to_scipy_sparse()
+        assert np.shares_memory(matrix.indices, loaded._targets)
+        assert find_shortest_path(loaded, "B", "C", directed=False) == ["B", "A", "C"]
+        assert get_connected_component(loaded, "D") == {"D"}
+
+    def test_edits_after_load_leave_files_unchanged(self, graph, tmp_path):
+        graph.save(tmp_path)
+        loaded = KnowledgeGraph.load(tmp_path)
+        loaded.add_node(Node(id="E", label="E"))
+        loaded.add_edge(Edge("E", "A"))
+        loaded.remove_node("B")
+        assert loaded.node_count == 4
+        assert set(loaded.get_neighbors("A")) == {"C", "E"}
+        assert loaded.get_node("E").label == "E"
+        assert "B" not in loaded
+
+        assert _sorted_dict(KnowledgeGraph.load(tmp_path)) == _sorted_dict(graph)
+
+    def test_save_over_mapped_source(self, graph, tmp_path):
+        graph.add_nodes([Node(id=f"N{i}", label=f"Node {i}") for i in range(500)])
+        graph.add_edges([Edge(f"N{i}", f"N{(i * 7) % 500}", weight=i / 10) for i in range(500)])
+        graph.save(tmp_path / "g")
+        loaded = KnowledgeGraph.load(tmp_path / "g")
+        assert isinstance(loaded._targets, np.memmap)
+
+        loaded.save(tmp_path / "g")
+        assert [p.name for p in tmp_path.iterdir()] == ["g"]
+        assert _sorted_dict(loaded) == _sorted_dict(graph)
+        assert _sorted_dict(KnowledgeGraph.load(tmp_path / "g")) == _sorted_dict(graph)
+
+    def test_enum_codes_are_remapped(self, graph, tmp_path):
+        graph.save(tmp_path)
+        header = json.loads((tmp_path / "graph.json").read_text())
+        header["relations"].reverse()
+        (tmp_path / "graph.json").write_text(json.dumps(header))
+        codes = np.load(tmp_path / "relations.npy")
+        np.save(tmp_path / "relations.npy", (len(EdgeType) - 1 - codes).astype(np.uint8))
+
+        assert _sorted_dict(KnowledgeGraph.load(tmp_path)) == _sorted_dict(graph)
+
+    def test_invalid_snapshots(self, graph, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            KnowledgeGraph.load(tmp_path)
+        (tmp_path / "graph.json").write_text(json.dumps({"format": "other"}))
+        with pytest.raises(ValueError, match="snapshot"):
+            KnowledgeGraph.load(tmp_path)
+
+        graph.add_node(Node(id="bad\0id", label="bad"))
+        with pytest.raises(ValueError, match="NUL"):
+            graph.save(tmp_path / "bad")
+
+    def test_empty_graph(self, tmp_path):
+        KnowledgeGraph(name="Empty").save(tmp_path)
+        loaded = KnowledgeGraph.load(tmp_path)
+        assert loaded.name == "Empty"
+        assert loaded.node_count == 0
+        assert loaded.edge_count == 0
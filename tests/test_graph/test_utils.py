@@ -1,6 +1,7 @@
 """Tests for biodbs._funcs.graph.utils module."""
 
 import pytest
+from biodbs._funcs.graph.compact import CompactKnowledgeGraph
 from biodbs._funcs.graph.core import (
     DataSource,
     Edge,
@@ -41,6 +42,11 @@ def diamond_graph():
     return g
 
 
+@pytest.fixture
+def compact_diamond(diamond_graph):
+    return CompactKnowledgeGraph.from_graph(diamond_graph)
+
+
 @pytest.fixture
 def empty_graph():
     return KnowledgeGraph(name="Empty", source=DataSource.CUSTOM)
@@ -105,6 +111,13 @@ class TestFindShortestPath:
         path = find_shortest_path(diamond_graph, "F", "H")
         assert path == ["F", "G", "H"]
 
+    def test_compact_graph(self, compact_diamond):
+        assert find_shortest_path(compact_diamond, "F", "H") == ["F", "G", "H"]
+        assert find_shortest_path(compact_diamond, "D", "A", directed=True) is None
+        assert len(find_shortest_path(compact_diamond, "D", "A", directed=False)) == 3
+        assert find_shortest_path(compact_diamond, "A", "D", max_depth=1) is None
+        assert find_shortest_path(compact_diamond, "A", "E") is None
+
 
 # =============================================================================
 # TestFindAllPaths
@@ -271,6 +284,19 @@ class TestGetAllConnectedComponents:
         assert len(comps) == 1
         assert comps[0] == {"X"}
 
+    def test_strongly_connected(self, diamond_graph):
+        diamond_graph.add_edge(Edge(source="H", target="F"))
+        comps = get_all_connected_components(diamond_graph, directed=True)
+        assert {"F", "G", "H"} in comps
+        assert len(comps) == 6
+
+    def test_compact_graph_with_parallel_edges(self, compact_diamond):
+        compact_diamond.add_edge(Edge(source="A", target="B", relation=EdgeType.PART_OF))
+        comps = get_all_connected_components(compact_diamond)
+        assert sorted(len(c) for c in comps) == [1, 3, 4]
+        assert get_connected_component(compact_diamond, "D") == {"A", "B", "C", "D"}
+        assert get_connected_component(compact_diamond, "B", directed=True) == {"B", "D"}
+
 
 # =============================================================================
 # TestFindHubNodes
@@ -348,6 +374,19 @@ class TestComputeBetweennessCentrality:
         for v in bc.values():
             assert v >= 0.0
 
+    def test_exact_values(self, diamond_graph, compact_diamond):
+        for graph in (diamond_graph, compact_diamond):
+            bc = compute_betweenness_centrality(graph, normalized=False)
+            assert bc == {"A": 0.0, "B": 0.5, "C": 0.5, "D": 0.0, "E": 0.0, "F": 0.0, "G": 1.0, "H": 0.0}
+
+    def test_workers_match_single_process(self, compact_diamond):
+        single = compute_betweenness_centrality(compact_diamond)
+        assert compute_betweenness_centrality(compact_diamond, workers=2) == pytest.approx(single)
+
+    def test_seeded_sample_is_reproducible(self, diamond_graph):
+        a = compute_betweenness_centrality(diamond_graph, sample_size=3, seed=7)
+        assert a == compute_betweenness_centrality(diamond_graph, sample_size=3, seed=7)
+
 
 # =============================================================================
 # TestGetGraphStatistics
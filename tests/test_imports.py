@@ -0,0 +1,76 @@
+"""Import-time regression tests for the lazily loaded biodbs namespaces."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+HEAVY_MODULES = (
+    "aiohttp",
+    "pandas",
+    "polars",
+    "pydantic",
+    "requests",
+    "scipy",
+    "tqdm",
+    "biodbs.fetch._func",
+    "biodbs._funcs.analysis.ora",
+)
+
+# Generous bound on the cumulative `import biodbs` time (microseconds); the
+# lazy namespaces import in tens of milliseconds, eager ones took seconds
+IMPORT_BUDGET_US = 1_000_000
+
+
+def _importtime(code: str) -> dict:
+    """Run ``code`` in a fresh interpreter; return module -> cumulative us."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = int(cumulative)
+    return timings
+
+
+class TestLazyImports:
+    def test_import_biodbs_is_light(self):
+        timings = _importtime("import biodbs")
+        loaded = [m for m in HEAVY_MODULES if m in timings]
+        assert loaded == []
+        assert timings["biodbs"] < IMPORT_BUDGET_US
+
+    @pytest.mark.parametrize(
+        "package", ["biodbs.fetch", "biodbs.analysis", "biodbs.graph", "biodbs.translate"]
+    )
+    def test_import_subpackage_is_light(self, package):
+        timings = _importtime(f"import {package}")
+        assert [m for m in HEAVY_MODULES if m in timings] == []
+
+    def test_name_loads_only_its_module(self):
+        timings = _importtime("from biodbs import kegg_get")
+        assert "biodbs.fetch.KEGG.funcs" in timings
+        assert "biodbs.fetch.pubchem" not in timings
+        assert "biodbs.data.FDA._data_model" not in timings
+
+    def test_exports_resolve(self):
+        import biodbs
+        from biodbs import analysis, fetch, graph, translate
+
+        for module in (biodbs, fetch, analysis, graph, translate):
+            missing = [name for name in module.__all__ if not hasattr(module, name)]
+            assert missing == [], module.__name__
+        assert set(fetch.__all__) <= set(dir(biodbs))
+
+    def test_unknown_name_raises(self):
+        import biodbs
+
+        with pytest.raises(AttributeError, match="no_such_function"):
+            biodbs.no_such_function
@@ -16,7 +16,7 @@ from biodbs.utils import get_rsp, save_image_from_rsp, fetch_and_extract, async_
 class TestGetRsp:
     """Tests for the get_rsp helper function."""
 
-    @patch("biodbs.utils.fetch.requests")
+    @patch("biodbs.fetch._session.session_pool")
     def test_successful_200_response(self, mock_requests):
         """Mock requests.get returns a 200 response object."""
         mock_rsp = Mock()
@@ -28,7 +28,7 @@ class TestGetRsp:
         mock_requests.get.assert_called_once_with("http://example.com/api", params=None)
         assert result is mock_rsp
 
-    @patch("biodbs.utils.fetch.requests")
+    @patch("biodbs.fetch._session.session_pool")
     def test_safe_check_true_non_200_raises(self, mock_requests):
         """safe_check=True (default) with non-200 status raises AssertionError."""
         mock_rsp = Mock()
@@ -38,7 +38,7 @@ class TestGetRsp:
         with pytest.raises(AssertionError, match="404"):
             get_rsp("http://example.com/api", safe_check=True)
 
-    @patch("biodbs.utils.fetch.requests")
+    @patch("biodbs.fetch._session.session_pool")
     def test_safe_check_false_non_200_returns_response(self, mock_requests):
         """safe_check=False with non-200 returns the response without assertion."""
         mock_rsp = Mock()
@@ -50,7 +50,7 @@ class TestGetRsp:
         assert result is mock_rsp
         assert result.status_code == 500
 
-    @patch("biodbs.utils.fetch.requests")
+    @patch("biodbs.fetch._session.session_pool")
     def test_method_post_calls_requests_post(self, mock_requests):
         """method='post' delegates to requests.post."""
         mock_rsp = Mock()
@@ -62,7 +62,7 @@ class TestGetRsp:
         mock_requests.post.assert_called_once_with("http://example.com/api", params=None)
         assert result is mock_rsp
 
-    @patch("biodbs.utils.fetch.requests")
+    @patch("biodbs.fetch._session.session_pool")
     def test_query_params_passed_through(self, mock_requests):
         """Query parameters are forwarded to the underlying request."""
         mock_rsp = Mock()
@@ -77,7 +77,7 @@ class TestGetRsp:
         )
         assert result is mock_rsp
 
-    @patch("biodbs.utils.fetch.requests")
+    @patch("biodbs.fetch._session.session_pool")
     def test_kwargs_forwarded(self, mock_requests):
         """Extra keyword arguments (e.g. headers, timeout) are forwarded."""
         mock_rsp = Mock()